@@ -171,6 +171,7 @@ def _initialize_application(root, splash):
             """Gracefully shuts down the application."""
             if app:
                 app.shutdown()
+            state_cache_manager.shutdown()
             root.destroy()
 
         root.protocol("WM_DELETE_WINDOW", on_closing)
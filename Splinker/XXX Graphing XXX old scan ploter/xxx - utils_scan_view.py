@@ -33,6 +33,9 @@ import traceback
 import numpy as np
 from matplotlib.offsetbox import AnchoredText
 
+from workers.builder.builder_data_graphing.graph_decimation import LineDecimator
+from workers.markers.worker_marker_peak_detection import detect_peaks
+
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 
@@ -55,29 +58,10 @@ def _find_and_plot_peaks(ax, data, start_freq_MHz, end_freq_MHz):
         x_data = np.array(data)[:, 0]
         y_data = np.array(data)[:, 1]
 
+        # The ten highest peaks, at least 1/150 of the span apart.
         total_span = end_freq_MHz - start_freq_MHz
-        segment_width = total_span / 150
-        peaks = []
-        i = 0
-        while i < len(x_data):
-            segment_end_freq = x_data[i] + segment_width
-            segment_indices = np.where(
-                (x_data >= x_data[i]) & (x_data <= segment_end_freq)
-            )
-            if not segment_indices[0].any():
-                i += 1
-                continue
-
-            segment_y_data = y_data[segment_indices]
-            segment_x_data = x_data[segment_indices]
-            peak_y = np.max(segment_y_data)
-            peak_x = segment_x_data[np.argmax(segment_y_data)]
-            peaks.append((peak_x, peak_y))
-
-            next_i_candidate = np.where(x_data >= peak_x + segment_width)[0]
-            i = next_i_candidate[0] if len(next_i_candidate) > 0 else len(x_data)
-
-        sorted_peaks = sorted(peaks, key=lambda p: p[1], reverse=True)[:10]
+        peaks = detect_peaks(x_data, y_data, min_separation=total_span / 150, top_n=10)
+        sorted_peaks = list(zip(peaks["x"], peaks["y"]))
         for peak_x, peak_y in sorted_peaks:
             ax.axvline(x=peak_x, color="orange", linestyle="--", linewidth=1, zorder=4)
 
@@ -192,7 +176,11 @@ def update_single_plot(
         if data_tuples:
             frequencies, amplitudes = zip(*data_tuples)
             # FIXED: Used the new line_color parameter
-            ax.plot(frequencies, amplitudes, color=line_color, linewidth=1)
+            # Only a min/max envelope per pixel column is drawn; zooming re-decimates
+            # from the full-resolution sweep kept by the decimator.
+            (trace_line,) = ax.plot([], [], color=line_color, linewidth=1)
+            ax.trace_decimator = LineDecimator(trace_line, ax)
+            ax.trace_decimator.set_data(np.asarray(frequencies), np.asarray(amplitudes))
 
         ax.set_title(plot_title, color="white")
         ax.set_xlim(start_freq_MHz, end_freq_MHz)
@@ -0,0 +1,431 @@
+# managers/Visa_Fleet_Manager/manager_fleet_dispatcher.py
+#
+# Consumes OPEN-AIR/Proxy/Tx_Inbox, routes each YAK command to the right VISA fleet device with a
+# priority, and publishes replies to OPEN-AIR/Proxy/Rx_Outbox under the original correlation_id.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.220000.1
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from managers.Visa_Fleet_Manager.manager_visa_command_queue import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_POLLING,
+    normalize_priority,
+)
+from workers.mqtt.mqtt_trace_payload import encode_trace_payload
+
+current_version = "20261016.220000.1"
+current_version_hash = 20261016 * 220000 * 1
+
+TX_INBOX_TOPIC = "OPEN-AIR/Proxy/Tx_Inbox"
+RX_OUTBOX_TOPIC = "OPEN-AIR/Proxy/Rx_Outbox"
+RX_TRACE_TOPIC = "OPEN-AIR/Proxy/Rx_Trace"  # + "/<serial>"; binary trace payloads
+
+
+class FleetCommandDispatcher:
+    """
+    The bridge between the YAK layer and the VISA fleet.
+
+    YakTranslator publishes {command, query, correlation_id, ...} to Tx_Inbox. For each message
+    the dispatcher picks the target device (explicit serial, else a model/serial named in
+    the YAK path, else the only device in the fleet), queues the command on that device's
+    proxy in the interactive or polling lane, and publishes the instrument's reply, an error
+    or a drop notice to Rx_Outbox with the same correlation_id.
+
+    Commands flagged "binary" are trace reads: the points go out once as a binary trace
+    payload on Rx_Trace/<serial>, and the Rx_Outbox reply carries its topic and point count.
+    """
+
+    # Initializes the dispatcher and hooks it into the fleet manager's callbacks.
+    # Inputs:
+    #     visa_fleet_manager (VisaFleetManager): The fleet whose proxies execute the commands.
+    #     mqtt_connection_manager (MqttConnectionManager, optional): Used to publish replies.
+    #     subscriber_router (MqttSubscriberRouter, optional): Used to subscribe to Tx_Inbox.
+    #     publish_func (Callable, optional): publish_func(topic, payload_bytes); overrides MQTT, e.g. for benchmarks.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        visa_fleet_manager: Any,
+        mqtt_connection_manager: Any = None,
+        subscriber_router: Any = None,
+        publish_func: Optional[Callable[[str, bytes], None]] = None,
+    ):
+        self.fleet = visa_fleet_manager
+        self.mqtt_util = mqtt_connection_manager
+        self.subscriber_router = subscriber_router
+        self._publish_func = publish_func
+
+        self._route_cache: Dict[str, str] = {}  # yak_path -> device serial
+        self._inflight_lock = threading.Lock()
+        # (serial, command) -> correlation_ids of queries still waiting for the instrument
+        self._inflight_queries = collections.defaultdict(collections.deque)
+
+        self.stats = {
+            "received": 0,
+            "dispatched_interactive": 0,
+            "dispatched_polling": 0,
+            "replies": 0,
+            "traces": 0,
+            "errors": 0,
+            "dropped": 0,
+            "rejected": 0,
+            "unroutable": 0,
+        }
+
+        self.fleet.set_callbacks(
+            on_inventory_update=self.fleet.cb_inventory,
+            on_device_response=self._on_device_response,
+            on_device_error=self._on_device_error,
+            on_proxy_status=self.fleet.cb_status,
+            on_command_dropped=self._on_command_dropped,
+            on_trace_response=self._on_device_trace,
+        )
+
+        if self.subscriber_router is not None:
+            self.subscriber_router.subscribe_to_topic(
+                TX_INBOX_TOPIC, self._on_tx_inbox_message
+            )
+            debug_logger(
+                message=f"💳 👂 FleetCommandDispatcher subscribed to '{TX_INBOX_TOPIC}'.",
+                **_get_log_args(),
+            )
+
+    # MQTT callback for Tx_Inbox.
+    # Inputs:
+    #     topic (str): The topic the message arrived on.
+    #     payload (str or bytes): The JSON command payload.
+    # Outputs:
+    #     None.
+    def _on_tx_inbox_message(self, topic, payload):
+        try:
+            payload_data = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            debug_logger(
+                message=f"💳 ❌ Failed to decode Tx_Inbox payload: {payload}",
+                **_get_log_args(),
+                level="ERROR",
+            )
+            return
+        self.dispatch(payload_data)
+
+    # Routes one command to its device.
+    # Inputs:
+    #     payload_data (dict): command, query, correlation_id and optionally serial, yak_path, priority, binary.
+    # Outputs:
+    #     bool: True if the command was queued on a device.
+    def dispatch(self, payload_data: dict) -> bool:
+        """
+        Queues a Tx_Inbox command on the resolved device, or replies with an error.
+        """
+        self.stats["received"] += 1
+        command = payload_data.get("command")
+        binary = bool(payload_data.get("binary", False))
+        query = binary or bool(payload_data.get("query", False))
+        correlation_id = payload_data.get("correlation_id", "N/A")
+        priority = normalize_priority(payload_data.get("priority"))
+
+        if not command:
+            self._publish_error(correlation_id, None, command, "rejected", "Empty command.")
+            self.stats["rejected"] += 1
+            return False
+
+        serial = self._resolve_device(payload_data)
+        if serial is None:
+            self.stats["unroutable"] += 1
+            self._publish_error(
+                correlation_id,
+                None,
+                command,
+                "unroutable",
+                f"No fleet device matches '{payload_data.get('serial') or payload_data.get('yak_path', '')}'.",
+            )
+            return False
+
+        if query:
+            with self._inflight_lock:
+                self._inflight_queries[(serial, command)].append(correlation_id)
+
+        # This runs on the MQTT network thread, so a full device lane is answered with
+        # "rejected" at once instead of waiting for room and stalling every other topic.
+        queued = self.fleet.enqueue_command(
+            serial,
+            command,
+            query=query,
+            correlation_id=correlation_id,
+            priority=priority,
+            binary=binary,
+            block=False,
+        )
+        if not queued:
+            if query:
+                self._take_inflight(serial, command, correlation_id)
+            self.stats["rejected"] += 1
+            self._publish_error(
+                correlation_id, serial, command, "rejected", "Device queue is full."
+            )
+            return False
+
+        if priority == PRIORITY_POLLING:
+            self.stats["dispatched_polling"] += 1
+        else:
+            self.stats["dispatched_interactive"] += 1
+        return True
+
+    # Picks the device serial for a command.
+    # Inputs:
+    #     payload_data (dict): The Tx_Inbox payload.
+    # Outputs:
+    #     str or None: The serial of a device with a live proxy, or None.
+    def _resolve_device(self, payload_data: dict) -> Optional[str]:
+        supervisor = self.fleet.fleet_supervisor
+        proxies = supervisor.device_proxies
+
+        serial = payload_data.get("serial")
+        if serial:
+            return serial if serial in proxies else None
+
+        yak_path = payload_data.get("yak_path") or ""
+        if yak_path:
+            cached = self._route_cache.get(yak_path)
+            if cached in proxies:
+                return cached
+            segments = {part.strip().upper() for part in yak_path.split("/") if part}
+            with supervisor.inventory_lock:
+                inventory = list(supervisor.instrument_inventory.items())
+            for device_serial, entry in inventory:
+                if device_serial not in proxies:
+                    continue
+                names = {
+                    str(entry.get("model", "")).upper(),
+                    str(entry.get("serial_number", "")).upper(),
+                    str(device_serial).upper(),
+                }
+                if names & segments:
+                    self._route_cache[yak_path] = device_serial
+                    return device_serial
+
+        if len(proxies) == 1:
+            return next(iter(proxies))
+        return None
+
+    # Fleet callback: an instrument answered a query.
+    def _on_device_response(self, serial, response, command, corr_id):
+        self._take_inflight(serial, command, corr_id)
+        self.stats["replies"] += 1
+        self._publish(
+            {
+                "status": "ok",
+                "response": response,
+                "command": command,
+                "correlation_id": corr_id,
+                "serial": serial,
+            }
+        )
+
+    # Fleet callback: an instrument returned a whole trace as an array, with its
+    # (start_hz, stop_hz) span when the proxy could read it.
+    def _on_device_trace(self, serial, values, command, corr_id, span=None):
+        self._take_inflight(serial, command, corr_id)
+        self.stats["traces"] += 1
+        trace_topic = f"{RX_TRACE_TOPIC}/{serial}"
+        metadata = {
+            "serial": serial,
+            "correlation_id": corr_id,
+            "command": command,
+            "timestamp": time.time(),
+        }
+        if span is not None:
+            metadata["start_hz"], metadata["stop_hz"] = span
+        self._publish_raw(trace_topic, encode_trace_payload(values, **metadata))
+        self._publish(
+            {
+                "status": "ok",
+                "trace_topic": trace_topic,
+                "points": len(values),
+                "command": command,
+                "correlation_id": corr_id,
+                "serial": serial,
+            }
+        )
+
+    # Fleet callback: a command failed. The error carries no correlation_id, so it is matched
+    # to the oldest outstanding query for the same device and command.
+    def _on_device_error(self, serial, message, command):
+        self.stats["errors"] += 1
+        corr_id = self._take_inflight(serial, command)
+        if corr_id is None:
+            debug_logger(
+                message=f"💳 ❌ Fleet error on {serial} for '{command}': {message}",
+                **_get_log_args(),
+                level="ERROR",
+            )
+            return
+        self._publish_error(corr_id, serial, command, "error", message)
+
+    # Fleet callback: a polling command was pushed out of a full queue.
+    def _on_command_dropped(self, serial, command, corr_id):
+        self.stats["dropped"] += 1
+        self._take_inflight(serial, command, corr_id)
+        self._publish_error(
+            corr_id, serial, command, "dropped", "Superseded by newer polling traffic."
+        )
+
+    def _take_inflight(self, serial, command, corr_id=None):
+        with self._inflight_lock:
+            pending = self._inflight_queries.get((serial, command))
+            if not pending:
+                return None
+            if corr_id is None:
+                corr_id = pending.popleft()
+            else:
+                try:
+                    pending.remove(corr_id)
+                except ValueError:
+                    corr_id = None
+            if not pending:
+                del self._inflight_queries[(serial, command)]
+            return corr_id
+
+    def _publish_error(self, correlation_id, serial, command, status, message):
+        self._publish(
+            {
+                "status": status,
+                "error": message,
+                "command": command,
+                "correlation_id": correlation_id,
+                "serial": serial,
+            }
+        )
+
+    def _publish(self, reply: dict) -> None:
+        self._publish_raw(RX_OUTBOX_TOPIC, orjson.dumps(reply))
+
+    def _publish_raw(self, topic: str, payload: bytes) -> None:
+        try:
+            if self._publish_func is not None:
+                self._publish_func(topic, payload)
+            elif self.mqtt_util is not None:
+                self.mqtt_util.get_client_instance().publish(
+                    topic=topic, payload=payload, qos=0, retain=False
+                )
+        except Exception as e:
+            debug_logger(
+                message=f"💳 ❌ Failed to publish to '{topic}': {e}",
+                **_get_log_args(),
+                level="ERROR",
+            )
+
+    # Returns the dispatcher counters.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     dict: Received/dispatched/reply/error counters and outstanding query count.
+    def get_stats(self) -> dict:
+        """
+        Returns a snapshot of the dispatcher counters.
+        """
+        with self._inflight_lock:
+            inflight = sum(len(ids) for ids in self._inflight_queries.values())
+        stats = dict(self.stats)
+        stats["inflight_queries"] = inflight
+        return stats
+
+
+# Benchmark: python -m managers.Visa_Fleet_Manager.manager_fleet_dispatcher
+# Floods one simulated instrument with polling reads while timing interactive presses.
+if __name__ == "__main__":
+    from managers.Visa_Fleet_Manager.visa_proxy_fleet import VisaProxyFleet
+    from managers.Visa_Fleet_Manager.manager_visa_simulated_instrument import (
+        SimulatedScpiInstrument,
+    )
+
+    class _BenchmarkFleet:
+        """The slice of VisaFleetManager the dispatcher uses, around one simulated device."""
+
+        def __init__(self):
+            self.cb_inventory = lambda x: None
+            self.cb_status = lambda s, st: None
+            self.fleet_supervisor = type(
+                "Supervisor",
+                (),
+                {
+                    "device_proxies": {},
+                    "instrument_inventory": {"SIM00001": {"model": "N9020A"}},
+                    "inventory_lock": threading.RLock(),
+                },
+            )()
+            proxy = VisaProxyFleet(self, "SIM00001", "SIM::INSTR", "N9020A")
+            proxy.set_instrument_instance(SimulatedScpiInstrument())
+            self.fleet_supervisor.device_proxies["SIM00001"] = proxy
+
+        def set_callbacks(self, on_inventory_update, on_device_response, on_device_error, on_proxy_status, on_command_dropped=None, on_trace_response=None):
+            self.cb_response, self.cb_error, self.cb_dropped = on_device_response, on_device_error, on_command_dropped
+            self.cb_trace = on_trace_response
+
+        def enqueue_command(self, serial, command, query=False, correlation_id="N/A", priority="interactive", timeout=None, binary=False, block=True):
+            return self.fleet_supervisor.device_proxies[serial].enqueue_command(command, query, correlation_id, priority=priority, timeout=timeout, binary=binary, block=block)
+
+        def _notify_trace(self, serial, values, command, corr_id, span=None):
+            self.cb_trace(serial, values, command, corr_id, span)
+
+        def _notify_response(self, serial, response, command, corr_id):
+            self.cb_response(serial, response, command, corr_id)
+
+        def _notify_error(self, serial, message, command="N/A"):
+            self.cb_error(serial, message, command)
+
+        def _notify_dropped(self, serial, command, corr_id):
+            self.cb_dropped(serial, command, corr_id)
+
+        def _notify_status(self, serial, status):
+            pass
+
+    replies = {}
+    done = threading.Condition()
+
+    def _collect(topic, payload):
+        reply = orjson.loads(payload)
+        with done:
+            replies[reply["correlation_id"]] = (time.monotonic(), reply["status"])
+            done.notify_all()
+
+    fleet = _BenchmarkFleet()
+    dispatcher = FleetCommandDispatcher(fleet, publish_func=_collect)
+    sent = {}
+    start = time.monotonic()
+    for i in range(2000):
+        corr = f"poll-{i}"
+        sent[corr] = time.monotonic()
+        dispatcher.dispatch({"command": "TRAC:DATA?", "query": True, "correlation_id": corr, "priority": "polling"})
+        if i % 100 == 0:
+            corr = f"press-{i}"
+            sent[corr] = time.monotonic()
+            dispatcher.dispatch({"command": "FREQ:CENT?", "query": True, "correlation_id": corr, "yak_path": "yak/Frequency/N9020A"})
+    with done:
+        done.wait_for(lambda: len(replies) >= len(sent), timeout=60)
+    elapsed = time.monotonic() - start
+
+    presses = sorted((replies[c][0] - sent[c]) * 1000 for c in sent if c.startswith("press") and c in replies)
+    print(f"Dispatched {len(sent)} commands in {elapsed:.2f}s")
+    print(f"Interactive latency ms: median {presses[len(presses) // 2]:.1f}, max {presses[-1]:.1f}")
+    print(f"Dispatcher: {dispatcher.get_stats()}")
+    print(f"Proxy: {fleet.fleet_supervisor.device_proxies['SIM00001'].get_stats()}")
+    fleet.fleet_supervisor.device_proxies["SIM00001"].shutdown()
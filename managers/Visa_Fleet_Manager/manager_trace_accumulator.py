@@ -0,0 +1,418 @@
+# managers/Visa_Fleet_Manager/manager_trace_accumulator.py
+#
+# Host-side trace accumulation per trace source: max/min hold, exponential and N-sweep
+# averages and a decaying persistence map, kept in preallocated NumPy arrays and published
+# back to MQTT as binary trace payloads.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261017.003000.1
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import orjson
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from workers.mqtt.mqtt_trace_payload import (
+    TracePayloadError,
+    decode_trace_payload,
+    encode_trace_payload,
+)
+
+current_version = "20261017.003000.1"
+current_version_hash = 20261017 * 3000 * 1
+
+TRACE_INPUT_TOPIC = "OPEN-AIR/Proxy/Rx_Trace/+"
+TRACES_ROOT = "OPEN-AIR/Traces"  # + "/<source>/<kind>"; binary trace payloads
+RESET_TOPIC = f"{TRACES_ROOT}/+/Reset"
+
+KIND_MAX_HOLD = "max_hold"
+KIND_MIN_HOLD = "min_hold"
+KIND_AVERAGE = "average"  # exponential
+KIND_SWEEP_AVERAGE = "sweep_average"  # mean of the last N sweeps
+KIND_PERSISTENCE = "persistence"
+ALL_KINDS = (KIND_MAX_HOLD, KIND_MIN_HOLD, KIND_AVERAGE, KIND_SWEEP_AVERAGE, KIND_PERSISTENCE)
+
+# Metadata copied from the incoming trace to every published result.
+PASSTHROUGH_METADATA = ("serial", "timestamp", "start_hz", "stop_hz", "units")
+
+# The persistence map is kept undecayed and scaled on read; it is renormalised once the
+# scale of new hits passes this, which keeps float32 precise and costs O(levels * bins)
+# only every few dozen sweeps.
+_PERSISTENCE_RESCALE_LIMIT = 1e3
+
+
+class TraceAccumulator:
+    """
+    The accumulated views of one trace source.
+
+    Every array is allocated once per trace length; update() then works in place with ufunc
+    `out=` arguments, so a sweep costs O(bins) and allocates nothing. A trace of a different
+    length resets the accumulator.
+
+    Persistence is a (levels x bins) hit map over [amp_min, amp_max]: every sweep adds one
+    hit per bin at its amplitude level and older hits fade by `persistence_decay` per sweep.
+    The fade is applied lazily (new hits are weighted up instead of the map being scaled
+    down), so each sweep still only touches one cell per bin.
+    """
+
+    # Initializes an empty accumulator.
+    # Inputs:
+    #     bins (int): The trace length.
+    #     average_count (int): Sweeps in the N-sweep average.
+    #     ema_alpha (float): Weight of the newest sweep in the exponential average.
+    #     persistence_decay (float): Per-sweep fade of the persistence map, in (0, 1].
+    #     persistence_levels (int): Amplitude rows of the persistence map.
+    #     amp_min, amp_max (float): The amplitude range of the persistence map.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        bins: int,
+        average_count: int = 10,
+        ema_alpha: float = 0.2,
+        persistence_decay: float = 0.9,
+        persistence_levels: int = 100,
+        amp_min: float = -140.0,
+        amp_max: float = 0.0,
+    ):
+        self.bins = int(bins)
+        self.average_count = max(1, int(average_count))
+        self.ema_alpha = float(ema_alpha)
+        self.persistence_decay = min(max(float(persistence_decay), 1e-6), 1.0)
+        self.persistence_levels = max(1, int(persistence_levels))
+        self.amp_min = float(amp_min)
+        self.amp_max = float(amp_max) if amp_max > amp_min else float(amp_min) + 1.0
+
+        bins, levels = self.bins, self.persistence_levels
+        self.max_hold = np.full(bins, -np.inf)
+        self.min_hold = np.full(bins, np.inf)
+        self.average = np.empty(bins)
+        self.sweep_average = np.empty(bins)
+        self._sweep_ring = np.empty((self.average_count, bins))
+        self._sweep_sum = np.empty(bins)
+        self._persistence = np.zeros((levels, bins), dtype=np.float32)
+        self._persistence_flat = self._persistence.reshape(-1)
+        self.persistence = np.zeros((levels, bins), dtype=np.float32)  # decayed, for publishing
+        self._sweep = np.empty(bins)
+        self._scratch = np.empty(bins)
+        self._hits = np.empty(bins, dtype=np.float32)
+        self._cells = np.empty(bins, dtype=np.intp)
+        self._bin_offsets = np.arange(bins, dtype=np.intp)
+
+        self.span = None  # (start_hz, stop_hz) the views were accumulated over
+        self.sweeps = 0  # since the last full reset
+        self._average_sweeps = 0
+        self._ring_slot = 0
+        self._ring_filled = 0
+        self._hit_weight = 1.0
+        self._persistence_sweeps = 0
+
+    # Folds one sweep into every view.
+    # Inputs:
+    #     values (np.ndarray): One trace of `bins` points (any float dtype).
+    # Outputs:
+    #     None.
+    def update(self, values: np.ndarray) -> None:
+        if len(values) != self.bins:
+            raise ValueError(f"Trace has {len(values)} points, accumulator expects {self.bins}.")
+        self.sweeps += 1
+        # One cast into float64 up front; mixed-dtype ufuncs would each buffer a converted copy.
+        np.copyto(self._sweep, values)
+        values = self._sweep
+
+        np.maximum(self.max_hold, values, out=self.max_hold)
+        np.minimum(self.min_hold, values, out=self.min_hold)
+
+        if self._average_sweeps == 0:
+            np.copyto(self.average, values)
+        else:
+            np.subtract(values, self.average, out=self._scratch)
+            self._scratch *= self.ema_alpha
+            self.average += self._scratch
+        self._average_sweeps += 1
+
+        self._update_sweep_average(values)
+        self._update_persistence(values)
+
+    def _update_sweep_average(self, values) -> None:
+        slot = self._sweep_ring[self._ring_slot]
+        if self._ring_filled == self.average_count:
+            self._sweep_sum -= slot
+        np.copyto(slot, values)
+        self._ring_filled = min(self._ring_filled + 1, self.average_count)
+        self._ring_slot = (self._ring_slot + 1) % self.average_count
+        if self._ring_slot == 0:
+            # Re-sum from the ring once per wrap so add/subtract rounding never builds up.
+            np.sum(self._sweep_ring, axis=0, out=self._sweep_sum)
+        elif self._ring_filled == 1:
+            np.copyto(self._sweep_sum, slot)
+        else:
+            self._sweep_sum += slot
+        np.multiply(self._sweep_sum, 1.0 / self._ring_filled, out=self.sweep_average)
+
+    def _update_persistence(self, values) -> None:
+        if self._persistence_sweeps:
+            self._hit_weight /= self.persistence_decay
+            if self._hit_weight > _PERSISTENCE_RESCALE_LIMIT:
+                self._persistence *= np.float32(1.0 / self._hit_weight)
+                self._hit_weight = 1.0
+        self._persistence_sweeps += 1
+
+        # Amplitude -> level row, clipped into the map, then row-major cell index per bin.
+        scale = self.persistence_levels / (self.amp_max - self.amp_min)
+        np.subtract(values, self.amp_min, out=self._scratch)
+        self._scratch *= scale
+        np.clip(self._scratch, 0, self.persistence_levels - 1, out=self._scratch)
+        np.copyto(self._cells, self._scratch, casting="unsafe")
+        self._cells *= self.bins
+        self._cells += self._bin_offsets
+        # Exactly one cell per bin, so take/put cannot collide.
+        # The indices are in range by construction; mode="raise" would copy `out` first.
+        np.take(self._persistence_flat, self._cells, out=self._hits, mode="clip")
+        self._hits += np.float32(self._hit_weight)
+        np.put(self._persistence_flat, self._cells, self._hits, mode="clip")
+
+    # Returns the persistence map with the pending fade applied (into a preallocated array).
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     np.ndarray: (levels x bins) float32; the newest sweep counts 1 per bin.
+    def persistence_map(self) -> np.ndarray:
+        np.multiply(self._persistence, np.float32(1.0 / self._hit_weight), out=self.persistence)
+        return self.persistence
+
+    # Returns the current array for one kind.
+    def view(self, kind: str) -> np.ndarray:
+        if kind == KIND_PERSISTENCE:
+            return self.persistence_map()
+        if kind not in ALL_KINDS:
+            raise KeyError(kind)
+        return getattr(self, kind)
+
+    # Clears some or all views; the next sweep restarts them.
+    # Inputs:
+    #     kinds (iterable of str, optional): Kinds to reset; all when omitted.
+    # Outputs:
+    #     None.
+    def reset(self, kinds=None) -> None:
+        kinds = ALL_KINDS if not kinds else tuple(kinds)
+        if KIND_MAX_HOLD in kinds:
+            self.max_hold.fill(-np.inf)
+        if KIND_MIN_HOLD in kinds:
+            self.min_hold.fill(np.inf)
+        if KIND_AVERAGE in kinds:
+            self._average_sweeps = 0
+        if KIND_SWEEP_AVERAGE in kinds:
+            self._ring_slot = 0
+            self._ring_filled = 0
+        if KIND_PERSISTENCE in kinds:
+            self._persistence.fill(0.0)
+            self._hit_weight = 1.0
+            self._persistence_sweeps = 0
+        if set(ALL_KINDS) <= set(kinds):
+            self.sweeps = 0
+
+
+class TraceAccumulatorManager:
+    """
+    Accumulates every trace published on OPEN-AIR/Proxy/Rx_Trace/<source>.
+
+    After each sweep the trace views are published to OPEN-AIR/Traces/<source>/<kind> as
+    binary trace payloads, so a FluxPlotter dataset can show e.g. a max hold by setting its
+    "trace_topic" to OPEN-AIR/Traces/<serial>/max_hold. The persistence map is larger (one
+    trace per amplitude level), so it is flattened row by row and only published every
+    `persistence_every` sweeps.
+
+    Publishing anything to OPEN-AIR/Traces/<source>/Reset clears that source; the payload
+    may name the kinds to clear ("max_hold", ["max_hold", "min_hold"] or
+    {"kinds": [...]}), otherwise everything is cleared.
+    """
+
+    # Initializes the manager and subscribes to the trace and reset topics.
+    # Inputs:
+    #     mqtt_connection_manager (MqttConnectionManager, optional): Used to publish results.
+    #     subscriber_router (MqttSubscriberRouter, optional): Used to subscribe.
+    #     publish_func (Callable, optional): publish_func(topic, payload_bytes); overrides MQTT.
+    #     persistence_every (int, optional): Publish the persistence map every N sweeps; 0 never.
+    #     **accumulator_options: TraceAccumulator settings (average_count, ema_alpha, ...).
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        mqtt_connection_manager: Any = None,
+        subscriber_router: Any = None,
+        publish_func: Optional[Callable[[str, bytes], None]] = None,
+        persistence_every: int = 10,
+        **accumulator_options,
+    ):
+        self.mqtt_util = mqtt_connection_manager
+        self.subscriber_router = subscriber_router
+        self._publish_func = publish_func
+        self.persistence_every = max(0, int(persistence_every))
+        self.accumulator_options = accumulator_options
+        self.accumulators: Dict[str, TraceAccumulator] = {}
+        self._lock = threading.Lock()
+        self.stats = {"sweeps": 0, "published": 0, "resets": 0, "rejected": 0}
+
+        if self.subscriber_router is not None:
+            self.subscriber_router.subscribe_to_topic(TRACE_INPUT_TOPIC, self._on_trace_message)
+            self.subscriber_router.subscribe_to_topic(RESET_TOPIC, self._on_reset_message)
+            debug_logger(
+                message=f"📈 👂 TraceAccumulatorManager subscribed to '{TRACE_INPUT_TOPIC}' and '{RESET_TOPIC}'.",
+                **_get_log_args(),
+            )
+
+    # MQTT callback for Rx_Trace/<source>.
+    def _on_trace_message(self, topic, payload):
+        source = topic.rsplit("/", 1)[-1]
+        try:
+            metadata, values = decode_trace_payload(payload)
+        except (TracePayloadError, TypeError) as e:
+            self.stats["rejected"] += 1
+            debug_logger(
+                message=f"📈 ❌ Ignoring invalid trace payload on '{topic}': {e}",
+                **_get_log_args(),
+                level="ERROR",
+            )
+            return
+        self.add_sweep(source, values, metadata)
+
+    # Folds one sweep into a source's accumulator and publishes the results.
+    # Inputs:
+    #     source (str): The trace source, e.g. an instrument serial.
+    #     values (array-like): The trace.
+    #     metadata (dict, optional): The trace metadata; start_hz/stop_hz/units are passed on.
+    # Outputs:
+    #     TraceAccumulator: The source's accumulator.
+    def add_sweep(self, source: str, values, metadata: Optional[dict] = None) -> TraceAccumulator:
+        metadata = metadata or {}
+        with self._lock:
+            accumulator = self.accumulators.get(source)
+            span = (metadata.get("start_hz"), metadata.get("stop_hz"))
+            if accumulator is None or accumulator.bins != len(values):
+                # A new trace length is a new measurement: start over with fresh arrays.
+                accumulator = TraceAccumulator(len(values), **self.accumulator_options)
+                self.accumulators[source] = accumulator
+            elif accumulator.span != span:
+                accumulator.reset()
+            accumulator.span = span
+            accumulator.update(values)
+            self.stats["sweeps"] += 1
+            self._publish_views(source, accumulator, metadata)
+        return accumulator
+
+    def _publish_views(self, source, accumulator, metadata) -> None:
+        common = {key: metadata[key] for key in PASSTHROUGH_METADATA if key in metadata}
+        common["source"] = source
+        common["sweeps"] = accumulator.sweeps
+        for kind in (KIND_MAX_HOLD, KIND_MIN_HOLD, KIND_AVERAGE, KIND_SWEEP_AVERAGE):
+            self._publish(source, kind, encode_trace_payload(accumulator.view(kind), kind=kind, **common))
+        if self.persistence_every and accumulator.sweeps % self.persistence_every == 0:
+            self._publish(
+                source,
+                KIND_PERSISTENCE,
+                encode_trace_payload(
+                    accumulator.persistence_map(),
+                    kind=KIND_PERSISTENCE,
+                    shape=[accumulator.persistence_levels, accumulator.bins],
+                    amp_min=accumulator.amp_min,
+                    amp_max=accumulator.amp_max,
+                    **common,
+                ),
+            )
+
+    # MQTT callback for Traces/<source>/Reset.
+    def _on_reset_message(self, topic, payload):
+        source = topic.split("/")[-2]
+        kinds = None
+        if payload:
+            try:
+                request = orjson.loads(payload)
+            except orjson.JSONDecodeError:
+                request = payload.decode() if isinstance(payload, bytes) else payload
+            if isinstance(request, dict):
+                request = request.get("kinds")
+            if isinstance(request, str):
+                request = [request]
+            if isinstance(request, list):
+                kinds = [kind for kind in request if kind in ALL_KINDS] or None
+        self.reset(source, kinds)
+
+    # Clears accumulated views.
+    # Inputs:
+    #     source (str, optional): The source to clear; every source when omitted.
+    #     kinds (iterable of str, optional): The kinds to clear; all when omitted.
+    # Outputs:
+    #     None.
+    def reset(self, source: Optional[str] = None, kinds=None) -> None:
+        with self._lock:
+            targets = self.accumulators.values() if source is None else [self.accumulators.get(source)]
+            for accumulator in targets:
+                if accumulator is not None:
+                    accumulator.reset(kinds)
+            self.stats["resets"] += 1
+        debug_logger(
+            message=f"📈 🧹 Trace accumulator reset: source={source or 'all'}, kinds={kinds or 'all'}.",
+            **_get_log_args(),
+        )
+
+    def _publish(self, source: str, kind: str, payload: bytes) -> None:
+        topic = f"{TRACES_ROOT}/{source}/{kind}"
+        try:
+            if self._publish_func is not None:
+                self._publish_func(topic, payload)
+            elif self.mqtt_util is not None:
+                self.mqtt_util.get_client_instance().publish(
+                    topic=topic, payload=payload, qos=0, retain=False
+                )
+            self.stats["published"] += 1
+        except Exception as e:
+            debug_logger(
+                message=f"📈 ❌ Failed to publish to '{topic}': {e}",
+                **_get_log_args(),
+                level="ERROR",
+            )
+
+    # Returns the manager counters.
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["sources"] = len(self.accumulators)
+        return stats
+
+
+# Benchmark: python -m managers.Visa_Fleet_Manager.manager_trace_accumulator
+# Times TraceAccumulator.update() on 10,001-bin sweeps and checks it allocates nothing.
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    rng = np.random.default_rng(3)
+    sweeps = rng.normal(-100.0, 3.0, (64, 10_001)).astype(np.float32)
+    accumulator = TraceAccumulator(sweeps.shape[1])
+    for sweep in sweeps:
+        accumulator.update(sweep)
+
+    started = time.perf_counter()
+    for i in range(500):
+        accumulator.update(sweeps[i % len(sweeps)])
+    elapsed_us = (time.perf_counter() - started) / 500 * 1e6
+    print(f"update(): {elapsed_us:.0f} µs per {sweeps.shape[1]}-bin sweep")
+
+    tracemalloc.start()
+    for i in range(200):
+        accumulator.update(sweeps[i % len(sweeps)])
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Traced allocations over 200 sweeps: current {current} B, peak {peak} B")
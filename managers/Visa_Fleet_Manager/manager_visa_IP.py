@@ -5,11 +5,11 @@
 # Author: Gemini Agent
 #
 
+import asyncio
+import ipaddress
 import socket
-import urllib.request
-import urllib.parse
 import re
-from concurrent.futures import ThreadPoolExecutor
+import time
 
 try:
     from workers.logger.logger import debug_logger
@@ -29,6 +29,14 @@ except ModuleNotFoundError:
 
 # --- CONFIGURATION (from cli_visa_find.py) ---
 HTTP_TIMEOUT = 5
+VXI11_PORT = 111
+SCPI_PORT = 5025
+GATEWAY_HTTP_PORT = 80
+GATEWAY_PAGE_PATH = "/html/instrumentspage.html"
+GATEWAY_PAGE_MAX_BYTES = 65536
+GATEWAY_HTTP_TIMEOUT = 1.0
+CONNECT_TIMEOUT = 0.3
+DEFAULT_SCAN_CONCURRENCY = 128
 
 
 def _get_local_ip():
@@ -43,97 +51,256 @@ def _get_local_ip():
     return IP
 
 
-def _check_host(ip):
-    """Checks for Port 111 (VXI-11) and Port 5025 (SCPI)."""
-    debug_logger(f"   🔍 Checking host: {ip}", **_get_log_args())
-    # 1. Port 111 (VXI-11)
+def _parse_address_list(value):
+    """Splits a comma/whitespace separated config.ini value into a list of entries."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = re.split(r"[\s,;]+", value)
+    return [item.strip() for item in value if item and item.strip()]
+
+
+def _expand_scan_targets(subnets=None, hosts=None, exclude=None):
+    """
+    Turns CIDR subnets (e.g. "192.168.1.0/24") and explicit host addresses into an ordered,
+    de-duplicated list of IPv4 addresses to probe.
+
+    Args:
+        subnets (list or str, optional): CIDR blocks; a bare address is treated as a /32.
+        hosts (list or str, optional): Individual addresses that are always probed.
+        exclude (str, optional): An address to leave out, normally our own.
+
+    Returns:
+        list: The host addresses as strings.
+    """
+    targets = []
+    seen = {exclude} if exclude else set()
+    for host in _parse_address_list(hosts):
+        if host not in seen:
+            seen.add(host)
+            targets.append(host)
+    for subnet in _parse_address_list(subnets):
+        try:
+            network = ipaddress.ip_network(subnet, strict=False)
+        except ValueError as e:
+            debug_logger(
+                f"⚠️ Ignoring invalid subnet '{subnet}': {e}",
+                **_get_log_args(),
+                level="WARNING",
+            )
+            continue
+        addresses = list(network.hosts()) or [network.network_address]
+        for address in addresses:
+            ip = str(address)
+            if ip not in seen:
+                seen.add(ip)
+                targets.append(ip)
+    return targets
+
+
+async def _port_open(ip, port, timeout):
+    """Returns True if a TCP connection to ip:port is accepted within `timeout` seconds."""
+    writer = None
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, port), timeout=timeout
+        )
+        return True
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+
+async def _is_e5810_gateway(ip, http_port, timeout):
+    """
+    Fetches the instrument page of a VXI-11 host over a plain asyncio stream and reports
+    whether it is an E5810 LAN/GPIB gateway. The response is read until EOF, the byte cap
+    or the marker, all within one `timeout`, since headers and body may arrive separately.
+    """
+    writer = None
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(0.3)
-        result = sock.connect_ex((ip, 111))
-        sock.close()
-        if result == 0:
-            is_gateway = False
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, http_port), timeout=timeout
+        )
+        request = (
+            f"GET {GATEWAY_PAGE_PATH} HTTP/1.0\r\nHost: {ip}\r\nConnection: close\r\n\r\n"
+        )
+        writer.write(request.encode("ascii"))
+        await writer.drain()
+        return await asyncio.wait_for(_read_finds_e5810(reader), timeout=timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        if writer is not None:
+            writer.close()
             try:
-                url = f"http://{ip}/html/instrumentspage.html"
-                with urllib.request.urlopen(url, timeout=1) as resp:
-                    if "E5810" in resp.read().decode("utf-8", errors="ignore"):
-                        is_gateway = True
-            except:
+                await writer.wait_closed()
+            except Exception:
                 pass
+
+
+async def _read_finds_e5810(reader):
+    """Reads the HTTP response until EOF or GATEWAY_PAGE_MAX_BYTES; True once "E5810" is seen."""
+    body = b""
+    while len(body) < GATEWAY_PAGE_MAX_BYTES:
+        chunk = await reader.read(GATEWAY_PAGE_MAX_BYTES - len(body))
+        if not chunk:
+            break
+        body += chunk
+        if b"E5810" in body:
+            return True
+    return False
+
+
+async def _check_host_async(ip, semaphore, connect_timeout, http_timeout, ports):
+    """
+    Checks Port 111 (VXI-11) and Port 5025 (SCPI) at the same time.
+
+    Returns:
+        tuple or None: (ip, "GATEWAY" | "DEDICATED"), or None if neither port answered.
+    """
+    vxi11_port, scpi_port, http_port = ports
+    async with semaphore:
+        vxi11_open, scpi_open = await asyncio.gather(
+            _port_open(ip, vxi11_port, connect_timeout),
+            _port_open(ip, scpi_port, connect_timeout),
+        )
+        if vxi11_open:
+            is_gateway = await _is_e5810_gateway(ip, http_port, http_timeout)
             debug_logger(
-                f"     ✅ Host {ip}: Port 111 open. Type: {'GATEWAY' if is_gateway else 'DEDICATED'}",
+                f"     ✅ Host {ip}: Port {vxi11_port} open. Type: {'GATEWAY' if is_gateway else 'DEDICATED'}",
                 **_get_log_args(),
             )
             return (ip, "GATEWAY" if is_gateway else "DEDICATED")
-        else:
+        if scpi_open:
             debug_logger(
-                f"⚠️ Host{ip}: Port 111 closed.", **_get_log_args(), level="WARNING"
+                f"     ✅ Host {ip}: Port {scpi_port} open. Type: DEDICATED",
+                **_get_log_args(),
             )
-    except Exception as e:
-        debug_logger(
-            f"⚠️ Host{ip}: Error checking Port 111: {e}",
-            **_get_log_args(),
-            level="WARNING",
-        )
-
-    # 2. Port 5025 (SCPI)
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(0.3)
-        result = sock.connect_ex((ip, 5025))
-        sock.close()
-        if result == 0:
-            #  debug_logger(f"     ✅ Host {ip}: Port 5025 open. Type: DEDICATED", **_get_log_args())
             return (ip, "DEDICATED")
-        else:
-            debug_logger(
-                f"⚠️ Host{ip}: Port 5025 closed.", **_get_log_args(), level="WARNING"
-            )
-    except Exception as e:
-        debug_logger(
-            f"⚠️ Host{ip}: Error checking Port 5025: {e}",
-            **_get_log_args(),
-            level="WARNING",
-        )
     return None
 
 
-def discover_ip_devices():
+async def sweep_hosts_async(
+    hosts,
+    max_concurrency=DEFAULT_SCAN_CONCURRENCY,
+    connect_timeout=CONNECT_TIMEOUT,
+    http_timeout=GATEWAY_HTTP_TIMEOUT,
+    ports=(VXI11_PORT, SCPI_PORT, GATEWAY_HTTP_PORT),
+):
     """
-    Hunts the local network for VISA-enabled devices (dedicated IPs and VXI-11 gateways).
-    Returns two lists: (dedicated_ips, gateway_ips).
+    Probes `hosts` concurrently and yields each VISA-capable host as soon as it answers.
+
+    This is an async generator: `async for ip, type_ in sweep_hosts_async(...)`.
+    At most `max_concurrency` hosts are in flight at once.
     """
-    debug_logger("💳 🔍 Hunting network for VISA devices...", **_get_log_args())
-    my_ip = _get_local_ip()
-    if my_ip == "127.0.0.1":
-        debug_logger(
-            "Could not determine local IP. Skipping network hunt.",
-            **_get_log_args(),
-            level="WARNING",
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+    tasks = [
+        asyncio.ensure_future(
+            _check_host_async(ip, semaphore, connect_timeout, http_timeout, ports)
         )
-        return [], []
+        for ip in hosts
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
 
-    subnet = ".".join(my_ip.split(".")[:-1])
 
-    targets_to_scan = [
-        f"{subnet}.{i}" for i in range(1, 255) if f"{subnet}.{i}" != my_ip
-    ]
+def sweep_hosts(hosts, on_result=None, **sweep_kwargs):
+    """
+    Synchronous wrapper around sweep_hosts_async for worker threads without an event loop.
 
-    gateways = []
-    dedicated = []
+    Args:
+        hosts (list): The addresses to probe.
+        on_result (callable, optional): Called as on_result(ip, type_) for each host as it is found.
+        **sweep_kwargs: Passed through to sweep_hosts_async.
+
+    Returns:
+        list: (ip, type_) tuples in the order they were found.
+    """
 
-    with ThreadPoolExecutor(max_workers=50) as executor:
-        futures = {executor.submit(_check_host, ip): ip for ip in targets_to_scan}
-        for future in futures:
-            res = future.result()
-            if res:
-                ip, type_ = res
-                if type_ == "GATEWAY":
-                    gateways.append(ip)
-                else:
-                    dedicated.append(ip)
+    async def _collect():
+        found = []
+        async for ip, type_ in sweep_hosts_async(hosts, **sweep_kwargs):
+            found.append((ip, type_))
+            if on_result is not None:
+                try:
+                    on_result(ip, type_)
+                except Exception as e:
+                    debug_logger(
+                        f"❌ IP sweep on_result callback failed for {ip}: {e}",
+                        **_get_log_args(),
+                        level="ERROR",
+                    )
+        return found
 
+    return asyncio.run(_collect())
+
+
+def discover_ip_devices(
+    subnets=None,
+    hosts=None,
+    on_result=None,
+    max_concurrency=DEFAULT_SCAN_CONCURRENCY,
+    connect_timeout=CONNECT_TIMEOUT,
+):
+    """
+    Hunts the network for VISA-enabled devices (dedicated IPs and VXI-11 gateways).
+
+    Without `subnets` or `hosts` the local /24 is swept, as before. Both ports of every
+    host are probed concurrently on one asyncio event loop.
+
+    Args:
+        subnets (list or str, optional): CIDR blocks to sweep instead of the local /24.
+        hosts (list or str, optional): Extra individual addresses to probe.
+        on_result (callable, optional): Called as on_result(ip, type_) as each host is found.
+        max_concurrency (int, optional): Maximum number of hosts probed at once.
+        connect_timeout (float, optional): TCP connect timeout per port, in seconds.
+
+    Returns two lists: (dedicated_ips, gateway_ips).
+    """
+    debug_logger("💳 🔍 Hunting network for VISA devices...", **_get_log_args())
+    my_ip = _get_local_ip()
+    subnets = _parse_address_list(subnets)
+    if not subnets:
+        if my_ip == "127.0.0.1":
+            if not _parse_address_list(hosts):
+                debug_logger(
+                    "Could not determine local IP. Skipping network hunt.",
+                    **_get_log_args(),
+                    level="WARNING",
+                )
+                return [], []
+        else:
+            subnets = [f"{my_ip}/24"]
+
+    targets_to_scan = _expand_scan_targets(subnets, hosts, exclude=my_ip)
+    started = time.monotonic()
+    found = sweep_hosts(
+        targets_to_scan,
+        on_result=on_result,
+        max_concurrency=max_concurrency,
+        connect_timeout=connect_timeout,
+    )
+
+    gateways = [ip for ip, type_ in found if type_ == "GATEWAY"]
+    dedicated = [ip for ip, type_ in found if type_ != "GATEWAY"]
+
+    debug_logger(
+        f"💳 🔍 Swept {len(targets_to_scan)} hosts in {time.monotonic() - started:.2f}s.",
+        **_get_log_args(),
+    )
     if dedicated:
         debug_logger(f"✅ Found Dedicated: {dedicated}", **_get_log_args())
     if gateways:
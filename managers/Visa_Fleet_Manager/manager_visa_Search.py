@@ -9,6 +9,8 @@ import pyvisa
 import time
 import re
 import string  # For _clean_string_for_display
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from workers.logger.logger import debug_logger
@@ -28,6 +30,23 @@ except ModuleNotFoundError:
 
 # --- CONFIGURATION (from cli_visa_find.py) ---
 VISA_TIMEOUT = 5000
+RETRY_DELAY_S = 2.0  # Settle time before the second USB/ASRL attempt
+RETRY_MIN_BUDGET_S = 0.5  # Do not bother retrying with less than this left after the settle
+
+# --- PARALLEL PROBING ---
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_DEADLINE_S = 8.0
+# Concurrent probes allowed per shared link. Keys are the first element of _interface_key().
+# Gateways and serial ports handle one session at a time; direct LAN instruments are
+# limited per host, so distinct hosts still probe in parallel.
+DEFAULT_INTERFACE_LIMITS = {
+    "GATEWAY": 1,
+    "USB": 2,
+    "ASRL": 1,
+    "GPIB": 1,
+    "TCPIP": 1,
+    "OTHER": 1,
+}
 
 
 def _clean_string_for_display(s):
@@ -67,11 +86,69 @@ def _parse_resource_details(res_str):
     return details
 
 
-def _query_device_safe(rm, resource_str, attempt=1):
+def _interface_key(res_str):
+    """
+    Returns the shared link a resource is reached through, e.g. ("GATEWAY", "44.44.44.222")
+    for every GPIB address behind one LAN/GPIB gateway, or ("USB",) for the local USB bus.
+    Probes that share a key are throttled together by probe_devices.
+    """
+    clean_res = _clean_string_for_display(res_str)
+    parts = clean_res.split("::")
+    upper = clean_res.upper()
+    if upper.startswith("TCPIP"):
+        host = parts[1] if len(parts) >= 2 else clean_res
+        if len(parts) > 2 and "," in parts[2]:
+            return ("GATEWAY", host)
+        return ("TCPIP", host)
+    if upper.startswith("USB"):
+        return ("USB",)
+    if upper.startswith("ASRL"):
+        return ("ASRL",)
+    if upper.startswith("GPIB"):
+        return ("GPIB", parts[0])
+    return ("OTHER", clean_res)
+
+
+def _interleave_by_interface(potential_targets):
+    """
+    Orders targets round-robin across interfaces so a long queue of addresses behind one
+    gateway does not occupy every worker while other links sit idle.
+    """
+    groups = {}
+    for target in potential_targets:
+        groups.setdefault(_interface_key(target["Resource"]), []).append(target)
+    ordered = []
+    queues = list(groups.values())
+    while queues:
+        for group in queues:
+            ordered.append(group.pop(0))
+        queues = [group for group in queues if group]
+    return ordered
+
+
+def _query_device_safe(rm, resource_str, attempt=1, deadline=None):
+    """
+    Opens a resource, asks for *IDN? and closes it again.
+
+    If `deadline` (a time.monotonic() value) is given, the open and query timeouts are
+    shortened to fit inside it and the USB/ASRL retry only happens if there is time left.
+    """
+    timeout_ms = VISA_TIMEOUT
+    if deadline is not None:
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            debug_logger(
+                f"      ⏱️ Probe deadline reached before querying {resource_str}.",
+                **_get_log_args(),
+                level="WARNING",
+            )
+            return None
+        timeout_ms = min(VISA_TIMEOUT, remaining_ms)
+
     inst = None
     try:
-        inst = rm.open_resource(resource_str)
-        inst.timeout = VISA_TIMEOUT
+        inst = rm.open_resource(resource_str, open_timeout=timeout_ms)
+        inst.timeout = timeout_ms
         inst.read_termination = "\n"
         inst.write_termination = "\n"
 
@@ -111,9 +188,9 @@ def _query_device_safe(rm, resource_str, attempt=1):
                 inst.close()
             except:
                 pass
-        if attempt == 1 and ("USB" in resource_str or "ASRL" in resource_str):
-            time.sleep(2.0)
-            return _query_device_safe(rm, resource_str, attempt=2)
+        if _should_retry(resource_str, attempt, deadline):
+            time.sleep(RETRY_DELAY_S)
+            return _query_device_safe(rm, resource_str, attempt=2, deadline=deadline)
         return None
     except Exception as e:
         debug_logger(
@@ -126,20 +203,173 @@ def _query_device_safe(rm, resource_str, attempt=1):
                 inst.close()
             except:
                 pass
-        if attempt == 1 and ("USB" in resource_str or "ASRL" in resource_str):
-            time.sleep(2.0)
-            return _query_device_safe(rm, resource_str, attempt=2)
+        if _should_retry(resource_str, attempt, deadline):
+            time.sleep(RETRY_DELAY_S)
+            return _query_device_safe(rm, resource_str, attempt=2, deadline=deadline)
         return None
 
 
-def probe_devices(resource_manager, potential_targets):
+def _should_retry(resource_str, attempt, deadline):
+    """
+    USB and serial devices get one more attempt after a short settle, but only if that
+    attempt can still finish before the deadline.
+    """
+    if attempt != 1 or not ("USB" in resource_str or "ASRL" in resource_str):
+        return False
+    if deadline is None:
+        return True
+    return deadline - time.monotonic() > RETRY_DELAY_S + RETRY_MIN_BUDGET_S
+
+
+def _build_device_entry(target, idn):
+    """
+    Builds the inventory entry for one probed target.
+
+    Returns:
+        tuple: (device_identifier, device_entry). The identifier is not yet de-duplicated
+               against other devices in the same scan.
+    """
+    raw_res = target["Resource"]
+    display_res = _clean_string_for_display(raw_res)
+    conn_details = _parse_resource_details(display_res)
+
+    device_entry = {
+        "type": target["Type"],
+        "resource_string": display_res,
+        "ip_address": conn_details["IP"],
+        "interface_port": conn_details["Interface"],
+        "gpib_address": conn_details["GPIB_Addr"],
+    }
+
+    if not idn:
+        device_identifier = re.sub(
+            r"[^\w\-]+", "_", raw_res
+        )  # Still need identifier for unresponsive devices
+        device_entry.update(
+            {
+                "status": "Unresponsive",
+                "manufacturer": "Unknown",
+                "model": "Unknown",
+                "serial_number": "Unknown",
+                "firmware": "Unknown",
+                "device_type": "Unknown",
+                "notes": "Connection Timed Out",
+            }
+        )
+        return device_identifier, device_entry
+
+    mfg, model, serial_num, firm = _parse_idn(idn)  # Use _parse_idn for basic parsing
+
+    device_identifier = serial_num
+    if not device_identifier or device_identifier == "0":
+        # Construct unique ID from IP last octet, interface port number, and GPIB address
+        # Example: "222-7-1" from IP 44.44.44.222, gpib7, 1
+
+        last_octet = "Unknown"
+        if conn_details["IP"] and "." in conn_details["IP"]:
+            last_octet = conn_details["IP"].split(".")[-1]
+        elif conn_details["IP"] == "USB":  # Handle USB IP
+            last_octet = "USB"
+
+        interface_port_num = "Unknown"
+        if conn_details["Interface"]:
+            match = re.search(r"\d+", conn_details["Interface"])
+            if match:
+                interface_port_num = match.group(0)
+            else:
+                interface_port_num = conn_details[
+                    "Interface"
+                ]  # Use full string if no number
+
+        gpib_addr = (
+            conn_details["GPIB_Addr"] if conn_details["GPIB_Addr"] != "N/A" else "Unknown"
+        )
+
+        # Combine to form the new device_identifier
+        # Sanitize components to ensure valid identifier (e.g., replace non-alphanumeric with '_')
+        device_identifier_parts = [last_octet, interface_port_num, gpib_addr]
+        sanitized_parts = [
+            re.sub(r"[^\w\-]+", "_", str(p)) for p in device_identifier_parts
+        ]
+
+        device_identifier = "-".join(sanitized_parts)
+
+        debug_logger(
+            f"      Generated new device_identifier for empty/0 serial: {device_identifier}",
+            **_get_log_args(),
+            level="DEBUG",
+        )
+
+    device_entry.update(
+        {
+            "status": "Active",
+            "manufacturer": mfg,
+            "model": model,
+            "serial_number": serial_num,
+            "firmware": firm,
+            "idn_string": idn,
+            # "idn_details": {} # Will be added by supervisor with robust parser
+        }
+    )
+    return device_identifier, device_entry
+
+
+def _unique_identifier(device_identifier, taken):
+    """Appends _1, _2, ... to `device_identifier` until it is not in `taken`."""
+    taken = set(taken)
+    original_identifier = device_identifier
+    counter = 1
+    while device_identifier in taken:
+        device_identifier = f"{original_identifier}_{counter}"
+        counter += 1
+    return device_identifier
+
+
+def _report(on_result, device_identifier, device_entry):
+    """Hands one probe result to the caller's on_result callback, if any."""
+    if on_result is None:
+        return
+    try:
+        on_result(device_identifier, device_entry)
+    except Exception as e:
+        debug_logger(
+            f"💳 🔍 manager_visa_Search: on_result callback failed for {device_identifier}: {e}",
+            **_get_log_args(),
+            level="ERROR",
+        )
+
+
+def probe_devices(
+    resource_manager,
+    potential_targets,
+    on_result=None,
+    max_workers=DEFAULT_MAX_WORKERS,
+    interface_limits=None,
+    deadline_s=DEFAULT_DEADLINE_S,
+):
     """
     Probes a list of potential VISA resources to gather detailed information.
 
+    Targets are probed concurrently by a bounded worker pool. Probes that share a link
+    (all addresses behind one GPIB gateway, the local USB bus, ...) are additionally
+    limited by `interface_limits` so a slow gateway is never hit with parallel sessions.
+    Each probe must finish within `deadline_s` of starting, and every result is handed to
+    `on_result` as soon as it is known instead of after the whole sweep.
+
+    Devices sharing an identifier get `_1`, `_2`, ... suffixes in `potential_targets`
+    order once every probe is in. A result streamed under an identifier that this changes
+    is handed to `on_result` again under its final one.
+
     Args:
         resource_manager: The PyVISA ResourceManager instance.
         potential_targets (list): A list of dictionaries, each with 'Type' and 'Resource' keys.
                                   E.g., [{"Type": "DEDICATED", "Resource": "TCPIP::192.168.1.10::INSTR"}]
+        on_result (callable, optional): Called as on_result(device_identifier, device_entry) on the
+                                        calling thread for each target as soon as it has been probed.
+        max_workers (int, optional): Maximum number of probes in flight.
+        interface_limits (dict, optional): Concurrent probes allowed per link kind
+                                           ("GATEWAY", "USB", "ASRL", "GPIB", "TCPIP", "OTHER").
+        deadline_s (float, optional): Time budget for one resource, including the USB/ASRL retry.
 
     Returns:
         dict: A dictionary of probed device entries, keyed by device identifier (serial number or sanitized resource).
@@ -149,122 +379,73 @@ def probe_devices(resource_manager, potential_targets):
         **_get_log_args(),
     )
     device_collection = {}
-
-    try:
-        for idx, target in enumerate(potential_targets):
-            raw_res = target["Resource"]
-            display_res = _clean_string_for_display(raw_res)
-
+    if not potential_targets:
+        return device_collection
+
+    limits = dict(DEFAULT_INTERFACE_LIMITS)
+    limits.update(interface_limits or {})
+    semaphores = {}
+    for target in potential_targets:
+        key = _interface_key(target["Resource"])
+        if key not in semaphores:
+            semaphores[key] = threading.BoundedSemaphore(max(1, int(limits.get(key[0], 1))))
+
+    def _probe_one(target):
+        raw_res = target["Resource"]
+        with semaphores[_interface_key(raw_res)]:
+            # The deadline starts once the link is free, so queued probes are not penalised.
+            deadline = time.monotonic() + deadline_s if deadline_s else None
             debug_logger(
-                f"   🎯 Probing {display_res} ... ",
+                f"   🎯 Probing {_clean_string_for_display(raw_res)} ... ",
                 **_get_log_args(),
-                end="",
-                flush=True,
             )
+            return _query_device_safe(resource_manager, raw_res, deadline=deadline)
 
-            conn_details = _parse_resource_details(display_res)
-            idn = _query_device_safe(resource_manager, raw_res)
+    # Input position of each target; results are collected by it
+    positions = {id(target): index for index, target in enumerate(potential_targets)}
+    results = {}
+    streamed = {}
 
-            device_entry = {
-                # "id": str(idx + 1), # Will be replaced by serial or similar unique ID
-                "type": target["Type"],
-                "resource_string": display_res,
-                "ip_address": conn_details["IP"],
-                "interface_port": conn_details["Interface"],
-                "gpib_address": conn_details["GPIB_Addr"],
+    started = time.monotonic()
+    workers = max(1, min(int(max_workers), len(potential_targets)))
+    try:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="VisaProbe"
+        ) as executor:
+            futures = {
+                executor.submit(_probe_one, target): target
+                for target in _interleave_by_interface(potential_targets)
             }
-
-            if idn:
-                debug_logger(f"SUCCESS", **_get_log_args())
-                mfg, model, serial_num, firm = _parse_idn(
-                    idn
-                )  # Use _parse_idn for basic parsing
-
-                device_identifier = serial_num
-                if not device_identifier or device_identifier == "0":
-                    # Construct unique ID from IP last octet, interface port number, and GPIB address
-                    # Example: "222-7-1" from IP 44.44.44.222, gpib7, 1
-
-                    last_octet = "Unknown"
-                    if conn_details["IP"] and "." in conn_details["IP"]:
-                        last_octet = conn_details["IP"].split(".")[-1]
-                    elif conn_details["IP"] == "USB":  # Handle USB IP
-                        last_octet = "USB"
-
-                    interface_port_num = "Unknown"
-                    if conn_details["Interface"]:
-                        match = re.search(r"\d+", conn_details["Interface"])
-                        if match:
-                            interface_port_num = match.group(0)
-                        else:
-                            interface_port_num = conn_details[
-                                "Interface"
-                            ]  # Use full string if no number
-
-                    gpib_addr = (
-                        conn_details["GPIB_Addr"]
-                        if conn_details["GPIB_Addr"] != "N/A"
-                        else "Unknown"
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    idn = future.result()
+                except Exception as e:
+                    debug_logger(
+                        f"      ❌ Probe worker failed for {target['Resource']}: {e}",
+                        **_get_log_args(),
+                        level="ERROR",
                     )
+                    idn = None
 
-                    # Combine to form the new device_identifier
-                    # Sanitize components to ensure valid identifier (e.g., replace non-alphanumeric with '_')
-                    device_identifier_parts = [
-                        last_octet,
-                        interface_port_num,
-                        gpib_addr,
-                    ]
-                    sanitized_parts = [
-                        re.sub(r"[^\w\-]+", "_", str(p))
-                        for p in device_identifier_parts
-                    ]
-
-                    device_identifier = "-".join(sanitized_parts)
-
+                display_res = _clean_string_for_display(target["Resource"])
+                if idn:
+                    debug_logger(
+                        f"   ✅ {display_res}: SUCCESS", **_get_log_args()
+                    )
+                else:
                     debug_logger(
-                        f"      Generated new device_identifier for empty/0 serial: {device_identifier}",
+                        f"   ❌ {display_res}: FAILED (IDN Query Error)",
                         **_get_log_args(),
-                        level="DEBUG",
+                        level="ERROR",
                     )
 
-                # Ensure the device_identifier is unique across the collection
-                original_identifier = device_identifier
-                counter = 1
-                while device_identifier in device_collection:
-                    device_identifier = f"{original_identifier}_{counter}"
-                    counter += 1
-
-                device_entry.update(
-                    {
-                        "status": "Active",
-                        "manufacturer": mfg,
-                        "model": model,
-                        "serial_number": serial_num,
-                        "firmware": firm,
-                        "idn_string": idn,
-                        # "idn_details": {} # Will be added by supervisor with robust parser
-                    }
-                )
-            else:
-                debug_logger(
-                    f"FAILED (IDN Query Error)", **_get_log_args(), level="ERROR"
-                )
-                device_identifier = re.sub(
-                    r"[^\w\-]+", "_", raw_res
-                )  # Still need identifier for unresponsive devices
-                device_entry.update(
-                    {
-                        "status": "Unresponsive",
-                        "manufacturer": "Unknown",
-                        "model": "Unknown",
-                        "serial_number": "Unknown",
-                        "firmware": "Unknown",
-                        "device_type": "Unknown",
-                        "notes": "Connection Timed Out",
-                    }
-                )
-
-            device_collection[device_identifier] = device_entry
+                device_identifier, device_entry = _build_device_entry(target, idn)
+                results[positions[id(target)]] = (device_identifier, device_entry)
+
+                # Streamed under the bare identifier; duplicates are settled below
+                streamed[positions[id(target)]] = device_identifier
+                _report(on_result, device_identifier, device_entry)
     except Exception as e:
         debug_logger(
             f"💳 🔍 CRITICAL manager_visa_Search: Exception in probe_devices loop: {e}",
@@ -272,8 +453,17 @@ def probe_devices(resource_manager, potential_targets):
             level="ERROR",
         )
 
+    # Suffixes for duplicate identifiers follow the order of potential_targets, not the
+    # order the probes finished in, so a device keeps its identifier from scan to scan.
+    for index in sorted(results):
+        device_identifier, device_entry = results[index]
+        device_identifier = _unique_identifier(device_identifier, device_collection)
+        device_collection[device_identifier] = device_entry
+        if device_identifier != streamed[index]:
+            _report(on_result, device_identifier, device_entry)
+
     debug_logger(
-        f"💳 🔍 manager_visa_Search: Finished probing. Returning {len(device_collection)} probed devices: {device_collection}",
+        f"💳 🔍 manager_visa_Search: Finished probing in {time.monotonic() - started:.2f}s with {workers} workers. Returning {len(device_collection)} probed devices: {device_collection}",
         **_get_log_args(),
     )
     return device_collection
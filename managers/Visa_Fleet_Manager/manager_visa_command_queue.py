@@ -0,0 +1,204 @@
+# managers/Visa_Fleet_Manager/manager_visa_command_queue.py
+#
+# A per-device command queue with priority lanes: interactive commands preempt background polling,
+# interactive traffic gets backpressure and polling traffic is bounded with drop-oldest.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.180000.1
+
+import collections
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+current_version = "20261016.180000.1"
+current_version_hash = 20261016 * 180000 * 1
+
+PRIORITY_INTERACTIVE = 0  # Actuator presses and anything a user is waiting on
+PRIORITY_POLLING = 1  # Periodic background reads; stale ones are worth nothing
+
+PRIORITY_NAMES = {"interactive": PRIORITY_INTERACTIVE, "polling": PRIORITY_POLLING}
+
+DEFAULT_INTERACTIVE_DEPTH = 64
+DEFAULT_POLLING_DEPTH = 32
+
+
+# Maps a priority given as a name or number onto one of the known lanes.
+# Inputs:
+#     priority (str or int or None): "interactive", "polling", 0, 1 or None.
+# Outputs:
+#     int: PRIORITY_INTERACTIVE or PRIORITY_POLLING.
+def normalize_priority(priority) -> int:
+    """
+    Unknown or missing priorities are treated as interactive.
+    """
+    if isinstance(priority, str):
+        return PRIORITY_NAMES.get(priority.strip().lower(), PRIORITY_INTERACTIVE)
+    if priority == PRIORITY_POLLING:
+        return PRIORITY_POLLING
+    return PRIORITY_INTERACTIVE
+
+
+class DeviceCommandQueue:
+    """
+    A drop-in replacement for the queue.Queue a VisaProxyFleet worker consumes.
+
+    Items are the proxy's command dictionaries; their "priority" key selects a lane. `get()`
+    always serves the interactive lane first, FIFO within a lane. When the polling lane is
+    full the oldest polling command is discarded (and reported through `on_drop`), so a
+    slow instrument never builds up a backlog of stale reads. When the interactive lane is
+    full, `put()` blocks for up to `timeout` and then raises queue.Full, pushing back on the
+    producer instead of silently losing a user action. `None` (the worker exit signal) is
+    always accepted and served first.
+    """
+
+    # Initializes the queue.
+    # Inputs:
+    #     interactive_depth (int, optional): Maximum queued interactive commands.
+    #     polling_depth (int, optional): Maximum queued polling commands before the oldest is dropped.
+    #     on_drop (Callable, optional): Called with each discarded command dictionary.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        interactive_depth: int = DEFAULT_INTERACTIVE_DEPTH,
+        polling_depth: int = DEFAULT_POLLING_DEPTH,
+        on_drop: Optional[Callable[[dict], None]] = None,
+    ):
+        self.depths = {
+            PRIORITY_INTERACTIVE: max(1, int(interactive_depth)),
+            PRIORITY_POLLING: max(1, int(polling_depth)),
+        }
+        self.on_drop = on_drop
+        self._lanes = {
+            PRIORITY_INTERACTIVE: collections.deque(),
+            PRIORITY_POLLING: collections.deque(),
+        }
+        self._exit_requested = False
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self._unfinished_tasks = 0
+        self.dropped = 0
+
+    # Adds a command to its lane.
+    # Inputs:
+    #     item (dict or None): The command dictionary, or None to ask the worker to exit.
+    #     block (bool, optional): Wait for room in a full interactive lane.
+    #     timeout (float, optional): Maximum seconds to wait for room.
+    # Outputs:
+    #     None. Raises queue.Full if the interactive lane stays full.
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Queues `item`. Polling commands never block; interactive ones may.
+        """
+        dropped_item = None
+        with self._not_full:
+            if item is None:
+                self._exit_requested = True
+                self._unfinished_tasks += 1
+                self._not_empty.notify()
+                return
+
+            priority = normalize_priority(item.get("priority"))
+            lane = self._lanes[priority]
+            if priority == PRIORITY_POLLING:
+                if len(lane) >= self.depths[priority]:
+                    dropped_item = lane.popleft()
+                    self.dropped += 1
+                    self._unfinished_tasks -= 1
+            else:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while len(lane) >= self.depths[priority]:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not block or (remaining is not None and remaining <= 0):
+                        raise queue.Full
+                    self._not_full.wait(remaining)
+            lane.append(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+        if dropped_item is not None and self.on_drop is not None:
+            self.on_drop(dropped_item)
+
+    # Removes and returns the next command, interactive lane first.
+    # Inputs:
+    #     block (bool, optional): Wait for a command.
+    #     timeout (float, optional): Maximum seconds to wait.
+    # Outputs:
+    #     dict or None: The command, or None if the worker should exit. Raises queue.Empty.
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Returns the highest-priority queued command.
+        """
+        with self._not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._exit_requested and not self._qsize_locked():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise queue.Empty
+                self._not_empty.wait(remaining)
+
+            if self._exit_requested:
+                self._exit_requested = False
+                return None
+            for priority in (PRIORITY_INTERACTIVE, PRIORITY_POLLING):
+                lane = self._lanes[priority]
+                if lane:
+                    item = lane.popleft()
+                    self._not_full.notify()
+                    return item
+
+    # Equivalent to get(block=False).
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    # Equivalent to put(item, block=False).
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    # Marks one previously fetched command as processed, as queue.Queue.task_done does.
+    def task_done(self) -> None:
+        with self._all_tasks_done:
+            unfinished = self._unfinished_tasks - 1
+            if unfinished < 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks = unfinished
+            if unfinished == 0:
+                self._all_tasks_done.notify_all()
+
+    # Blocks until every queued command has been processed (or dropped).
+    def join(self) -> None:
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+    # Returns the number of queued commands across both lanes.
+    def qsize(self) -> int:
+        with self._mutex:
+            return self._qsize_locked()
+
+    # Returns the number of queued commands per lane name.
+    def lane_sizes(self) -> dict:
+        with self._mutex:
+            return {
+                name: len(self._lanes[priority])
+                for name, priority in PRIORITY_NAMES.items()
+            }
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def _qsize_locked(self) -> int:
+        return len(self._lanes[PRIORITY_INTERACTIVE]) + len(self._lanes[PRIORITY_POLLING])
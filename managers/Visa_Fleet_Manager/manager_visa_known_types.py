@@ -105,6 +105,8 @@ KNOWN_DEVICES = {
     "N9030B": {"type": "Spectrum", "notes": "PXA Signal Analyzer (High Performance)"},
     "N9040B": {"type": "Spectrum", "notes": "UXA Signal Analyzer (Ultra Performance)"},
     "N9340B": {"type": "Spectrum", "notes": "Handheld (100 kHz - 3 GHz)"},
+    "N9342CN": {"type": "Spectrum", "notes": "Handheld (100 kHz - 7 GHz)"},
+    "E4411A": {"type": "Spectrum", "notes": "ESA-L1500A 1.5 GHz (Legacy)"},
     "N9912A": {"type": "Spectrum", "notes": "FieldFox RF Analyzer (4 GHz)"},
     "N9918A": {"type": "Spectrum", "notes": "FieldFox RF Analyzer (26.5 GHz)"},
 
@@ -217,3 +219,66 @@ KNOWN_DEVICES = {
     "NGL200":  {"type": "Power", "notes": "Precision Power Supply (Linear)"},
     "NGM200":  {"type": "Power", "notes": "Precision Power Supply (High Speed)"},
 }
+
+
+# How many commands (and characters) one ';'-joined SCPI program message may carry, and the
+# delay PyVISA waits between write and read of a query. Looked up by model, then by the
+# device type from KNOWN_DEVICES, then DEFAULT_SCPI_BATCH_LIMITS.
+DEFAULT_SCPI_BATCH_LIMITS = {"max_commands": 8, "max_chars": 240, "query_delay_s": 0.1}
+
+SCPI_BATCH_LIMITS_BY_TYPE = {
+    "Oscilloscope": {"max_commands": 16, "max_chars": 480},
+    "Spectrum": {"max_commands": 16, "max_chars": 480},
+}
+
+SCPI_BATCH_LIMITS_BY_MODEL = {
+    "3458A": {"max_commands": 1},  # HP-ML, not SCPI: no compound messages
+    "33120A": {"max_commands": 4, "max_chars": 120},  # Small input buffer
+}
+
+
+def get_scpi_batch_limits(model):
+    """
+    Returns the batching limits for an instrument model, filling gaps from its device
+    type and then from DEFAULT_SCPI_BATCH_LIMITS.
+    """
+    limits = dict(DEFAULT_SCPI_BATCH_LIMITS)
+    device_type = KNOWN_DEVICES.get(model, {}).get("type")
+    limits.update(SCPI_BATCH_LIMITS_BY_TYPE.get(device_type, {}))
+    limits.update(SCPI_BATCH_LIMITS_BY_MODEL.get(model, {}))
+    return limits
+
+
+# How trace data can be read back in binary. "format" is the :FORMat argument ("REAL,32",
+# "INT,32", "REAL,64") or None for ASCII only; "byte_order" is the block's byte order and
+# "byte_order_command" the SCPI that selects it (None if the model has no :FORMat:BORDer).
+# A model that rejects the binary transfer is switched to ASCII for the rest of the session.
+# "span_query" reads the frequency span of the trace back as two values (None if not applicable).
+DEFAULT_TRACE_TRANSFER = {"format": None, "byte_order": "big", "byte_order_command": None, "span_query": None}
+
+TRACE_TRANSFER_BY_TYPE = {
+    "Spectrum": {"format": "REAL,32", "byte_order": "big", "span_query": ":FREQuency:STARt?;:FREQuency:STOP?"},
+}
+
+TRACE_TRANSFER_BY_MODEL = {
+    "E4411A": {"format": "REAL,32", "byte_order": "big", "byte_order_command": ":FORMat:BORDer NORMal"},
+    "N9340B": {"format": "REAL,32", "byte_order": "big"},
+    "N9342CN": {"format": "REAL,32", "byte_order": "big"},
+}
+
+# :FORMat argument -> (struct datatype for query_binary_values, bytes per point)
+BINARY_TRACE_FORMATS = {"REAL,32": ("f", 4), "REAL,64": ("d", 8), "INT,32": ("i", 4)}
+
+
+def get_trace_transfer(model):
+    """
+    Returns the binary trace settings for an instrument model, filling gaps from its device
+    type and then from DEFAULT_TRACE_TRANSFER.
+    """
+    transfer = dict(DEFAULT_TRACE_TRANSFER)
+    device_type = KNOWN_DEVICES.get(model, {}).get("type")
+    transfer.update(TRACE_TRANSFER_BY_TYPE.get(device_type, {}))
+    transfer.update(TRACE_TRANSFER_BY_MODEL.get(model, {}))
+    if transfer["format"] not in BINARY_TRACE_FORMATS:
+        transfer["format"] = None
+    return transfer
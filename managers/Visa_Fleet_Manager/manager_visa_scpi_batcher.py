@@ -0,0 +1,131 @@
+# managers/Visa_Fleet_Manager/manager_visa_scpi_batcher.py
+#
+# Plans ';'-joined SCPI program messages from queued proxy commands and splits combined responses.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.170000.1
+
+current_version = "20261016.170000.1"
+current_version_hash = 20261016 * 170000 * 1
+
+MESSAGE_UNIT_SEPARATOR = ";"
+
+
+# Decides whether a command may share a program message with others.
+# Common commands (*RST, *OPC?, ...) change instrument-wide state or synchronise, so they
+# always travel alone, as do commands that are already compound or still hold placeholders.
+# Inputs:
+#     command (str): The SCPI command text.
+# Outputs:
+#     bool: True if the command can be joined into a batch.
+def is_batchable(command: str) -> bool:
+    """
+    Returns True if `command` is a plain SCPI command that can be ';'-joined.
+    """
+    text = (command or "").strip()
+    if not text or text.startswith("*"):
+        return False
+    return not any(marker in text for marker in (";", "<", ">", "\n", "\r"))
+
+
+# Makes a command header absolute so it is not resolved relative to the previous
+# command's path once it is joined into a program message.
+# Inputs:
+#     command (str): The SCPI command text.
+# Outputs:
+#     str: The command with a leading ':'.
+def absolute_header(command: str) -> str:
+    """
+    Prefixes a ':' to `command` unless it already has one.
+    """
+    text = command.strip()
+    return text if text.startswith(":") else f":{text}"
+
+
+# Groups queued command dictionaries into batches without reordering them.
+# Inputs:
+#     command_infos (list): Queued items with "command" and "query" keys.
+#     max_commands (int): Most commands in one program message (1 disables batching).
+#     max_chars (int): Longest program message allowed, in characters.
+# Outputs:
+#     list: A list of batches; each batch is a non-empty list of the original items.
+def plan_batches(command_infos: list, max_commands: int, max_chars: int) -> list:
+    """
+    Splits `command_infos` into consecutive runs that can each go out as one message.
+    """
+    batches = []
+    current = []
+    current_chars = 0
+    max_commands = max(1, int(max_commands))
+    for info in command_infos:
+        command = info["command"]
+        if not is_batchable(command) or max_commands == 1:
+            if current:
+                batches.append(current)
+                current, current_chars = [], 0
+            batches.append([info])
+            continue
+
+        length = len(absolute_header(command))
+        joined_length = current_chars + length + (1 if current else 0)
+        if current and (len(current) >= max_commands or joined_length > max_chars):
+            batches.append(current)
+            current, current_chars = [], 0
+            joined_length = length
+        current.append(info)
+        current_chars = joined_length
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+# Builds the ';'-joined program message for a batch.
+# Inputs:
+#     batch (list): Items with a "command" key.
+# Outputs:
+#     str: The program message.
+def join_batch(batch: list) -> str:
+    """
+    Joins the commands of a batch into one SCPI program message.
+    """
+    if len(batch) == 1:
+        return batch[0]["command"]
+    return MESSAGE_UNIT_SEPARATOR.join(absolute_header(info["command"]) for info in batch)
+
+
+# Splits a combined response into one string per query. Separators inside quoted
+# string responses are left alone.
+# Inputs:
+#     raw_response (str): The response to a ';'-joined program message.
+# Outputs:
+#     list: The individual response units, stripped.
+def split_response(raw_response: str) -> list:
+    """
+    Splits `raw_response` on ';' outside of quoted strings.
+    """
+    units = []
+    current = []
+    quote = None
+    for char in raw_response.strip():
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ('"', "'"):
+            quote = char
+        elif char == MESSAGE_UNIT_SEPARATOR:
+            units.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    units.append("".join(current).strip())
+    return units
@@ -0,0 +1,110 @@
+# managers/Visa_Fleet_Manager/manager_visa_simulated_instrument.py
+#
+# An in-process stand-in for a PyVISA instrument session, used to benchmark the fleet command path
+# without hardware.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.180000.1
+
+import threading
+import time
+
+current_version = "20261016.180000.1"
+current_version_hash = 20261016 * 180000 * 1
+
+
+class SimulatedScpiInstrument:
+    """
+    Behaves like an opened pyvisa resource: `write`, `query`, `close` and the usual
+    timeout/termination attributes. Every program message costs `round_trip_s` plus
+    `per_command_s` for each ';'-separated command in it, so batching and priority effects
+    show up in the timings the same way they would on a LAN or GPIB link.
+    Queries answer `*IDN?` with `idn` and everything else with `query_response`; the trace
+    reads (`query_binary_values`, `query_ascii_values`) return `trace_points` points.
+    """
+
+    # Initializes the simulated instrument.
+    # Inputs:
+    #     round_trip_s (float, optional): Fixed cost of one program message.
+    #     per_command_s (float, optional): Extra cost per command in the message.
+    #     idn (str, optional): The *IDN? response.
+    #     query_response (str, optional): The response to any other query.
+    #     trace_points (int, optional): The length of a simulated trace.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        round_trip_s: float = 0.004,
+        per_command_s: float = 0.0005,
+        idn: str = "Keysight Technologies,N9020A,SIM00001,A.01.01",
+        query_response: str = "+1.00000000E+009",
+        trace_points: int = 1001,
+    ):
+        self.round_trip_s = round_trip_s
+        self.per_command_s = per_command_s
+        self.idn = idn
+        self.query_response = query_response
+        self.trace_points = trace_points
+        self.timeout = 5000
+        self.read_termination = "\n"
+        self.write_termination = "\n"
+        self.query_delay = 0.0
+        self._lock = threading.Lock()  # One message on the wire at a time, like a real session
+        self.messages = []
+
+    def write(self, message: str) -> int:
+        self._transact(message, 0.0)
+        return len(message)
+
+    def query(self, message: str) -> str:
+        units = self._transact(message, self.query_delay)
+        responses = [
+            self.idn if unit.strip().upper() == "*IDN?" else self.query_response
+            for unit in units
+            if unit.strip().endswith("?")
+        ]
+        return ";".join(responses)
+
+    def query_binary_values(self, message: str, datatype="f", is_big_endian=False, container=list):
+        # A binary block costs roughly 4 bytes per point on the wire; the transaction time models
+        # the message, not the payload size.
+        self._transact(message, self.query_delay)
+        return self._contain(self._trace(), container)
+
+    def query_ascii_values(self, message: str, container=list):
+        self._transact(message, self.query_delay)
+        return self._contain(self._trace(), container)
+
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _transact(self, message: str, delay_s: float) -> list:
+        units = message.split(";")
+        with self._lock:
+            self.messages.append(message)
+            time.sleep(self.round_trip_s + self.per_command_s * len(units) + delay_s)
+        return units
+
+    def _trace(self) -> list:
+        return [-90.0 + (i % 50) * 0.1 for i in range(self.trace_points)]
+
+    # Like pyvisa, container=numpy.ndarray means "a NumPy array", not the ndarray(shape) constructor.
+    @staticmethod
+    def _contain(values: list, container):
+        if getattr(container, "__name__", "") == "ndarray":
+            import numpy as np
+
+            return np.asarray(values)
+        return container(values)
@@ -60,6 +60,109 @@ class VisaFleetSupervisor:
         self.resource_manager = pyvisa.ResourceManager("@py")
 
         self.scan_lock = threading.Lock()
+        # Guards instrument_inventory: scan results stream in while connection threads update it
+        self.inventory_lock = threading.RLock()
+        # resource_string -> device identifier for devices re-validated by warm_start();
+        # the following full scan reuses these instead of probing them again.
+        self._validated_resources = {}
+
+    def warm_start(self, known_inventory):
+        """
+        Re-validates the devices from the last saved inventory before any discovery runs.
+
+        Each known resource string gets one quick reconnect + *IDN? probe. Devices that still
+        answer with the same model and serial are put into the inventory (and get proxies)
+        immediately, so start-up only waits for the known fleet rather than the whole
+        USB/subnet/gateway sweep. A resource that now answers as a different instrument is
+        dropped here and probed again by the full discovery.
+
+        Args:
+            known_inventory (list): Flat device entries, as loaded by VisaJsonBuilder.
+
+        Returns:
+            int: The number of known devices that answered.
+        """
+        known_by_resource = {}
+        for entry in known_inventory or []:
+            resource = manager_visa_Search._clean_string_for_display(
+                entry.get("resource_string", "")
+            )
+            if resource and resource != "N/A":
+                known_by_resource[resource] = entry
+        if not known_by_resource:
+            debug_logger(
+                "💳 ℹ️ FleetSupervisor: No known devices to warm start from.",
+                **_get_log_args(),
+            )
+            return 0
+
+        if not self.scan_lock.acquire(blocking=False):
+            debug_logger(
+                "💳 ℹ️ FleetSupervisor: Scan already in progress. Skipping warm start.",
+                **_get_log_args(),
+            )
+            return 0
+
+        try:
+            from managers.configini.config_reader import Config
+
+            app_constants = Config.get_instance()
+
+            debug_logger(
+                f"💳 🔥 FleetSupervisor: Warm start, re-validating {len(known_by_resource)} known devices...",
+                **_get_log_args(),
+            )
+            targets = [
+                {"Type": entry.get("type", "KNOWN"), "Resource": resource}
+                for resource, entry in known_by_resource.items()
+            ]
+
+            def _on_known_device_probed(device_identifier, device_entry):
+                if device_entry.get("status") != "Active":
+                    return  # Left for the full discovery to decide
+                known = known_by_resource.get(device_entry.get("resource_string"), {})
+                if known.get("serial_number") not in (
+                    None,
+                    device_entry.get("serial_number"),
+                ) or known.get("model") not in (None, device_entry.get("model")):
+                    debug_logger(
+                        f"💳 🔄 FleetSupervisor: {device_entry.get('resource_string')} now answers as {device_entry.get('model')} #{device_entry.get('serial_number')} (was {known.get('model')} #{known.get('serial_number')}). Leaving it for full discovery.",
+                        **_get_log_args(),
+                    )
+                    return
+                self._validated_resources[device_entry["resource_string"]] = (
+                    device_identifier
+                )
+                self._on_device_probed(device_identifier, device_entry)
+
+            manager_visa_Search.probe_devices(
+                self.resource_manager,
+                targets,
+                on_result=_on_known_device_probed,
+                **self._probe_settings(app_constants),
+            )
+
+            debug_logger(
+                f"💳 🔥 FleetSupervisor: Warm start complete. {len(self._validated_resources)}/{len(known_by_resource)} known devices answered.",
+                **_get_log_args(),
+            )
+            # Published only: saving this partial fleet would forget the devices that have
+            # not answered yet. The full scan that follows saves the inventory.
+            self._emit_inventory_update()
+            return len(self._validated_resources)
+        finally:
+            self.scan_lock.release()
+
+    def _probe_settings(self, app_constants):
+        """Returns the probe_devices concurrency/deadline keyword arguments from config.ini."""
+        return {
+            "max_workers": app_constants.PROBE_MAX_WORKERS,
+            "interface_limits": {
+                "GATEWAY": app_constants.PROBE_GATEWAY_CONCURRENCY,
+                "USB": app_constants.PROBE_USB_CONCURRENCY,
+            },
+            "deadline_s": app_constants.PROBE_DEADLINE_S,
+        }
 
     def scan_and_manage_fleet(self):
         """
@@ -107,7 +210,12 @@ class VisaFleetSupervisor:
             # 2. Discover IP devices (Dedicated and Gateways)
             # We discover both, then conditionally add them to the target list.
             debug_logger("💳 🔍 Discovering potential IP devices...", **_get_log_args())
-            dedicated_ips, gateway_ips = manager_visa_IP.discover_ip_devices()
+            dedicated_ips, gateway_ips = manager_visa_IP.discover_ip_devices(
+                subnets=app_constants.IP_SCAN_SUBNETS,
+                hosts=app_constants.IP_SCAN_HOSTS,
+                max_concurrency=app_constants.IP_SCAN_CONCURRENCY,
+                connect_timeout=app_constants.IP_CONNECT_TIMEOUT_S,
+            )
 
             # Conditionally add DEDICATED (Direct IP) devices
             if app_constants.SCAN_IP_DIRECT:
@@ -150,92 +258,57 @@ class VisaFleetSupervisor:
                 f"💳 🔍 Final list of potential targets ({len(potential_targets)}): {potential_targets}",
                 **_get_log_args(),
             )
-            debug_logger(
-                f"   ⏳ Pausing 2s for settling after discovery phases...",
-                **_get_log_args(),
-            )
-            time.sleep(2.0)
-
             # 4. PROBE INSTRUMENTS
+            # Probes run in parallel; each result is folded into the inventory (and a proxy
+            # spawned) as soon as it arrives, so the GUI sees devices while slow or dead
+            # addresses are still timing out.
+            # Devices re-validated by warm_start() a moment ago are carried over, not re-probed.
+            validated = self._validated_resources
+            self._validated_resources = {}
+            carried_over = set()
+            targets_to_probe = []
+            for target in potential_targets:
+                resource = manager_visa_Search._clean_string_for_display(
+                    target["Resource"]
+                )
+                if resource in validated:
+                    carried_over.add(validated[resource])
+                else:
+                    targets_to_probe.append(target)
+            if carried_over:
+                debug_logger(
+                    f"💳 🔥 Skipping {len(carried_over)} devices already validated by warm start.",
+                    **_get_log_args(),
+                )
+
+            with self.inventory_lock:
+                previous_inventory = {
+                    serial: dict(entry)
+                    for serial, entry in self.instrument_inventory.items()
+                }
+
             debug_logger("💳 🔍 Probing instruments...", **_get_log_args())
 
-            # Use the manager_visa_Search module to probe all potential targets
             probed_devices_collection = manager_visa_Search.probe_devices(
-                self.resource_manager, potential_targets
+                self.resource_manager,
+                targets_to_probe,
+                on_result=self._on_device_probed,
+                **self._probe_settings(app_constants),
             )
             debug_logger(
                 f"💳 🔍 Probed devices collection: {probed_devices_collection}",
                 **_get_log_args(),
             )
 
-            current_scanned_serials = set(
-                probed_devices_collection.keys()
-            )  # All successfully probed devices
-
-            # Update self.instrument_inventory with probed details and manage proxies
-            self.instrument_inventory.clear()
-            for device_identifier, device_entry in probed_devices_collection.items():
-                self.instrument_inventory[device_identifier] = device_entry
-
-                # If the device is active, ensure a proxy is running
-                if device_entry.get("status") == "Active":
-                    if device_identifier not in self.device_proxies:
-                        debug_logger(
-                            f"💳 ✨ FleetSupervisor: New active device detected: {device_identifier}",
-                            **_get_log_args(),
-                        )
-
-                        # Extract details for proxy creation
-                        resource_name = device_entry.get("resource_string", "N/A")
-                        model = device_entry.get("model", "Unknown Model")
-                        manufacturer = device_entry.get(
-                            "manufacturer", "Unknown Manufacturer"
-                        )
-                        idn_string = device_entry.get("idn_string", "")
-                        # Use the robust parse_idn_string to get full idn_details from the idn_string
-                        idn_details = parse_idn_string(
-                            idn_string
-                        )  # Re-enabled parsing from dedicated module
-
-                        proxy = VisaProxyFleet(
-                            manager_ref=self.manager,
-                            device_serial=device_identifier,
-                            resource_name=resource_name,
-                            instrument_model=model,
-                            manufacturer=manufacturer,
-                        )
-                        self.device_proxies[device_identifier] = proxy
-
-                        connection_thread = threading.Thread(
-                            target=self._connect_and_setup_device,
-                            args=(proxy, resource_name, idn_details, idn_string),
-                            daemon=True,
-                        )
-                        connection_thread.start()
-                    else:
-                        # Device already known and active, just ensure its resource string is up-to-date in proxy
-                        existing_proxy = self.device_proxies[device_identifier]
-                        if existing_proxy.resource_name != device_entry.get(
-                            "resource_string"
-                        ):
-                            debug_logger(
-                                f"💳 🔄 FleetSupervisor: Resource string updated for {device_identifier}. Old: {existing_proxy.resource_name}, New: {device_entry.get('resource_string')}. Updating proxy.",
-                                **_get_log_args(),
-                            )
-                            existing_proxy.resource_name = device_entry.get(
-                                "resource_string"
-                            )  # Update resource name in proxy
-                else:  # Device is unresponsive or not active
-                    if device_identifier in self.device_proxies:
-                        debug_logger(
-                            f"💳 ℹ️ FleetSupervisor: Active device {device_identifier} is now unresponsive. Shutting down its proxy.",
-                            **_get_log_args(),
-                        )
-                        proxy_to_remove = self.device_proxies.pop(device_identifier)
-                        if device_identifier in self.device_drivers:
-                            del self.device_drivers[device_identifier]
-                        proxy_to_remove.shutdown()
-                        del proxy_to_remove
+            current_scanned_serials = (
+                set(probed_devices_collection.keys()) | carried_over
+            )  # Every target seen in this scan, responsive or not
+            self._log_inventory_diff(previous_inventory, current_scanned_serials)
+
+            # Drop inventory entries left over from earlier scans
+            with self.inventory_lock:
+                for stale_serial in set(self.instrument_inventory) - current_scanned_serials:
+                    del self.instrument_inventory[stale_serial]
 
             # Clean up proxies for devices that are no longer found at all
             managed_serials = set(self.device_proxies.keys())
@@ -246,29 +319,126 @@ class VisaFleetSupervisor:
                     **_get_log_args(),
                 )
                 proxy_to_remove = self.device_proxies.pop(serial)
-                driver_to_remove = self.device_drivers.pop(serial, None)
-
-                if driver_to_remove:
-                    del driver_to_remove
-
                 proxy_to_remove.shutdown()
                 del proxy_to_remove
 
-                if serial in self.instrument_inventory:
-                    del self.instrument_inventory[
-                        serial
-                    ]  # Remove from inventory if completely gone
-
             debug_logger(
                 f"💳 ✅ FleetSupervisor: Scan and management cycle complete. {len(self.device_proxies)} proxies active.",
                 **_get_log_args(),
             )
-            self._emit_inventory_update()
-            return len(probed_devices_collection)  # Return the number of probed devices
+            self._emit_inventory_update(persist=True)
+            return len(current_scanned_serials)  # Return the number of probed devices
 
         finally:
             self.scan_lock.release()
 
+    def _log_inventory_diff(self, previous_inventory, current_serials):
+        """
+        Logs which devices a full scan added, removed or moved compared to what was
+        in the inventory before it started (e.g. the warm-start result).
+
+        Returns:
+            tuple: (added, removed, changed) sorted lists of device identifiers.
+        """
+        with self.inventory_lock:
+            current = {
+                serial: self.instrument_inventory.get(serial, {})
+                for serial in current_serials
+            }
+        added = sorted(set(current) - set(previous_inventory))
+        removed = sorted(set(previous_inventory) - set(current))
+        changed = sorted(
+            serial
+            for serial in set(current) & set(previous_inventory)
+            if (
+                current[serial].get("resource_string"),
+                current[serial].get("status"),
+            )
+            != (
+                previous_inventory[serial].get("resource_string"),
+                previous_inventory[serial].get("status"),
+            )
+        )
+        debug_logger(
+            f"💳 📊 FleetSupervisor: Scan diff: +{len(added)} {added} / -{len(removed)} {removed} / ~{len(changed)} {changed}",
+            **_get_log_args(),
+        )
+        return added, removed, changed
+
+    def _on_device_probed(self, device_identifier, device_entry):
+        """
+        Streaming callback from manager_visa_Search.probe_devices. Runs on the scan thread
+        once per probed target: records the entry, manages its proxy and publishes the
+        inventory right away. Saving it is left to the end of the scan.
+        """
+        with self.inventory_lock:
+            self.instrument_inventory[device_identifier] = device_entry
+        self._manage_proxy_for_device(device_identifier, device_entry)
+        self._emit_inventory_update()
+
+    def _manage_proxy_for_device(self, device_identifier, device_entry):
+        """
+        Ensures an active device has a running proxy and an unresponsive one does not.
+        """
+        # If the device is active, ensure a proxy is running
+        if device_entry.get("status") == "Active":
+            if device_identifier not in self.device_proxies:
+                debug_logger(
+                    f"💳 ✨ FleetSupervisor: New active device detected: {device_identifier}",
+                    **_get_log_args(),
+                )
+
+                # Extract details for proxy creation
+                resource_name = device_entry.get("resource_string", "N/A")
+                model = device_entry.get("model", "Unknown Model")
+                manufacturer = device_entry.get("manufacturer", "Unknown Manufacturer")
+                idn_string = device_entry.get("idn_string", "")
+                # Use the robust parse_idn_string to get full idn_details from the idn_string
+                idn_details = parse_idn_string(
+                    idn_string
+                )  # Re-enabled parsing from dedicated module
+
+                from managers.configini.config_reader import Config
+
+                app_constants = Config.get_instance()
+                proxy = VisaProxyFleet(
+                    manager_ref=self.manager,
+                    device_serial=device_identifier,
+                    resource_name=resource_name,
+                    instrument_model=model,
+                    manufacturer=manufacturer,
+                    interactive_queue_depth=app_constants.FLEET_INTERACTIVE_QUEUE_DEPTH,
+                    polling_queue_depth=app_constants.FLEET_POLLING_QUEUE_DEPTH,
+                )
+                self.device_proxies[device_identifier] = proxy
+
+                connection_thread = threading.Thread(
+                    target=self._connect_and_setup_device,
+                    args=(proxy, resource_name, idn_details, idn_string),
+                    daemon=True,
+                )
+                connection_thread.start()
+            else:
+                # Device already known and active, just ensure its resource string is up-to-date in proxy
+                existing_proxy = self.device_proxies[device_identifier]
+                if existing_proxy.resource_name != device_entry.get("resource_string"):
+                    debug_logger(
+                        f"💳 🔄 FleetSupervisor: Resource string updated for {device_identifier}. Old: {existing_proxy.resource_name}, New: {device_entry.get('resource_string')}. Updating proxy.",
+                        **_get_log_args(),
+                    )
+                    existing_proxy.resource_name = device_entry.get(
+                        "resource_string"
+                    )  # Update resource name in proxy
+        else:  # Device is unresponsive or not active
+            if device_identifier in self.device_proxies:
+                debug_logger(
+                    f"💳 ℹ️ FleetSupervisor: Active device {device_identifier} is now unresponsive. Shutting down its proxy.",
+                    **_get_log_args(),
+                )
+                proxy_to_remove = self.device_proxies.pop(device_identifier)
+                proxy_to_remove.shutdown()
+                del proxy_to_remove
+
     def _connect_and_setup_device(
         self,
         proxy_instance: VisaProxyFleet,
@@ -297,7 +467,7 @@ class VisaFleetSupervisor:
             )  # Use consistent timeout from search module
             inst.read_termination = "\n"
             inst.write_termination = "\n"
-            inst.query_delay = 0.1
+            inst.query_delay = proxy_instance.batch_limits["query_delay_s"]
 
             proxy_instance.set_instrument_instance(inst)
 
@@ -352,13 +522,18 @@ class VisaFleetSupervisor:
             if device_serial in self.instrument_inventory:
                 self.instrument_inventory[device_serial]["status"] = "CONNECTION_FAILED"
         finally:
-            self._emit_inventory_update()
+            # While a scan runs its final update saves this status; afterwards save it here
+            self._emit_inventory_update(persist=not self.scan_lock.locked())
 
-    def _emit_inventory_update(self):
-        """Compiles inventory list and sends it to the Manager."""
-        inventory_list = list(self.instrument_inventory.values())
+    def _emit_inventory_update(self, persist=False):
+        """
+        Compiles inventory list and sends it to the Manager. `persist=True` also has the
+        Manager save it; streamed updates are only published.
+        """
+        with self.inventory_lock:
+            inventory_list = list(self.instrument_inventory.values())
 
-        self.manager._notify_inventory(inventory_list)
+        self.manager._notify_inventory(inventory_list, persist=persist)
         debug_logger(
             f"💳 📡⬆️ FleetSupervisor: Emitted fleet inventory ({len(inventory_list)} devices) to manager.",
             **_get_log_args(),
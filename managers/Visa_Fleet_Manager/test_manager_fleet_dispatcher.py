@@ -0,0 +1,56 @@
+import unittest
+import os
+import sys
+import threading
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+import orjson
+
+from managers.Visa_Fleet_Manager.manager_fleet_dispatcher import FleetCommandDispatcher, RX_OUTBOX_TOPIC
+
+
+class _FullFleet:
+    """A fleet with one device whose interactive lane is always full."""
+
+    def __init__(self):
+        self.fleet_supervisor = type(
+            "Supervisor",
+            (),
+            {
+                "device_proxies": {"SN1": object()},
+                "instrument_inventory": {"SN1": {"model": "N9340B"}},
+                "inventory_lock": threading.RLock(),
+            },
+        )()
+        self.cb_inventory = self.cb_status = None
+        self.enqueue_calls = []
+
+    def set_callbacks(self, **callbacks):
+        pass
+
+    def enqueue_command(self, serial, command, **kwargs):
+        self.enqueue_calls.append(kwargs)
+        return False
+
+
+class TestFleetCommandDispatcher(unittest.TestCase):
+
+    def test_full_queue_is_rejected_without_blocking(self):
+        fleet = _FullFleet()
+        published = []
+        dispatcher = FleetCommandDispatcher(fleet, publish_func=lambda topic, payload: published.append((topic, orjson.loads(payload))))
+
+        self.assertFalse(dispatcher.dispatch({"command": "FREQ:CENT?", "query": True, "correlation_id": "c1", "serial": "SN1"}))
+        self.assertFalse(fleet.enqueue_calls[0]["block"])
+        topic, reply = published[0]
+        self.assertEqual(topic, RX_OUTBOX_TOPIC)
+        self.assertEqual((reply["status"], reply["correlation_id"]), ("rejected", "c1"))
+        self.assertEqual(dispatcher.stats["rejected"], 1)
+        self.assertFalse(any(dispatcher._inflight_queries.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
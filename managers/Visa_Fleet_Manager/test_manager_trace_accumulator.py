@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    import numpy as np
+    from managers.Visa_Fleet_Manager.manager_trace_accumulator import (
+        TraceAccumulator,
+        TraceAccumulatorManager,
+    )
+    from workers.mqtt.mqtt_trace_payload import (
+        decode_trace_payload,
+        encode_trace_payload,
+    )
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestTraceAccumulator(unittest.TestCase):
+
+    def setUp(self):
+        self.sweeps = np.random.default_rng(5).normal(-80.0, 5.0, (23, 64)).astype(np.float32)
+
+    def test_holds_and_averages_match_direct_computation(self):
+        accumulator = TraceAccumulator(64, average_count=5, ema_alpha=0.25)
+        expected_average = self.sweeps[0].astype(float)
+        for sweep in self.sweeps:
+            accumulator.update(sweep)
+        for sweep in self.sweeps[1:]:
+            expected_average += 0.25 * (sweep - expected_average)
+        np.testing.assert_allclose(accumulator.max_hold, self.sweeps.max(axis=0))
+        np.testing.assert_allclose(accumulator.min_hold, self.sweeps.min(axis=0))
+        np.testing.assert_allclose(accumulator.average, expected_average)
+        np.testing.assert_allclose(accumulator.sweep_average, self.sweeps[-5:].astype(float).mean(axis=0))
+
+    def test_persistence_decays_older_sweeps(self):
+        accumulator = TraceAccumulator(2, persistence_decay=0.5, persistence_levels=10, amp_min=-100, amp_max=0)
+        for _ in range(40):  # enough to pass the lazy-decay rescale
+            accumulator.update(np.array([-95.0, -5.0]))
+        accumulator.update(np.array([-50.0, -5.0]))
+        hits = accumulator.persistence_map()
+        self.assertAlmostEqual(float(hits[5, 0]), 1.0, places=5)
+        self.assertAlmostEqual(float(hits[0, 0]), 1.0, places=4)  # 0.5 + 0.25 + ...
+        self.assertAlmostEqual(float(hits[9, 1]), 2.0, places=4)
+
+    def test_reset_topic_clears_only_the_named_kind(self):
+        published = {}
+        manager = TraceAccumulatorManager(publish_func=published.__setitem__, persistence_every=0)
+        for sweep in self.sweeps[:3]:
+            manager._on_trace_message("OPEN-AIR/Proxy/Rx_Trace/SN1", encode_trace_payload(sweep, start_hz=1e6))
+        manager._on_reset_message("OPEN-AIR/Traces/SN1/Reset", b'"max_hold"')
+        manager._on_trace_message("OPEN-AIR/Proxy/Rx_Trace/SN1", encode_trace_payload(self.sweeps[3], start_hz=1e6))
+
+        metadata, max_hold = decode_trace_payload(published["OPEN-AIR/Traces/SN1/max_hold"])
+        self.assertEqual(metadata["start_hz"], 1e6)
+        np.testing.assert_array_equal(max_hold, self.sweeps[3])
+        _, min_hold = decode_trace_payload(published["OPEN-AIR/Traces/SN1/min_hold"])
+        np.testing.assert_array_equal(min_hold, self.sweeps[:4].min(axis=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
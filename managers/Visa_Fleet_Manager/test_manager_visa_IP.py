@@ -0,0 +1,109 @@
+
+import unittest
+import os
+import sys
+import socket
+import threading
+import time
+import http.server
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from managers.Visa_Fleet_Manager import manager_visa_IP
+
+
+def _listen():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(16)
+    return sock
+
+
+class _GatewayPage(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b"<html>Agilent E5810 LAN/GPIB Gateway</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _SlowBodyGatewayPage(_GatewayPage):
+    """Sends the headers and the body in separate writes, 50 ms apart."""
+
+    def do_GET(self):
+        body = b"<html>Agilent E5810 LAN/GPIB Gateway</html>"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.flush()
+        time.sleep(0.05)
+        self.wfile.write(body)
+
+
+class TestIpSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.listeners = []
+
+    def tearDown(self):
+        for listener in self.listeners:
+            listener.close()
+
+    def _port(self):
+        listener = _listen()
+        self.listeners.append(listener)
+        return listener.getsockname()[1]
+
+    def test_expand_scan_targets(self):
+        targets = manager_visa_IP._expand_scan_targets(
+            "10.0.0.0/30, 10.0.1.7", "10.0.0.9 10.0.0.1", exclude="10.0.0.2"
+        )
+        self.assertEqual(targets, ["10.0.0.9", "10.0.0.1", "10.0.1.7"])
+        self.assertEqual(len(manager_visa_IP._expand_scan_targets(["192.168.5.0/24"])), 254)
+        self.assertEqual(manager_visa_IP._expand_scan_targets("not-a-subnet"), [])
+
+    def test_scpi_listener_is_dedicated(self):
+        scpi_port = self._port()
+        closed_port = self._port()
+        self.listeners.pop().close()
+
+        found = []
+        results = manager_visa_IP.sweep_hosts(
+            ["127.0.0.1", "127.0.0.2"],
+            on_result=lambda ip, type_: found.append((ip, type_)),
+            ports=(closed_port, scpi_port, closed_port),
+        )
+        self.assertEqual(results, [("127.0.0.1", "DEDICATED")])
+        self.assertEqual(found, results)
+
+    def test_vxi11_listener_with_e5810_page_is_gateway(self):
+        self._assert_gateway(_GatewayPage)
+
+    def test_gateway_body_arriving_after_the_headers_is_read(self):
+        self._assert_gateway(_SlowBodyGatewayPage)
+
+    def _assert_gateway(self, handler):
+        vxi11_port = self._port()
+        closed_port = self._port()
+        self.listeners.pop().close()
+        server = http.server.HTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            results = manager_visa_IP.sweep_hosts(
+                ["127.0.0.1"],
+                ports=(vxi11_port, closed_port, server.server_address[1]),
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(results, [("127.0.0.1", "GATEWAY")])
+
+
+if __name__ == '__main__':
+    unittest.main()
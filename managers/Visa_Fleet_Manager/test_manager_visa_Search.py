@@ -0,0 +1,123 @@
+import unittest
+import os
+import sys
+import threading
+import time
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from managers.Visa_Fleet_Manager.manager_visa_Search import _interface_key, probe_devices
+
+    SEARCH_AVAILABLE = True
+except ImportError:  # pyvisa is not installed
+    SEARCH_AVAILABLE = False
+
+
+class _StubInstrument:
+    def __init__(self, rm, resource):
+        self.rm = rm
+        self.resource = resource
+        self.timeout = None
+
+    def query(self, command):
+        delay_s = self.rm.delays_s.get(self.resource, 0.02)
+        if delay_s * 1000 > self.timeout:
+            time.sleep(self.timeout / 1000)
+            raise TimeoutError("VI_ERROR_TMO")
+        time.sleep(delay_s)
+        return f"Keysight,N9340B,{self.resource.split('::')[-2]},A.01\n"
+
+    def close(self):
+        with self.rm.lock:
+            self.rm.active[_interface_key(self.resource)] -= 1
+        if self.resource in self.rm.finished:
+            self.rm.finished[self.resource].set()
+
+
+class _StubResourceManager:
+    """Answers *IDN? after a per-resource delay and records concurrent sessions per link."""
+
+    def __init__(self, delays_s=None):
+        self.delays_s = delays_s or {}
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.finished = {}
+
+    def open_resource(self, resource, open_timeout=None):
+        key = _interface_key(resource)
+        with self.lock:
+            self.active[key] = self.active.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+        return _StubInstrument(self, resource)
+
+
+def _target(resource):
+    return {"Type": "TEST", "Resource": resource}
+
+
+@unittest.skipUnless(SEARCH_AVAILABLE, "pyvisa is not installed")
+class TestProbeDevices(unittest.TestCase):
+
+    def test_interface_limits_are_never_exceeded(self):
+        rm = _StubResourceManager()
+        targets = [_target(f"TCPIP0::10.0.0.5::gpib0,{address}::INSTR") for address in range(1, 7)]
+        targets += [_target(f"USB0::0x0957::0xFFEF::SN{i}::INSTR") for i in range(6)]
+        devices = probe_devices(rm, targets, max_workers=8, interface_limits={"GATEWAY": 1, "USB": 2})
+
+        self.assertEqual(len(devices), 12)
+        self.assertEqual(rm.peak[("GATEWAY", "10.0.0.5")], 1)
+        self.assertEqual(rm.peak[("USB",)], 2)
+
+    def test_resource_past_its_deadline_is_reported_and_skipped(self):
+        slow = "TCPIP0::10.0.0.9::SLOW::INSTR"
+        rm = _StubResourceManager({slow: 5.0})
+        results = {}
+        started = time.monotonic()
+        devices = probe_devices(
+            rm,
+            [_target(slow), _target("TCPIP0::10.0.0.7::FAST::INSTR")],
+            on_result=lambda identifier, entry: results.__setitem__(entry["resource_string"], entry),
+            deadline_s=0.2,
+        )
+
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(len(devices), 2)
+        self.assertEqual(results[slow]["status"], "Unresponsive")
+        self.assertEqual(results["TCPIP0::10.0.0.7::FAST::INSTR"]["status"], "Active")
+
+    def test_on_result_fires_before_the_pool_finishes(self):
+        slow = "TCPIP0::10.0.0.9::SLOW::INSTR"
+        rm = _StubResourceManager({slow: 0.5})
+        rm.finished[slow] = threading.Event()
+        slow_done_at_callback = {}
+
+        def on_result(identifier, entry):
+            slow_done_at_callback[entry["resource_string"]] = rm.finished[slow].is_set()
+
+        probe_devices(rm, [_target(slow), _target("TCPIP0::10.0.0.7::FAST::INSTR")], on_result=on_result)
+
+        self.assertFalse(slow_done_at_callback["TCPIP0::10.0.0.7::FAST::INSTR"])
+        self.assertTrue(slow_done_at_callback[slow])
+
+    def test_duplicate_suffixes_follow_target_order(self):
+        first = "TCPIP0::10.0.0.9::DUP::INSTR"
+        second = "TCPIP0::10.0.0.7::DUP::INSTR"
+        rm = _StubResourceManager({first: 0.3})  # The second target answers first
+        reported = {}
+        devices = probe_devices(
+            rm,
+            [_target(first), _target(second)],
+            on_result=lambda identifier, entry: reported.__setitem__(identifier, entry["resource_string"]),
+        )
+
+        expected = {"DUP": first, "DUP_1": second}
+        self.assertEqual({identifier: entry["resource_string"] for identifier, entry in devices.items()}, expected)
+        self.assertEqual(reported, expected)  # The last report per identifier is the final one
+
+
+if __name__ == '__main__':
+    unittest.main()
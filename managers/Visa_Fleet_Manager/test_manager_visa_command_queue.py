@@ -0,0 +1,57 @@
+
+import unittest
+import os
+import sys
+import queue
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from managers.Visa_Fleet_Manager.manager_visa_command_queue import (
+    DeviceCommandQueue,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_POLLING,
+)
+
+
+def _cmd(name, priority):
+    return {"command": name, "priority": priority}
+
+
+class TestDeviceCommandQueue(unittest.TestCase):
+
+    def test_interactive_preempts_polling(self):
+        q = DeviceCommandQueue()
+        q.put(_cmd("poll-1", PRIORITY_POLLING))
+        q.put(_cmd("poll-2", "polling"))
+        q.put(_cmd("press", "interactive"))
+        self.assertEqual([q.get_nowait()["command"] for _ in range(3)], ["press", "poll-1", "poll-2"])
+        self.assertRaises(queue.Empty, q.get_nowait)
+
+    def test_polling_drops_oldest_and_keeps_task_accounting(self):
+        dropped = []
+        q = DeviceCommandQueue(polling_depth=2, on_drop=dropped.append)
+        for i in range(4):
+            q.put(_cmd(f"poll-{i}", PRIORITY_POLLING))
+        self.assertEqual([d["command"] for d in dropped], ["poll-0", "poll-1"])
+        self.assertEqual(q.dropped, 2)
+        for _ in range(2):
+            q.get_nowait()
+            q.task_done()
+        q.join()  # Returns at once: dropped commands count as finished
+
+    def test_interactive_backpressure(self):
+        q = DeviceCommandQueue(interactive_depth=1)
+        q.put(_cmd("press-1", PRIORITY_INTERACTIVE))
+        self.assertRaises(queue.Full, q.put, _cmd("press-2", PRIORITY_INTERACTIVE), timeout=0.01)
+
+    def test_exit_signal_is_served_first(self):
+        q = DeviceCommandQueue()
+        q.put(_cmd("press", PRIORITY_INTERACTIVE))
+        q.put(None)
+        self.assertIsNone(q.get(timeout=0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
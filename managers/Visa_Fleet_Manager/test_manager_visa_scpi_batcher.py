@@ -0,0 +1,40 @@
+
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from managers.Visa_Fleet_Manager import manager_visa_scpi_batcher as batcher
+
+
+def _cmd(command, query=False):
+    return {"command": command, "query": query, "correlation_id": command}
+
+
+class TestScpiBatcher(unittest.TestCase):
+
+    def test_common_and_compound_commands_travel_alone(self):
+        commands = [_cmd("FREQ:CENT 1E9"), _cmd("*RST"), _cmd("BAND 1E6"), _cmd("BAND?", True),
+                    _cmd("INIT;*WAI"), _cmd("DISP:ENAB <state>")]
+        batches = batcher.plan_batches(commands, max_commands=8, max_chars=240)
+        self.assertEqual(
+            [[info["command"] for info in batch] for batch in batches],
+            [["FREQ:CENT 1E9"], ["*RST"], ["BAND 1E6", "BAND?"], ["INIT;*WAI"], ["DISP:ENAB <state>"]],
+        )
+        self.assertEqual(batcher.join_batch(batches[2]), ":BAND 1E6;:BAND?")
+
+    def test_limits_split_batches(self):
+        commands = [_cmd(f"SENS:FREQ:SPAN {i}") for i in range(5)]
+        self.assertEqual([len(b) for b in batcher.plan_batches(commands, 2, 240)], [2, 2, 1])
+        self.assertEqual([len(b) for b in batcher.plan_batches(commands, 8, 40)], [2, 2, 1])
+        self.assertEqual([len(b) for b in batcher.plan_batches(commands, 1, 240)], [1] * 5)
+
+    def test_split_response_respects_quotes(self):
+        self.assertEqual(batcher.split_response('+1.0E9;"a;b";OFF\n'), ["+1.0E9", '"a;b"', "OFF"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from managers.Visa_Fleet_Manager import manager_visa_IP, manager_visa_USB
+    from managers.Visa_Fleet_Manager.manager_visa_supervisor import VisaFleetSupervisor
+
+    SUPERVISOR_AVAILABLE = True
+except ImportError:  # pyvisa is not installed
+    SUPERVISOR_AVAILABLE = False
+
+USB_A = "USB0::0x0957::0xFFEF::SNA::INSTR"
+USB_B = "USB0::0x0957::0xFFEF::SNB::INSTR"
+USB_GONE = "USB0::0x0957::0xFFEF::SNG::INSTR"
+
+
+class _StubInstrument:
+    def __init__(self, idn):
+        self.idn = idn
+
+    def query(self, command):
+        return self.idn
+
+    def close(self):
+        pass
+
+
+class _StubResourceManager:
+    """Answers *IDN? with a fixed string per resource; unknown resources time out."""
+
+    def __init__(self, idns):
+        self.idns = idns
+
+    def open_resource(self, resource, open_timeout=None):
+        if resource not in self.idns:
+            raise TimeoutError("VI_ERROR_TMO")
+        return _StubInstrument(self.idns[resource])
+
+
+class _FakeManager:
+    def __init__(self):
+        self.inventories = []
+        self.persisted = []
+
+    def _notify_inventory(self, inventory, persist=True):
+        self.inventories.append(inventory)
+        self.persisted.append(persist)
+
+
+def _known(resource, model, serial):
+    return {"type": "LOCAL", "resource_string": resource, "model": model, "serial_number": serial}
+
+
+@unittest.skipUnless(SUPERVISOR_AVAILABLE, "pyvisa is not installed")
+class TestWarmStart(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = _FakeManager()
+        self.supervisor = VisaFleetSupervisor(self.manager)
+        self.supervisor._manage_proxy_for_device = lambda identifier, entry: None  # No proxy threads
+        self.discovery_calls = []
+        self._saved = (manager_visa_USB.discover_usb_devices, manager_visa_IP.discover_ip_devices)
+        manager_visa_USB.discover_usb_devices = lambda *args, **kwargs: self.discovery_calls.append("usb") or []
+        manager_visa_IP.discover_ip_devices = lambda *args, **kwargs: self.discovery_calls.append("ip") or ([], [])
+
+    def tearDown(self):
+        manager_visa_USB.discover_usb_devices, manager_visa_IP.discover_ip_devices = self._saved
+
+    def test_known_devices_are_published_before_discovery(self):
+        self.supervisor.resource_manager = _StubResourceManager(
+            {
+                USB_A: "Keysight Technologies,N9340B,SNA,A.01\n",
+                USB_B: "Keysight Technologies,N9342CN,SN-NEW,A.01\n",  # Another unit on B's port
+            }
+        )
+        answered = self.supervisor.warm_start(
+            [
+                _known(USB_A, "N9340B", "SNA"),
+                _known(USB_B, "N9342CN", "SNB"),
+                _known(USB_GONE, "E4411A", "SNG"),
+            ]
+        )
+
+        self.assertEqual(answered, 1)
+        self.assertEqual(self.discovery_calls, [])
+        published = [entry["serial_number"] for entry in self.manager.inventories[-1]]
+        self.assertEqual(published, ["SNA"])
+        self.assertFalse(any(self.manager.persisted))  # The full scan saves the fleet
+        self.assertEqual(self.supervisor._validated_resources, {USB_A: "SNA"})
+
+    def test_scan_streams_devices_and_saves_once_at_the_end(self):
+        self.supervisor.resource_manager = _StubResourceManager(
+            {
+                USB_A: "Keysight Technologies,N9340B,SNA,A.01\n",
+                USB_B: "Keysight Technologies,N9342CN,SNB,A.01\n",
+            }
+        )
+        manager_visa_USB.discover_usb_devices = lambda *args, **kwargs: [USB_A, USB_B]
+        self.assertEqual(self.supervisor.scan_and_manage_fleet(), 2)
+        self.assertEqual(self.manager.persisted, [False, False, True])
+        self.assertEqual(len(self.manager.inventories[-1]), 2)
+
+    def test_inventory_diff_reports_added_and_removed(self):
+        previous = {
+            "SNA": {"resource_string": USB_A, "status": "Active"},
+            "SNG": {"resource_string": USB_GONE, "status": "Active"},
+        }
+        self.supervisor.instrument_inventory = {
+            "SNA": {"resource_string": USB_B, "status": "Active"},
+            "SNC": {"resource_string": "TCPIP::10.0.0.7::INSTR", "status": "Active"},
+        }
+        added, removed, changed = self.supervisor._log_inventory_diff(previous, {"SNA", "SNC"})
+        self.assertEqual((added, removed, changed), (["SNC"], ["SNG"], ["SNA"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from managers.Visa_Fleet_Manager.visa_proxy_fleet import VisaProxyFleet
+    from managers.Visa_Fleet_Manager.manager_visa_simulated_instrument import SimulatedScpiInstrument
+    PROXY_AVAILABLE = True
+except ImportError:  # pyvisa is not installed
+    PROXY_AVAILABLE = False
+
+
+def _cmd(command, query=False):
+    return {"command": command, "query": query, "correlation_id": command}
+
+
+class _FakeInstrument:
+    """Answers single queries, but fails any batched (';'-joined) query."""
+
+    def __init__(self):
+        self.writes = []
+        self.queries = []
+        self.clears = 0
+
+    def write(self, command):
+        self.writes.append(command)
+
+    def query(self, command):
+        self.queries.append(command)
+        if ";" in command:
+            raise IOError("VI_ERROR_TMO")
+        return "+1.0E6\n"
+
+    def clear(self):
+        self.clears += 1
+
+
+class _FakeManager:
+    def __init__(self):
+        self.responses = []
+        self.errors = []
+        self.traces = []
+
+    def _notify_response(self, serial, response, command, corr_id):
+        self.responses.append((command, response))
+
+    def _notify_error(self, serial, message, command=None):
+        self.errors.append((command, message))
+
+    def _notify_trace(self, serial, values, command, corr_id, span=None):
+        self.traces.append((command, len(values), span))
+
+
+@unittest.skipUnless(PROXY_AVAILABLE, "pyvisa is not installed")
+class TestSendBatchFailure(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = _FakeManager()
+        self.proxy = VisaProxyFleet(self.manager, "SN1", "TCPIP0::sim::INSTR")
+        self.proxy.inst = _FakeInstrument()
+
+    def tearDown(self):
+        self.proxy.inst = None
+        self.proxy.shutdown()
+
+    def test_failed_batch_requeries_but_never_replays_writes(self):
+        batch = [_cmd("FREQ:CENT 1E9"), _cmd("BAND 1E6"), _cmd("BAND?", True)]
+        round_trips, fallback = self.proxy._send_batch(batch)
+
+        self.assertTrue(fallback)
+        self.assertEqual(round_trips, 2)
+        self.assertEqual(self.proxy.inst.clears, 1)
+        self.assertEqual(self.proxy.inst.writes, [])
+        self.assertEqual(self.proxy.inst.queries[-1], "BAND?")
+        self.assertEqual(self.manager.responses, [("BAND?", "+1.0E6")])
+        self.assertEqual([command for command, _ in self.manager.errors], ["FREQ:CENT 1E9", "BAND 1E6"])
+        self.assertTrue(all("unknown" in message for _, message in self.manager.errors))
+
+
+
+@unittest.skipUnless(PROXY_AVAILABLE, "pyvisa is not installed")
+class TestSendTrace(unittest.TestCase):
+
+    def test_trace_carries_its_frequency_span(self):
+        manager = _FakeManager()
+        proxy = VisaProxyFleet(manager, "SN2", "TCPIP0::sim::INSTR", instrument_model="N9340B")
+        proxy.inst = SimulatedScpiInstrument(round_trip_s=0.0, per_command_s=0.0, query_response="+1.5E+009", trace_points=11)
+        try:
+            round_trips = proxy._send_trace(_cmd(":TRACe1:DATA?", True))
+        finally:
+            proxy.inst = None
+            proxy.shutdown()
+
+        self.assertEqual(round_trips, 2)
+        self.assertEqual(manager.traces, [(":TRACe1:DATA?", 11, (1.5e9, 1.5e9))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,8 +68,11 @@ class VisaFleetManager:
         self.cb_response = lambda s, r, c, i: None
         self.cb_error = lambda s, m, c: None
         self.cb_status = lambda s, st: None
+        self.cb_dropped = lambda s, c, i: None
+        self.cb_trace = None  # Without a trace listener, traces are reported as comma-separated text
 
-        self._current_inventory = []  # Internal storage for the latest inventory
+        self._current_inventory = []  # Internal storage for the latest saved inventory
+        self._inventory_save_lock = threading.Lock()
         self._current_inventory = (
             self.json_builder.load_inventory_from_json()
         )  # Load inventory on startup
@@ -85,13 +88,23 @@ class VisaFleetManager:
         )
 
     def set_callbacks(
-        self, on_inventory_update, on_device_response, on_device_error, on_proxy_status
+        self,
+        on_inventory_update,
+        on_device_response,
+        on_device_error,
+        on_proxy_status,
+        on_command_dropped=None,
+        on_trace_response=None,
     ):
         """Link external listeners (like the MQTT Bridge or a GUI) to internal events."""
         self.cb_inventory = on_inventory_update
         self.cb_response = on_device_response
         self.cb_error = on_device_error
         self.cb_status = on_proxy_status
+        if on_command_dropped is not None:
+            self.cb_dropped = on_command_dropped
+        if on_trace_response is not None:
+            self.cb_trace = on_trace_response
 
     def start(self):
         self._running = True
@@ -110,10 +123,26 @@ class VisaFleetManager:
         debug_logger("💳 Core: VisaFleetManager Stopped.", **_get_log_args())
 
     def trigger_scan(self):
-        """Public API to start a scan."""
+        """
+        Public API to start a scan.
+
+        With warm start enabled the last known fleet is re-validated first and the initial
+        scan is reported complete as soon as that finishes; full discovery then runs in the
+        same background thread and only reports what changed. The warm-start result is only
+        published; VISA_FLEET.json is saved once scan_and_manage_fleet() has completed.
+        """
         self.initial_scan_complete_event.clear()
         debug_logger("💳 Core: Scan Triggered via API.", **_get_log_args())
         self._publish_scan_status("Start", {"status": "scanning"})
+
+        app_constants = Config.get_instance()
+        if app_constants.SCAN_WARM_START and self._current_inventory:
+            num_known_found = self.fleet_supervisor.warm_start(self._current_inventory)
+            self._publish_scan_status(
+                "WarmStart", {"status": "discovering", "num_devices": num_known_found}
+            )
+            self.initial_scan_complete_event.set()
+
         num_devices_found = self.fleet_supervisor.scan_and_manage_fleet()
         self._publish_scan_status(
             "Complete", {"status": "ready", "num_devices": num_devices_found}
@@ -147,32 +176,73 @@ class VisaFleetManager:
                 **_get_log_args(),
             )
 
-    def enqueue_command(self, serial, command, query=False, correlation_id="N/A"):
-        """Public API to send a command to a specific device."""
+    def enqueue_command(
+        self,
+        serial,
+        command,
+        query=False,
+        correlation_id="N/A",
+        priority="interactive",
+        timeout=None,
+        binary=False,
+        block=True,
+    ):
+        """
+        Public API to send a command to a specific device.
+        `binary=True` reads a trace as one array (see VisaProxyFleet._send_trace).
+        Returns True if the command was queued on the device's proxy.
+        """
         proxy = self.fleet_supervisor.get_proxy_for_device(serial)
         if proxy:
-            proxy.enqueue_command(command, query, correlation_id)
-        else:
-            self.cb_error(serial, "Device not found in fleet manager", command)
+            return proxy.enqueue_command(
+                command,
+                query,
+                correlation_id,
+                priority=priority,
+                timeout=timeout,
+                binary=binary,
+                block=block,
+            )
+        self.cb_error(serial, "Device not found in fleet manager", command)
+        return False
+
+    def get_device_stats(self):
+        """Public API returning per-device command throughput/latency counters, keyed by serial."""
+        return {
+            serial: proxy.get_stats()
+            for serial, proxy in list(self.fleet_supervisor.device_proxies.items())
+        }
 
     # --- Internal Event Handlers (Called by Supervisor/Proxies) ---
 
-    def _notify_inventory(self, inventory_data):
-        """Receives updated inventory from Supervisor, augments it, and saves it."""
+    def _notify_inventory(self, inventory_data, persist=True):
+        """
+        Receives updated inventory from Supervisor, augments it and publishes it.
+
+        Only `persist=True` updates (the end of a scan) are saved to VISA_FLEET.json and
+        the CSVs; the per-device updates streamed while a scan runs are published only.
+        """
         augmented_inventory = []
         for device_entry in inventory_data:
             augmented_inventory.append(
                 self.json_builder.augment_device_details(device_entry)
             )
 
-        self._current_inventory = augmented_inventory
-        self.json_builder.save_inventory_to_json(augmented_inventory)
+        if persist:
+            # Scan and connection threads both report here; one writer at a time
+            with self._inventory_save_lock:
+                self._current_inventory = augmented_inventory
+                self.json_builder.save_inventory_to_json(augmented_inventory)
 
-        # NEW: Trigger CSV regeneration after JSON is saved
-        self.csv_builder.build_csvs_from_json()
+                # NEW: Trigger CSV regeneration after JSON is saved
+                self.csv_builder.build_csvs_from_json()
 
-        # Load the newly saved (and grouped) inventory to ensure MQTT reflects the file structure
-        grouped_inventory = self.json_builder.load_grouped_inventory_from_json()
+                # Load the newly saved (and grouped) inventory to ensure MQTT reflects the file structure
+                grouped_inventory = self.json_builder.load_grouped_inventory_from_json()
+        else:
+            grouped_inventory = self.json_builder._group_devices_by_type_and_model(
+                augmented_inventory
+            )
 
         self.cb_inventory(
             augmented_inventory
@@ -188,9 +258,19 @@ class VisaFleetManager:
         )
         self.cb_response(serial, response, command, corr_id)
 
+    def _notify_trace(self, serial, values, command, corr_id, span=None):
+        """Receives a whole trace as an array (not saved to the query response JSON)."""
+        if self.cb_trace is not None:
+            self.cb_trace(serial, values, command, corr_id, span)
+        else:
+            self.cb_response(serial, ",".join(map(str, values)), command, corr_id)
+
     def _notify_error(self, serial, message, command):
         self.cb_error(serial, message, command)
 
+    def _notify_dropped(self, serial, command, corr_id):
+        self.cb_dropped(serial, command, corr_id)
+
     def _notify_status(self, serial, status):
         self.cb_status(serial, status)
 
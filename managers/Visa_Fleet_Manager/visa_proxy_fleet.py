@@ -12,6 +12,15 @@ import queue
 import threading
 import _queue
 
+# --- Graceful Dependency Importing ---
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 try:
     from workers.logger.logger import debug_logger
     from workers.logger.log_utils import _get_log_args
@@ -26,6 +35,21 @@ except ModuleNotFoundError:
         return {}  # Return empty dict, as logger args are not available
 
 
+from managers.Visa_Fleet_Manager import manager_visa_scpi_batcher as scpi_batcher
+from managers.Visa_Fleet_Manager.manager_visa_known_types import (
+    BINARY_TRACE_FORMATS,
+    get_scpi_batch_limits,
+    get_trace_transfer,
+)
+from managers.Visa_Fleet_Manager.manager_visa_command_queue import (
+    DeviceCommandQueue,
+    DEFAULT_INTERACTIVE_DEPTH,
+    DEFAULT_POLLING_DEPTH,
+    PRIORITY_INTERACTIVE,
+    normalize_priority,
+)
+
+
 # --- Helper functions for safe VISA operations ---
 # These now interact directly with the proxy instance's manager callbacks.
 
@@ -137,6 +161,8 @@ class VisaProxyFleet:
         resource_name,
         instrument_model="Generic",
         manufacturer="Unknown Manufacturer",
+        interactive_queue_depth=DEFAULT_INTERACTIVE_DEPTH,
+        polling_queue_depth=DEFAULT_POLLING_DEPTH,
     ):
         current_function_name = inspect.currentframe().f_code.co_name
         self.manager = manager_ref  # Reference to the VisaFleetManager
@@ -152,7 +178,28 @@ class VisaProxyFleet:
 
         self.inst = None  # The actual pyvisa instrument instance
 
-        self.command_queue = queue.Queue()
+        # Interactive commands are served before polling; stale polling reads are dropped
+        self.command_queue = DeviceCommandQueue(
+            interactive_depth=interactive_queue_depth,
+            polling_depth=polling_queue_depth,
+            on_drop=self._on_command_dropped,
+        )
+        self.batch_limits = get_scpi_batch_limits(instrument_model)
+        self.trace_transfer = get_trace_transfer(instrument_model)
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "commands": 0,
+            "queries": 0,
+            "round_trips": 0,
+            "batches": 0,
+            "batch_fallbacks": 0,
+            "binary_traces": 0,
+            "ascii_traces": 0,
+            "latency_total_s": 0.0,
+            "latency_max_s": 0.0,
+            "busy_s": 0.0,
+            "first_command_ts": None,
+        }
         self.shutdown_flag = None
         self.worker_thread = None
         self.is_connected = False
@@ -212,35 +259,39 @@ class VisaProxyFleet:
             )
 
     def _command_processor_worker(self):
-        """Worker thread to process commands from the queue."""
+        """
+        Worker thread to process commands from the queue.
+
+        Whatever has queued up while the previous message was on the wire is drained in one go
+        (up to the model's batch limit) and sent as ';'-joined SCPI program messages, so a burst
+        of commands costs a few round trips instead of one each.
+        """
         while not self.shutdown_flag.is_set():
-            command_info = None
             try:
                 command_info = self.command_queue.get(
                     block=True, timeout=0.5
                 )  # Block with timeout
-                if command_info is None:  # Exit signal
-                    break
-
-                command = command_info["command"]
-                query = command_info["query"]
-                correlation_id = command_info["correlation_id"]
-
-                if query:
-                    _query_safe_fleet(self, command, correlation_id)
-                else:
-                    _write_safe_fleet(self, command)
-
-                self.command_queue.task_done()
             except (_queue.Empty, queue.Empty):
                 # Queue is empty, continue waiting
                 continue
+            if command_info is None:  # Exit signal
+                break
+
+            pending = [command_info]
+            exit_requested = False
+            while len(pending) < self.batch_limits["max_commands"]:
+                try:
+                    next_info = self.command_queue.get_nowait()
+                except (_queue.Empty, queue.Empty):
+                    break
+                if next_info is None:
+                    exit_requested = True
+                    break
+                pending.append(next_info)
+
+            try:
+                self._process_commands(pending)
             except Exception as e:
-                cmd_for_error = (
-                    command_info.get("command", "N/A")
-                    if command_info is not None
-                    else "N/A"
-                )
                 debug_logger(
                     message=f"💳 Unhandled exception in FleetProxy worker for {self.device_serial}: {e}",
                     **_get_log_args(),
@@ -249,24 +300,351 @@ class VisaProxyFleet:
                 self.manager._notify_error(
                     serial=self.device_serial,
                     message=f"Unhandled worker exception: {e}",
-                    command=cmd_for_error,
+                    command=pending[0].get("command", "N/A"),
                 )
-                if command_info is not None:
-                    self.command_queue.task_done()  # Mark task done even on error to prevent queue buildup
+            finally:
+                for _ in pending:
+                    self.command_queue.task_done()  # Mark done even on error to prevent queue buildup
+            if exit_requested:
+                break
         debug_logger(
             message=f"💳 ℹ️ FleetProxy Log ({self.device_serial}): Command processor worker terminated.",
             **_get_log_args(),
         )
 
-    def enqueue_command(self, command, query=False, correlation_id="N/A"):
-        """Public method for the manager to enqueue a command to this proxy."""
-        self.command_queue.put(
-            {"command": command, "query": query, "correlation_id": correlation_id}
+    def _process_commands(self, pending):
+        """
+        Sends a drained run of commands, batching where the instrument allows it.
+        Trace transfers are never batched; they split the run and keep their place in it.
+        """
+        started = time.monotonic()
+        batches = []
+        run = []
+        for info in pending:
+            if info.get("binary"):
+                if run:
+                    batches.extend(self._plan(run))
+                    run = []
+                batches.append([info])
+            else:
+                run.append(info)
+        if run:
+            batches.extend(self._plan(run))
+
+        round_trips = 0
+        fallbacks = 0
+        for batch in batches:
+            if len(batch) == 1:
+                round_trips += self._send_single(batch[0])
+            else:
+                trips, fell_back = self._send_batch(batch)
+                round_trips += trips
+                fallbacks += int(fell_back)
+        self._record_stats(pending, batches, round_trips, fallbacks, started)
+
+    def _plan(self, run):
+        return scpi_batcher.plan_batches(
+            run, self.batch_limits["max_commands"], self.batch_limits["max_chars"]
+        )
+
+    def _send_single(self, command_info):
+        """Sends one command through the original safe helpers. Returns the round trips used."""
+        if command_info.get("binary"):
+            return self._send_trace(command_info)
+        if command_info["query"]:
+            _query_safe_fleet(self, command_info["command"], command_info["correlation_id"])
+        else:
+            _write_safe_fleet(self, command_info["command"])
+        return 1
+
+    def _send_batch(self, batch):
+        """
+        Sends a batch as one program message and hands each query its own slice of the
+        combined response. If the response does not split into one unit per query, the
+        queries are re-sent one at a time. If the message itself fails, the device is cleared
+        and only the queries are re-sent: a write may already have been executed, so writes are
+        never replayed and are reported to the manager as errors with an unknown outcome.
+
+        Returns:
+            tuple: (round trips used, whether a fallback was needed)
+        """
+        if not self.inst:
+            return sum(self._send_single(info) for info in batch), True
+
+        message = scpi_batcher.join_batch(batch)
+        queries = [info for info in batch if info["query"]]
+        debug_logger(
+            message=f"💳 ℹ️ FleetProxy Log ({self.device_serial}): 💳💳⬆️⬆️ Send Visa Batch ({len(batch)} commands): {message}",
+            **_get_log_args(),
+        )
+        try:
+            if not queries:
+                self.inst.write(message)
+                return 1, False
+            responses = scpi_batcher.split_response(self.inst.query(message))
+        except Exception as e:
+            debug_logger(
+                message=f"💳 ⚠️ FleetProxy Log ({self.device_serial}): Batch failed ({e}). Clearing the device and re-sending {len(queries)} queries individually.",
+                **_get_log_args(),
+                level="WARNING",
+            )
+            try:
+                self.inst.clear()
+            except Exception:
+                pass
+            for info in batch:
+                if not info["query"]:
+                    self.manager._notify_error(
+                        serial=self.device_serial,
+                        message=f"Batched write not replayed after batch failure ({e}); its outcome is unknown.",
+                        command=info["command"],
+                    )
+            return 1 + sum(self._send_single(info) for info in queries), True
+
+        if len(responses) != len(queries):
+            debug_logger(
+                message=f"💳 ⚠️ FleetProxy Log ({self.device_serial}): Batch returned {len(responses)} responses for {len(queries)} queries. Re-querying individually.",
+                **_get_log_args(),
+                level="WARNING",
+            )
+            return 1 + sum(self._send_single(info) for info in queries), True
+
+        for info, response in zip(queries, responses):
+            self.manager._notify_response(
+                serial=self.device_serial,
+                response=response,
+                command=info["command"],
+                corr_id=info["correlation_id"],
+            )
+        return 1, False
+
+    def _send_trace(self, command_info):
+        """
+        Reads a whole trace in one transfer and hands the points to the manager as an array.
+
+        Where the model supports it (see manager_visa_known_types.TRACE_TRANSFER_BY_MODEL) the
+        :FORMat switch and the trace query travel in one message and the IEEE 488.2 block is
+        read with query_binary_values; ASCII format is restored afterwards so other queries
+        are unaffected. If the binary transfer fails, the model is switched to ASCII for the
+        rest of the session and the trace is re-read with query_ascii_values. For models with
+        a span_query the start and stop frequency are read back as well, so the trace can be
+        placed on a frequency axis.
+
+        Returns:
+            int: The round trips used.
+        """
+        command = command_info["command"]
+        corr_id = command_info["correlation_id"]
+        if not self.inst:
+            self.manager._notify_error(
+                serial=self.device_serial,
+                message=f"Instrument {self.device_serial} not connected. Cannot read trace.",
+                command=command,
+            )
+            return 0
+
+        container = np.ndarray if NUMPY_AVAILABLE else list
+        transfer = self.trace_transfer
+        round_trips = 0
+        values = None
+        binary_format = transfer["format"]
+        if binary_format:
+            datatype = BINARY_TRACE_FORMATS[binary_format][0]
+            prefix = [transfer["byte_order_command"]] if transfer["byte_order_command"] else []
+            message = ";".join(
+                prefix + [f":FORMat {binary_format}", scpi_batcher.absolute_header(command)]
+            )
+            try:
+                round_trips += 1
+                values = self.inst.query_binary_values(
+                    message,
+                    datatype=datatype,
+                    is_big_endian=transfer["byte_order"] == "big",
+                    container=container,
+                )
+                self.inst.write(":FORMat ASCii")
+            except Exception as e:
+                debug_logger(
+                    message=f"💳 ⚠️ FleetProxy Log ({self.device_serial}): Binary trace transfer failed ({e}). Using ASCII traces for {self.instrument_model} from now on.",
+                    **_get_log_args(),
+                    level="WARNING",
+                )
+                self.trace_transfer = dict(transfer, format=None)
+                values = None
+                try:
+                    self.inst.clear()
+                    self.inst.write(":FORMat ASCii")
+                except Exception:
+                    pass
+
+        if values is None:
+            try:
+                round_trips += 1
+                values = self.inst.query_ascii_values(command, container=container)
+            except Exception as e:
+                self.manager._notify_error(
+                    serial=self.device_serial,
+                    message=f"Error reading trace '{command}' from {self.device_serial}: {e}",
+                    command=command,
+                )
+                return round_trips
+            stats_key = "ascii_traces"
+        else:
+            stats_key = "binary_traces"
+
+        span = None
+        if transfer["span_query"]:
+            round_trips += 1
+            span = self._read_trace_span(transfer["span_query"])
+
+        with self._stats_lock:
+            self._stats[stats_key] += 1
+        debug_logger(
+            message=f"💳 ℹ️ FleetProxy Log ({self.device_serial}): 💳💳⬇️⬇️ RX trace: {len(values)} points via {stats_key.split('_')[0]}.",
+            **_get_log_args(),
+        )
+        self.manager._notify_trace(
+            serial=self.device_serial,
+            values=values,
+            command=command,
+            corr_id=corr_id,
+            span=span,
+        )
+        return round_trips
+
+    def _read_trace_span(self, span_query):
+        """Returns (start_hz, stop_hz) of the trace just read, or None if the span is unavailable."""
+        try:
+            start_hz, stop_hz = (
+                float(unit) for unit in scpi_batcher.split_response(self.inst.query(span_query))
+            )
+            return start_hz, stop_hz
+        except Exception as e:
+            debug_logger(
+                message=f"💳 ⚠️ FleetProxy Log ({self.device_serial}): Could not read the trace span ({e}).",
+                **_get_log_args(),
+                level="WARNING",
+            )
+            return None
+
+    def _record_stats(self, pending, batches, round_trips, fallbacks, started):
+        now = time.monotonic()
+        with self._stats_lock:
+            stats = self._stats
+            if stats["first_command_ts"] is None:
+                stats["first_command_ts"] = started
+            stats["commands"] += len(pending)
+            stats["queries"] += sum(1 for info in pending if info["query"])
+            stats["round_trips"] += round_trips
+            stats["batches"] += sum(1 for batch in batches if len(batch) > 1)
+            stats["batch_fallbacks"] += fallbacks
+            stats["busy_s"] += now - started
+            for info in pending:
+                latency = now - info.get("enqueued_ts", started)
+                stats["latency_total_s"] += latency
+                stats["latency_max_s"] = max(stats["latency_max_s"], latency)
+
+    def get_stats(self):
+        """
+        Returns throughput and latency counters for this device.
+        Latency is measured from enqueue_command() until the command's message completed.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        commands = stats["commands"]
+        elapsed = (
+            time.monotonic() - stats["first_command_ts"]
+            if stats["first_command_ts"] is not None
+            else 0.0
         )
+        return {
+            "device_serial": self.device_serial,
+            "commands": commands,
+            "queries": stats["queries"],
+            "round_trips": stats["round_trips"],
+            "batches": stats["batches"],
+            "batch_fallbacks": stats["batch_fallbacks"],
+            "binary_traces": stats["binary_traces"],
+            "ascii_traces": stats["ascii_traces"],
+            "trace_format": self.trace_transfer["format"] or "ASCII",
+            "commands_per_round_trip": (
+                commands / stats["round_trips"] if stats["round_trips"] else 0.0
+            ),
+            "throughput_cmd_s": commands / elapsed if elapsed > 0 else 0.0,
+            "avg_latency_ms": (
+                stats["latency_total_s"] * 1000.0 / commands if commands else 0.0
+            ),
+            "max_latency_ms": stats["latency_max_s"] * 1000.0,
+            "busy_s": stats["busy_s"],
+            "queue_depth": self.command_queue.qsize(),
+            "queue_lanes": self.command_queue.lane_sizes(),
+            "dropped": self.command_queue.dropped,
+            "batch_limits": dict(self.batch_limits),
+        }
+
+    def enqueue_command(
+        self,
+        command,
+        query=False,
+        correlation_id="N/A",
+        priority=PRIORITY_INTERACTIVE,
+        timeout=None,
+        binary=False,
+        block=True,
+    ):
+        """
+        Public method for the manager to enqueue a command to this proxy.
+
+        Interactive commands wait up to `timeout` seconds (forever if None) for room in their
+        lane, or not at all with block=False; polling commands never wait and may push out
+        the oldest queued poll.
+        `binary=True` marks a trace query: its answer is read as one array and reported
+        through the manager's _notify_trace instead of _notify_response.
+
+        Returns:
+            bool: True if the command was queued, False if the interactive lane stayed full.
+        """
+        priority = normalize_priority(priority)
+        try:
+            self.command_queue.put(
+                {
+                    "command": command,
+                    "query": query,
+                    "correlation_id": correlation_id,
+                    "priority": priority,
+                    "binary": bool(binary),
+                    "enqueued_ts": time.monotonic(),
+                },
+                block=block,
+                timeout=timeout,
+            )
+        except queue.Full:
+            debug_logger(
+                message=f"💳 ⚠️ FleetProxy Log ({self.device_serial}): Interactive queue full, rejecting '{command}'.",
+                **_get_log_args(),
+                level="WARNING",
+            )
+            return False
         debug_logger(
             message=f"💳 ℹ️ FleetProxy Log ({self.device_serial}): Command '{command}' enqueued. Query: {query}",
             **_get_log_args(),
         )
+        return True
+
+    def _on_command_dropped(self, command_info):
+        """Reports a polling command pushed out of a full queue by a newer one."""
+        debug_logger(
+            message=f"💳 ⚠️ FleetProxy Log ({self.device_serial}): Polling queue full, dropped stale '{command_info['command']}'.",
+            **_get_log_args(),
+            level="WARNING",
+        )
+        notify_dropped = getattr(self.manager, "_notify_dropped", None)
+        if notify_dropped is not None:
+            notify_dropped(
+                serial=self.device_serial,
+                command=command_info["command"],
+                corr_id=command_info["correlation_id"],
+            )
 
     def set_instrument_instance(self, inst):
         """Sets the PyVISA instrument instance and updates connection status."""
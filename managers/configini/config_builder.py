@@ -14,12 +14,22 @@ def create_default_config_ini(config_path: pathlib.Path, silent: bool = False):
 
     config["Mode"] = {"SKIP_DEP_CHECK": "False", "CLEAN_INSTALL_MODE": "True"}
 
-    config["Debug"] = {"ENABLE_DEBUG_MODE": "True", "ENABLE_DEBUG_SCREEN": "True"}
+    config["Debug"] = {
+        "ENABLE_DEBUG_MODE": "True",
+        "ENABLE_DEBUG_SCREEN": "True",
+        "LOG_LEVEL": "DEBUG",
+        "LOG_QUEUE_SIZE": "10000",
+        "LOG_MAX_BYTES": "10485760",
+        "LOG_BACKUP_COUNT": "5",
+        "LOG_ROTATE_INTERVAL_S": "0",
+    }
 
     config["UI"] = {
         "LAYOUT_SPLIT_EQUAL": "50",
         "LAYOUT_FULL_WEIGHT": "100",
         "RELOAD_CONFIG_DISPLAYED": "False",
+        "LAZY_BUILD": "True",
+        "LAZY_BUILD_MARGIN_PX": "600",
     }
 
     config["MQTT"] = {
@@ -30,5 +40,47 @@ def create_default_config_ini(config_path: pathlib.Path, silent: bool = False):
         "MQTT_RETAIN_BEHAVIOR": "True",
     }
 
+    config["ScanSettings"] = {
+        "SCAN_GATEWAYS": "True",
+        "SCAN_USB": "True",
+        "SCAN_IP_DIRECT": "True",
+        "IP_SCAN_SUBNETS": "",
+        "IP_SCAN_HOSTS": "",
+        "IP_SCAN_CONCURRENCY": "128",
+        "IP_CONNECT_TIMEOUT_S": "0.3",
+        "SCAN_WARM_START": "True",
+        "PROBE_MAX_WORKERS": "8",
+        "PROBE_DEADLINE_S": "8.0",
+        "PROBE_GATEWAY_CONCURRENCY": "1",
+        "PROBE_USB_CONCURRENCY": "2",
+    }
+
+    config["FleetDispatch"] = {
+        "INTERACTIVE_QUEUE_DEPTH": "64",
+        "POLLING_QUEUE_DEPTH": "32",
+    }
+
+    config["YakCorrelation"] = {
+        "RESPONSE_TIMEOUT_S": "10.0",
+        "MAX_ENTRIES": "1024",
+    }
+
+    config["TraceAccumulator"] = {
+        "AVERAGE_COUNT": "10",
+        "EMA_ALPHA": "0.2",
+        "PERSISTENCE_DECAY": "0.9",
+        "PERSISTENCE_LEVELS": "100",
+        "PERSISTENCE_MIN_DBM": "-140.0",
+        "PERSISTENCE_MAX_DBM": "0.0",
+        "PERSISTENCE_EVERY": "10",
+    }
+
+    config["StateCache"] = {
+        "FLUSH_INTERVAL_S": "2.0",
+        "DIRTY_THRESHOLD": "500",
+        "COMPACT_JOURNAL_BYTES": "4194304",
+        "COMPACT_INTERVAL_S": "600",
+    }
+
     with open(config_path, "w") as configfile:
         config.write(configfile)
@@ -33,12 +33,19 @@ class Config:
     CLEAN_INSTALL_MODE = False
     ENABLE_DEBUG_MODE = False
     ENABLE_DEBUG_SCREEN = False
+    LOG_LEVEL = "DEBUG"  # DEBUG, INFO, WARNING, ERROR or OFF
+    LOG_QUEUE_SIZE = 10000  # Lines waiting for the log writer thread before new ones are dropped
+    LOG_MAX_BYTES = 10485760  # Rotate a log file once it reaches this size (0 disables)
+    LOG_BACKUP_COUNT = 5  # Rotated files kept per log
+    LOG_ROTATE_INTERVAL_S = 0  # Rotate a log file once it is this old (0 disables)
     UI_LAYOUT_SPLIT_EQUAL = 50
     UI_LAYOUT_FULL_WEIGHT = 100
     SHOW_RELOAD_BUTTON = (
         True  # This might be redundant, but keeping for now if used elsewhere
     )
     RELOAD_CONFIG_DISPLAYED = False  # New setting
+    UI_LAZY_BUILD = True  # Build page widgets only as they scroll into view
+    UI_LAZY_BUILD_MARGIN_PX = 600  # How far beyond the viewport widgets are built ahead of time
     MQTT_BROKER_ADDRESS = "localhost"
     MQTT_BROKER_PORT = 1883
     MQTT_USERNAME = None
@@ -51,6 +58,42 @@ class Config:
     SCAN_GATEWAYS = True
     SCAN_USB = True
     SCAN_IP_DIRECT = True
+    IP_SCAN_SUBNETS = ""  # Comma-separated CIDRs to sweep; empty sweeps the local /24
+    IP_SCAN_HOSTS = ""  # Comma-separated addresses that are always probed
+    IP_SCAN_CONCURRENCY = 128  # Hosts probed at once by the subnet sweep
+    IP_CONNECT_TIMEOUT_S = 0.3  # TCP connect timeout per port
+    SCAN_WARM_START = True  # Re-validate the saved fleet before full discovery
+    PROBE_MAX_WORKERS = 8  # Concurrent *IDN? probes during a fleet scan
+    PROBE_DEADLINE_S = 8.0  # Time budget per resource, including the USB/ASRL retry
+    PROBE_GATEWAY_CONCURRENCY = 1  # Concurrent probes behind one LAN/GPIB gateway
+    PROBE_USB_CONCURRENCY = 2  # Concurrent probes on the local USB bus
+
+    # --- Fleet Dispatch Defaults ---
+
+    FLEET_INTERACTIVE_QUEUE_DEPTH = 64  # Queued actuator commands per device before new ones are rejected
+    FLEET_POLLING_QUEUE_DEPTH = 32  # Queued polling commands per device before the oldest is dropped
+
+    # --- YAK Correlation Defaults ---
+
+    YAK_RESPONSE_TIMEOUT_S = 10.0  # How long a YAK query waits for its instrument response
+    YAK_CORRELATION_MAX_ENTRIES = 1024  # Outstanding YAK queries kept before the oldest is evicted
+
+    # --- Trace Accumulator Defaults ---
+
+    TRACE_AVERAGE_COUNT = 10  # Sweeps in the N-sweep average
+    TRACE_EMA_ALPHA = 0.2  # Weight of the newest sweep in the exponential average
+    TRACE_PERSISTENCE_DECAY = 0.9  # Per-sweep fade of the persistence map
+    TRACE_PERSISTENCE_LEVELS = 100  # Amplitude rows of the persistence map
+    TRACE_PERSISTENCE_MIN_DBM = -140.0
+    TRACE_PERSISTENCE_MAX_DBM = 0.0
+    TRACE_PERSISTENCE_EVERY = 10  # Publish the persistence map every N sweeps; 0 disables it
+
+    # --- State Cache Defaults ---
+
+    STATE_CACHE_FLUSH_INTERVAL_S = 2.0
+    STATE_CACHE_DIRTY_THRESHOLD = 500
+    STATE_CACHE_COMPACT_JOURNAL_BYTES = 4194304
+    STATE_CACHE_COMPACT_INTERVAL_S = 600.0
 
     def __init__(self):
         """
@@ -174,6 +217,19 @@ class Config:
             self.ENABLE_DEBUG_SCREEN = config["Debug"].getboolean(
                 "ENABLE_DEBUG_SCREEN", self.ENABLE_DEBUG_SCREEN
             )
+            self.LOG_LEVEL = config["Debug"].get("LOG_LEVEL", self.LOG_LEVEL).upper()
+            self.LOG_QUEUE_SIZE = config["Debug"].getint(
+                "LOG_QUEUE_SIZE", self.LOG_QUEUE_SIZE
+            )
+            self.LOG_MAX_BYTES = config["Debug"].getint(
+                "LOG_MAX_BYTES", self.LOG_MAX_BYTES
+            )
+            self.LOG_BACKUP_COUNT = config["Debug"].getint(
+                "LOG_BACKUP_COUNT", self.LOG_BACKUP_COUNT
+            )
+            self.LOG_ROTATE_INTERVAL_S = config["Debug"].getfloat(
+                "LOG_ROTATE_INTERVAL_S", self.LOG_ROTATE_INTERVAL_S
+            )
 
             if "UI" in config:
 
@@ -189,6 +245,12 @@ class Config:
                 self.RELOAD_CONFIG_DISPLAYED = config["UI"].getboolean(
                     "RELOAD_CONFIG_DISPLAYED", self.RELOAD_CONFIG_DISPLAYED
                 )
+                self.UI_LAZY_BUILD = config["UI"].getboolean(
+                    "LAZY_BUILD", self.UI_LAZY_BUILD
+                )
+                self.UI_LAZY_BUILD_MARGIN_PX = config["UI"].getint(
+                    "LAZY_BUILD_MARGIN_PX", self.UI_LAZY_BUILD_MARGIN_PX
+                )
 
         if "MQTT" in config:
             self.MQTT_BROKER_ADDRESS = config["MQTT"].get(
@@ -217,6 +279,86 @@ class Config:
             self.SCAN_IP_DIRECT = config["ScanSettings"].getboolean(
                 "scan_ip_direct", self.SCAN_IP_DIRECT
             )
+            self.IP_SCAN_SUBNETS = config["ScanSettings"].get(
+                "ip_scan_subnets", self.IP_SCAN_SUBNETS
+            )
+            self.IP_SCAN_HOSTS = config["ScanSettings"].get(
+                "ip_scan_hosts", self.IP_SCAN_HOSTS
+            )
+            self.IP_SCAN_CONCURRENCY = config["ScanSettings"].getint(
+                "ip_scan_concurrency", self.IP_SCAN_CONCURRENCY
+            )
+            self.IP_CONNECT_TIMEOUT_S = config["ScanSettings"].getfloat(
+                "ip_connect_timeout_s", self.IP_CONNECT_TIMEOUT_S
+            )
+            self.SCAN_WARM_START = config["ScanSettings"].getboolean(
+                "scan_warm_start", self.SCAN_WARM_START
+            )
+            self.PROBE_MAX_WORKERS = config["ScanSettings"].getint(
+                "probe_max_workers", self.PROBE_MAX_WORKERS
+            )
+            self.PROBE_DEADLINE_S = config["ScanSettings"].getfloat(
+                "probe_deadline_s", self.PROBE_DEADLINE_S
+            )
+            self.PROBE_GATEWAY_CONCURRENCY = config["ScanSettings"].getint(
+                "probe_gateway_concurrency", self.PROBE_GATEWAY_CONCURRENCY
+            )
+            self.PROBE_USB_CONCURRENCY = config["ScanSettings"].getint(
+                "probe_usb_concurrency", self.PROBE_USB_CONCURRENCY
+            )
+
+        if "FleetDispatch" in config:
+            self.FLEET_INTERACTIVE_QUEUE_DEPTH = config["FleetDispatch"].getint(
+                "interactive_queue_depth", self.FLEET_INTERACTIVE_QUEUE_DEPTH
+            )
+            self.FLEET_POLLING_QUEUE_DEPTH = config["FleetDispatch"].getint(
+                "polling_queue_depth", self.FLEET_POLLING_QUEUE_DEPTH
+            )
+
+        if "YakCorrelation" in config:
+            self.YAK_RESPONSE_TIMEOUT_S = config["YakCorrelation"].getfloat(
+                "response_timeout_s", self.YAK_RESPONSE_TIMEOUT_S
+            )
+            self.YAK_CORRELATION_MAX_ENTRIES = config["YakCorrelation"].getint(
+                "max_entries", self.YAK_CORRELATION_MAX_ENTRIES
+            )
+
+        if "TraceAccumulator" in config:
+            self.TRACE_AVERAGE_COUNT = config["TraceAccumulator"].getint(
+                "average_count", self.TRACE_AVERAGE_COUNT
+            )
+            self.TRACE_EMA_ALPHA = config["TraceAccumulator"].getfloat(
+                "ema_alpha", self.TRACE_EMA_ALPHA
+            )
+            self.TRACE_PERSISTENCE_DECAY = config["TraceAccumulator"].getfloat(
+                "persistence_decay", self.TRACE_PERSISTENCE_DECAY
+            )
+            self.TRACE_PERSISTENCE_LEVELS = config["TraceAccumulator"].getint(
+                "persistence_levels", self.TRACE_PERSISTENCE_LEVELS
+            )
+            self.TRACE_PERSISTENCE_MIN_DBM = config["TraceAccumulator"].getfloat(
+                "persistence_min_dbm", self.TRACE_PERSISTENCE_MIN_DBM
+            )
+            self.TRACE_PERSISTENCE_MAX_DBM = config["TraceAccumulator"].getfloat(
+                "persistence_max_dbm", self.TRACE_PERSISTENCE_MAX_DBM
+            )
+            self.TRACE_PERSISTENCE_EVERY = config["TraceAccumulator"].getint(
+                "persistence_every", self.TRACE_PERSISTENCE_EVERY
+            )
+
+        if "StateCache" in config:
+            self.STATE_CACHE_FLUSH_INTERVAL_S = config["StateCache"].getfloat(
+                "flush_interval_s", self.STATE_CACHE_FLUSH_INTERVAL_S
+            )
+            self.STATE_CACHE_DIRTY_THRESHOLD = config["StateCache"].getint(
+                "dirty_threshold", self.STATE_CACHE_DIRTY_THRESHOLD
+            )
+            self.STATE_CACHE_COMPACT_JOURNAL_BYTES = config["StateCache"].getint(
+                "compact_journal_bytes", self.STATE_CACHE_COMPACT_JOURNAL_BYTES
+            )
+            self.STATE_CACHE_COMPACT_INTERVAL_S = config["StateCache"].getfloat(
+                "compact_interval_s", self.STATE_CACHE_COMPACT_INTERVAL_S
+            )
 
         debug_logger(message="--- Loaded Debug Settings ---", **_get_log_args())
         debug_logger(
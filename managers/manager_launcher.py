@@ -30,6 +30,13 @@ from managers.Visa_Fleet_Manager.visa_fleet_manager import (
 )  # Import VisaFleetManager
 from managers.yak.yak_translator import YakTranslator  # Import YakTranslator
 from managers.yak.manager_yak_rx import YakRxManager  # Import YakRxManager
+from managers.Visa_Fleet_Manager.manager_fleet_dispatcher import (
+    FleetCommandDispatcher,
+)
+from managers.Visa_Fleet_Manager.manager_trace_accumulator import (
+    TraceAccumulatorManager,
+)
+from managers.configini.config_reader import Config
 from workers.monitoring.fleet_status_monitor import (
     FleetStatusMonitor,
 )  # Import FleetStatusMonitor
@@ -119,11 +126,32 @@ def launch_managers(app, splash, root, state_cache_manager, mqtt_connection_mana
             yak_translator=yak_translator,
         )
 
-        # 5. Initialize Fleet Status Monitor
+        # 5. Route Tx_Inbox commands to the VISA fleet and replies back to Rx_Outbox
+        fleet_dispatcher = FleetCommandDispatcher(
+            visa_fleet_manager=visa_fleet_manager,
+            mqtt_connection_manager=mqtt_connection_manager,
+            subscriber_router=subscriber_router,
+        )
+
+        # 6. Initialize Fleet Status Monitor
         fleet_status_monitor = FleetStatusMonitor(
             state_mirror_engine=state_mirror_engine, subscriber_router=subscriber_router
         )
 
+        # 7. Accumulate max/min hold, averages and persistence for every published trace
+        config = Config.get_instance()
+        trace_accumulator = TraceAccumulatorManager(
+            mqtt_connection_manager=mqtt_connection_manager,
+            subscriber_router=subscriber_router,
+            persistence_every=config.TRACE_PERSISTENCE_EVERY,
+            average_count=config.TRACE_AVERAGE_COUNT,
+            ema_alpha=config.TRACE_EMA_ALPHA,
+            persistence_decay=config.TRACE_PERSISTENCE_DECAY,
+            persistence_levels=config.TRACE_PERSISTENCE_LEVELS,
+            amp_min=config.TRACE_PERSISTENCE_MIN_DBM,
+            amp_max=config.TRACE_PERSISTENCE_MAX_DBM,
+        )
+
         debug_logger(
             message="✅ All core managers have been successfully launched!",
             **_get_log_args(),
@@ -138,7 +166,9 @@ def launch_managers(app, splash, root, state_cache_manager, mqtt_connection_mana
             "visa_fleet_manager": visa_fleet_manager,  # Add VisaFleetManager
             "yak_translator": yak_translator,
             "yak_rx_manager": yak_rx_manager,
+            "fleet_dispatcher": fleet_dispatcher,
             "fleet_status_monitor": fleet_status_monitor,
+            "trace_accumulator": trace_accumulator,
         }
 
         # Return instantiated managers for use by the application if needed
@@ -32,7 +32,14 @@ from managers.configini.config_reader import Config
 
 app_constants = Config.get_instance()  # Get the singleton instance
 
+from managers.yak.yak_response_decoder import (
+    YakDecodeError,
+    compile_outputs,
+    decode_response,
+)
+
 LOCAL_DEBUG_ENABLE = False
+OUTPUT_SPEC_CACHE_SIZE = 1024
 
 
 class YakRxManager:
@@ -44,6 +51,7 @@ class YakRxManager:
         self.mqtt_util = mqtt_connection_manager
         self.subscriber_router = subscriber_router
         self.yak_translator = yak_translator
+        self._output_spec_cache = {}  # id(Outputs declaration) -> (declaration, [OutputSpec])
         self.NAB_BANDWIDTH_TRIGGER_PATH = [
             "yak",
             "Bandwidth",
@@ -77,10 +85,21 @@ class YakRxManager:
             response_value = payload_data.get("response")
             command_sent = payload_data.get("command")
             correlation_id = payload_data.get("correlation_id")
+            status = payload_data.get("status", "ok")
 
-            if correlation_id and response_value:
+            if correlation_id and status != "ok":
+                # The fleet dispatcher reports errors, drops and rejections on the same topic;
+                # fail the pending query now instead of letting it run into its timeout.
+                self.yak_translator.fail_command(
+                    correlation_id, status, payload_data.get("error", "")
+                )
+            elif correlation_id and payload_data.get("trace_topic"):
+                # Binary trace reads: the points went to the trace topic, so the pending query
+                # resolves with the reply itself (trace_topic, points) for the caller to follow.
+                self.yak_translator.retrieve_command_context(correlation_id, payload_data)
+            elif correlation_id and response_value:
                 command_context = self.yak_translator.retrieve_command_context(
-                    correlation_id
+                    correlation_id, response_value
                 )
                 if command_context:
                     path_parts = command_context.get("path_parts")
@@ -123,6 +142,20 @@ class YakRxManager:
                 level="CRITICAL",
             )
 
+    def _get_output_specs(self, outputs):
+        """
+        Returns the compiled OutputSpec list for a command's Outputs declaration, cached per
+        declaration object (the repository index hands out the same dictionaries each time).
+        """
+        cached = self._output_spec_cache.get(id(outputs))
+        if cached is not None and cached[0] is outputs:
+            return cached[1]
+        if len(self._output_spec_cache) >= OUTPUT_SPEC_CACHE_SIZE:
+            self._output_spec_cache.clear()  # The repository was recompiled; start over
+        specs = compile_outputs(outputs)
+        self._output_spec_cache[id(outputs)] = (outputs, specs)
+        return specs
+
     def process_response(self, path_parts, command_details, response):
         """
         Parses the response and publishes the results to MQTT topics.
@@ -142,15 +175,15 @@ class YakRxManager:
             )
             debug_logger(message=f"ℹ️ Path Parts: {path_parts}", **_get_log_args())
             debug_logger(
-                message=f"ℹ️ Command Details: {orjson.dumps(outputs, indent=2)}",
+                message=f"ℹ️ Command Details: {orjson.dumps(outputs, option=orjson.OPT_INDENT_2).decode()}",
                 **_get_log_args(),
             )
             debug_logger(message=f"ℹ️ Raw Response: {response}", **_get_log_args())
 
         try:
-            # Split the response into individual parts
-            response_parts = [p.strip() for p in response.split(";")]
-            output_keys = list(outputs.keys())
+            # Typed decoders for each declared output, in declaration order
+            output_specs = self._get_output_specs(outputs)
+            output_keys = [spec.key for spec in output_specs]
 
             # --- START FIX: Order Correction for NAB_bandwidth_settings ---
 
@@ -210,10 +243,15 @@ class YakRxManager:
 
             # --- END FIX ---
 
-            if len(response_parts) != len(output_keys):
+            specs_by_key = {spec.key: spec for spec in output_specs}
+            try:
+                decoded_outputs = decode_response(
+                    response, [specs_by_key[key] for key in output_keys]
+                )
+            except YakDecodeError as e:
                 if app_constants.global_settings["debug_enabled"]:
                     debug_logger(
-                        message=f"❌🔴 Mismatched response length after potential correction! Expected {len(output_keys)} parts, but received {len(response_parts)}.",
+                        message=f"❌🔴 Response does not match the declared outputs after potential correction! {e}",
                         **_get_log_args(),
                     )
                 return
@@ -225,20 +263,20 @@ class YakRxManager:
             base_output_topic_parts = ["OPEN-AIR", "yak"] + path_parts[:4] + ["Outputs"]
             base_output_topic = "/".join(base_output_topic_parts)
 
-            # Match and publish each part of the response
-            for i, key in enumerate(output_keys):
-                raw_value = response_parts[i]
+            # Publish one payload per output; array outputs go out as a single document
+            for spec, value in decoded_outputs:
+                payload = spec.encode(value)
 
                 # Construct the full topic for the specific output value
-                output_topic = f"{base_output_topic}/{key}/value"
+                output_topic = f"{base_output_topic}/{spec.key}/value"
 
                 # Publish the value to the MQTT topic
                 self.mqtt_util.get_client_instance().publish(
-                    topic=output_topic, payload=raw_value, qos=0, retain=True
+                    topic=output_topic, payload=payload, qos=0, retain=True
                 )
                 if app_constants.global_settings["debug_enabled"]:
                     debug_logger(
-                        message=f"💾 Published to '{output_topic}' with value: '{raw_value}'.",
+                        message=f"💾 Published to '{output_topic}' with value: '{payload if not spec.is_array else f'<{spec.data_type} x{len(value)}>'}'.",
                         **_get_log_args(),
                     )
 
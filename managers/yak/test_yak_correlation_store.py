@@ -0,0 +1,65 @@
+
+import unittest
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from managers.yak.yak_correlation_store import (
+    YakCorrelationStore,
+    YakCommandFailed,
+    YakCommandTimeout,
+)
+
+
+class TestYakCorrelationStore(unittest.TestCase):
+
+    def setUp(self):
+        self.timeouts = []
+        self.store = YakCorrelationStore(
+            on_timeout=lambda cid, ctx, cmd, elapsed: self.timeouts.append((cid, ctx, cmd)),
+            default_timeout_s=5.0,
+            max_entries=2,
+        )
+
+    def tearDown(self):
+        self.store.shutdown()
+
+    def test_resolve_completes_future_and_records_latency(self):
+        future = self.store.register("a", {"path_parts": ["x"]}, "FREQ:CENT?")
+        self.assertEqual(self.store.resolve("a", "1E9"), {"path_parts": ["x"]})
+        self.assertEqual(future.result(timeout=0), "1E9")
+        self.assertIsNone(self.store.resolve("a", "again"))
+        stats = self.store.get_latency_stats()["FREQ:CENT?"]
+        self.assertEqual(stats["count"], 1)
+        self.assertEqual(sum(stats["histogram_ms"].values()), 1)
+
+    def test_timeout_fails_future_and_reports(self):
+        future = self.store.register("slow", "ctx", "*OPC?", timeout_s=0.05)
+        self.assertRaises(YakCommandTimeout, future.result, 1.0)
+        deadline = time.monotonic() + 1.0
+        while not self.timeouts and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.timeouts, [("slow", "ctx", "*OPC?")])
+        self.assertNotIn("slow", self.store)
+
+    def test_oldest_entry_is_evicted_when_full(self):
+        first = self.store.register("1", None, "A?")
+        self.store.register("2", None, "B?")
+        self.store.register("3", None, "C?")
+        with self.assertRaises(YakCommandFailed) as raised:
+            first.result(timeout=0)
+        self.assertEqual(raised.exception.status, "evicted")
+        self.assertEqual(len(self.store), 2)
+
+    def test_fail_reports_status(self):
+        future = self.store.register("d", "ctx", "TRAC?")
+        self.assertEqual(self.store.fail("d", "dropped", "queue full"), "ctx")
+        self.assertRaises(YakCommandFailed, future.result, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
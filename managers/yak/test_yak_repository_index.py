@@ -0,0 +1,107 @@
+
+import unittest
+import os
+import sys
+import tempfile
+import pathlib
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+import orjson
+
+from managers.yak.yak_repository_index import (
+    CompiledScpiTemplate,
+    CompiledYakCommand,
+    ScpiTemplateError,
+    YakRepositoryIndex,
+)
+
+REPOSITORY = {
+    "yak": {
+        "Frequency": {
+            "set": {
+                "Center": {
+                    "scpi_template": ":FREQ:CENT {value}{units}",
+                    "Input": {
+                        "value": {"value": "1E9", "min": "0", "max": "26.5E9"},
+                        "units": {"value": "HZ"},
+                    },
+                },
+                "Points": {
+                    "scpi_template": ":SWE:POIN {points}",
+                    "Input": {"fields": {"points": {"value": "1001", "min": "1", "max": "40001"}}},
+                },
+            },
+            "nab": {"Center": {"scpi_template": ":FREQ:CENT?", "is_query": True, "timeout_s": 2.0}},
+        }
+    }
+}
+
+
+class TestCompiledScpiTemplate(unittest.TestCase):
+
+    def test_defaults_coercion_and_range(self):
+        template = CompiledScpiTemplate(":FREQ:CENT {value}{units}", REPOSITORY["yak"]["Frequency"]["set"]["Center"]["Input"])
+        self.assertEqual(template.render({}), ":FREQ:CENT 1E9HZ")
+        self.assertEqual(template.render({"value": " 2.5E9 ", "priority": "polling"}), ":FREQ:CENT 2.5E9HZ")
+        self.assertRaises(ScpiTemplateError, template.render, {"value": "30E9"})
+        self.assertRaises(ScpiTemplateError, template.render, {"value": "fast"})
+
+    def test_missing_argument(self):
+        template = CompiledScpiTemplate("FREQ {value:.3f}")
+        self.assertEqual(template.render({"value": 1.5}), "FREQ 1.500")
+        self.assertRaises(ScpiTemplateError, template.render, {})
+
+    def test_angle_syntax_keeps_unknown_placeholders(self):
+        template = CompiledScpiTemplate(":CHAN1:SCAL <scale> {raw} <other>", syntax="angle")
+        self.assertEqual(template.render({"scale": "0.5"}, keep_missing=True), ":CHAN1:SCAL 0.5 {raw} <other>")
+
+
+class TestCompiledYakCommand(unittest.TestCase):
+
+    def test_binary_trace_from_template_or_flag(self):
+        def command(template, **declaration):
+            return CompiledYakCommand("yak/Trace", {"scpi_template": template, "is_query": True, **declaration})
+
+        self.assertTrue(command(":TRACe{trace_number}:DATA?").binary_trace)
+        self.assertTrue(command(":TRACe:DATA? TRACE{trace_number}").binary_trace)
+        self.assertFalse(command(":FREQ:STAR?;:TRACe1:DATA?").binary_trace)
+        self.assertFalse(command(":TRACe1:MODE?").binary_trace)
+        self.assertFalse(command(":TRACe1:DATA?", binary_trace=False).binary_trace)
+        self.assertTrue(command(":CALC:DATA?", binary_trace=True).binary_trace)
+        self.assertFalse(command(":TRACe1:DATA?", is_query=False).binary_trace)
+
+
+class TestYakRepositoryIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_path = pathlib.Path(self.tmp.name) / "YAKETYYAK.json"
+        self.repo_path.write_bytes(orjson.dumps(REPOSITORY))
+        self.index = YakRepositoryIndex(self.repo_path, check_interval_s=0.0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_flat_lookup(self):
+        self.assertEqual(len(self.index), 3)
+        points = self.index.lookup(["yak", "Frequency", "set", "Points"])
+        self.assertEqual(points.render({"points": 201}), ":SWE:POIN 201")
+        self.assertRaises(ScpiTemplateError, points.render, {"points": "2.5"})
+        query = self.index.lookup("yak/Frequency/nab/Center")
+        self.assertTrue(query.is_query)
+        self.assertEqual(query.timeout_s, 2.0)
+        self.assertIsNone(self.index.lookup(["yak", "Frequency"]))
+
+    def test_rebuilds_when_file_changes(self):
+        changed = {"yak": {"Run": {"scpi_template": ":RUN"}}}
+        self.repo_path.write_bytes(orjson.dumps(changed))
+        os.utime(self.repo_path, ns=(0, 1))  # Force a different mtime even on coarse filesystems
+        self.assertEqual(self.index.lookup(["yak", "Run"]).render({}), ":RUN")
+        self.assertIsNone(self.index.lookup("yak/Frequency/nab/Center"))
+
+
+if __name__ == '__main__':
+    unittest.main()
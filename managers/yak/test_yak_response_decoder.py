@@ -0,0 +1,58 @@
+
+import unittest
+import os
+import sys
+import struct
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+import orjson
+
+from managers.yak.yak_response_decoder import (
+    YakDecodeError,
+    compile_outputs,
+    decode_response,
+    parse_definite_length_block,
+    split_response_fields,
+)
+
+
+class TestYakResponseDecoder(unittest.TestCase):
+
+    def test_typed_scalars_and_unit_scaling(self):
+        specs = compile_outputs({
+            "Center": {"data_type": "float", "instrument_units": "Hz", "units": "MHz"},
+            "Points": {"data_type": "int"},
+            "Continuous": {"data_type": "bool"},
+            "Detector": {"data_type": "enum", "options": {"POS": "Peak", "SAMP": "Sample"}},
+            "Raw": {"value": ""},
+        })
+        decoded = decode_response("+1.50000000E+009;1001;ON;POS;+1.0E+0", specs)
+        self.assertEqual([value for _, value in decoded], [1500.0, 1001, True, "Peak", "+1.0E+0"])
+        self.assertEqual([spec.encode(value) for spec, value in decoded][2:], [b"true", "Peak", "+1.0E+0"])
+        self.assertRaises(YakDecodeError, decode_response, "1;2", specs)
+
+    def test_single_array_output_is_one_payload(self):
+        specs = compile_outputs({"Trace": {"data_type": "float_array", "units": "dBm"}})
+        (spec, values), = decode_response("-90.5,-88.25,-40.0", specs)
+        self.assertEqual(list(values), [-90.5, -88.25, -40.0])
+        self.assertEqual(orjson.loads(spec.encode(values)), {"values": [-90.5, -88.25, -40.0], "count": 3, "units": "dBm"})
+
+    def test_definite_length_block(self):
+        body = struct.pack(">3f", 1.0, -2.5, 3.25)
+        block = b"#212" + body + b"\n"
+        self.assertEqual(parse_definite_length_block(block), body)
+        specs = compile_outputs({"Trace": {"data_type": "block", "format": "float32"}, "Count": {"data_type": "int"}})
+        decoded = decode_response(block.strip() + b";3", specs)
+        self.assertEqual(list(decoded[0][1]), [1.0, -2.5, 3.25])
+        self.assertEqual(decoded[1][1], 3)
+        self.assertRaises(YakDecodeError, parse_definite_length_block, b"#3999abc")
+
+    def test_split_skips_quotes(self):
+        self.assertEqual(split_response_fields('"a;b";2'), ['"a;b"', "2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,7 @@ import inspect
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 from managers.configini.config_reader import Config
+from managers.yak.yak_repository_index import compile_scpi_template
 
 app_constants = Config.get_instance()  # Get the singleton instance
 
@@ -41,32 +42,17 @@ def fill_scpi_placeholders(scpi_command_template: str, Input: dict):
             **_get_log_args(),
         )
 
-    filled_command = scpi_command_template
-
+    # The template is parsed once and cached; each call is a single substitution pass.
+    # Placeholders with no matching Input are left as written, as before.
+    values = {}
     if Input:
         for key, details in Input.items():
-            placeholder = f"<{key}>"
-            value_to_substitute = str(details.get("value", ""))
-
-            # --- NEW FIX: Replace the placeholder value with a single double quote for the path terminator ---
-            filled_command = filled_command.replace('"', '"')
-
-            if placeholder == "<path_terminator>" and placeholder in filled_command:
-                filled_command = filled_command.replace(placeholder, '"')
-                value_to_substitute = '"'
-
-            if placeholder == "<path_starter>" and placeholder in filled_command:
-                filled_command = filled_command.replace(placeholder, '"')
-                value_to_substitute = '"'
-
-            if placeholder in filled_command:
-                filled_command = filled_command.replace(
-                    placeholder, value_to_substitute
-                )
-                if app_constants.global_settings["debug_enabled"]:
-                    debug_logger(
-                        message=f"🔁 Replaced placeholder '{placeholder}' with value '{value_to_substitute}'.",
-                        **_get_log_args(),
-                    )
+            if key in ("path_terminator", "path_starter"):
+                values[key] = '"'
+            else:
+                values[key] = str(details.get("value", ""))
+    filled_command = compile_scpi_template(scpi_command_template, "angle").render(
+        values, keep_missing=True
+    )
     debug_logger(message=f"✅ Filled SCPI Command: {filled_command}", **_get_log_args())
     return filled_command
@@ -0,0 +1,313 @@
+# managers/yak/yak_correlation_store.py
+#
+# Tracks outstanding YAK queries by correlation_id as futures, with per-command timeouts,
+# LRU-bounded size and round-trip latency histograms per SCPI command.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.190000.1
+
+import bisect
+import collections
+import heapq
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+current_version = "20261016.190000.1"
+current_version_hash = 20261016 * 190000 * 1
+
+DEFAULT_TIMEOUT_S = 10.0
+DEFAULT_MAX_ENTRIES = 1024
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+LATENCY_SAMPLES_KEPT = 256  # Recent samples per command used for percentiles
+
+
+class YakCommandTimeout(TimeoutError):
+    """Raised from a YAK command future when the instrument never answered."""
+
+
+class YakCommandFailed(RuntimeError):
+    """Raised from a YAK command future when the proxy reported an error or dropped the command."""
+
+    def __init__(self, status: str, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+class _Pending:
+    __slots__ = ("future", "context", "command", "sent_ts", "deadline")
+
+    def __init__(self, future, context, command, sent_ts, deadline):
+        self.future = future
+        self.context = context
+        self.command = command
+        self.sent_ts = sent_ts
+        self.deadline = deadline
+
+
+class YakCorrelationStore:
+    """
+    Replaces the unbounded correlation_id -> context dictionary.
+
+    `register()` returns a concurrent.futures.Future that completes with the instrument's
+    response, so callers can block on `result()`, attach `add_done_callback()`, or
+    `await asyncio.wrap_future(...)`. Entries leave the store when they are resolved,
+    failed, time out (a reaper thread enforces each command's deadline and calls
+    `on_timeout`), or are evicted because the store is full (oldest first).
+    """
+
+    # Initializes the store and starts its reaper thread.
+    # Inputs:
+    #     on_timeout (Callable, optional): on_timeout(correlation_id, context, command, elapsed_s), called when a query expires.
+    #     default_timeout_s (float, optional): Deadline used when register() is not given one.
+    #     max_entries (int, optional): Most outstanding queries kept before the oldest is evicted.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        on_timeout: Optional[Callable[[str, Any, str, float], None]] = None,
+        default_timeout_s: float = DEFAULT_TIMEOUT_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.on_timeout = on_timeout
+        self.default_timeout_s = default_timeout_s
+        self.max_entries = max(1, int(max_entries))
+
+        self._lock = threading.Condition()
+        self._pending: "collections.OrderedDict[str, _Pending]" = collections.OrderedDict()
+        self._deadlines = []  # heap of (deadline, correlation_id); stale rows are skipped
+        self._histograms: Dict[str, dict] = {}
+        self._running = True
+        self.counters = {"resolved": 0, "failed": 0, "timed_out": 0, "evicted": 0, "unknown": 0}
+
+        self._reaper = threading.Thread(
+            target=self._reap_loop, name="YakCorrelationReaper", daemon=True
+        )
+        self._reaper.start()
+
+    # Starts tracking a query.
+    # Inputs:
+    #     correlation_id (str): The id sent with the command.
+    #     context (Any): Whatever the response handler needs later (path parts, output definitions).
+    #     command (str): The SCPI command, used for latency statistics and timeout reports.
+    #     timeout_s (float, optional): Seconds to wait for the response.
+    # Outputs:
+    #     Future: Completes with the response, or raises YakCommandTimeout / YakCommandFailed.
+    def register(
+        self,
+        correlation_id: str,
+        context: Any,
+        command: str,
+        timeout_s: Optional[float] = None,
+    ) -> Future:
+        """
+        Adds a pending query and returns its future.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        now = time.monotonic()
+        deadline = now + (self.default_timeout_s if timeout_s is None else timeout_s)
+        evicted = []
+        with self._lock:
+            self._pending[correlation_id] = _Pending(future, context, command, now, deadline)
+            heapq.heappush(self._deadlines, (deadline, correlation_id))
+            while len(self._pending) > self.max_entries:
+                evicted.append(self._pending.popitem(last=False))
+            self.counters["evicted"] += len(evicted)
+            self._lock.notify()
+        for evicted_id, entry in evicted:
+            debug_logger(
+                message=f"🟡 Correlation store full, evicting CorrID {evicted_id} ('{entry.command}').",
+                **_get_log_args(),
+            )
+            entry.future.set_exception(
+                YakCommandFailed("evicted", "Correlation store is full.")
+            )
+        return future
+
+    # Completes a query with its response.
+    # Inputs:
+    #     correlation_id (str): The id from the Rx_Outbox reply.
+    #     response (Any): The instrument's response.
+    # Outputs:
+    #     Any: The context given to register(), or None if the id is unknown or already expired.
+    def resolve(self, correlation_id: str, response: Any) -> Any:
+        """
+        Removes the entry, records its round-trip latency and completes its future.
+        """
+        entry = self._pop(correlation_id)
+        if entry is None:
+            return None
+        elapsed = time.monotonic() - entry.sent_ts
+        with self._lock:
+            self.counters["resolved"] += 1
+            self._record_latency(entry.command, elapsed)
+        entry.future.set_result(response)
+        return entry.context
+
+    # Completes a query with a failure reported by the proxy.
+    # Inputs:
+    #     correlation_id (str): The id from the Rx_Outbox reply.
+    #     status (str): The proxy's status, e.g. "error", "dropped", "rejected".
+    #     message (str): The error text.
+    # Outputs:
+    #     Any: The context given to register(), or None if the id is unknown.
+    def fail(self, correlation_id: str, status: str, message: str) -> Any:
+        """
+        Removes the entry and fails its future with YakCommandFailed.
+        """
+        entry = self._pop(correlation_id)
+        if entry is None:
+            return None
+        with self._lock:
+            self.counters["failed"] += 1
+        entry.future.set_exception(YakCommandFailed(status, message))
+        return entry.context
+
+    # Returns latency statistics per SCPI command header.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     dict: {command: {"count", "p50_ms", "p95_ms", "max_ms", "histogram_ms": {bucket: count}}}
+    def get_latency_stats(self) -> dict:
+        """
+        Summarises the round-trip latency histograms.
+        """
+        with self._lock:
+            histograms = {
+                command: (dict(h), list(h["samples"])) for command, h in self._histograms.items()
+            }
+        stats = {}
+        for command, (hist, samples) in histograms.items():
+            samples.sort()
+            labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [
+                f">{LATENCY_BUCKETS_MS[-1]}"
+            ]
+            stats[command] = {
+                "count": hist["count"],
+                "p50_ms": _percentile(samples, 0.50),
+                "p95_ms": _percentile(samples, 0.95),
+                "max_ms": hist["max_ms"],
+                "histogram_ms": dict(zip(labels, hist["buckets"])),
+            }
+        return stats
+
+    # Returns the store counters.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     dict: Outstanding queries plus resolved/failed/timed_out/evicted/unknown counts.
+    def get_stats(self) -> dict:
+        """
+        Returns a snapshot of the store counters.
+        """
+        with self._lock:
+            stats = dict(self.counters)
+            stats["pending"] = len(self._pending)
+        return stats
+
+    # Stops the reaper thread. Outstanding futures are left as they are.
+    def shutdown(self) -> None:
+        with self._lock:
+            self._running = False
+            self._lock.notify()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def __contains__(self, correlation_id: str) -> bool:
+        with self._lock:
+            return correlation_id in self._pending
+
+    def _pop(self, correlation_id: str) -> Optional[_Pending]:
+        with self._lock:
+            entry = self._pending.pop(correlation_id, None)
+            if entry is None:
+                self.counters["unknown"] += 1
+            return entry
+
+    # Must be called with the lock held.
+    def _record_latency(self, command: str, elapsed_s: float) -> None:
+        header = (command or "?").split(None, 1)[0].upper()
+        hist = self._histograms.get(header)
+        if hist is None:
+            hist = {
+                "count": 0,
+                "max_ms": 0.0,
+                "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                "samples": collections.deque(maxlen=LATENCY_SAMPLES_KEPT),
+            }
+            self._histograms[header] = hist
+        elapsed_ms = elapsed_s * 1000.0
+        hist["count"] += 1
+        hist["max_ms"] = max(hist["max_ms"], elapsed_ms)
+        hist["buckets"][bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        hist["samples"].append(elapsed_ms)
+
+    # Sleeps until the earliest deadline, then expires everything that is due.
+    def _reap_loop(self) -> None:
+        while True:
+            expired = []
+            with self._lock:
+                while self._running:
+                    if not self._deadlines:
+                        if expired:
+                            break
+                        self._lock.wait()
+                        continue
+                    deadline, correlation_id = self._deadlines[0]
+                    entry = self._pending.get(correlation_id)
+                    if entry is None or entry.deadline != deadline:
+                        heapq.heappop(self._deadlines)  # Already resolved or re-registered
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        if expired:
+                            break
+                        self._lock.wait(remaining)
+                        continue
+                    heapq.heappop(self._deadlines)
+                    del self._pending[correlation_id]
+                    self.counters["timed_out"] += 1
+                    expired.append((correlation_id, entry))
+                if not self._running:
+                    return
+
+            now = time.monotonic()
+            for correlation_id, entry in expired:
+                elapsed = now - entry.sent_ts
+                entry.future.set_exception(
+                    YakCommandTimeout(
+                        f"No response to '{entry.command}' after {elapsed:.2f}s."
+                    )
+                )
+                if self.on_timeout is not None:
+                    try:
+                        self.on_timeout(correlation_id, entry.context, entry.command, elapsed)
+                    except Exception as e:
+                        debug_logger(
+                            message=f"❌ Correlation timeout handler failed for {correlation_id}: {e}",
+                            **_get_log_args(),
+                        )
+
+
+def _percentile(sorted_samples: list, fraction: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
@@ -0,0 +1,485 @@
+# managers/yak/yak_repository_index.py
+#
+# Compiles the nested YAK repository (YAKETYYAK.json) once into a flat path -> command table with
+# precompiled SCPI templates, and rebuilds it when the repository file changes on disk.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.200000.1
+
+import functools
+import pathlib
+import re
+import string
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+current_version = "20261016.200000.1"
+current_version_hash = 20261016 * 200000 * 1
+
+DEFAULT_CHECK_INTERVAL_S = 1.0  # How often lookups may stat the repository file for changes
+
+_ANGLE_SLOT = re.compile(r"<([A-Za-z_][A-Za-z0-9_]*)>")
+# A lone whole-trace read (":TRACe1:DATA?", ":TRACe:DATA? TRACE{n}"); batched messages never match.
+_TRACE_DATA_QUERY = re.compile(r"^\s*:?TRAC[^:;\s]*:DATA\?[^;]*$", re.IGNORECASE)
+_FORMATTER = string.Formatter()
+_MISSING = object()
+_INF = float("inf")
+
+
+class ScpiTemplateError(ValueError):
+    """Raised when a template cannot be compiled or its arguments are missing or invalid."""
+
+
+class _Slot:
+    __slots__ = ("name", "format_spec", "conversion", "kind", "minimum", "maximum", "default")
+
+    def __init__(self, name, format_spec="", conversion=None, spec=None):
+        self.name = name
+        self.format_spec = format_spec or ""
+        self.conversion = conversion
+        spec = spec if isinstance(spec, dict) else {}
+        self.default = spec.get("value", _MISSING)
+        self.minimum = _to_number(spec.get("min"))
+        self.maximum = _to_number(spec.get("max"))
+        self.kind = _slot_kind(spec, self.default, self.minimum, self.maximum)
+
+    # Coerces and validates one argument. Integer slots return an int; float slots keep
+    # numeric strings as written (so "1.5E9" is sent as "1.5E9") once they have been checked.
+    def coerce(self, value):
+        cls = value.__class__
+        if cls is int or cls is float:
+            number = value
+        elif cls is bool:
+            raise ScpiTemplateError(f"'{self.name}' expects a number, got {value!r}.")
+        else:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                raise ScpiTemplateError(f"'{self.name}' expects a number, got {value!r}.") from None
+            value = value.strip()
+        if number != number or number in (_INF, -_INF):
+            raise ScpiTemplateError(f"'{self.name}' expects a finite number, got {value!r}.")
+        if self.kind == "int":
+            if number != int(number):
+                raise ScpiTemplateError(f"'{self.name}' expects an integer, got {value!r}.")
+            value = int(number)
+        if self.minimum is not None and number < self.minimum:
+            raise ScpiTemplateError(f"'{self.name}'={value} is below the minimum {self.minimum}.")
+        if self.maximum is not None and number > self.maximum:
+            raise ScpiTemplateError(f"'{self.name}'={value} is above the maximum {self.maximum}.")
+        return value
+
+
+class CompiledScpiTemplate:
+    """
+    An SCPI template parsed once into literal text and argument slots.
+
+    syntax="format" reads `{name}` / `{name:.3f}` placeholders (the YakTranslator's
+    `scpi_template` form); syntax="angle" reads `<name>` placeholders (the YAK v2 "message"
+    form used by yak_command_builder). `input_specs` is the command's Input block; a field's
+    "value" is the default, and "min"/"max" or a "data_type" of "int"/"float"/"str" turn on
+    numeric coercion and range checks for that slot.
+    """
+
+    __slots__ = ("template", "syntax", "slots", "_segments", "_format", "_defaults", "_checked")
+
+    # Parses the template.
+    # Inputs:
+    #     template (str): The SCPI template.
+    #     input_specs (dict, optional): {name: {"value", "min", "max", "data_type"}} or an OcaBlock with "fields".
+    #     syntax (str, optional): "format" or "angle".
+    # Outputs:
+    #     None. Raises ScpiTemplateError on a malformed template.
+    def __init__(self, template: str, input_specs: Optional[dict] = None, syntax: str = "format"):
+        self.template = template
+        self.syntax = syntax
+        specs = _input_fields(input_specs)
+        segments = []
+        if syntax == "angle":
+            position = 0
+            for match in _ANGLE_SLOT.finditer(template):
+                if match.start() > position:
+                    segments.append(template[position : match.start()])
+                name = match.group(1)
+                segments.append(_Slot(name, spec=specs.get(name)))
+                position = match.end()
+            if position < len(template):
+                segments.append(template[position:])
+        else:
+            try:
+                parsed = list(_FORMATTER.parse(template))
+            except ValueError as e:
+                raise ScpiTemplateError(f"Malformed SCPI template '{template}': {e}") from e
+            for literal, field_name, format_spec, conversion in parsed:
+                if literal:
+                    segments.append(literal)
+                if field_name is None:
+                    continue
+                if not field_name.isidentifier():
+                    raise ScpiTemplateError(
+                        f"Unsupported placeholder '{{{field_name}}}' in SCPI template '{template}'."
+                    )
+                segments.append(_Slot(field_name, format_spec, conversion, specs.get(field_name)))
+        self._segments = tuple(segments)
+        slots = [s for s in segments if isinstance(s, _Slot)]
+        self.slots = tuple(s.name for s in slots)
+
+        # Rendering is a single str.format_map over a normalised format string; only slots
+        # that need coercion or range checks are touched in Python.
+        self._format = "".join(
+            s.replace("{", "{{").replace("}", "}}") if isinstance(s, str) else self._format_field(s)
+            for s in segments
+        )
+        self._defaults = {s.name: s.default for s in slots if s.default is not _MISSING}
+        self._checked = tuple({s.name: s for s in slots if s.kind != "str"}.values())
+
+    # Fills the template.
+    # Inputs:
+    #     params (dict): Argument values by slot name; extra keys are ignored.
+    #     keep_missing (bool, optional): Leave unfilled slots as written instead of raising.
+    # Outputs:
+    #     str: The SCPI command. Raises ScpiTemplateError on a missing or invalid argument.
+    def render(self, params: dict, keep_missing: bool = False) -> str:
+        """
+        Substitutes the arguments, coercing and range-checking each one.
+        """
+        if self._defaults:
+            values = {**self._defaults, **params}
+        elif self._checked:
+            values = params.copy()
+        else:
+            values = params
+        for slot in self._checked:
+            value = values.get(slot.name, _MISSING)
+            if value is not _MISSING:
+                values[slot.name] = slot.coerce(value)
+        try:
+            return self._format.format_map(values)
+        except KeyError as e:
+            if not keep_missing:
+                raise ScpiTemplateError(f"Missing parameter {e} for '{self.template}'.") from None
+        return self._format.format_map(_KeepMissing(values, self))
+
+    @staticmethod
+    def _format_field(slot: _Slot) -> str:
+        conversion = f"!{slot.conversion}" if slot.conversion else ""
+        format_spec = f":{slot.format_spec}" if slot.format_spec else ""
+        return "{" + slot.name + conversion + format_spec + "}"
+
+
+class _KeepMissing(dict):
+    """format_map mapping that writes unfilled slots back out the way the template spelled them."""
+
+    def __init__(self, values: dict, template: CompiledScpiTemplate):
+        super().__init__(values)
+        self._template = template
+
+    def __missing__(self, name):
+        return _Verbatim(f"<{name}>" if self._template.syntax == "angle" else "{" + name + "}")
+
+
+class _Verbatim(str):
+    def __format__(self, format_spec):
+        return str(self)
+
+
+# Returns a compiled template for templates without Input specs, cached across calls.
+# Inputs:
+#     template (str): The SCPI template.
+#     syntax (str, optional): "format" or "angle".
+# Outputs:
+#     CompiledScpiTemplate.
+@functools.lru_cache(maxsize=4096)
+def compile_scpi_template(template: str, syntax: str = "format") -> CompiledScpiTemplate:
+    return CompiledScpiTemplate(template, syntax=syntax)
+
+
+class CompiledYakCommand:
+    """One executable YAK command: its declaration plus everything needed to send it."""
+
+    __slots__ = ("path", "declaration", "template", "is_query", "outputs", "timeout_s", "binary_trace")
+
+    def __init__(self, path: str, declaration: dict):
+        self.path = path
+        self.declaration = declaration
+        self.template = CompiledScpiTemplate(
+            declaration["scpi_template"], declaration.get("Input")
+        )
+        self.is_query = bool(declaration.get("is_query", False))
+        self.outputs = declaration.get("Outputs", {})
+        self.timeout_s = declaration.get("timeout_s")
+        # Whole-trace reads go to the proxy as binary transfers. A declaration can say so with
+        # "binary_trace"; otherwise it is inferred from a template that is a single trace query.
+        binary_trace = declaration.get("binary_trace")
+        if binary_trace is None:
+            binary_trace = bool(_TRACE_DATA_QUERY.match(declaration["scpi_template"]))
+        self.binary_trace = self.is_query and bool(binary_trace)
+
+    def render(self, params: dict) -> str:
+        return self.template.render(params)
+
+
+# Flattens a YAK repository into {"a/b/c": CompiledYakCommand} for every node with a scpi_template.
+# Inputs:
+#     repository (dict): The parsed YAKETYYAK.json.
+# Outputs:
+#     tuple: (commands dict, list of (path, error) for declarations that failed to compile).
+def compile_repository(repository: dict):
+    commands: Dict[str, CompiledYakCommand] = {}
+    errors = []
+    stack = [((), repository)]
+    while stack:
+        path, node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        if isinstance(node.get("scpi_template"), str):
+            joined = "/".join(path)
+            try:
+                commands[joined] = CompiledYakCommand(joined, node)
+            except ScpiTemplateError as e:
+                errors.append((joined, str(e)))
+        for key, child in node.items():
+            if isinstance(child, dict):
+                stack.append((path + (key,), child))
+    return commands, errors
+
+
+class YakRepositoryIndex:
+    """
+    The YAK repository compiled for O(1) lookups.
+
+    `lookup()` takes the path parts (or the joined path) that follow "OPEN-AIR/yak/commands/".
+    At most every `check_interval_s` a lookup also stats the repository file and recompiles
+    the table if its mtime or size changed, so edits to YAKETYYAK.json are picked up without
+    restarting. The raw nested dictionary stays available as `repository`.
+    """
+
+    # Initializes the index and loads the repository.
+    # Inputs:
+    #     repo_path (pathlib.Path): Location of YAKETYYAK.json.
+    #     check_interval_s (float, optional): Minimum seconds between file change checks.
+    # Outputs:
+    #     None.
+    def __init__(self, repo_path, check_interval_s: float = DEFAULT_CHECK_INTERVAL_S):
+        self.repo_path = pathlib.Path(repo_path)
+        self.check_interval_s = check_interval_s
+        self.repository: dict = {}
+        self.commands: Dict[str, CompiledYakCommand] = {}
+        self._signature = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.reload()
+
+    # Looks up a compiled command.
+    # Inputs:
+    #     path (list or str): Path parts, or the parts joined with "/".
+    # Outputs:
+    #     CompiledYakCommand or None.
+    def lookup(self, path) -> Optional[CompiledYakCommand]:
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval_s
+            self.refresh_if_changed()
+        if not isinstance(path, str):
+            path = "/".join(path)
+        return self.commands.get(path)
+
+    # Recompiles the table if the repository file changed since it was last loaded.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     bool: True if the table was rebuilt.
+    def refresh_if_changed(self) -> bool:
+        if self._file_signature() == self._signature:
+            return False
+        debug_logger(
+            message=f"🐂 YAK repository changed on disk, recompiling {self.repo_path}",
+            **_get_log_args(),
+        )
+        self.reload()
+        return True
+
+    # Loads and compiles the repository file. A missing or unreadable file gives an empty table.
+    def reload(self) -> None:
+        with self._lock:
+            signature = self._file_signature()
+            repository = {}
+            if signature is not None and signature[1] > 0:
+                try:
+                    repository = orjson.loads(self.repo_path.read_bytes())
+                    debug_logger(
+                        message=f"🐂 YAK repository loaded from {self.repo_path}",
+                        **_get_log_args(),
+                    )
+                except orjson.JSONDecodeError as e:
+                    debug_logger(
+                        message=f"❌ Error decoding JSON from YAK repository file {self.repo_path}: {e}. Initializing empty repository.",
+                        **_get_log_args(),
+                    )
+                except Exception as e:
+                    debug_logger(
+                        message=f"❌ Error loading YAK repository from {self.repo_path}: {e}. Initializing empty repository.",
+                        **_get_log_args(),
+                    )
+            else:
+                debug_logger(
+                    message=f"🟡 YAK repository file not found or empty at {self.repo_path}. Initializing empty repository.",
+                    **_get_log_args(),
+                )
+            self.load_repository(repository if isinstance(repository, dict) else {})
+            self._signature = signature
+
+    # Compiles an already parsed repository.
+    # Inputs:
+    #     repository (dict): The nested YAK definitions.
+    # Outputs:
+    #     None.
+    def load_repository(self, repository: dict) -> None:
+        commands, errors = compile_repository(repository)
+        for path, error in errors:
+            debug_logger(
+                message=f"❌ Skipping YAK command '{path}': {error}",
+                **_get_log_args(),
+            )
+        self.repository = repository
+        self.commands = commands
+        debug_logger(
+            message=f"✅ Compiled {len(commands)} YAK commands ({len(errors)} skipped).",
+            **_get_log_args(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def _file_signature(self):
+        try:
+            stat = self.repo_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+def _input_fields(input_specs) -> dict:
+    if not isinstance(input_specs, dict):
+        return {}
+    fields = input_specs.get("fields")
+    return fields if isinstance(fields, dict) else input_specs
+
+
+def _slot_kind(spec: dict, default, minimum, maximum) -> str:
+    data_type = str(spec.get("data_type", "")).lower()
+    if data_type in ("int", "float", "str"):
+        return data_type
+    if minimum is None and maximum is None:
+        return "str"
+    if all(
+        isinstance(v, int) or (isinstance(v, str) and v.strip().lstrip("+-").isdigit())
+        for v in (spec.get("min"), spec.get("max"), default)
+        if v is not None and v is not _MISSING
+    ):
+        return "int"
+    return "float"
+
+
+def _to_number(value):
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        text = str(value).strip()
+        return int(text) if text.lstrip("+-").isdigit() else float(text)
+    except ValueError:
+        return None
+
+
+def _benchmark(command_count: int = 2000, iterations: int = 200000) -> None:
+    """
+    Compares the previous per-message path (walk the nested dictionary, then str.format)
+    with the compiled index, on a synthetic repository.
+    """
+    import random
+
+    repository = {}
+    paths = []
+    for i in range(command_count):
+        parts = ["yak", f"Group_{i % 12}", ("nab", "set", "rig")[i % 3], f"Command_{i}", "scpi_details", "Execute Command"]
+        node = repository
+        for part in parts:
+            node = node.setdefault(part, {})
+        node.update(
+            {
+                "scpi_template": f":SENS{i % 4 + 1}:FREQ:CENT {{value}}{{units}}",
+                "is_query": False,
+                "Input": {"value": {"value": "1.0", "min": "0", "max": "26.5E9"}, "units": {"value": "HZ"}},
+            }
+        )
+        paths.append(parts)
+
+    prefix = "OPEN-AIR/yak/commands/"
+
+    def legacy(topic, params):
+        node = repository
+        for part in topic.replace(prefix, "").split("/"):
+            node = node.get(part)
+            if node is None:
+                return None
+        return node["scpi_template"].format(**params)
+
+    def build_index(repo):
+        index = YakRepositoryIndex.__new__(YakRepositoryIndex)
+        index.repo_path = pathlib.Path("/nonexistent")
+        index.check_interval_s = DEFAULT_CHECK_INTERVAL_S
+        index._lock = threading.Lock()
+        index._signature = None
+        index._next_check = float("inf")
+        index.load_repository(repo)
+        return index
+
+    checked = build_index(repository)
+    unchecked = build_index(
+        orjson.loads(orjson.dumps(repository).replace(b'"min":"0","max":"26.5E9"', b'"_":0'))
+    )
+
+    rng = random.Random(7)
+    sample = [prefix + "/".join(rng.choice(paths)) for _ in range(iterations)]
+    params = {"value": "1.5E9", "units": "HZ", "priority": "interactive"}
+
+    def walk_only(topic):
+        node = repository
+        for part in topic.replace(prefix, "").split("/"):
+            node = node.get(part)
+        return node
+
+    def rate(func):
+        start = time.perf_counter()
+        for topic in sample:
+            func(topic)
+        return iterations / (time.perf_counter() - start)
+
+    cut = len(prefix)
+    print(f"{command_count} commands, {iterations} operations each")
+    print(f"  lookup    nested walk              : {rate(walk_only):12,.0f} /s")
+    print(f"  lookup    compiled index           : {rate(lambda t: checked.lookup(t[cut:])):12,.0f} /s")
+    print(f"  translate nested walk + str.format : {rate(lambda t: legacy(t, params)):12,.0f} /s")
+    print(f"  translate compiled, no range checks: {rate(lambda t: unchecked.lookup(t[cut:]).render(params)):12,.0f} /s")
+    print(f"  translate compiled, range checked  : {rate(lambda t: checked.lookup(t[cut:]).render(params)):12,.0f} /s")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,336 @@
+# managers/yak/yak_response_decoder.py
+#
+# Decodes SCPI query responses into typed values using the output declarations in the YAK
+# repository: scalars, comma-separated numeric arrays, and IEEE 488.2 definite-length binary blocks.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.210000.1
+
+import array
+import sys
+
+import orjson
+
+# --- Graceful Dependency Importing ---
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+current_version = "20261016.210000.1"
+current_version_hash = 20261016 * 210000 * 1
+
+# Output "data_type" values understood by the decoder. Outputs without one are published raw.
+SCALAR_TYPES = ("float", "int", "bool", "enum", "str")
+ARRAY_TYPES = ("float_array", "int_array", "block")
+
+# Binary block element formats: (numpy dtype char, array typecode, item size).
+BLOCK_FORMATS = {
+    "float32": ("f4", "f", 4),
+    "float64": ("f8", "d", 8),
+    "int16": ("i2", "h", 2),
+    "int32": ("i4", "i", 4),
+    "uint8": ("u1", "B", 1),
+}
+
+# Multipliers to SI base units, used to convert "instrument_units" into "units".
+UNIT_FACTORS = {
+    "hz": 1.0, "khz": 1e3, "mhz": 1e6, "ghz": 1e9,
+    "s": 1.0, "ms": 1e-3, "us": 1e-6, "ns": 1e-9,
+    "v": 1.0, "mv": 1e-3, "uv": 1e-6,
+    "a": 1.0, "ma": 1e-3,
+    "w": 1.0, "mw": 1e-3,
+}
+
+_TRUE_WORDS = {"1", "ON", "TRUE", "YES"}
+_FALSE_WORDS = {"0", "OFF", "FALSE", "NO"}
+
+
+class YakDecodeError(ValueError):
+    """Raised when a response field does not match its output declaration."""
+
+
+# Splits a response into its ';'-separated fields, stepping over quoted strings and binary blocks.
+# Inputs:
+#     response (str or bytes): The raw instrument response.
+# Outputs:
+#     list: One str/bytes field per response message unit.
+def split_response_fields(response) -> list:
+    """
+    Responses without quotes or blocks take the plain str.split fast path, so a
+    multi-kilobyte ASCII trace is never walked character by character.
+    """
+    is_bytes = isinstance(response, (bytes, bytearray))
+    separator, quotes, hash_mark = (b";", (b'"', b"'"), b"#") if is_bytes else (";", ('"', "'"), "#")
+    if hash_mark not in response and quotes[0] not in response and quotes[1] not in response:
+        return [field.strip() for field in response.strip().split(separator)]
+
+    fields = []
+    start = 0
+    position = 0
+    length = len(response)
+    while position < length:
+        char = response[position : position + 1]
+        if char in quotes:
+            closing = response.find(char, position + 1)
+            position = length if closing < 0 else closing + 1
+        elif char == hash_mark and position == _field_start(response, start, position):
+            position = _block_end(response, position)
+        elif char == separator:
+            fields.append(response[start:position].strip())
+            start = position = position + 1
+        else:
+            position += 1
+    fields.append(response[start:].strip())
+    return fields
+
+
+# Returns the payload of an IEEE 488.2 block ("#<n><length><data>" or indefinite "#0<data>").
+# Inputs:
+#     field (str or bytes): The block, including its header. A str is treated as latin-1.
+# Outputs:
+#     bytes: The data bytes.
+def parse_definite_length_block(field) -> bytes:
+    data = field.encode("latin-1") if isinstance(field, str) else bytes(field)
+    data = data.lstrip()
+    if not data.startswith(b"#") or len(data) < 2 or not data[1:2].isdigit():
+        raise YakDecodeError("Binary block does not start with '#<digit>'.")
+    digits = int(data[1:2])
+    if digits == 0:
+        return data[2:].rstrip(b"\r\n")
+    header_end = 2 + digits
+    try:
+        size = int(data[2:header_end])
+    except ValueError:
+        raise YakDecodeError("Binary block has a malformed length header.") from None
+    if len(data) < header_end + size:
+        raise YakDecodeError(f"Binary block is truncated: expected {size} bytes, got {len(data) - header_end}.")
+    return data[header_end : header_end + size]
+
+
+class OutputSpec:
+    """
+    One declared output. Recognised keys in the YAK "Outputs" entry:
+        data_type        one of SCALAR_TYPES / ARRAY_TYPES; missing means "publish raw"
+        options          enum labels: a {raw: label} mapping or a list indexed by the raw integer
+        scale            explicit multiplier applied to numeric values
+        instrument_units / units
+                         converts e.g. "Hz" from the instrument into "MHz" for display
+        format           block element format (see BLOCK_FORMATS), default "float32"
+        byte_order       "big" (the IEEE 488.2 default) or "little"
+    """
+
+    __slots__ = ("key", "data_type", "options", "scale", "units", "block_format", "byte_order")
+
+    def __init__(self, key: str, declaration):
+        declaration = declaration if isinstance(declaration, dict) else {}
+        self.key = key
+        data_type = declaration.get("data_type")
+        self.data_type = data_type if data_type in SCALAR_TYPES + ARRAY_TYPES else None
+        self.options = declaration.get("options")
+        self.units = declaration.get("units")
+        self.scale = _scale_factor(declaration)
+        self.block_format = declaration.get("format", "float32")
+        if self.block_format not in BLOCK_FORMATS:
+            raise YakDecodeError(f"Unknown block format '{self.block_format}' for output '{key}'.")
+        self.byte_order = "little" if str(declaration.get("byte_order", "big")).lower() == "little" else "big"
+
+    @property
+    def is_array(self) -> bool:
+        return self.data_type in ARRAY_TYPES
+
+    # Decodes one response field.
+    # Inputs:
+    #     field (str or bytes): The field for this output.
+    # Outputs:
+    #     The decoded value: the raw str, a scalar, or an array (NumPy if available, else array.array).
+    def decode(self, field):
+        if self.data_type is None:
+            return _as_text(field)
+        if self.data_type == "block":
+            return self._scaled(_decode_block(parse_definite_length_block(field), self.block_format, self.byte_order))
+        text = _as_text(field).strip()
+        if self.data_type in ("float_array", "int_array"):
+            return self._scaled(_decode_ascii_array(text, self.data_type == "int_array"))
+        if self.data_type == "float":
+            return _to_float(text, self.key) * self.scale
+        if self.data_type == "int":
+            value = _to_int(text, self.key)
+            return value * self.scale if self.scale != 1.0 else value
+        if self.data_type == "bool":
+            word = text.upper()
+            if word in _TRUE_WORDS:
+                return True
+            if word in _FALSE_WORDS:
+                return False
+            raise YakDecodeError(f"'{self.key}' expects a boolean, got '{text}'.")
+        if self.data_type == "enum":
+            return _decode_enum(text, self.options)
+        return text.strip('"').strip("'")
+
+    # Encodes a decoded value as the MQTT payload for Outputs/<key>/value.
+    # Raw and str/enum values are published as text, numbers and booleans as JSON, and
+    # arrays as one JSON document: {"values": [...], "count": n, "units": ...}.
+    def encode(self, value):
+        if self.data_type is None or isinstance(value, str):
+            return value
+        if self.is_array:
+            if NUMPY_AVAILABLE and isinstance(value, np.ndarray):
+                values = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("="))
+                option = orjson.OPT_SERIALIZE_NUMPY
+            else:
+                values, option = value.tolist(), None
+            payload = {"values": values, "count": len(value)}
+            if self.units:
+                payload["units"] = self.units
+            return orjson.dumps(payload, option=option)
+        return orjson.dumps(value)
+
+    def _scaled(self, values):
+        if self.scale == 1.0:
+            return values
+        if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+            return values * self.scale
+        return array.array("d", (v * self.scale for v in values))
+
+
+# Compiles the output declarations of one command, preserving their order.
+# Inputs:
+#     outputs (dict): {key: declaration} from the YAK repository (or an OcaBlock with "fields").
+# Outputs:
+#     list: OutputSpec per output.
+def compile_outputs(outputs: dict) -> list:
+    if isinstance(outputs, dict) and isinstance(outputs.get("fields"), dict):
+        outputs = outputs["fields"]
+    return [OutputSpec(key, declaration) for key, declaration in (outputs or {}).items()]
+
+
+# Decodes a whole response against a command's outputs.
+# Inputs:
+#     response (str or bytes): The raw response.
+#     specs (list): OutputSpec list from compile_outputs().
+# Outputs:
+#     list: (OutputSpec, decoded value) pairs. Raises YakDecodeError on a field count mismatch.
+def decode_response(response, specs: list) -> list:
+    """
+    A command with a single array output receives the whole response, so a trace never goes
+    through the ';' splitter. Everything else is split into one field per output.
+    """
+    if len(specs) == 1 and specs[0].is_array:
+        return [(specs[0], specs[0].decode(response))]
+    fields = split_response_fields(response)
+    if len(fields) != len(specs):
+        raise YakDecodeError(f"Expected {len(specs)} response fields, received {len(fields)}.")
+    return [(spec, spec.decode(field)) for spec, field in zip(specs, fields)]
+
+
+def _decode_ascii_array(text: str, integers: bool):
+    if not text:
+        return np.empty(0) if NUMPY_AVAILABLE else array.array("d")
+    expected = text.count(",") + 1
+    if NUMPY_AVAILABLE:
+        values = np.fromstring(text, dtype=np.float64, sep=",")
+        if values.size != expected:
+            raise YakDecodeError(f"Numeric array parsed {values.size} of {expected} values.")
+        return values.astype(np.int64) if integers else values
+    try:
+        if integers:
+            return array.array("q", (int(float(v)) for v in text.split(",")))
+        return array.array("d", map(float, text.split(",")))
+    except ValueError as e:
+        raise YakDecodeError(f"Numeric array could not be parsed: {e}") from None
+
+
+def _decode_block(data: bytes, block_format: str, byte_order: str):
+    dtype_char, typecode, item_size = BLOCK_FORMATS[block_format]
+    if len(data) % item_size:
+        raise YakDecodeError(f"Binary block of {len(data)} bytes is not a whole number of {block_format} values.")
+    if NUMPY_AVAILABLE:
+        return np.frombuffer(data, dtype=np.dtype((">" if byte_order == "big" else "<") + dtype_char))
+    values = array.array(typecode)
+    values.frombytes(data)
+    if byte_order != sys.byteorder and item_size > 1:
+        values.byteswap()
+    return values
+
+
+def _decode_enum(text: str, options):
+    raw = text.strip('"').strip("'")
+    if isinstance(options, dict):
+        for candidate in (raw, raw.upper()):
+            if candidate in options:
+                return options[candidate]
+    elif isinstance(options, list):
+        try:
+            return options[int(float(raw))]
+        except (ValueError, IndexError):
+            pass
+    return raw
+
+
+def _scale_factor(declaration: dict) -> float:
+    scale = declaration.get("scale")
+    if scale is not None:
+        try:
+            return float(scale)
+        except (TypeError, ValueError):
+            raise YakDecodeError(f"Output scale '{scale}' is not a number.") from None
+    source = str(declaration.get("instrument_units", "")).lower()
+    target = str(declaration.get("units", "")).lower()
+    if source in UNIT_FACTORS and target in UNIT_FACTORS:
+        return UNIT_FACTORS[source] / UNIT_FACTORS[target]
+    return 1.0
+
+
+def _to_float(text: str, key: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        raise YakDecodeError(f"'{key}' expects a number, got '{text}'.") from None
+
+
+def _to_int(text: str, key: str) -> int:
+    try:
+        return int(text)
+    except ValueError:
+        number = _to_float(text, key)
+        if number != int(number):
+            raise YakDecodeError(f"'{key}' expects an integer, got '{text}'.") from None
+        return int(number)
+
+
+def _as_text(field) -> str:
+    return field.decode("latin-1") if isinstance(field, (bytes, bytearray)) else field
+
+
+def _field_start(response, start: int, position: int) -> int:
+    # The first non-blank position of the current field, so only a leading '#' opens a block.
+    while start < position and response[start : start + 1].isspace():
+        start += 1
+    return start
+
+
+def _block_end(response, position: int) -> int:
+    digit = response[position + 1 : position + 2]
+    if not digit.isdigit():
+        return position + 1
+    digits = int(digit)
+    if digits == 0:
+        return len(response)  # Indefinite-length block runs to the end of the message
+    try:
+        size = int(response[position + 2 : position + 2 + digits])
+    except ValueError:
+        return position + 1
+    return min(len(response), position + 2 + digits + size)
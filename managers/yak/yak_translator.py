@@ -15,7 +15,7 @@
 # Source Code: https://github.com/APKaudio/
 # Feature Requests can be emailed to i @ like . audio
 #
-# Version 20251225.000000.1
+# Version 20261016.200000.1
 
 import os
 import inspect
@@ -24,6 +24,7 @@ import pathlib
 import re
 import time  # For timestamping MQTT messages
 import uuid  # For correlation IDs
+from concurrent.futures import Future
 
 from managers.configini.config_reader import Config
 
@@ -34,10 +35,8 @@ from workers.logger.log_utils import _get_log_args
 from workers.mqtt.mqtt_connection_manager import MqttConnectionManager
 from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
 from workers.setup.worker_project_paths import YAKETY_YAK_REPO_PATH
-
-# Imports for command building logic (will be refactored into this class)
-# from managers.yak_manager.yak_repository_parser import get_command_node, lookup_scpi_command, lookup_inputs, lookup_outputs
-# from managers.yak_manager.yak_command_builder import fill_scpi_placeholders
+from managers.yak.yak_correlation_store import YakCorrelationStore
+from managers.yak.yak_repository_index import ScpiTemplateError, YakRepositoryIndex
 
 
 class YakTranslator:
@@ -54,8 +53,13 @@ class YakTranslator:
     ):
         self.mqtt_util = mqtt_connection_manager
         self.subscriber_router = subscriber_router
-        self.yak_repository = {}  # In-memory storage for YAK command definitions
-        self.command_context_store = {}  # Store command details keyed by correlation_id
+        self.yak_index = None  # Flat, precompiled view of the YAK command definitions
+        # Outstanding queries keyed by correlation_id, with timeouts and latency statistics
+        self.correlation_store = YakCorrelationStore(
+            on_timeout=self._on_command_timeout,
+            default_timeout_s=app_constants.YAK_RESPONSE_TIMEOUT_S,
+            max_entries=app_constants.YAK_CORRELATION_MAX_ENTRIES,
+        )
 
         self._load_yak_repository()
         self._setup_mqtt_subscriptions()
@@ -65,9 +69,17 @@ class YakTranslator:
             **_get_log_args(),
         )
 
+    @property
+    def yak_repository(self):
+        """
+        The nested YAK command definitions as loaded from the JSON file.
+        """
+        return self.yak_index.repository if self.yak_index else {}
+
     def _load_yak_repository(self):
         """
-        Loads the YAK command definitions from the JSON file into memory.
+        Loads the YAK command definitions from the JSON file and compiles them into a flat
+        path -> command index. The index recompiles itself when the file changes on disk.
         """
         current_function_name = inspect.currentframe().f_code.co_name
         repo_path = YAKETY_YAK_REPO_PATH  # Assuming this is correctly defined in worker_project_paths.py
@@ -75,32 +87,10 @@ class YakTranslator:
         if not repo_path.parent.exists():
             repo_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if repo_path.is_file() and repo_path.stat().st_size > 0:
-            try:
-                with open(repo_path, "r") as f:
-                    self.yak_repository = orjson.loads(f.read())
-                debug_logger(
-                    message=f"🐂 YAK repository loaded from {repo_path}",
-                    **_get_log_args(),
-                )
-            except orjson.JSONDecodeError as e:
-                debug_logger(
-                    message=f"❌ Error decoding JSON from YAK repository file {repo_path}: {e}. Initializing empty repository.",
-                    **_get_log_args(),
-                )
-                self.yak_repository = {}
-            except Exception as e:
-                debug_logger(
-                    message=f"❌ Error loading YAK repository from {repo_path}: {e}. Initializing empty repository.",
-                    **_get_log_args(),
-                )
-                self.yak_repository = {}
+        if self.yak_index is None:
+            self.yak_index = YakRepositoryIndex(repo_path)
         else:
-            debug_logger(
-                message=f"🟡 YAK repository file not found or empty at {repo_path}. Initializing empty repository.",
-                **_get_log_args(),
-            )
-            self.yak_repository = {}
+            self.yak_index.reload()
 
     def _setup_mqtt_subscriptions(self):
         """
@@ -125,7 +115,7 @@ class YakTranslator:
     def _on_yak_trigger_message(self, topic, payload):
         """
         Callback for incoming MQTT messages that trigger YAK command translation.
-        Parses the topic, looks up the command in the repository, builds it, and publishes to VisaProxy.
+        Parses the topic and payload and hands them to `send_command`.
         """
         current_function_name = inspect.currentframe().f_code.co_name
         debug_logger(
@@ -134,83 +124,15 @@ class YakTranslator:
         )
 
         try:
-            # The payload will likely contain parameters for substitution in the SCPI command.
-            # Example payload: {"command_key": "CENTER_FREQ_SET", "value": 100.0, "units": "MHz"}
-            # Or perhaps the topic itself contains enough info.
-
-            # For simplicity, assume payload contains the arguments for the command
-            # and the topic contains path to the command declaration in the repo.
-
             # Extract command path from topic (e.g., OPEN-AIR/yak/commands/INSTRUMENT/MEASUREMENT/FREQ)
             # Remove "OPEN-AIR/yak/commands/" prefix
             yak_command_path = topic.replace("OPEN-AIR/yak/commands/", "").split("/")
 
-            # Find the command definition in the loaded yak_repository
-            command_declaration = self._get_command_declaration(yak_command_path)
-
-            if not command_declaration:
-                debug_logger(
-                    message=f"❌ No YAK declaration found for command path: {yak_command_path}",
-                    **_get_log_args(),
-                    level="ERROR",
-                )
-                return
-
             # Assume payload contains parameters for substitution
             # e.g., if command is "FREQ {value} {units}", payload could be {"value": 100, "units": "MHZ"}
             payload_data = orjson.loads(payload)
 
-            # Build the SCPI command
-            scpi_template = command_declaration.get("scpi_template")
-            if not scpi_template:
-                debug_logger(
-                    message=f"❌ No 'scpi_template' found in YAK declaration for {yak_command_path}",
-                    **_get_log_args(),
-                    level="ERROR",
-                )
-                return
-
-            # Perform substitutions (using a simplified version of yak_command_builder logic)
-            final_scpi_command = self._fill_scpi_placeholders(
-                scpi_template, payload_data
-            )
-
-            if not final_scpi_command:
-                debug_logger(
-                    message=f"❌ Failed to build SCPI command from template: {scpi_template} and payload: {payload_data}",
-                    **_get_log_args(),
-                    level="ERROR",
-                )
-                return
-
-            # Determine if it's a query or write based on declaration
-            is_query = command_declaration.get("is_query", False)
-
-            # Generate correlation ID for response handling
-            correlation_id = str(uuid.uuid4())
-
-            # Store command context for YakRxManager
-            self.command_context_store[correlation_id] = {
-                "path_parts": yak_command_path,
-                "command_details": command_declaration.get("Outputs", {}),
-            }
-
-            # Publish to VisaProxy's Tx_Inbox
-            proxy_payload = {
-                "command": final_scpi_command,
-                "query": is_query,
-                "correlation_id": correlation_id,
-            }
-            self.mqtt_util.get_client_instance().publish(
-                topic="OPEN-AIR/Proxy/Tx_Inbox",
-                payload=orjson.dumps(proxy_payload),
-                qos=0,
-                retain=False,
-            )
-            debug_logger(
-                message=f"⬆️ Published SCPI command to Proxy Tx_Inbox: '{final_scpi_command}' (Query: {is_query}, CorrID: {correlation_id})",
-                **_get_log_args(),
-            )
+            self.send_command(yak_command_path, payload_data)
 
         except orjson.JSONDecodeError:
             debug_logger(
@@ -225,50 +147,113 @@ class YakTranslator:
                 level="CRITICAL",
             )
 
-    def _get_command_declaration(self, path_parts: list):
+    def send_command(self, yak_command_path: list, payload_data: dict):
         """
-        Navigates the yak_repository to find the command declaration.
-        Example path_parts: ["INSTRUMENT", "MEASUREMENT", "FREQ", "SET"]
-        """
-        node = self.yak_repository
-        for part in path_parts:
-            node = node.get(part)
-            if node is None:
-                return None
-        return node
-
-    def _fill_scpi_placeholders(self, scpi_template: str, params: dict):
-        """
-        Fills placeholders in an SCPI command template using parameters from a dictionary.
-        Example: "FREQ {value}{units}" with {"value": 100, "units": "MHZ"} -> "FREQ 100MHZ"
+        Builds the SCPI command for a YAK path and publishes it to the Proxy's Tx_Inbox.
+
+        Returns a concurrent.futures.Future that completes with the raw instrument response
+        for queries (or None at once for writes), so callers can block on it, attach
+        callbacks, or `await asyncio.wrap_future(...)`. Queries that are not answered within
+        the declaration's `timeout_s` (default YAK_RESPONSE_TIMEOUT_S) fail with
+        YakCommandTimeout and a timeout result is published to the command's Outputs.
+        Returns None if the command could not be built.
         """
-        try:
-            # Use f-string formatting style
-            formatted_command = scpi_template.format(**params)
-            return formatted_command
-        except KeyError as e:
+        # Find the compiled command in the repository index
+        yak_path = "/".join(yak_command_path)
+        compiled_command = self.yak_index.lookup(yak_path)
+
+        if compiled_command is None:
             debug_logger(
-                message=f"❌ Missing parameter for SCPI template '{scpi_template}': {e}",
+                message=f"❌ No YAK declaration with a 'scpi_template' found for command path: {yak_command_path}",
                 **_get_log_args(),
                 level="ERROR",
             )
             return None
-        except Exception as e:
+
+        # Fill the precompiled template; arguments are coerced and range-checked against the Input block
+        try:
+            final_scpi_command = compiled_command.render(payload_data)
+        except ScpiTemplateError as e:
             debug_logger(
-                message=f"❌ Error filling SCPI placeholders for template '{scpi_template}': {e}",
+                message=f"❌ Failed to build SCPI command from template: {compiled_command.template.template} and payload: {payload_data}: {e}",
                 **_get_log_args(),
                 level="ERROR",
             )
             return None
 
-    def retrieve_command_context(self, correlation_id: str):
+        # Determine if it's a query or write based on declaration
+        is_query = compiled_command.is_query
+
+        # Generate correlation ID for response handling
+        correlation_id = str(uuid.uuid4())
+
+        # Only queries get an answer, so only queries are tracked for YakRxManager.
+        # Registering before publishing means a fast response can never beat its context.
+        if is_query:
+            future = self.correlation_store.register(
+                correlation_id,
+                {
+                    "path_parts": yak_command_path,
+                    "command_details": compiled_command.outputs,
+                },
+                final_scpi_command,
+                timeout_s=compiled_command.timeout_s,
+            )
+        else:
+            future = Future()
+            future.set_running_or_notify_cancel()
+
+        # Publish to VisaProxy's Tx_Inbox
+        proxy_payload = {
+            "command": final_scpi_command,
+            "query": is_query,
+            "correlation_id": correlation_id,
+            # Routing hints for the fleet dispatcher: the YAK path names the model, and
+            # background reads can ask for the polling lane.
+            "yak_path": yak_path,
+            "priority": payload_data.get("priority", "interactive"),
+        }
+        if payload_data.get("serial"):
+            proxy_payload["serial"] = payload_data["serial"]
+        if compiled_command.binary_trace:
+            # Whole-trace reads come back as a binary payload on Proxy/Rx_Trace/<serial>.
+            proxy_payload["binary"] = True
+        try:
+            self.mqtt_util.get_client_instance().publish(
+                topic="OPEN-AIR/Proxy/Tx_Inbox",
+                payload=orjson.dumps(proxy_payload),
+                qos=0,
+                retain=False,
+            )
+        except Exception as e:
+            if is_query:
+                self.correlation_store.fail(correlation_id, "error", str(e))
+            else:
+                future.set_exception(e)
+            raise
+        if not is_query:
+            future.set_result(None)
+        debug_logger(
+            message=f"⬆️ Published SCPI command to Proxy Tx_Inbox: '{final_scpi_command}' (Query: {is_query}, CorrID: {correlation_id})",
+            **_get_log_args(),
+        )
+        return future
+
+    def _get_command_declaration(self, path_parts: list):
+        """
+        Returns the command declaration for a path from the compiled index.
+        Example path_parts: ["INSTRUMENT", "MEASUREMENT", "FREQ", "SET"]
         """
-        Retrieves and removes the command context associated with a correlation ID.
+        compiled_command = self.yak_index.lookup(path_parts)
+        return compiled_command.declaration if compiled_command else None
+
+    def retrieve_command_context(self, correlation_id: str, response=None):
+        """
+        Retrieves and removes the command context associated with a correlation ID,
+        completing the command's future with `response`.
         """
-        if correlation_id in self.command_context_store:
-            context = self.command_context_store.pop(
-                correlation_id
-            )  # Retrieve and remove
+        context = self.correlation_store.resolve(correlation_id, response)
+        if context is not None:
             debug_logger(
                 message=f"✅ Retrieved command context for CorrID: {correlation_id}",
                 **_get_log_args(),
@@ -276,8 +261,70 @@ class YakTranslator:
             return context
         else:
             debug_logger(
-                message=f"❌ No command context found for CorrID: {correlation_id}",
+                message=f"❌ No command context found for CorrID: {correlation_id} (unknown, timed out or evicted)",
                 **_get_log_args(),
                 level="WARNING",
             )
             return None
+
+    def fail_command(self, correlation_id: str, status: str, message: str):
+        """
+        Fails a pending query whose reply reported an error (e.g. the proxy errored,
+        dropped or rejected it) and publishes the failure to the command's Outputs.
+        """
+        context = self.correlation_store.fail(correlation_id, status, message)
+        if context is None:
+            return None
+        self._publish_command_status(
+            context.get("path_parts"),
+            {"status": status, "correlation_id": correlation_id, "error": message},
+        )
+        return context
+
+    def get_latency_stats(self) -> dict:
+        """
+        Returns round-trip latency histograms per SCPI command header, plus the
+        correlation store counters under "_store".
+        """
+        stats = self.correlation_store.get_latency_stats()
+        stats["_store"] = self.correlation_store.get_stats()
+        return stats
+
+    def _on_command_timeout(self, correlation_id, context, command, elapsed_s):
+        """
+        Called by the correlation store when a query was never answered.
+        """
+        debug_logger(
+            message=f"⏰ No response to '{command}' after {elapsed_s:.2f}s (CorrID: {correlation_id}).",
+            **_get_log_args(),
+            level="WARNING",
+        )
+        self._publish_command_status(
+            context.get("path_parts"),
+            {
+                "status": "timeout",
+                "correlation_id": correlation_id,
+                "command": command,
+                "elapsed_s": round(elapsed_s, 3),
+            },
+        )
+
+    def _publish_command_status(self, path_parts, result: dict):
+        """
+        Publishes a structured command result to OPEN-AIR/yak/<path>/Outputs/_status,
+        alongside the output values YakRxManager publishes for successful queries.
+        """
+        if not path_parts:
+            return
+        result["timestamp"] = time.time()
+        status_topic = "/".join(["OPEN-AIR", "yak"] + list(path_parts[:4]) + ["Outputs", "_status"])
+        try:
+            self.mqtt_util.get_client_instance().publish(
+                topic=status_topic, payload=orjson.dumps(result), qos=0, retain=True
+            )
+        except Exception as e:
+            debug_logger(
+                message=f"❌ Failed to publish command status to '{status_topic}': {e}",
+                **_get_log_args(),
+                level="ERROR",
+            )
@@ -1,6 +1,7 @@
 # State_Cache/cache_io_handler.py
 #
-# Handles all disk I/O operations for the application's state cache, including loading and atomic saving of snapshots.
+# Handles all disk I/O operations for the application's state cache, including loading and atomic saving of snapshots,
+# the append-only change journal, and journal replay/compaction.
 #
 # Author: Anthony Peter Kuzub
 # Blog: www.Like.audio (Contributor to this project)
@@ -19,29 +20,41 @@ import orjson
 import pathlib
 import tempfile
 import inspect
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Tuple
 
 import workers.setup.worker_project_paths as app_constants
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 
-current_version = "20251230.230000.1"
-current_version_hash = 20251230 * 230000 * 1
+current_version = "20261016.110000.1"
+current_version_hash = 20261016 * 110000 * 1
 
 
-# Loads the application state cache from `device_state_snapshot.json` on disk.
-# This function attempts to read a JSON file containing the cached device state.
-# If the file exists and is readable, its contents are returned as a dictionary;
-# otherwise, an empty dictionary is returned, and any errors are logged.
+# Loads the application state cache from disk.
+# This function reads the base snapshot (`device_state_snapshot.json`) and then replays
+# the append-only change journal over it, so changes recorded since the last compaction
+# are not lost. If neither file is readable, an empty dictionary is returned.
 # Inputs:
 #     None.
 # Outputs:
 #     Dict[str, Any]: A dictionary representing the loaded cache data, or an empty dictionary on failure.
 def load_cache() -> Dict[str, Any]:
     """
-    Reads device_state_snapshot.json from the DATA directory defined in app_constants.
+    Reads device_state_snapshot.json from the DATA directory defined in app_constants
+    and replays device_state_journal.jsonl on top of it.
     Returns an empty dict on failure/missing file.
     """
+    data = _load_base_snapshot()
+    replay_journal(data)
+    return data
+
+
+# Reads the base snapshot written by the last compaction.
+# Inputs:
+#     None.
+# Outputs:
+#     Dict[str, Any]: The base snapshot, or an empty dictionary on failure.
+def _load_base_snapshot() -> Dict[str, Any]:
     debug_logger(message="📖  We're attempting to read the Almanac!", **_get_log_args())
     try:
         if app_constants.DEVICE_STATE_SNAPSHOT_PATH.exists():
@@ -76,11 +89,12 @@ def load_cache() -> Dict[str, Any]:
 # Inputs:
 #     data (Dict[str, Any]): The dictionary containing the state cache data to be saved.
 # Outputs:
-#     bool: True if the cache was saved successfully, False otherwise.
-def save_cache(data: Dict[str, Any]) -> bool:
+#     int: The number of bytes written if the cache was saved successfully, 0 otherwise.
+def save_cache(data: Dict[str, Any]) -> int:
     """
     Writes the dictionary to disk. Use a temp file + rename (atomic write)
     to prevent corruption during a power loss.
+    Returns the number of bytes written (0 on failure) so callers can keep I/O counters.
     """
     debug_logger(message="✍️  We're about to write to the Almanac!", **_get_log_args())
     try:
@@ -92,19 +106,22 @@ def save_cache(data: Dict[str, Any]) -> bool:
         with tempfile.NamedTemporaryFile(
             mode="wb", dir=temp_dir, delete=False, suffix=".tmp"
         ) as temp_f:
-            temp_f.write(orjson.dumps(data))
+            encoded = orjson.dumps(data)
+            temp_f.write(encoded)
+            temp_f.flush()
+            os.fsync(temp_f.fileno())
             temp_path = temp_f.name
         debug_logger(
             message=f"↔️ Temporal duplicate created at {temp_path}. Now, for the switch!",
             **_get_log_args(),
         )
 
-        os.rename(temp_path, app_constants.DEVICE_STATE_SNAPSHOT_PATH)
+        os.replace(temp_path, app_constants.DEVICE_STATE_SNAPSHOT_PATH)
         debug_logger(
             message="💾  The timeline has been successfully recorded in the Almanac!",
             **_get_log_args(),
         )
-        return True
+        return len(encoded)
     except Exception as e:
         debug_logger(
             message=f"💥  We've created a paradox! Failed to save the cache: {e}",
@@ -116,4 +133,125 @@ def save_cache(data: Dict[str, Any]) -> bool:
                 message="🔥 Paradox contained. Temporal duplicate destroyed.",
                 **_get_log_args(),
             )
-        return False
\ No newline at end of file
+        return 0
+
+
+# Appends a batch of changed topics to the append-only journal.
+# Each change is written as one small orjson line `[topic, payload]`, so the cost of a
+# write is proportional to what changed rather than to the size of the whole cache.
+# The file is flushed and fsync'd so an acknowledged batch survives a crash.
+# Inputs:
+#     records (Iterable[Tuple[str, Any]]): The (topic, payload) pairs to append.
+# Outputs:
+#     int: The number of bytes appended, 0 on failure or when there is nothing to write.
+def append_journal(records: Iterable[Tuple[str, Any]]) -> int:
+    """
+    Appends (topic, payload) records to device_state_journal.jsonl.
+    Returns the number of bytes written (0 on failure).
+    """
+    try:
+        encoded = b"".join(
+            orjson.dumps([topic, payload]) + b"\n" for topic, payload in records
+        )
+        if not encoded:
+            return 0
+        with open(app_constants.DEVICE_STATE_JOURNAL_PATH, "ab") as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        return len(encoded)
+    except Exception as e:
+        debug_logger(
+            message=f"💥  The journal refused the entry! Failed to append to the journal: {e}",
+            **_get_log_args(),
+        )
+        return 0
+
+
+# Replays the change journal over a base snapshot, in place.
+# Records are applied in file order, so the last record for a topic wins. A torn or
+# corrupt line (e.g. from a crash mid-append) is skipped rather than aborting the replay.
+# Inputs:
+#     data (Dict[str, Any]): The base snapshot to update.
+# Outputs:
+#     int: The number of journal records applied.
+def replay_journal(data: Dict[str, Any]) -> int:
+    """
+    Applies device_state_journal.jsonl on top of `data` and returns the record count.
+    """
+    journal_path = app_constants.DEVICE_STATE_JOURNAL_PATH
+    if not journal_path.exists():
+        return 0
+
+    applied = 0
+    skipped = 0
+    try:
+        with open(journal_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    topic, payload = orjson.loads(line)
+                except Exception:
+                    skipped += 1
+                    continue
+                data[topic] = payload
+                applied += 1
+    except Exception as e:
+        debug_logger(
+            message=f"🆘  The journal is unreadable! Could not replay it: {e}",
+            **_get_log_args(),
+        )
+        return applied
+
+    debug_logger(
+        message=f"📜 Replayed {applied} journal entries onto the Almanac ({skipped} torn entries skipped).",
+        **_get_log_args(),
+    )
+    return applied
+
+
+# Returns the current size of the change journal in bytes.
+# Inputs:
+#     None.
+# Outputs:
+#     int: The journal size, or 0 if it does not exist.
+def journal_size() -> int:
+    """
+    Returns the size of device_state_journal.jsonl in bytes (0 if missing).
+    """
+    try:
+        return app_constants.DEVICE_STATE_JOURNAL_PATH.stat().st_size
+    except OSError:
+        return 0
+
+
+# Compacts the journal into the base snapshot.
+# The full state is written atomically with `save_cache` first; only once that has
+# succeeded is the journal truncated. A crash between the two steps simply replays the
+# journal over the new base on the next load, so no journaled change is lost.
+# Inputs:
+#     data (Dict[str, Any]): The complete, current state cache.
+# Outputs:
+#     int: The number of bytes written to the base snapshot, 0 on failure.
+def compact_cache(data: Dict[str, Any]) -> int:
+    """
+    Writes `data` as the new base snapshot and truncates the journal.
+    Returns the number of bytes written (0 on failure, in which case the journal is kept).
+    """
+    written = save_cache(data)
+    if not written:
+        return 0
+    try:
+        with open(app_constants.DEVICE_STATE_JOURNAL_PATH, "wb"):
+            pass
+        debug_logger(
+            message="🗜️ The journal has been folded into the Almanac.",
+            **_get_log_args(),
+        )
+    except Exception as e:
+        debug_logger(
+            message=f"💥  Failed to truncate the journal after compaction: {e}",
+            **_get_log_args(),
+        )
+    return written
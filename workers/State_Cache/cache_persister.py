@@ -0,0 +1,322 @@
+# State_Cache/cache_persister.py
+#
+# A write-behind, debounced persister that coalesces bursts of cache changes into journal appends and periodic compactions.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.110000.1
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from . import cache_io_handler
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+current_version = "20261016.110000.1"
+current_version_hash = 20261016 * 110000 * 1
+
+DEFAULT_FLUSH_INTERVAL_S = 2.0
+DEFAULT_DIRTY_THRESHOLD = 500
+DEFAULT_COMPACT_JOURNAL_BYTES = 4 * 1024 * 1024
+DEFAULT_COMPACT_INTERVAL_S = 600.0
+
+
+class CachePersister:
+    """
+    Owns a background thread that persists state cache changes some time after they
+    happen, instead of on every change.
+
+    Each flush appends only the changed topics to the journal. Once the journal grows
+    past `compact_journal_bytes` (or `compact_interval_s` has passed) the full cache is
+    written as the new base snapshot and the journal is truncated.
+    """
+
+    # Initializes the CachePersister.
+    # The persister never touches the cache directly; it asks `snapshot_provider` for a
+    # consistent copy when it is time to compact.
+    # Inputs:
+    #     snapshot_provider (Callable): Returns a point-in-time copy of the cache.
+    #     io_handler (module, optional): Provides append_journal, compact_cache and journal_size.
+    #     flush_interval_s (float, optional): Maximum time a change may sit in memory before it is journaled.
+    #     dirty_threshold (int, optional): Number of pending changes that forces an early flush.
+    #     compact_journal_bytes (int, optional): Journal size that triggers a compaction.
+    #     compact_interval_s (float, optional): Maximum time between compactions while changes keep arriving.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        snapshot_provider: Callable[[], Dict[str, Any]],
+        io_handler: Any = cache_io_handler,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        dirty_threshold: int = DEFAULT_DIRTY_THRESHOLD,
+        compact_journal_bytes: int = DEFAULT_COMPACT_JOURNAL_BYTES,
+        compact_interval_s: float = DEFAULT_COMPACT_INTERVAL_S,
+    ):
+        self.snapshot_provider = snapshot_provider
+        self.io_handler = io_handler
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.dirty_threshold = max(1, int(dirty_threshold))
+        self.compact_journal_bytes = max(0, int(compact_journal_bytes))
+        self.compact_interval_s = max(0.0, float(compact_interval_s))
+
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()  # Serialises disk writes between the worker and flush_now()
+        self._pending: Dict[str, Any] = {}  # topic -> latest payload; bursts on one topic coalesce here
+        self._dirty_count = 0
+        self._first_dirty_ts: Optional[float] = None
+        self._compaction_requested = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._journal_bytes = self.io_handler.journal_size()
+        self._last_compaction_ts = time.monotonic()
+
+        self.flush_count = 0
+        self.failed_flush_count = 0
+        self.compaction_count = 0
+        self.bytes_written = 0
+        self.changes_persisted = 0
+        self.changes_coalesced = 0
+        self.last_flush_ts: Optional[float] = None
+
+    # Starts the background write-behind thread.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     None.
+    def start(self) -> None:
+        """
+        Starts the persister thread. Calling start() twice is harmless.
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="StateCachePersister", daemon=True
+        )
+        self._thread.start()
+        debug_logger(
+            message=f"🗄️ Write-behind persister online (interval={self.flush_interval_s}s, threshold={self.dirty_threshold}).",
+            **_get_log_args(),
+        )
+
+    # Records a changed topic and schedules a write.
+    # This is the hot-path call made for every changed MQTT message, so it only stores the
+    # payload under the lock and wakes the worker when there is something new to do.
+    # Inputs:
+    #     topic (str): The MQTT topic that changed.
+    #     payload (Any): The new payload for the topic.
+    # Outputs:
+    #     None.
+    def record_change(self, topic: str, payload: Any) -> None:
+        """
+        Queues a changed topic. Writes are coalesced by the background thread.
+        """
+        with self._condition:
+            if topic in self._pending:
+                self.changes_coalesced += 1
+            self._pending[topic] = payload
+            self._mark_dirty_locked(1)
+
+    # Requests a full compaction on the next flush, e.g. after the cache was replaced wholesale.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     None.
+    def request_compaction(self) -> None:
+        """
+        Forces the next flush to rewrite the base snapshot and truncate the journal.
+        """
+        with self._condition:
+            self._compaction_requested = True
+            self._mark_dirty_locked(1)
+
+    # Synchronously writes any pending changes on the calling thread.
+    # Inputs:
+    #     compact (bool, optional): Also fold the journal into the base snapshot.
+    # Outputs:
+    #     bool: True if everything pending was written successfully, False otherwise.
+    def flush_now(self, compact: bool = False) -> bool:
+        """
+        Writes pending changes immediately instead of waiting for the interval.
+        """
+        with self._condition:
+            if compact:
+                self._compaction_requested = True
+            if self._dirty_count == 0 and not self._compaction_requested:
+                return True
+        return self._flush()
+
+    # Stops the background thread, optionally writing any pending changes first.
+    # Inputs:
+    #     flush (bool, optional): Perform a final flush and compaction of pending changes.
+    #     timeout (float, optional): Seconds to wait for the worker thread to exit.
+    # Outputs:
+    #     None.
+    def stop(self, flush: bool = True, timeout: float = 5.0) -> None:
+        """
+        Stops the persister. With flush=True no acknowledged change is lost on shutdown
+        and the next start-up reads a freshly compacted base snapshot.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        if flush:
+            self.flush_now(compact=True)
+        debug_logger(
+            message=f"🛑 Write-behind persister stopped. {self.get_stats()}",
+            **_get_log_args(),
+        )
+
+    # Returns the persister counters.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     dict: Flush, compaction, byte and pending-change counters.
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the persister counters.
+        """
+        with self._condition:
+            pending = self._dirty_count
+        return {
+            "flushes": self.flush_count,
+            "failed_flushes": self.failed_flush_count,
+            "compactions": self.compaction_count,
+            "bytes_written": self.bytes_written,
+            "journal_bytes": self._journal_bytes,
+            "changes_persisted": self.changes_persisted,
+            "changes_coalesced": self.changes_coalesced,
+            "pending_changes": pending,
+            "last_flush_ts": self.last_flush_ts,
+        }
+
+    # Bumps the dirty counter and wakes the worker. Must be called with the condition held.
+    # Inputs:
+    #     count (int): The number of changes being reported.
+    # Outputs:
+    #     None.
+    def _mark_dirty_locked(self, count: int) -> None:
+        if self._dirty_count == 0:
+            self._first_dirty_ts = time.monotonic()
+            self._condition.notify()
+        self._dirty_count += count
+        if self._dirty_count >= self.dirty_threshold:
+            self._condition.notify()
+
+    # The worker loop. Sleeps until the cache is dirty, then waits out the remainder of the
+    # flush interval (or until the dirty threshold is crossed) before writing once.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     None.
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and self._dirty_count == 0:
+                    self._condition.wait()
+                if not self._running:
+                    return
+
+                while self._running and self._dirty_count < self.dirty_threshold:
+                    remaining = self.flush_interval_s - (
+                        time.monotonic() - self._first_dirty_ts
+                    )
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(timeout=remaining)
+                if not self._running:
+                    return  # stop() performs the final flush on the caller's thread
+
+            self._flush()
+
+    # Appends pending changes to the journal and compacts when due, updating the counters.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     bool: True if all pending work was written successfully.
+    def _flush(self) -> bool:
+        with self._flush_lock:
+            with self._condition:
+                records = self._pending
+                pending = self._dirty_count
+                compact = self._compaction_requested
+                self._pending = {}
+                self._dirty_count = 0
+                self._first_dirty_ts = None
+                self._compaction_requested = False
+
+            ok = True
+            if records:
+                written = self._call_io("append_journal", list(records.items()))
+                if written:
+                    self._journal_bytes += written
+                    self.bytes_written += written
+                else:
+                    ok = False
+
+            if ok and (compact or self._compaction_due()):
+                written = self._call_io("compact_cache", self.snapshot_provider())
+                if written:
+                    self.compaction_count += 1
+                    self.bytes_written += written
+                    self._journal_bytes = 0
+                    self._last_compaction_ts = time.monotonic()
+                else:
+                    ok = False
+
+            if ok:
+                self.flush_count += 1
+                self.changes_persisted += len(records)
+                self.last_flush_ts = time.time()
+                return True
+
+            # Put the work back so the next cycle retries it; newer payloads win.
+            self.failed_flush_count += 1
+            with self._condition:
+                for topic, payload in records.items():
+                    self._pending.setdefault(topic, payload)
+                self._compaction_requested = self._compaction_requested or compact
+                self._mark_dirty_locked(max(1, pending))
+            return False
+
+    # Decides whether the journal has grown enough (or aged enough) to fold into the base.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     bool: True if a compaction should run now.
+    def _compaction_due(self) -> bool:
+        if self._journal_bytes == 0:
+            return False
+        if self._journal_bytes >= self.compact_journal_bytes:
+            return True
+        return time.monotonic() - self._last_compaction_ts >= self.compact_interval_s
+
+    # Calls an io_handler function, logging and swallowing any exception.
+    # Inputs:
+    #     name (str): The io_handler function name.
+    #     argument (Any): The single argument to pass.
+    # Outputs:
+    #     int: The bytes written reported by the handler, 0 on failure.
+    def _call_io(self, name: str, argument: Any) -> int:
+        try:
+            return int(getattr(self.io_handler, name)(argument) or 0)
+        except Exception as e:
+            debug_logger(
+                message=f"❌ Write-behind {name} failed: {e}", **_get_log_args()
+            )
+            return 0
@@ -46,8 +46,7 @@ def process_traffic(
     Returns (False, None) if it's redundant.
     """
     debug_logger(
-        message=f"tt! A new event is rippling through the timeline! Topic: {topic}",
-        **_get_log_args(),
+        message=lambda: f"tt! A new event is rippling through the timeline! Topic: {topic}"
     )
     try:
         if isinstance(payload, bytes):
@@ -60,8 +59,7 @@ def process_traffic(
 
         if state_comparator.should_update(topic, new_payload, current_cache):
             debug_logger(
-                message=f"⚓ A change in the timeline! This is heavy. Topic: {topic}",
-                **_get_log_args(),
+                message=lambda: f"⚓ A change in the timeline! This is heavy. Topic: {topic}"
             )
             return True, new_payload
         else:
@@ -15,16 +15,21 @@
 # Version 20250821.200641.1
 
 import inspect
+import threading
 from typing import Dict, Any
 
 from . import cache_io_handler
 from . import cache_traffic_controller
 from . import gui_state_restorer
+from .cache_persister import CachePersister
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
+from managers.configini.config_reader import Config
 
-current_version = "20251230.230400.1"
-current_version_hash = 20251230 * 230400 * 1
+app_constants = Config.get_instance()  # Get the singleton instance
+
+current_version = "20261016.110000.1"
+current_version_hash = 20261016 * 110000 * 1
 
 
 class StateCacheManager:
@@ -34,7 +39,8 @@ class StateCacheManager:
 
     # Initializes the StateCacheManager.
     # This constructor sets up the manager with references to the MQTT connection
-    # and state mirror engines, and initializes the internal cache dictionary.
+    # and state mirror engines, initializes the internal cache dictionary, and starts
+    # the write-behind persister that flushes the cache to disk.
     # Inputs:
     #     mqtt_connection_manager (Any): An instance of the MQTT connection manager.
     #     state_mirror_engine (Any, optional): An instance of the state mirror engine.
@@ -48,6 +54,15 @@ class StateCacheManager:
         self.state_mirror_engine = state_mirror_engine
         self.cache = {}
         self.subscriber_router = None
+        self._cache_lock = threading.Lock()
+        self.persister = CachePersister(
+            snapshot_provider=self._snapshot_cache,
+            flush_interval_s=app_constants.STATE_CACHE_FLUSH_INTERVAL_S,
+            dirty_threshold=app_constants.STATE_CACHE_DIRTY_THRESHOLD,
+            compact_journal_bytes=app_constants.STATE_CACHE_COMPACT_JOURNAL_BYTES,
+            compact_interval_s=app_constants.STATE_CACHE_COMPACT_INTERVAL_S,
+        )
+        self.persister.start()
         debug_logger(
             message="🚀 Great Scott! The State Cache Manager is online! We're ready to manipulate the timeline!",
             **_get_log_args(),
@@ -72,8 +87,9 @@ class StateCacheManager:
         )
 
     # Initializes the application state by loading the cache from disk and restoring the GUI.
-    # This function orchestrates the loading of cached data from `device_state_snapshot.json`
+    # This function orchestrates the loading of cached data (base snapshot plus journal replay)
     # and, if data is present, uses the GUI state restorer to bring the GUI to its last known state.
+    # The replayed journal is then compacted so the session starts from a clean base.
     # Inputs:
     #     None.
     # Outputs:
@@ -86,7 +102,11 @@ class StateCacheManager:
             message="🧐 Initializing the timeline... let's see what the past holds.",
             **_get_log_args(),
         )
-        self.cache = cache_io_handler.load_cache()
+        loaded_cache = cache_io_handler.load_cache()
+        with self._cache_lock:
+            self.cache = loaded_cache
+        if cache_io_handler.journal_size():
+            self.persister.request_compaction()
         if self.cache:
             debug_logger(
                 message="📖 The Almanac has entries! Engaging the Time Circuits!",
@@ -102,8 +122,8 @@ class StateCacheManager:
     # Handles incoming MQTT messages, processes them, updates the cache, and forwards them.
     # This method acts as a central handler for all incoming MQTT traffic. It uses
     # the cache traffic controller to determine if an update is necessary, updates
-    # the internal cache, saves the cache to disk, and then forwards the message
-    # to the subscriber router.
+    # the internal cache, hands the change to the write-behind persister, and then
+    # forwards the message to the subscriber router.
     # Inputs:
     #     client: The Paho MQTT client instance.
     #     userdata: User-defined data passed to the callback.
@@ -112,11 +132,11 @@ class StateCacheManager:
     #     None.
     def handle_incoming_mqtt(self, client, userdata, msg) -> None:
         """
-        Calls Traffic Controller -> Calls IO Save (if changed) -> Calls router.
+        Calls Traffic Controller -> Journals the change (if changed) -> Calls router.
         """
         topic = msg.topic
         payload = msg.payload
-        debug_logger(message=f"🌀 Topic: {topic}", **_get_log_args())
+        debug_logger(message=lambda: f"🌀 Topic: {topic}")
 
         should_process, new_payload = cache_traffic_controller.process_traffic(
             topic, payload, self.cache
@@ -127,8 +147,9 @@ class StateCacheManager:
                 message="🏋️ This is heavy! The timeline has been altered. Recording the new event.",
                 **_get_log_args(),
             )
-            self.cache[topic] = new_payload
-            cache_io_handler.save_cache(self.cache)
+            with self._cache_lock:
+                self.cache[topic] = new_payload
+            self.persister.record_change(topic, new_payload)
         else:
             debug_logger(
                 message="👯 The event is a duplicate. No alteration to the timeline needed.",
@@ -145,4 +166,40 @@ class StateCacheManager:
             debug_logger(
                 message="🤷 Nowhere to route the temporal flux! The subscriber router is missing!",
                 **_get_log_args(),
-            )
\ No newline at end of file
+            )
+
+    # Returns a point-in-time copy of the cache for the persister to serialise.
+    # Payloads are replaced rather than mutated, so a shallow copy is consistent.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     Dict[str, Any]: A shallow copy of the cache.
+    def _snapshot_cache(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            return dict(self.cache)
+
+    # Returns the write-behind persister counters (flushes, compactions, bytes written, pending changes).
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     dict: The persister statistics.
+    def get_persistence_stats(self) -> Dict[str, Any]:
+        """
+        Exposes the persister counters for diagnostics.
+        """
+        return self.persister.get_stats()
+
+    # Stops the write-behind persister, forcing a final flush and compaction so no change is lost.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     None.
+    def shutdown(self) -> None:
+        """
+        Flushes any pending changes to the Almanac and stops the persister.
+        """
+        debug_logger(
+            message="💾 Shutting down the State Cache. Committing the timeline to the Almanac!",
+            **_get_log_args(),
+        )
+        self.persister.stop(flush=True)
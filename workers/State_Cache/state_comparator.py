@@ -42,9 +42,7 @@ def should_update(
     If ts is missing, compare val.
     If identical, return False.
     """
-    debug_logger(
-        message=f"⚖️ Comparing timelines for topic: {incoming_topic}", **_get_log_args()
-    )
+    debug_logger(message=lambda: f"⚖️ Comparing timelines for topic: {incoming_topic}")
     cached_payload = cached_state.get(incoming_topic)
     if not cached_payload:
         debug_logger(
@@ -57,8 +55,7 @@ def should_update(
 
     if incoming_ts and cached_ts:
         debug_logger(
-            message=f"🕰️ Comparing timestamps: Incoming '{incoming_ts}' vs Cached '{cached_ts}'",
-            **_get_log_args(),
+            message=lambda: f"🕰️ Comparing timestamps: Incoming '{incoming_ts}' vs Cached '{cached_ts}'"
         )
         if incoming_ts > cached_ts:
             debug_logger(
@@ -79,8 +76,7 @@ def should_update(
     cached_val = cached_payload.get("val")
     if incoming_val != cached_val:
         debug_logger(
-            message=f"🔀 Values have changed! Incoming '{incoming_val}' vs Cached '{cached_val}'. Updating.",
-            **_get_log_args(),
+            message=lambda: f"🔀 Values have changed! Incoming '{incoming_val}' vs Cached '{cached_val}'. Updating."
         )
         return True
 
@@ -0,0 +1,53 @@
+
+import unittest
+import os
+import sys
+import pathlib
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from workers.State_Cache import cache_io_handler
+
+
+class TestCacheJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        paths = cache_io_handler.app_constants
+        self._saved_paths = (paths.DEVICE_STATE_SNAPSHOT_PATH, paths.DEVICE_STATE_JOURNAL_PATH)
+        paths.DEVICE_STATE_SNAPSHOT_PATH = pathlib.Path(self.temp_dir.name) / "snapshot.json"
+        paths.DEVICE_STATE_JOURNAL_PATH = pathlib.Path(self.temp_dir.name) / "journal.jsonl"
+
+    def tearDown(self):
+        paths = cache_io_handler.app_constants
+        paths.DEVICE_STATE_SNAPSHOT_PATH, paths.DEVICE_STATE_JOURNAL_PATH = self._saved_paths
+        self.temp_dir.cleanup()
+
+    def test_journal_replays_over_base_snapshot(self):
+        self.assertTrue(cache_io_handler.save_cache({"a": {"val": 1}, "b": {"val": 2}}))
+        cache_io_handler.append_journal([("a", {"val": 10})])
+        cache_io_handler.append_journal([("c", {"val": 3}), ("a", {"val": 11})])
+        self.assertEqual(
+            cache_io_handler.load_cache(),
+            {"a": {"val": 11}, "b": {"val": 2}, "c": {"val": 3}},
+        )
+
+    def test_torn_tail_is_skipped(self):
+        cache_io_handler.append_journal([("a", {"val": 1})])
+        with open(cache_io_handler.app_constants.DEVICE_STATE_JOURNAL_PATH, "ab") as f:
+            f.write(b'["b", {"val"')
+        self.assertEqual(cache_io_handler.load_cache(), {"a": {"val": 1}})
+
+    def test_compaction_folds_journal_into_base(self):
+        cache_io_handler.append_journal([("a", {"val": 1})])
+        self.assertGreater(cache_io_handler.journal_size(), 0)
+        self.assertGreater(cache_io_handler.compact_cache({"a": {"val": 1}}), 0)
+        self.assertEqual(cache_io_handler.journal_size(), 0)
+        self.assertEqual(cache_io_handler.load_cache(), {"a": {"val": 1}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+
+import unittest
+import os
+import sys
+import threading
+import time
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from workers.State_Cache.cache_persister import CachePersister
+
+
+class FakeIoHandler:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.journal = []
+        self.snapshots = []
+        self.written = threading.Event()
+
+    def journal_size(self):
+        return 0
+
+    def append_journal(self, records):
+        if self.fail:
+            return 0
+        self.journal.extend(records)
+        self.written.set()
+        return 10 * len(records)
+
+    def compact_cache(self, snapshot):
+        if self.fail:
+            return 0
+        self.snapshots.append(dict(snapshot))
+        self.journal = []
+        return 100
+
+
+class TestCachePersister(unittest.TestCase):
+
+    def test_burst_is_coalesced_into_one_journal_append(self):
+        io = FakeIoHandler()
+        persister = CachePersister(dict, io_handler=io, flush_interval_s=0.2, dirty_threshold=1000)
+        persister.start()
+        for i in range(100):
+            persister.record_change(f"OPEN-AIR/fader/{i % 10}", {"val": i})
+        self.assertTrue(io.written.wait(2.0))
+        persister.stop(flush=False)
+
+        self.assertEqual(len(io.journal), 10)
+        self.assertEqual(dict(io.journal)["OPEN-AIR/fader/9"], {"val": 99})
+        stats = persister.get_stats()
+        self.assertEqual(stats["flushes"], 1)
+        self.assertEqual(stats["bytes_written"], 100)
+        self.assertEqual(stats["changes_coalesced"], 90)
+        self.assertEqual(io.snapshots, [])
+
+    def test_dirty_threshold_forces_early_flush(self):
+        io = FakeIoHandler()
+        persister = CachePersister(dict, io_handler=io, flush_interval_s=60.0, dirty_threshold=5)
+        persister.start()
+        start = time.monotonic()
+        for i in range(5):
+            persister.record_change(f"t/{i}", {"val": i})
+        self.assertTrue(io.written.wait(2.0))
+        self.assertLess(time.monotonic() - start, 2.0)
+        persister.stop(flush=False)
+
+    def test_journal_size_triggers_compaction(self):
+        io = FakeIoHandler()
+        persister = CachePersister(lambda: {"t": {"val": 1}}, io_handler=io, compact_journal_bytes=20)
+        persister.record_change("t", {"val": 1})
+        self.assertTrue(persister.flush_now())
+        self.assertEqual(io.snapshots, [])
+        persister.record_change("t", {"val": 1})
+        self.assertTrue(persister.flush_now())
+        self.assertEqual(io.snapshots, [{"t": {"val": 1}}])
+        self.assertEqual(persister.get_stats()["journal_bytes"], 0)
+
+    def test_stop_forces_final_flush_and_compaction(self):
+        io = FakeIoHandler()
+        persister = CachePersister(lambda: {"t": {"val": 1}}, io_handler=io, flush_interval_s=60.0)
+        persister.start()
+        persister.record_change("t", {"val": 1})
+        persister.stop(flush=True)
+        self.assertEqual(io.snapshots, [{"t": {"val": 1}}])
+        self.assertEqual(persister.get_stats()["pending_changes"], 0)
+        self.assertEqual(persister.get_stats()["compactions"], 1)
+
+    def test_failed_write_stays_pending(self):
+        io = FakeIoHandler(fail=True)
+        persister = CachePersister(dict, io_handler=io, flush_interval_s=60.0)
+        persister.record_change("a", {"val": 1})
+        persister.record_change("b", {"val": 2})
+        self.assertFalse(persister.flush_now())
+        stats = persister.get_stats()
+        self.assertEqual(stats["failed_flushes"], 1)
+        self.assertEqual(stats["pending_changes"], 2)
+
+        io.fail = False
+        self.assertTrue(persister.flush_now())
+        self.assertEqual(sorted(io.journal), [("a", {"val": 1}), ("b", {"val": 2})])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,8 @@ from workers.logger.log_utils import _get_log_args
 from workers.styling.style import THEMES, DEFAULT_THEME
 import os
 from workers.mqtt.mqtt_topic_utils import get_topic
+from workers.builder.builder_core.gui_animation_clock import AnimationClock
+from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityRegistry
 
 
 class BarGraphCreatorMixin:
@@ -209,7 +211,8 @@ class BarGraphCreatorMixin:
             frame.anim_target = value_default
             frame.anim_mode = "idle" # idle, tracking, holding, decaying
             frame.anim_hold_start = 0
-            frame.anim_running = False
+            animation_clock = AnimationClock.for_widget(canvas)
+            visibility = VisibilityRegistry.scope_for(canvas)
             frame.anim_peak_expiry = 0
             frame.anim_peak_value = value_default
 
@@ -261,9 +264,10 @@ class BarGraphCreatorMixin:
                     elif now_ms > frame.anim_peak_expiry:
                         canvas.itemconfig(peak_led, fill="#444444")
 
-            def animate():
+            # Advances the bar (and its peak marker) by one frame of the shared animation clock.
+            # Returns True while there is motion (or a hold) left, so the clock keeps ticking it.
+            def animate(dt):
                 current = frame.anim_current_value
-                dt = 20.0 # ms per frame
                 full_range = max_val - min_val
                 if full_range <= 0: full_range = 1.0
 
@@ -283,8 +287,7 @@ class BarGraphCreatorMixin:
                         frame.anim_mode = "decaying"
                     else:
                         draw_indicator() # Still update peak if it's falling
-                        canvas.after(int(dt), animate)
-                        return
+                        return True
 
                 if frame.anim_mode == "tracking":
                     target = frame.anim_target
@@ -307,12 +310,9 @@ class BarGraphCreatorMixin:
                             frame.anim_hold_start = time.time() * 1000
                         else:
                             frame.anim_mode = "decaying"
-                        canvas.after(int(dt), animate)
-                        return
-                    else:
-                        frame.anim_mode = "idle"
-                        frame.anim_running = False
-                        return
+                        return True
+                    frame.anim_mode = "idle"
+                    return False
 
                 step = 0.0
                 time_param = glide_time if diff > 0 else (dwell_time if frame.anim_mode == "tracking" else fall_time)
@@ -325,14 +325,12 @@ class BarGraphCreatorMixin:
 
                 frame.anim_current_value += step
                 draw_indicator()
-                canvas.after(int(dt), animate)
+                return True
 
             def on_value_change(*args):
                 frame.anim_target = vu_value_var.get()
                 frame.anim_mode = "tracking"
-                if not frame.anim_running:
-                    frame.anim_running = True
-                    animate()
+                animation_clock.wake(animate, visibility)
 
             vu_value_var.trace_add("write", on_value_change)
             draw_indicator()
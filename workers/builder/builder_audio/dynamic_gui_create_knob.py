@@ -14,10 +14,11 @@
 # Source Code: https://github.com/APKaudio/
 # Feature Requests can be emailed to i @ like . audio
 #
-# Version 20260114.KnobOverhaul.1
+# Version 20261017.020000.1
 
 import tkinter as tk
 from tkinter import ttk
+import functools
 import math
 import sys
 import os
@@ -30,6 +31,38 @@ from workers.handlers.widget_event_binder import bind_variable_trace
 
 app_constants = Config.get_instance()
 
+# Background track (start, extent) in degrees for each knob style.
+KNOB_TRACK_SPANS = {"standard": (240, -300), "panner": (225, -270), "dial": (0, 359.9)}
+
+# Scale ticks every 30 degrees from 240 (min) down to -60 (max); the unit vectors are computed
+# once and shared by every knob on the page.
+KNOB_TICK_UNITS = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle))) for angle in range(240, -61, -30)
+)
+
+
+# Unit vectors of `count` vertices evenly spaced from 0 degrees, computed once per count.
+@functools.lru_cache(maxsize=None)
+def _ring_units(count):
+    step = 2 * math.pi / count
+    return tuple((math.cos(i * step), math.sin(i * step)) for i in range(count))
+
+
+# Returns the flat points of a polygon ring rotated by `start_angle` degrees. `radii` is cycled
+# over the vertices, e.g. (outer, inner) for a gear. Rotating the cached unit vectors costs one
+# cos/sin pair per call instead of one per vertex.
+def _rotated_ring_points(cx, cy, radii, count, start_angle):
+    rad = math.radians(start_angle)
+    cos_r, sin_r = math.cos(rad), math.sin(rad)
+    cycle = len(radii)
+    points = []
+    for i, (ux, uy) in enumerate(_ring_units(count)):
+        r = radii[i % cycle]
+        points.append(cx + r * (ux * cos_r - uy * sin_r))
+        points.append(cy - r * (uy * cos_r + ux * sin_r))
+    return points
+
+
 class CustomKnobFrame(ttk.Frame):
     def __init__(
         self,
@@ -222,9 +255,12 @@ class KnobCreatorMixin:
             knob_fill_color = config.get("knob_fill_color", "")
             knob_teeth = int(config.get("knob_teeth", 8))
 
+            # The static layer follows the canvas size; value changes reuse the drawn items.
+            knob_size = {"width": width, "height": height}
+
             def update_knob_visuals(*args):
                 self._draw_knob(
-                    canvas, width, height, knob_value_var.get(), frame.min_val, frame.max_val, 
+                    canvas, knob_size["width"], knob_size["height"], knob_value_var.get(), frame.min_val, frame.max_val, 
                     value_label, fg_color, accent_color, indicator_color, visual_props["secondary"],
                     text_inside=text_inside,
                     no_center=no_center,
@@ -245,7 +281,13 @@ class KnobCreatorMixin:
                     knob_style=knob_style
                 )
 
+            def on_canvas_resize(event):
+                if event.width > 1 and (event.width, event.height) != (knob_size["width"], knob_size["height"]):
+                    knob_size["width"], knob_size["height"] = event.width, event.height
+                    update_knob_visuals()
+
             knob_value_var.trace_add("write", update_knob_visuals)
+            canvas.bind("<Configure>", on_canvas_resize)
             update_knob_visuals()
 
             def on_mousewheel(event):
@@ -297,17 +339,144 @@ class KnobCreatorMixin:
             return None
 
     def _draw_knob(self, canvas, width, height, value, min_val, max_val, value_label, neutral_color, accent_for_arc, indicator_color, secondary, text_inside=False, no_center=False, show_ticks=False, tick_length=10, arc_width=5, pointer_length=None, pointer_offset=0, shape="circle", pointer_style="line", tick_style="simple", gradient_level=0, outline_thickness=2, outline_color="gray", fill_color="", teeth=8, knob_style="standard"):
-        """Modular rendering pipeline."""
+        """
+        Retained rendering pipeline.
+
+        The static layer (background track, ticks, fixed body, centre dot) is drawn once per
+        size, range and style. A value change only moves the dynamic items (value arc, pointer,
+        rotating gear/octagon body, readout) with coords/itemconfigure, and a hover only
+        recolours the track, so no canvas items are created or deleted while the knob turns.
+        """
+        layout = {
+            "width": width, "height": height, "min_val": min_val, "max_val": max_val,
+            "indicator_color": indicator_color, "text_inside": text_inside, "no_center": no_center,
+            "show_ticks": show_ticks, "tick_length": tick_length, "arc_width": arc_width,
+            "pointer_length": pointer_length, "pointer_offset": pointer_offset, "shape": shape,
+            "pointer_style": pointer_style, "tick_style": tick_style, "gradient_level": gradient_level,
+            "outline_thickness": outline_thickness, "outline_color": outline_color,
+            "fill_color": fill_color, "teeth": teeth, "knob_style": knob_style,
+        }
+        items = getattr(canvas, "knob_items", None)
+        if items is None or items["layout"] != layout:
+            items = self._build_knob_layers(canvas, layout, secondary)
+            canvas.knob_items = items
+            if text_inside:
+                value_label.place_forget(); value_label.pack_forget()
+        elif items["secondary"] != secondary:
+            self._recolor_knob_track(canvas, items, secondary)
+
+        self._update_knob_layers(canvas, items, value, value_label)
+
+    def _build_knob_layers(self, canvas, layout, secondary):
+        """Draws the static layer and creates the dynamic items, in the knob's Z-order."""
         canvas.delete("all")
+        width, height = layout["width"], layout["height"]
+        arc_width = layout["arc_width"]
+        knob_style = layout["knob_style"]
+        indicator_color = layout["indicator_color"]
         cx, cy = width / 2, height / 2
-        
+
         # Calculate max radius
         padding = arc_width / 2 + 2
-        if show_ticks:
-            padding += tick_length + 5 # Extra padding for numbers
-            
+        if layout["show_ticks"]:
+            padding += layout["tick_length"] + 5 # Extra padding for numbers
         radius = min(width, height) / 2 - padding
-        
+        bbox = (cx - radius, cy - radius, cx + radius, cy + radius)
+
+        items = {"layout": layout, "secondary": secondary, "cx": cx, "cy": cy, "radius": radius, "angles": None, "text_value": None}
+
+        # 1. Track - Background (static) and value arc (dynamic)
+        bg_start, bg_extent = KNOB_TRACK_SPANS.get(knob_style, KNOB_TRACK_SPANS["standard"])
+        items["track"] = canvas.create_arc(*bbox, start=bg_start, extent=bg_extent, style=tk.ARC, outline=secondary, width=arc_width)
+        arc_style = tk.PIESLICE if knob_style == "dial" else tk.ARC
+        items["value_arc"] = canvas.create_arc(*bbox, start=0, extent=0, style=arc_style, outline="", fill="", width=arc_width, state=tk.HIDDEN)
+        items["center_tick"] = None
+        if knob_style == "panner":
+            # Center tick for panner when near 0
+            items["center_tick"] = canvas.create_line(cx, cy - radius + 2, cx, cy - radius + 12, fill=secondary, width=2, state=tk.HIDDEN)
+
+        # 2. Ticks (static)
+        if layout["show_ticks"]:
+            self._draw_ticks(canvas, cx, cy, radius, arc_width, layout["tick_length"], layout["tick_style"], secondary, layout["min_val"], layout["max_val"], tags=("knob_ticks",))
+
+        # 3. Body - a circle is static, a gear or octagon turns with the pointer
+        items["body"] = []
+        if knob_style != "dial": # Dial usually doesn't have a central "knob" body in the same way, or it IS the body
+            body = self._draw_body(canvas, cx, cy, radius, layout["shape"], layout["outline_color"], layout["gradient_level"], outline_thickness=layout["outline_thickness"], fill_color=layout["fill_color"], teeth=layout["teeth"])
+            if layout["shape"] in ("octagon", "gear"):
+                items["body"] = body
+
+        # 4. Pointer (dynamic) and centre dot (static)
+        pointer_style = layout["pointer_style"]
+        if pointer_style == "triangle":
+            items["pointer"] = canvas.create_polygon(cx, cy, cx, cy, cx, cy, fill=indicator_color, outline=indicator_color)
+        elif pointer_style == "notch":
+            items["pointer"] = canvas.create_line(cx, cy, cx, cy, fill=indicator_color, width=4, capstyle=tk.BUTT)
+        else:
+            items["pointer"] = canvas.create_line(cx, cy, cx, cy, fill=indicator_color, width=2, capstyle=tk.ROUND)
+        if not layout["no_center"]:
+            canvas.create_oval(cx - 3, cy - 3, cx + 3, cy + 3, fill=indicator_color, outline=indicator_color)
+
+        # 5. Readout (dynamic)
+        items["text"] = None
+        if layout["text_inside"]:
+            items["text"] = canvas.create_text(cx, cy + (10 if not layout["no_center"] else 0), text="", fill=indicator_color, font=("Helvetica", 8, "bold"))
+        return items
+
+    def _recolor_knob_track(self, canvas, items, secondary):
+        """Applies a new track colour (hover) to the static items drawn in it."""
+        items["secondary"] = secondary
+        canvas.itemconfigure(items["track"], outline=secondary)
+        if items["center_tick"] is not None:
+            canvas.itemconfigure(items["center_tick"], fill=secondary)
+        if items["layout"]["tick_style"] == "dots":
+            canvas.itemconfigure("knob_ticks", fill=secondary, outline=secondary)
+        else:
+            canvas.itemconfigure("knob_ticks", fill=secondary)
+
+    def _update_knob_layers(self, canvas, items, value, value_label):
+        """Moves the dynamic items to `value`; unchanged angles and text cost nothing."""
+        layout = items["layout"]
+        knob_style = layout["knob_style"]
+        start_angle, val_extent, pointer_angle_deg = self._knob_angles(value, layout["min_val"], layout["max_val"], knob_style)
+
+        if items["angles"] != (start_angle, val_extent):
+            items["angles"] = (start_angle, val_extent)
+            cx, cy, radius = items["cx"], items["cy"], items["radius"]
+
+            if abs(val_extent) > 0.1:
+                # Panner Coloring: red for right (negative extent from 90), active for left
+                color = "red" if knob_style == "panner" and val_extent < 0 else layout["indicator_color"]
+                if knob_style == "dial":
+                    canvas.itemconfigure(items["value_arc"], start=start_angle, extent=val_extent, fill=color, state=tk.NORMAL)
+                else:
+                    canvas.itemconfigure(items["value_arc"], start=start_angle, extent=val_extent, outline=color, state=tk.NORMAL)
+                if items["center_tick"] is not None:
+                    canvas.itemconfigure(items["center_tick"], state=tk.HIDDEN)
+            else:
+                canvas.itemconfigure(items["value_arc"], state=tk.HIDDEN)
+                if items["center_tick"] is not None:
+                    canvas.itemconfigure(items["center_tick"], state=tk.NORMAL)
+
+            for item, ring_radius in items["body"]:
+                if layout["shape"] == "octagon":
+                    points = self._get_poly_points(cx, cy, ring_radius, sides=8, start_angle=pointer_angle_deg)
+                else:
+                    points = self._get_gear_points(cx, cy, ring_radius, teeth=layout["teeth"], notch_depth=0.15, start_angle=pointer_angle_deg)
+                canvas.coords(item, points)
+
+            canvas.coords(items["pointer"], self._get_pointer_points(cx, cy, radius, layout["arc_width"], pointer_angle_deg, layout["pointer_style"], layout["pointer_length"], layout["pointer_offset"]))
+
+        text = f"{int(value)}"
+        if text != items["text_value"]:
+            items["text_value"] = text
+            if items["text"] is not None:
+                canvas.itemconfigure(items["text"], text=text)
+            else:
+                value_label.config(text=text)
+
+    def _knob_angles(self, value, min_val, max_val, knob_style="standard"):
+        """Returns (start_angle, val_extent, pointer_angle_deg) of the value arc and pointer."""
         # 1. Math Prep
         if max_val > min_val:
             norm_val_0_1 = (value - min_val) / (max_val - min_val)
@@ -321,73 +490,29 @@ class KnobCreatorMixin:
         pointer_angle_deg = start_angle + val_extent
 
         if knob_style == "panner":
-            # Center Zero Logic
-            # Assuming min_val < 0 < max_val usually, or we map 0.5 to center
-            # Let's assume standard -100 to 100 or similar where 0 is center.
-            # Or if min/max are positive, we treat midpoint as center?
-            # "Panner" usually implies 0 is center. 
+            # Center Zero Logic: the midpoint of the range sits at 12 o'clock (90 degrees).
+            # Right is Clockwise (-), Left is Counter-Clockwise (+), up to +/- 135 degrees.
             mid_val = (min_val + max_val) / 2
-            norm_from_center = (value - mid_val) / ((max_val - min_val) / 2) # -1 to 1
-            
-            # Arc logic for panner: Top is 90 degrees.
-            # Right is Clockwise (-), Left is Counter-Clockwise (+)
-            # Extent is proportional to distance from center.
-            # Max extent from center? Let's say +/- 135 degrees
+            half_span = (max_val - min_val) / 2
+            norm_from_center = (value - mid_val) / half_span if half_span else 0 # -1 to 1
             panner_max_arc = 135
-            
-            # If norm_from_center > 0 (Right), start=90, extent = - (norm * 135)
-            # If norm_from_center < 0 (Left), start=90, extent = + (abs(norm) * 135)
-            
-            if norm_from_center >= 0:
-                 start_angle = 90
-                 val_extent = -1 * norm_from_center * panner_max_arc
-            else:
-                 start_angle = 90
-                 val_extent = abs(norm_from_center) * panner_max_arc
-            
-            pointer_angle_deg = 90 + (-1 * norm_from_center * panner_max_arc) # 90 is 12 o'clock
 
-        elif knob_style == "dial":
-             # Dial / Pie Chart style
-             # Usually starts at 90 (12 o'clock) and goes full 360 or 240?
-             # Based on dynamic_gui_create_dial.py: start=90, extent = -360 * norm
-             start_angle = 90
-             val_extent = -360 * norm_val_0_1
-             if abs(val_extent) >= 360: val_extent = -359.9
-             pointer_angle_deg = start_angle + val_extent
-
-
-        # 2. Draw Track (The Arc) - Background
-        # For Dial, we might not want a background track, or a full circle?
-        # Dial code had: start=0, extent=359.9
-        bg_start = 0 if knob_style == "dial" else 240
-        bg_extent = 359.9 if knob_style == "dial" else -300
-        if knob_style == "panner":
-             bg_start = 225
-             bg_extent = -270 # 135 left + 135 right
-        
-        self._draw_track(canvas, cx, cy, radius, bg_start, bg_extent, start_angle, val_extent, secondary, indicator_color, arc_width, knob_style)
-        
-        # 3. Draw Ticks - Background
-        if show_ticks:
-            self._draw_ticks(canvas, cx, cy, radius, arc_width, tick_length, tick_style, secondary, min_val, max_val)
+            start_angle = 90
+            val_extent = -1 * norm_from_center * panner_max_arc
+            pointer_angle_deg = 90 + val_extent # 90 is 12 o'clock
 
-        # 4. Draw Body / Outline (The Gear) - Middle Layer
-        if knob_style != "dial": # Dial usually doesn't have a central "knob" body in the same way, or it IS the body
-            self._draw_body(canvas, cx, cy, radius, shape, outline_color, gradient_level, rotation_angle=pointer_angle_deg, outline_thickness=outline_thickness, fill_color=fill_color, teeth=teeth)
-            
-        # 5. Draw Pointer - Top Layer
-        self._draw_pointer(canvas, cx, cy, radius, arc_width, pointer_angle_deg, pointer_style, indicator_color, pointer_length, pointer_offset, no_center)
+        elif knob_style == "dial":
+            # Dial / Pie Chart style: start=90, extent = -360 * norm
+            start_angle = 90
+            val_extent = -360 * norm_val_0_1
+            if abs(val_extent) >= 360: val_extent = -359.9
+            pointer_angle_deg = start_angle + val_extent
 
-        # 6. Text Updates
-        if text_inside:
-            value_label.place_forget(); value_label.pack_forget()
-            canvas.create_text(cx, cy + (10 if not no_center else 0), text=f"{int(value)}", fill=indicator_color, font=("Helvetica", 8, "bold"))
-        else:
-             value_label.config(text=f"{int(value)}")
+        return start_angle, val_extent, pointer_angle_deg
 
-    def _draw_body(self, canvas, cx, cy, radius, shape, color, gradient_level, rotation_angle=0, outline_thickness=0, fill_color="", teeth=8):
-        """Draws the background shape."""
+    def _draw_body(self, canvas, cx, cy, radius, shape, color, gradient_level, rotation_angle=0, outline_thickness=0, fill_color="", teeth=8, tags=()):
+        """Draws the background shape. Returns [(item, ring_radius), ...] of the drawn rings."""
+        drawn = []
         # Simple gradient simulation using concentric rings
         steps = gradient_level + 1
         for i in range(steps):
@@ -411,14 +536,15 @@ class KnobCreatorMixin:
             if shape == "circle":
                 # Only draw if explicitly needed (e.g. filled body)
                 if gradient_level > 0 or (i == 0 and (current_thickness > 0 or current_fill)):
-                    canvas.create_oval(cx-r, cy-r, cx+r, cy+r, outline=color, width=current_thickness, fill=current_fill)
+                    drawn.append((canvas.create_oval(cx-r, cy-r, cx+r, cy+r, outline=color, width=current_thickness, fill=current_fill, tags=tags), r))
             elif shape == "octagon":
                 points = self._get_poly_points(cx, cy, r, sides=8, start_angle=rotation_angle)
-                canvas.create_polygon(points, outline=color, fill=current_fill, width=current_thickness)
+                drawn.append((canvas.create_polygon(points, outline=color, fill=current_fill, width=current_thickness, tags=tags), r))
             elif shape == "gear":
                 # Gear: adjustable teeth
                 points = self._get_gear_points(cx, cy, r, teeth=teeth, notch_depth=0.15, start_angle=rotation_angle)
-                canvas.create_polygon(points, outline=color, fill=current_fill, width=current_thickness)
+                drawn.append((canvas.create_polygon(points, outline=color, fill=current_fill, width=current_thickness, tags=tags), r))
+        return drawn
 
     def _draw_track(self, canvas, cx, cy, radius, bg_start, bg_extent, start_angle, val_extent, bg_color, active_color, width, knob_style="standard"):
         """Draws the value arc."""
@@ -446,109 +572,77 @@ class KnobCreatorMixin:
             # Center tick for panner when near 0
             canvas.create_line(cx, cy - radius + 2, cx, cy - radius + 12, fill=bg_color, width=2)
 
-    def _draw_ticks(self, canvas, cx, cy, radius, arc_width, tick_length, style, color, min_val, max_val):
-        start_angle = 240
-        end_angle = 240 - 300
-        step = 30 # degrees between ticks
-        
-        curr = start_angle
+    def _draw_ticks(self, canvas, cx, cy, radius, arc_width, tick_length, style, color, min_val, max_val, tags=()):
         val_step = (max_val - min_val) / 10.0 # Approx 10 ticks
-        curr_val = min_val
-        
-        while curr >= end_angle - 1: # Allow small float error
-            rad = math.radians(curr)
-            ts_dist = radius + (arc_width/2) + 2
-            te_dist = ts_dist + tick_length
-            
-            ts_x = cx + ts_dist * math.cos(rad)
-            ts_y = cy - ts_dist * math.sin(rad)
-            te_x = cx + te_dist * math.cos(rad)
-            te_y = cy - te_dist * math.sin(rad)
+        ts_dist = radius + (arc_width/2) + 2
+        te_dist = ts_dist + tick_length
+
+        for index, (cos_a, sin_a) in enumerate(KNOB_TICK_UNITS):
+            ts_x = cx + ts_dist * cos_a
+            ts_y = cy - ts_dist * sin_a
+            te_x = cx + te_dist * cos_a
+            te_y = cy - te_dist * sin_a
             
             if style == "dots":
-                canvas.create_oval(te_x-1, te_y-1, te_x+1, te_y+1, fill=color, outline=color)
+                canvas.create_oval(te_x-1, te_y-1, te_x+1, te_y+1, fill=color, outline=color, tags=tags)
             elif style == "numeric":
                 # Draw number
-                txt = f"{int(curr_val)}"
-                canvas.create_text(te_x, te_y, text=txt, fill=color, font=("Arial", 6))
+                txt = f"{int(min_val + index * val_step)}"
+                canvas.create_text(te_x, te_y, text=txt, fill=color, font=("Arial", 6), tags=tags)
             else:
                 # Line (default)
-                canvas.create_line(ts_x, ts_y, te_x, te_y, fill=color, width=1)
-            
-            curr -= step
-            curr_val += val_step
+                canvas.create_line(ts_x, ts_y, te_x, te_y, fill=color, width=1, tags=tags)
 
     def _draw_pointer(self, canvas, cx, cy, radius, arc_width, angle_deg, style, color, length, offset, no_center):
+        points = self._get_pointer_points(cx, cy, radius, arc_width, angle_deg, style, length, offset)
+        if style == "triangle":
+            canvas.create_polygon(points, fill=color, outline=color)
+        elif style == "notch":
+            canvas.create_line(points, fill=color, width=4, capstyle=tk.BUTT)
+        else:
+            canvas.create_line(points, fill=color, width=2, capstyle=tk.ROUND)
+
+        if not no_center:
+            canvas.create_oval(cx - 3, cy - 3, cx + 3, cy + 3, fill=color, outline=color)
+
+    # --- Geometry Helpers ---
+    def _get_pointer_points(self, cx, cy, radius, arc_width, angle_deg, style, length, offset):
+        """Returns the flat coordinate list of the pointer for the given style."""
         angle_rad = math.radians(angle_deg)
+        cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
         
         p_start = offset
         p_end = (radius - arc_width/2) if length is None else (offset + float(length))
         
         if style == "triangle":
-            # Triangle pointing out
-            # Base at p_start, tip at p_end
-            tip_x = cx + p_end * math.cos(angle_rad)
-            tip_y = cy - p_end * math.sin(angle_rad)
+            # Triangle pointing out: base at p_start, tip at p_end
+            tip_x = cx + p_end * cos_a
+            tip_y = cy - p_end * sin_a
             
             # Base width
             w = 5 
             # Base center
-            bx = cx + p_start * math.cos(angle_rad)
-            by = cy - p_start * math.sin(angle_rad)
+            bx = cx + p_start * cos_a
+            by = cy - p_start * sin_a
             
-            # Perpendicular vector for base corners
-            perp_ang = angle_rad + math.pi/2
-            c1x = bx + w * math.cos(perp_ang)
-            c1y = by - w * math.sin(perp_ang)
-            c2x = bx - w * math.cos(perp_ang)
-            c2y = by + w * math.sin(perp_ang)
+            # Perpendicular vector for base corners: (cos, sin) of angle + 90 is (-sin, cos)
+            return [tip_x, tip_y, bx - w * sin_a, by - w * cos_a, bx + w * sin_a, by + w * cos_a]
             
-            canvas.create_polygon(tip_x, tip_y, c1x, c1y, c2x, c2y, fill=color, outline=color)
-            
-        elif style == "notch":
-            # Just a small notch on the perimeter
-            # Usually requires a filled body to look right, but we'll draw a thick short line
+        if style == "notch":
+            # Just a small notch on the perimeter, drawn as a thick short line
             notch_len = 5
-            sx = cx + (radius - notch_len) * math.cos(angle_rad)
-            sy = cy - (radius - notch_len) * math.sin(angle_rad)
-            ex = cx + radius * math.cos(angle_rad)
-            ey = cy - radius * math.sin(angle_rad)
-            canvas.create_line(sx, sy, ex, ey, fill=color, width=4, capstyle=tk.BUTT)
+            return [
+                cx + (radius - notch_len) * cos_a, cy - (radius - notch_len) * sin_a,
+                cx + radius * cos_a, cy - radius * sin_a,
+            ]
             
-        else:
-            # Standard Line
-            sx = cx + p_start * math.cos(angle_rad)
-            sy = cy - p_start * math.sin(angle_rad)
-            ex = cx + p_end * math.cos(angle_rad)
-            ey = cy - p_end * math.sin(angle_rad)
-            canvas.create_line(sx, sy, ex, ey, fill=color, width=2, capstyle=tk.ROUND)
-
-        if not no_center:
-            canvas.create_oval(cx - 3, cy - 3, cx + 3, cy + 3, fill=color, outline=color)
+        # Standard Line
+        return [cx + p_start * cos_a, cy - p_start * sin_a, cx + p_end * cos_a, cy - p_end * sin_a]
 
-    # --- Geometry Helpers ---
     def _get_poly_points(self, cx, cy, radius, sides=8, start_angle=0):
-        points = []
-        angle_step = 360 / sides
-        for i in range(sides):
-            deg = i * angle_step + start_angle
-            rad = math.radians(deg)
-            x = cx + radius * math.cos(rad)
-            y = cy - radius * math.sin(rad)
-            points.extend([x, y])
-        return points
+        return _rotated_ring_points(cx, cy, (radius,), sides, start_angle)
 
     def _get_gear_points(self, cx, cy, radius, teeth=8, notch_depth=0.2, start_angle=0):
-        points = []
-        angle_step = 360 / (teeth * 2) # Tooth + Gap
+        # Tooth + Gap: alternate outer and inner radius
         inner_radius = radius * (1 - notch_depth)
-        
-        for i in range(teeth * 2):
-            deg = i * angle_step + start_angle
-            rad = math.radians(deg)
-            # Alternate radius
-            r = radius if i % 2 == 0 else inner_radius
-            x = cx + r * math.cos(rad)
-            y = cy - r * math.sin(rad)
-            points.extend([x, y])
-        return points
+        return _rotated_ring_points(cx, cy, (radius, inner_radius), teeth * 2, start_angle)
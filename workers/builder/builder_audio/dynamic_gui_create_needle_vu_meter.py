@@ -12,7 +12,7 @@
 # Source Code: https://github.com/APKaudio/
 # Feature Requests can be emailed to i @ like . audio
 #
-# Version 20250821.200641.1
+# Version 20261017.020000.1
 
 import tkinter as tk
 from tkinter import ttk
@@ -27,6 +27,8 @@ from workers.logger.log_utils import _get_log_args
 from workers.styling.style import THEMES, DEFAULT_THEME
 import os
 from workers.mqtt.mqtt_topic_utils import get_topic  # <--- ADD THIS LINE
+from workers.builder.builder_core.gui_animation_clock import AnimationClock
+from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityRegistry
 
 
 class NeedleVUMeterCreatorMixin:
@@ -159,7 +161,8 @@ class NeedleVUMeterCreatorMixin:
             
             frame.anim_mode = "idle" # idle, tracking, holding, decaying
             frame.anim_hold_start = 0
-            frame.anim_running = False
+            animation_clock = AnimationClock.for_widget(canvas)
+            visibility = VisibilityRegistry.scope_for(canvas)
 
             def draw_current_frame():
                 val2 = frame.anim_current_value_2 if meter_mode == "stereo" else None
@@ -191,8 +194,9 @@ class NeedleVUMeterCreatorMixin:
                     sub_ticks=sub_ticks
                 )
 
-            def animate():
-                dt = 20.0 # milliseconds per frame (approx 50 FPS)
+            # Advances the needle(s) by one frame of the shared animation clock.
+            # Returns True while there is motion (or a hold) left, so the clock keeps ticking it.
+            def animate(dt):
                 full_range = max_val - min_val
                 if full_range <= 0: full_range = 1.0
 
@@ -203,8 +207,7 @@ class NeedleVUMeterCreatorMixin:
                         frame.anim_mode = "decaying"
                     else:
                         # Still holding, just wait
-                        canvas.after(int(dt), animate)
-                        return
+                        return True
 
                 targets = [frame.anim_target]
                 currents = [frame.anim_current_value]
@@ -256,36 +259,32 @@ class NeedleVUMeterCreatorMixin:
                                 step = max(diff, -max_step)
                         new_currents.append(current + step)
 
-                frame.anim_current_value = new_currents[0]
-                if meter_mode == "stereo":
-                    frame.anim_current_value_2 = new_currents[1]
-
-                draw_current_frame()
+                if new_currents != currents:
+                    frame.anim_current_value = new_currents[0]
+                    if meter_mode == "stereo":
+                        frame.anim_current_value_2 = new_currents[1]
+                    draw_current_frame()
                 
-                if all_done:
-                    if frame.anim_mode == "tracking":
-                        # Reached tracking target
-                        if hold_time > 0:
-                            frame.anim_mode = "holding"
-                            frame.anim_hold_start = time.time() * 1000
-                        else:
-                            frame.anim_mode = "decaying"
-                        canvas.after(int(dt), animate)
-                    elif frame.anim_mode == "decaying":
-                        # Reached resting_point (decay complete)
-                        frame.anim_mode = "idle"
-                        frame.anim_running = False
-                else:
-                    canvas.after(int(dt), animate)
+                if not all_done:
+                    return True
+                if frame.anim_mode == "tracking":
+                    # Reached tracking target
+                    if hold_time > 0:
+                        frame.anim_mode = "holding"
+                        frame.anim_hold_start = time.time() * 1000
+                    else:
+                        frame.anim_mode = "decaying"
+                    return True
+                # Reached resting_point (decay complete)
+                frame.anim_mode = "idle"
+                return False
 
             def on_value_change(*args):
                 # New value received from logic/user
                 new_target = vu_value_var.get()
                 frame.anim_target = new_target
                 frame.anim_mode = "tracking"
-                if not frame.anim_running:
-                    frame.anim_running = True
-                    animate()
+                animation_clock.wake(animate, visibility)
 
             vu_value_var.trace_add("write", on_value_change)
             
@@ -294,9 +293,7 @@ class NeedleVUMeterCreatorMixin:
                     new_target = vu_value_var_2.get()
                     frame.anim_target_2 = new_target
                     frame.anim_mode = "tracking"
-                    if not frame.anim_running:
-                        frame.anim_running = True
-                        animate()
+                    animation_clock.wake(animate, visibility)
                 vu_value_var_2.trace_add("write", on_value_change_2)
 
             # Initial Draw
@@ -373,8 +370,9 @@ class NeedleVUMeterCreatorMixin:
             return None
 
     # Draws the needle-style VU meter on the canvas.
-    # This method renders all the visual elements of the VU meter, including the background arc,
-    # tick marks, labels, and the needle that indicates the current value.
+    # The scale (ticks, labels, colour arcs) and the pivot are retained canvas items drawn once
+    # per size and configuration; each frame only moves the needle item(s) with canvas.coords,
+    # so an animating meter creates and deletes no canvas items.
     # Inputs:
     #     canvas: The tkinter canvas to draw on.
     #     size (int): The size of the meter.
@@ -413,21 +411,62 @@ class NeedleVUMeterCreatorMixin:
         mask=False,
         sub_ticks=0
     ):
+        layout = {
+            "size": size, "min_val": min_val, "max_val": max_val, "red_zone_start": red_zone_start,
+            "pointer_colour": pointer_colour, "secondary": secondary, "fg": fg,
+            "upper_colour": upper_colour, "lower_colour": lower_colour,
+            "needle_thickness": needle_thickness, "scale_numbers": scale_numbers,
+            "curve_thickness": curve_thickness, "ticks_visible": ticks_visible,
+            "meter_viewable_angle": meter_viewable_angle, "custom_ticks": custom_ticks,
+            "pointer_colour2": pointer_colour2 if value2 is not None else None,
+            "meter_center_angle": meter_center_angle, "counter_clockwise": counter_clockwise,
+            "pointer_style": pointer_style, "pivot_size": pivot_size, "sub_ticks": sub_ticks,
+        }
+        items = getattr(canvas, "vu_items", None)
+        if items is None or items["layout"] != layout:
+            items = self._build_needle_vu_layers(canvas, layout)
+            canvas.vu_items = items
+
+        needles = items["needles"]
+        self._move_needle(canvas, items, needles[0], value)
+        if len(needles) > 1:
+            self._move_needle(canvas, items, needles[1], value2)
+
+    # Draws the static scale and pivot and creates the needle item(s), replacing any earlier ones.
+    # Inputs:
+    #     canvas: The tkinter canvas to draw on.
+    #     layout (dict): Every _draw_needle_vu_meter argument except the values.
+    # Outputs:
+    #     dict: The meter geometry and needle items, kept on the canvas as `vu_items`.
+    def _build_needle_vu_layers(self, canvas, layout):
         canvas.delete("vu_element")
+        size = layout["size"]
+        min_val, max_val = layout["min_val"], layout["max_val"]
+        fg = layout["fg"]
+        counter_clockwise = layout["counter_clockwise"]
+
         # Ensure coordinates are aligned with the pivot center used in creation
         width = size
         center_x = width / 2
         center_y = size / 2 + 10
 
         main_arc_radius = (width - 20) / 2
-        arc_thickness = curve_thickness
+        arc_thickness = layout["curve_thickness"]
 
         # Calculate start and end angles centered around meter_center_angle
-        half_angle = meter_viewable_angle / 2.0
-        start_angle_deg = meter_center_angle + half_angle
-        end_angle_deg = meter_center_angle - half_angle
+        half_angle = layout["meter_viewable_angle"] / 2.0
+        start_angle_deg = layout["meter_center_angle"] + half_angle
+        end_angle_deg = layout["meter_center_angle"] - half_angle
         
         extent_deg = start_angle_deg - end_angle_deg
+        range_val = max_val - min_val
+
+        # Maps a value to its angle on the scale
+        def angle_of(val):
+            percentage = (val - min_val) / range_val if range_val != 0 else 0
+            if counter_clockwise:
+                return end_angle_deg + (percentage * extent_deg)
+            return start_angle_deg - (percentage * extent_deg)
 
         # --- Draw Ticks and Labels ---
         tick_length = 8
@@ -437,219 +476,170 @@ class NeedleVUMeterCreatorMixin:
         # Ticks should start from the inner edge of the arc
         tick_start_radius = main_arc_radius - (arc_thickness / 2)
 
-        if custom_ticks:
-            tick_values = custom_ticks
+        if layout["custom_ticks"]:
+            tick_values = layout["custom_ticks"]
         else:
             tick_values = [min_val + (i / 5.0 * (max_val - min_val)) for i in range(6)]
 
+        # Sine/cosine of every tick and sub-tick angle, computed once for this scale
+        sub_ticks = layout["sub_ticks"]
+        tick_units = []
         for i, tick_val in enumerate(tick_values):
-            # Calculate normalized position (0.0 to 1.0)
-            range_val = max_val - min_val
-            percentage = (tick_val - min_val) / range_val if range_val != 0 else 0
-            
-            # Map to angle
-            if counter_clockwise:
-                current_angle_deg = end_angle_deg + (percentage * extent_deg)
-            else:
-                current_angle_deg = start_angle_deg - (percentage * extent_deg)
-                
-            current_angle_rad = math.radians(current_angle_deg)
+            current_angle_rad = math.radians(angle_of(tick_val))
+            subs = []
+            if sub_ticks > 0 and i < len(tick_values) - 1:
+                next_val = tick_values[i+1]
+                for j in range(1, sub_ticks + 1):
+                    sub_angle_rad = math.radians(angle_of(tick_val + (j * (next_val - tick_val) / (sub_ticks + 1))))
+                    subs.append((math.cos(sub_angle_rad), math.sin(sub_angle_rad)))
+            tick_units.append((tick_val, math.cos(current_angle_rad), math.sin(current_angle_rad), subs))
 
+        for tick_val, cos_a, sin_a, subs in tick_units:
             # Draw Main Tick
-            if ticks_visible:
-                x_tick_start = center_x + tick_start_radius * math.cos(current_angle_rad)
-                y_tick_start = center_y - tick_start_radius * math.sin(current_angle_rad)
-                x_tick_end = center_x + (tick_start_radius - tick_length) * math.cos(current_angle_rad)
-                y_tick_end = center_y - (tick_start_radius - tick_length) * math.sin(current_angle_rad)
+            if layout["ticks_visible"]:
+                x_tick_start = center_x + tick_start_radius * cos_a
+                y_tick_start = center_y - tick_start_radius * sin_a
+                x_tick_end = center_x + (tick_start_radius - tick_length) * cos_a
+                y_tick_end = center_y - (tick_start_radius - tick_length) * sin_a
                 canvas.create_line(x_tick_start, y_tick_start, x_tick_end, y_tick_end, fill=fg, width=2, tags="vu_element")
 
             # Draw Sub-Ticks (between this tick and next)
-            if sub_ticks > 0 and i < len(tick_values) - 1:
-                next_val = tick_values[i+1]
-                for j in range(1, sub_ticks + 1):
-                    sub_val = tick_val + (j * (next_val - tick_val) / (sub_ticks + 1))
-                    sub_perc = (sub_val - min_val) / range_val if range_val != 0 else 0
-                    
-                    if counter_clockwise:
-                        sub_angle_deg = end_angle_deg + (sub_perc * extent_deg)
-                    else:
-                        sub_angle_deg = start_angle_deg - (sub_perc * extent_deg)
-                    
-                    sub_angle_rad = math.radians(sub_angle_deg)
-                    
-                    sx_tick_start = center_x + tick_start_radius * math.cos(sub_angle_rad)
-                    sy_tick_start = center_y - tick_start_radius * math.sin(sub_angle_rad)
-                    sx_tick_end = center_x + (tick_start_radius - sub_tick_length) * math.cos(sub_angle_rad)
-                    sy_tick_end = center_y - (tick_start_radius - sub_tick_length) * math.sin(sub_angle_rad)
-                    canvas.create_line(sx_tick_start, sy_tick_start, sx_tick_end, sy_tick_end, fill=fg, width=1, tags="vu_element")
+            for sub_cos, sub_sin in subs:
+                sx_tick_start = center_x + tick_start_radius * sub_cos
+                sy_tick_start = center_y - tick_start_radius * sub_sin
+                sx_tick_end = center_x + (tick_start_radius - sub_tick_length) * sub_cos
+                sy_tick_end = center_y - (tick_start_radius - sub_tick_length) * sub_sin
+                canvas.create_line(sx_tick_start, sy_tick_start, sx_tick_end, sy_tick_end, fill=fg, width=1, tags="vu_element")
 
             # Text label
-            if scale_numbers:
+            if layout["scale_numbers"]:
                 text_radius_pos = main_arc_radius + text_offset_from_arc
-                tx = center_x + text_radius_pos * math.cos(current_angle_rad)
-                ty = center_y - text_radius_pos * math.sin(current_angle_rad)
+                tx = center_x + text_radius_pos * cos_a
+                ty = center_y - text_radius_pos * sin_a
                 canvas.create_text(
                     tx, ty, text=f"{int(tick_val)}", fill=fg, font=("Helvetica", 8), tags="vu_element"
                 )
 
         # --- Draw Arcs ---
+        # Lower Color Arc (Green): from Min to red_zone_start; Upper Color Arc (Red): on to Max.
+        # Tkinter arcs are drawn CCW from `start`, so each segment starts at its smaller angle.
         green_start_norm = (
-            (red_zone_start - min_val) / (max_val - min_val) if max_val > min_val else 0
+            (layout["red_zone_start"] - min_val) / (max_val - min_val) if max_val > min_val else 0
+        )
+        arc_box = (
+            center_x - main_arc_radius,
+            center_y - main_arc_radius,
+            center_x + main_arc_radius,
+            center_y + main_arc_radius,
         )
-        
         if counter_clockwise:
-            # Green Zone: From Min to red_zone_start
-            # Min is at end_angle_deg. red_zone_start is at transition angle.
+            # Min is at end_angle_deg.
             transition_angle_deg = end_angle_deg + (green_start_norm * extent_deg)
-            
-            # Lower Color Arc (Green): From End to Transition (CCW)
-            canvas.create_arc(
-                center_x - main_arc_radius,
-                center_y - main_arc_radius,
-                center_x + main_arc_radius,
-                center_y + main_arc_radius,
-                start=end_angle_deg,
-                extent=(transition_angle_deg - end_angle_deg),
-                style=tk.ARC,
-                outline=lower_colour,
-                width=arc_thickness,
-                tags="vu_element"
-            )
-            
-            # Upper Color Arc (Red): From Transition to Start (CCW)
-            canvas.create_arc(
-                center_x - main_arc_radius,
-                center_y - main_arc_radius,
-                center_x + main_arc_radius,
-                center_y + main_arc_radius,
-                start=transition_angle_deg,
-                extent=(start_angle_deg - transition_angle_deg),
-                style=tk.ARC,
-                outline=upper_colour,
-                width=arc_thickness,
-                tags="vu_element"
-            )
+            lower_span = (end_angle_deg, transition_angle_deg - end_angle_deg)
+            upper_span = (transition_angle_deg, start_angle_deg - transition_angle_deg)
         else:
-            # Standard CW
-            # Green Zone: From Min to red_zone_start
-            # Min is at start_angle_deg. red_zone_start is at transition.
+            # Standard CW: Min is at start_angle_deg.
             transition_angle_deg = start_angle_deg - (green_start_norm * extent_deg)
-            
-            # Lower Color Arc (Green): From Start to Transition (CW)
-            # Tkinter arcs draw CCW. So we must draw from Transition to Start? No, Start=Start, Extent=negative.
-            # But tk.create_arc extent is always relative to start.
-            # To draw CW from Start, we assume Start is the Leftmost (Largest angle).
-            # Green segment is Min->Transition.
-            # Min is Start. Transition is < Start.
-            # So segment is Start -> Transition.
-            # In Tkinter, Start=Transition, Extent = (Start - Transition).
-            canvas.create_arc(
-                center_x - main_arc_radius,
-                center_y - main_arc_radius,
-                center_x + main_arc_radius,
-                center_y + main_arc_radius,
-                start=transition_angle_deg,
-                extent=(start_angle_deg - transition_angle_deg),
-                style=tk.ARC,
-                outline=lower_colour,
-                width=arc_thickness,
-                tags="vu_element"
-            )
+            lower_span = (transition_angle_deg, start_angle_deg - transition_angle_deg)
+            upper_span = (end_angle_deg, transition_angle_deg - end_angle_deg)
 
-            # Upper Color Arc (Red): From Transition to End (Max)
-            # Segment Transition -> End.
-            # Transition > End.
-            # Start=End, Extent=(Transition - End)
+        for (arc_start, arc_extent), colour in ((lower_span, layout["lower_colour"]), (upper_span, layout["upper_colour"])):
             canvas.create_arc(
-                center_x - main_arc_radius,
-                center_y - main_arc_radius,
-                center_x + main_arc_radius,
-                center_y + main_arc_radius,
-                start=end_angle_deg,
-                extent=(transition_angle_deg - end_angle_deg),
+                *arc_box,
+                start=arc_start,
+                extent=arc_extent,
                 style=tk.ARC,
-                outline=upper_colour,
+                outline=colour,
                 width=arc_thickness,
                 tags="vu_element"
             )
 
-        # --- Helper for Drawing Needle ---
-        def draw_single_needle(val, color):
-            if val < min_val: val = min_val
-            if val > max_val: val = max_val
-
-            norm_val = (val - min_val) / (max_val - min_val) if max_val > min_val else 0
-
-            if counter_clockwise:
-                needle_angle_deg = end_angle_deg + (norm_val * extent_deg)
-            else:
-                needle_angle_deg = start_angle_deg - (norm_val * extent_deg)
-                
-            needle_angle_rad = math.radians(needle_angle_deg)
-
-            # Make needle extend into the numbers
-            needle_total_len = main_arc_radius + text_offset_from_arc - 2
-
-            # Tip calculation
-            tip_x = center_x + needle_total_len * math.cos(needle_angle_rad)
-            tip_y = center_y - needle_total_len * math.sin(needle_angle_rad)
-
+        # --- Needles (moved every frame) ---
+        pointer_style = layout["pointer_style"]
+        colours = [layout["pointer_colour"]]
+        if layout["pointer_colour2"]:
+            colours.append(layout["pointer_colour2"])
+        needles = []
+        for colour in colours:
             if pointer_style == "taper" or pointer_style == "teardrop":
-                # Base corners calculation
-                # Perpendicular to the needle direction
-                perp_angle_rad = needle_angle_rad + (math.pi / 2)
-                base_radius = pivot_size / 2.0
-                
-                base_x1 = center_x + base_radius * math.cos(perp_angle_rad)
-                base_y1 = center_y - base_radius * math.sin(perp_angle_rad)
-                base_x2 = center_x - base_radius * math.cos(perp_angle_rad)
-                base_y2 = center_y + base_radius * math.sin(perp_angle_rad)
-                
-                # Taper is a triangle
-                # Teardrop is smoothed. 
-                # For teardrop, we can add control points or just use smooth=True
-                # A teardrop needs to be rounded at the bottom (pivot).
-                # We can simulate this by adding points BEHIND the pivot?
-                # Or just relying on the pivot circle to cover the base.
-                # Actually, "upside down heart" implies the lobes are at the pivot.
-                # If we draw a triangle and smooth it, it might just look like a blob.
-                # Let's add a "back" point for teardrop to round it out.
-                
-                points = [base_x1, base_y1, tip_x, tip_y, base_x2, base_y2]
-                
-                if pointer_style == "teardrop":
-                    # Add a point behind center to round the base
-                    back_len = base_radius * 0.8
-                    back_x = center_x - back_len * math.cos(needle_angle_rad)
-                    back_y = center_y + back_len * math.sin(needle_angle_rad)
-                    # Insert back point between base_x2 and base_x1 (closing the loop)
-                    points.extend([back_x, back_y])
-                    
-                canvas.create_polygon(points, fill=color, outline=color, smooth=(pointer_style=="teardrop"), tags="vu_element")
-                
+                # Taper is a triangle; teardrop adds a point behind the pivot and is smoothed.
+                point_count = 4 if pointer_style == "teardrop" else 3
+                needle = canvas.create_polygon(
+                    [center_x, center_y] * point_count, fill=colour, outline=colour, smooth=(pointer_style=="teardrop"), tags="vu_element"
+                )
             else:
-                # Line style
-                canvas.create_line(
-                    center_x, center_y, tip_x, tip_y, width=needle_thickness, fill=color, capstyle=tk.ROUND, tags="vu_element"
+                needle = canvas.create_line(
+                    center_x, center_y, center_x, center_y, width=layout["needle_thickness"], fill=colour, capstyle=tk.ROUND, tags="vu_element"
                 )
-
-        # --- Draw Needles ---
-        draw_single_needle(value, pointer_colour)
-        
-        if value2 is not None and pointer_colour2:
-            draw_single_needle(value2, pointer_colour2)
+            needles.append({"item": needle, "angle": None})
 
         # --- Draw Pivot ---
-        pivot_radius = pivot_size / 2.0
+        pivot_radius = layout["pivot_size"] / 2.0
         canvas.create_oval(
             center_x - pivot_radius,
             center_y - pivot_radius,
             center_x + pivot_radius,
             center_y + pivot_radius,
             fill=fg,
-            outline=secondary,
+            outline=layout["secondary"],
             tags="vu_element"
         )
         
         # Ensure VU meter elements are behind any overlays (like the Knob in composite widgets)
-        canvas.tag_lower("vu_element")
\ No newline at end of file
+        canvas.tag_lower("vu_element")
+
+        return {
+            "layout": layout,
+            "center": (center_x, center_y),
+            "angle_of": angle_of,
+            # Make needle extend into the numbers
+            "needle_length": main_arc_radius + text_offset_from_arc - 2,
+            "needles": needles,
+        }
+
+    # Moves one needle to `val` with canvas.coords; an unchanged angle is skipped.
+    # Inputs:
+    #     canvas: The tkinter canvas the meter is drawn on.
+    #     items (dict): The meter built by _build_needle_vu_layers.
+    #     needle (dict): The needle item and its last drawn angle.
+    #     val (float): The value to show.
+    # Outputs:
+    #     None.
+    def _move_needle(self, canvas, items, needle, val):
+        layout = items["layout"]
+        min_val, max_val = layout["min_val"], layout["max_val"]
+        if val < min_val: val = min_val
+        if val > max_val: val = max_val
+
+        needle_angle_deg = items["angle_of"](val)
+        if needle_angle_deg == needle["angle"]:
+            return
+        needle["angle"] = needle_angle_deg
+
+        needle_angle_rad = math.radians(needle_angle_deg)
+        cos_a, sin_a = math.cos(needle_angle_rad), math.sin(needle_angle_rad)
+        center_x, center_y = items["center"]
+
+        # Tip calculation
+        needle_total_len = items["needle_length"]
+        tip_x = center_x + needle_total_len * cos_a
+        tip_y = center_y - needle_total_len * sin_a
+
+        pointer_style = layout["pointer_style"]
+        if pointer_style == "taper" or pointer_style == "teardrop":
+            # Base corners, perpendicular to the needle direction
+            base_radius = layout["pivot_size"] / 2.0
+            base_x1 = center_x - base_radius * sin_a
+            base_y1 = center_y - base_radius * cos_a
+            base_x2 = center_x + base_radius * sin_a
+            base_y2 = center_y + base_radius * cos_a
+            points = [base_x1, base_y1, tip_x, tip_y, base_x2, base_y2]
+
+            if pointer_style == "teardrop":
+                # Add a point behind center to round the base
+                back_len = base_radius * 0.8
+                points.extend([center_x - back_len * cos_a, center_y + back_len * sin_a])
+            canvas.coords(needle["item"], points)
+        else:
+            # Line style
+            canvas.coords(needle["item"], center_x, center_y, tip_x, tip_y)
@@ -6,6 +6,8 @@ from managers.configini.config_reader import Config
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 from workers.styling.style import THEMES, DEFAULT_THEME
+from workers.builder.builder_core.gui_animation_clock import AnimationClock
+from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityRegistry
 
 app_constants = Config.get_instance()
 
@@ -74,6 +76,8 @@ class WinkButtonCreatorMixin:
             highlightthickness=0
         )
         canvas.pack()
+        animation_clock = AnimationClock.for_widget(canvas)
+        visibility = VisibilityRegistry.scope_for(canvas)
         
         # --- State Management ---
         # value_var tracks the logical state (for MQTT/Application)
@@ -88,7 +92,6 @@ class WinkButtonCreatorMixin:
             "is_latched": initial_value,
             "is_hovering": False,
             "shutter_ids": [],
-            "animating": False,
             "blink_open": True, # Used for toggling during blink
             "is_blinking_active": False
         }
@@ -119,46 +122,37 @@ class WinkButtonCreatorMixin:
             ]
             return canvas.create_polygon(points, smooth=True, **kwargs)
 
-        def update_physics():
-            """Smoothly interpolates current position to target position."""
+        def update_physics(dt):
+            """Smoothly interpolates current position to target position (one clock frame)."""
             current = state["current_open"]
             target = state["target_open"]
-            
-            moved = False
+            # The speeds are per 16 ms frame; scale them to the frame that actually elapsed.
+            frames = dt / 16.0
+
             if current < target:
-                state["current_open"] += open_speed
-                if state["current_open"] > target:
-                    state["current_open"] = target
-                moved = True
+                state["current_open"] = min(current + open_speed * frames, target)
             elif current > target:
-                state["current_open"] -= close_speed
-                if state["current_open"] < target:
-                    state["current_open"] = target
-                moved = True
-            
-            if moved:
-                draw_visuals()
-            
-            if moved or state["is_pressed"] or state["current_open"] != target:
-                canvas.after(16, update_physics)
+                state["current_open"] = max(current - close_speed * frames, target)
             else:
-                state["animating"] = False
+                return False
 
-        def blink_loop():
-            """Toggles the shutter state periodically if blinking is active."""
-            # Stop if not active or var is false (safety check, though on_value_change controls this)
-            if not state["is_blinking_active"] or not value_var.get():
-                return
+            draw_visuals()
+            return state["current_open"] != target
 
-            # Toggle target
-            state["blink_open"] = not state["blink_open"]
-            state["target_open"] = 1.0 if state["blink_open"] else 0.0
-            
-            if not state["animating"]:
-                state["animating"] = True
-                update_physics()
+        def on_blink(is_open):
+            """Shared blink phase for this interval: open or close the shutter with every other blinker."""
+            state["blink_open"] = is_open
+            state["target_open"] = 1.0 if is_open else 0.0
+            animation_clock.wake(update_physics, visibility)
 
-            canvas.after(blink_interval, blink_loop)
+        def set_blinking(active):
+            if active == state["is_blinking_active"]:
+                return
+            state["is_blinking_active"] = active
+            if active:
+                animation_clock.add_blinker(blink_interval, on_blink)
+            else:
+                animation_clock.remove_blinker(blink_interval, on_blink)
 
         def draw_visuals():
             """Redraws the moving parts (shutters) and the top bezel mask."""
@@ -331,13 +325,9 @@ class WinkButtonCreatorMixin:
             
             # Update Physics Target
             if blink_interval > 0 and new_val:
-                if not state["is_blinking_active"]:
-                    state["is_blinking_active"] = True
-                    state["blink_open"] = True # Start open
-                    state["target_open"] = 1.0
-                    blink_loop()
+                set_blinking(True)
             else:
-                state["is_blinking_active"] = False
+                set_blinking(False)
                 state["target_open"] = 1.0 if new_val else 0.0
             
             # Sync Latch State (if updated remotely), but ONLY if not locally pressed
@@ -345,9 +335,7 @@ class WinkButtonCreatorMixin:
                 state["is_latched"] = new_val
 
             # Trigger Animation
-            if not state["animating"]:
-                state["animating"] = True
-                update_physics()
+            animation_clock.wake(update_physics, visibility)
 
             # Broadcast
             if self.state_mirror_engine:
@@ -358,8 +346,8 @@ class WinkButtonCreatorMixin:
         
         # Initial Check for Blink (if default is True)
         if initial_value and blink_interval > 0:
-             state["is_blinking_active"] = True
-             blink_loop()
+             set_blinking(True)
+        canvas.bind("<Destroy>", lambda event: set_blinking(False), add="+")
 
         # Register with Engine
         subscriber_router = self.subscriber_router
@@ -0,0 +1,120 @@
+import unittest
+import math
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from workers.builder.builder_audio.dynamic_gui_create_knob import KnobCreatorMixin
+    from workers.builder.builder_audio.dynamic_gui_create_needle_vu_meter import NeedleVUMeterCreatorMixin
+
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+
+class _FakeCanvas:
+    """Records item creation, deletion and in-place updates instead of drawing."""
+
+    def __init__(self):
+        self.items = {}
+        self.created = 0
+        self.deleted = 0
+        self.moved = 0
+
+    def _create(self, kind, *coords, **options):
+        self.created += 1
+        self.items[self.created] = {"kind": kind, "coords": coords, **options}
+        return self.created
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return lambda *coords, **options: self._create(name[7:], *coords, **options)
+        raise AttributeError(name)
+
+    def coords(self, item, *coords):
+        self.moved += 1
+        self.items[item]["coords"] = coords
+
+    def itemconfigure(self, item, **options):
+        if item in self.items:
+            self.items[item].update(options)
+
+    def delete(self, tag):
+        self.deleted += len(self.items)
+        self.items.clear()
+
+    def tag_lower(self, tag):
+        pass
+
+
+class _FakeLabel:
+    def __init__(self):
+        self.text = None
+
+    def config(self, text):
+        self.text = text
+
+
+@unittest.skipUnless(TKINTER_AVAILABLE, "tkinter is not installed")
+class TestRetainedKnob(unittest.TestCase):
+
+    def draw(self, canvas, value, secondary="#444444"):
+        KnobCreatorMixin()._draw_knob(
+            canvas, 60, 60, value, 0.0, 100.0, self.label, "#fff", "#0af", "#0af", secondary,
+            show_ticks=True, shape="gear", pointer_style="triangle",
+        )
+
+    def setUp(self):
+        self.label = _FakeLabel()
+
+    def test_turning_and_hovering_create_no_items(self):
+        canvas = _FakeCanvas()
+        self.draw(canvas, 0.0)
+        created = canvas.created
+        for value in range(0, 101, 3):
+            self.draw(canvas, float(value))
+        self.draw(canvas, 99.0, secondary="#999999")
+        self.assertEqual(canvas.created, created)
+        self.assertEqual(canvas.deleted, 0)
+        self.assertGreater(canvas.moved, 0)
+        self.assertEqual(self.label.text, "99")
+        self.assertEqual(canvas.items[canvas.knob_items["track"]]["outline"], "#999999")
+
+    def test_table_driven_gear_matches_direct_trigonometry(self):
+        points = KnobCreatorMixin()._get_gear_points(10, 20, 8, teeth=4, notch_depth=0.25, start_angle=33)
+        for i in range(8):
+            r = 8 if i % 2 == 0 else 6
+            rad = math.radians(i * 45 + 33)
+            self.assertAlmostEqual(points[2 * i], 10 + r * math.cos(rad))
+            self.assertAlmostEqual(points[2 * i + 1], 20 - r * math.sin(rad))
+
+
+@unittest.skipUnless(TKINTER_AVAILABLE, "tkinter is not installed")
+class TestRetainedNeedleVU(unittest.TestCase):
+
+    def test_animating_needles_only_moves_them(self):
+        canvas = _FakeCanvas()
+        meter = NeedleVUMeterCreatorMixin()
+
+        def draw(value):
+            meter._draw_needle_vu_meter(
+                canvas, 150, value, -20.0, 3.0, 0.0, "#0af", "#444", "#ddd", "red",
+                value2=-value, pointer_colour2="#f00", sub_ticks=2,
+            )
+
+        draw(-20.0)
+        created = canvas.created
+        for step in range(50):
+            draw(-20.0 + step * 0.4)
+        self.assertEqual(canvas.created, created)
+        self.assertEqual(canvas.deleted, 0)
+        needle = canvas.items[canvas.vu_items["needles"][0]["item"]]
+        self.assertAlmostEqual(needle["coords"][0], 75.0)  # the needle pivots at the centre
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+# builder_core/gui_animation_clock.py
+#
+# One frame scheduler per Tk root for every animated widget (meters, bar graphs, winks,
+# radars): a single `after` loop ticks only the animators that are in motion, and blinking
+# widgets share one phase per blink interval.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261017.010000.1
+import time
+import tkinter as tk
+from typing import Any, Callable, Dict
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+current_version = "20261017.010000.1"
+current_version_hash = 20261017 * 10000 * 1
+
+DEFAULT_FRAME_INTERVAL_MS = 16  # ~60 fps target for all widget animation
+MAX_FRAME_STEP_MS = 100.0  # dt handed to animators is capped so a stalled loop does not jump
+
+
+class AnimationClock:
+    """
+    The shared frame loop of one Tk root.
+
+    An animator is a callable `animator(dt_ms) -> bool`; it advances its widget by dt_ms and
+    returns True while it still has motion left. Widgets wake() their animator when a value
+    or target changes; once it returns False it is not ticked again until the next wake(),
+    so meters and buttons at rest cost nothing. With no animators awake and no blinkers the
+    clock schedules no timer at all.
+
+    Blinkers subscribe per interval and are called with the new phase (True = open) on each
+    phase edge; every widget blinking at the same interval flips on the same frame.
+
+    An animator woken with a VisibilityScope is parked in that scope while it is hidden (a
+    notebook tab in the background, an iconified window) and resumes when it is shown.
+    """
+
+    # Initializes the clock.
+    # Inputs:
+    #     root: The Tk root (anything with `after` / `after_cancel`).
+    #     frame_interval_ms (int, optional): The target frame interval.
+    #     time_func (Callable, optional): Monotonic time source in seconds.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        root: Any,
+        frame_interval_ms: int = DEFAULT_FRAME_INTERVAL_MS,
+        time_func: Callable[[], float] = time.monotonic,
+    ):
+        self.root = root
+        self.frame_interval_ms = max(1, int(frame_interval_ms))
+        self._time_func = time_func
+        self._active: Dict[Callable, Any] = {}  # awake animator -> its VisibilityScope (or None)
+        self._blinkers: Dict[int, Dict[str, Any]] = {}  # interval_ms -> {"phase", "members"}
+        self._after_id = None
+        self._due_ms = None
+        self._last_frame_ms = None
+        self.stats = {
+            "frames": 0,
+            "ticks": 0,
+            "active_animators": 0,
+            "peak_active_animators": 0,
+            "blinkers": 0,
+            "last_frame_ms": 0.0,
+            "mean_frame_ms": 0.0,
+        }
+
+    # Returns the clock of the Tk root that `widget` belongs to, creating it on first use.
+    @classmethod
+    def for_widget(cls, widget: Any) -> "AnimationClock":
+        root = widget._root()
+        clock = getattr(root, "_animation_clock", None)
+        if clock is None:
+            clock = cls(root)
+            root._animation_clock = clock
+        return clock
+
+    def _now_ms(self) -> float:
+        return self._time_func() * 1000.0
+
+    # Puts an animator on the next frame (no-op if it is already awake).
+    # Inputs:
+    #     animator (Callable): animator(dt_ms) -> bool.
+    #     scope (VisibilityScope, optional): While it is hidden the animator is parked there.
+    # Outputs:
+    #     None.
+    def wake(self, animator: Callable[[float], bool], scope: Any = None) -> None:
+        if scope is not None and not scope.visible:
+            self._park(animator, scope)
+            return
+        self._active[animator] = scope
+        self._schedule(self._now_ms() + self.frame_interval_ms)
+
+    def _park(self, animator, scope) -> None:
+        self._active.pop(animator, None)
+        scope.run(animator, lambda: self.wake(animator, scope))
+
+    # Takes an animator off the frame loop, e.g. when its widget is destroyed.
+    def sleep(self, animator: Callable[[float], bool]) -> None:
+        self._active.pop(animator, None)
+
+    # Subscribes a blinker to a shared blink interval and calls it with the current phase.
+    # Inputs:
+    #     interval_ms (int): The time between phase edges.
+    #     callback (Callable): callback(is_open: bool), called on every edge.
+    # Outputs:
+    #     None.
+    def add_blinker(self, interval_ms: int, callback: Callable[[bool], None]) -> None:
+        interval_ms = max(1, int(interval_ms))
+        group = self._blinkers.get(interval_ms)
+        if group is None:
+            group = {"phase": self._blink_phase(interval_ms, self._now_ms()), "members": {}}
+            self._blinkers[interval_ms] = group
+        group["members"][callback] = None
+        callback(group["phase"])
+        self._schedule(self._next_blink_edge_ms(self._now_ms()))
+
+    # Removes a blinker; empty intervals are dropped.
+    def remove_blinker(self, interval_ms: int, callback: Callable[[bool], None]) -> None:
+        interval_ms = max(1, int(interval_ms))
+        group = self._blinkers.get(interval_ms)
+        if group is not None:
+            group["members"].pop(callback, None)
+            if not group["members"]:
+                del self._blinkers[interval_ms]
+
+    @staticmethod
+    def _blink_phase(interval_ms: int, now_ms: float) -> bool:
+        return int(now_ms // interval_ms) % 2 == 0
+
+    def _next_blink_edge_ms(self, now_ms: float):
+        if not self._blinkers:
+            return None
+        return min((now_ms // interval + 1) * interval for interval in self._blinkers)
+
+    # Makes sure a frame runs no later than `due_ms`.
+    def _schedule(self, due_ms) -> None:
+        if due_ms is None:
+            return
+        if self._after_id is not None:
+            if self._due_ms <= due_ms:
+                return
+            self.root.after_cancel(self._after_id)
+        self._due_ms = due_ms
+        delay = max(1, int(round(due_ms - self._now_ms())))
+        self._after_id = self.root.after(delay, self._on_frame)
+
+    def _on_frame(self) -> None:
+        self._after_id = None
+        self._due_ms = None
+        started = self._now_ms()
+
+        for interval, group in list(self._blinkers.items()):
+            phase = self._blink_phase(interval, started)
+            if phase != group["phase"]:
+                group["phase"] = phase
+                for callback in list(group["members"]):
+                    self._run(callback, phase, lambda: group["members"].pop(callback, None))
+
+        if self._active:
+            # A clock waking from idle steps one nominal frame rather than the whole idle gap.
+            if self._last_frame_ms is None:
+                dt_ms = float(self.frame_interval_ms)
+            else:
+                dt_ms = min(started - self._last_frame_ms, MAX_FRAME_STEP_MS)
+            self._last_frame_ms = started
+            for animator, scope in list(self._active.items()):
+                if scope is not None and not scope.visible:
+                    self._park(animator, scope)
+                    continue
+                if not self._run(animator, dt_ms, lambda: None):
+                    self._active.pop(animator, None)
+                self.stats["ticks"] += 1
+        else:
+            self._last_frame_ms = None
+
+        elapsed = self._now_ms() - started
+        stats = self.stats
+        stats["frames"] += 1
+        stats["last_frame_ms"] = elapsed
+        stats["mean_frame_ms"] += 0.05 * (elapsed - stats["mean_frame_ms"])
+        stats["active_animators"] = len(self._active)
+        stats["peak_active_animators"] = max(stats["peak_active_animators"], len(self._active))
+
+        if self._active:
+            self._schedule(started + self.frame_interval_ms)
+        else:
+            self._last_frame_ms = None
+            self._schedule(self._next_blink_edge_ms(self._now_ms()))
+
+    # Calls one animator or blinker; a destroyed widget (TclError) or a failing one is dropped.
+    def _run(self, func, argument, on_failure) -> bool:
+        try:
+            return bool(func(argument))
+        except tk.TclError:
+            on_failure()
+            return False
+        except Exception as e:
+            on_failure()
+            debug_logger(
+                message=f"❌ Animation callback {func} failed and was removed: {e}",
+                **_get_log_args(),
+            )
+            return False
+
+    # Returns frame count, frame time (last and smoothed, ms) and active animator counts.
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats["active_animators"] = len(self._active)
+        stats["blinkers"] = sum(len(group["members"]) for group in self._blinkers.values())
+        return stats
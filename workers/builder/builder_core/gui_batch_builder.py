@@ -12,7 +12,7 @@
 # Source Code: https://github.com/APKaudio/
 # Feature Requests can be emailed to i @ like . audio
 #
-# Version 20250821.200641.1
+# Version 20261017.040000.1
 import tkinter as tk
 from tkinter import ttk
 import traceback
@@ -72,68 +72,27 @@ class GuiBatchBuilderMixin:
                     col_idx, weight=weight, minsize=minwidth
                 )
 
-            # Process widgets in the current batch
+            # Process widgets in the current batch. With lazy building on, every entry only
+            # gets a placeholder here, so the whole page is laid out in a single pass.
+            if self.lazy_build_enabled:
+                batch_size = max(batch_size, len(widget_configs))
             for i in range(start_index, min(start_index + batch_size, len(widget_configs))):
                 key, value = widget_configs[i] # Unpack key and value for the current widget
                 current_path = f"{path_prefix}/{key}".strip("/")
 
                 if isinstance(value, dict):
-                    widget_type = value.get("type")
-                    if not widget_type and "widget_type" in value:
-                        widget_type = value.get("widget_type")
-                    
                     layout = value.get("layout", {})
                     col_span = int(layout.get("col_span", 1))
                     row_span = int(layout.get("row_span", 1))
-                    sticky = layout.get("sticky", "nsew")
-
-                    target_frame = None
-
-                    if widget_type == "OcaBlock":
-                        show_label = value.get("show_label", True)
-                        block_cols = value.get("layout_columns", None)
-                        # Add a minimal border and relief to make OcaBlocks visible
-                        target_frame = ttk.LabelFrame(
-                            parent_frame, text=key if show_label else "", borderwidth=0, relief="flat"
-                        )
-                        self._create_dynamic_widgets(
-                            parent_frame=target_frame,
-                            data=value, # Pass the WHOLE block config
-                            path_prefix=current_path,
-                            override_cols=block_cols,
-                        )
-
-                    elif widget_type in self.widget_factory:
-                        value['path'] = current_path
-                        factory_kwargs = {
-                            "parent_widget": parent_frame,
-                            "config_data": value,
-                            "base_mqtt_topic_from_path": self.base_mqtt_topic_from_path,
-                            "state_mirror_engine": self.state_mirror_engine,
-                            "subscriber_router": self.subscriber_router,
-                        }
-
-                        try:
-                            target_frame = self.widget_factory[widget_type](
-                                **factory_kwargs
-                            )
-                        except Exception as e:
-                            debug_logger(
-                                message=f"❌ Error creating widget '{key}' of type '{widget_type}': {e}",
-                                **_get_log_args(),
-                            )
-                            target_frame = None
-
-                    if target_frame:
-                        target_frame.grid(
-                            row=row,
-                            column=col,
-                            columnspan=col_span,
-                            rowspan=row_span,
-                            padx=5,
-                            pady=5,
-                            sticky=sticky,
-                        )
+                    grid_options = {
+                        "row": row,
+                        "column": col,
+                        "columnspan": col_span,
+                        "rowspan": row_span,
+                        "sticky": layout.get("sticky", "nsew"),
+                    }
+
+                    if self._place_widget_entry(parent_frame, key, value, current_path, grid_options):
                         parent_frame.grid_rowconfigure(row, weight=1)
                         col += col_span
                         if col >= max_cols:
@@ -214,67 +173,71 @@ class GuiBatchBuilderMixin:
                 current_path = f"{path_prefix}/{key}".strip("/")
 
                 if isinstance(value, dict):
-                    widget_type = value.get("type")
-                    if not widget_type and "widget_type" in value:
-                        widget_type = value.get("widget_type")
-                    
                     layout = value.get("layout", {})
                     col_span = int(layout.get("col_span", 1))
                     row_span = int(layout.get("row_span", 1))
-                    sticky = layout.get("sticky", "nsew")
-
-                    target_frame = None
-
-                    if widget_type == "OcaBlock":
-                        show_label = value.get("show_label", True)
-                        block_cols = value.get("layout_columns", None)
-                        target_frame = ttk.LabelFrame(
-                            parent_frame, text=key if show_label else "", borderwidth=0, relief="flat"
-                        )
-                        self._create_dynamic_widgets(
-                            parent_frame=target_frame,
-                            data=value, # Pass the whole block config
-                            path_prefix=current_path,
-                            override_cols=block_cols,
-                        )
-
-                    elif widget_type in self.widget_factory:
-                        value['path'] = current_path
-                        factory_kwargs = {
-                            "parent_widget": parent_frame,
-                            "config_data": value,
-                            "base_mqtt_topic_from_path": self.base_mqtt_topic_from_path,
-                            "state_mirror_engine": self.state_mirror_engine,
-                            "subscriber_router": self.subscriber_router,
-                        }
-                        try:
-                            target_frame = self.widget_factory[widget_type](
-                                **factory_kwargs
-                            )
-                        except Exception as e:
-                            debug_logger(
-                                message=f"❌ Error creating synchronous widget '{key}' of type '{widget_type}': {e}",
-                                **_get_log_args(),
-                            )
-                            target_frame = None
-
-                    if target_frame:
-                        target_frame.grid(
-                            row=row,
-                            column=col,
-                            columnspan=col_span,
-                            rowspan=row_span,
-                            padx=5,
-                            pady=5,
-                            sticky=sticky,
-                        )
+                    grid_options = {
+                        "row": row,
+                        "column": col,
+                        "columnspan": col_span,
+                        "rowspan": row_span,
+                        "sticky": layout.get("sticky", "nsew"),
+                    }
+
+                    if self._place_widget_entry(parent_frame, key, value, current_path, grid_options):
                         parent_frame.grid_rowconfigure(row, weight=1)
                         col += col_span
                         if col >= max_cols:
                             col = 0
-                            row += row_span       
+                            row += row_span
         except Exception as e:
             debug_logger(
                 message=f"❌ Error in synchronous _create_dynamic_widgets: {e}",
                 **_get_log_args(),
-            )
\ No newline at end of file
+            )
+
+    # Builds the widget (or OcaBlock frame and its contents) for one JSON entry.
+    # Inputs:
+    #     parent_frame: The parent tkinter frame.
+    #     key (str): The JSON key of the entry, used as the OcaBlock caption.
+    #     value (dict): The entry configuration.
+    #     current_path (str): The widget path used for its MQTT topic and state binding.
+    # Outputs:
+    #     tk.Widget: The widget to grid, or None if it could not be created.
+    def _build_widget_entry(self, parent_frame, key, value, current_path):
+        widget_type = value.get("type")
+        if not widget_type and "widget_type" in value:
+            widget_type = value.get("widget_type")
+
+        if widget_type == "OcaBlock":
+            show_label = value.get("show_label", True)
+            block_cols = value.get("layout_columns", None)
+            # Add a minimal border and relief to make OcaBlocks visible
+            target_frame = ttk.LabelFrame(
+                parent_frame, text=key if show_label else "", borderwidth=0, relief="flat"
+            )
+            self._create_dynamic_widgets(
+                parent_frame=target_frame,
+                data=value, # Pass the WHOLE block config
+                path_prefix=current_path,
+                override_cols=block_cols,
+            )
+            return target_frame
+
+        if widget_type in self.widget_factory:
+            value['path'] = current_path
+            factory_kwargs = {
+                "parent_widget": parent_frame,
+                "config_data": value,
+                "base_mqtt_topic_from_path": self.base_mqtt_topic_from_path,
+                "state_mirror_engine": self.state_mirror_engine,
+                "subscriber_router": self.subscriber_router,
+            }
+            try:
+                return self.widget_factory[widget_type](**factory_kwargs)
+            except Exception as e:
+                debug_logger(
+                    message=f"❌ Error creating widget '{key}' of type '{widget_type}': {e}",
+                    **_get_log_args(),
+                )
+        return None
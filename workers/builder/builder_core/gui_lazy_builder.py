@@ -0,0 +1,209 @@
+# builder_core/gui_lazy_builder.py
+#
+# Viewport-driven widget instantiation: every widget and OcaBlock of a page starts as an empty
+# placeholder frame of estimated size, and is only built (and bound to the StateMirrorEngine by
+# its factory) when the placeholder scrolls into or near the visible part of the canvas.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261017.040000.1
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Dict, Optional, Tuple
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+from managers.configini.config_reader import Config
+
+app_constants = Config.get_instance()
+
+current_version = "20261017.040000.1"
+current_version_hash = 20261017 * 40000 * 1
+
+DEFAULT_WIDGET_HEIGHT_PX = 40  # Placeholder height of a widget that does not declare one
+BLOCK_HEADER_PX = 20  # LabelFrame caption of an OcaBlock
+GRID_PADDING_PX = 10  # pady=5 above and below every grid cell
+MATERIALIZE_BUDGET = 8  # Entries built per pass before yielding back to the main loop
+
+
+# Estimates the on-screen height of one JSON entry without building it.
+# Inputs:
+#     value (dict): The widget or OcaBlock configuration.
+# Outputs:
+#     int: The estimated height in pixels (grid padding not included).
+def estimate_entry_height(value: Dict[str, Any]) -> int:
+    layout = value.get("layout", {})
+    widget_type = value.get("type") or value.get("widget_type")
+    if widget_type != "OcaBlock":
+        height = layout.get("height", value.get("height"))
+        try:
+            return max(1, int(height))
+        except (TypeError, ValueError):
+            return DEFAULT_WIDGET_HEIGHT_PX
+
+    fields = value.get("fields", value)
+    max_cols = max(1, int(value.get("layout_columns", 1) or 1))
+    total, row_height, col = BLOCK_HEADER_PX, 0, 0
+    for child in fields.values():
+        if not isinstance(child, dict) or not (child.get("type") or child.get("widget_type")):
+            continue
+        child_layout = child.get("layout", {})
+        row_height = max(row_height, estimate_entry_height(child) + GRID_PADDING_PX)
+        col += int(child_layout.get("col_span", 1))
+        if col >= max_cols:
+            total, row_height, col = total + row_height, 0, 0
+    return total + row_height
+
+
+class GuiLazyBuilderMixin:
+    """
+    Builds page entries on demand as they come into view.
+
+    _place_widget_entry() grids an empty placeholder frame sized by estimate_entry_height()
+    where the entry belongs and queues it. Whenever the canvas view moves or resizes, or the
+    builder's tab becomes visible, one idle pass builds the queued entries whose placeholder lies
+    within UI_LAZY_BUILD_MARGIN_PX of the viewport, nearest first and MATERIALIZE_BUDGET at a time;
+    each real widget takes its placeholder's grid cell. An OcaBlock that is built lays out its own
+    children as placeholders in turn, so the first frame costs what is on screen, not the page.
+    """
+
+    # Initializes lazy building and hooks it to the canvas view and the tab's visibility.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     None.
+    def _setup_lazy_build(self):
+        self.lazy_build_enabled = bool(getattr(app_constants, "UI_LAZY_BUILD", True))
+        self.lazy_build_margin_px = int(getattr(app_constants, "UI_LAZY_BUILD_MARGIN_PX", 600))
+        self._lazy_pending = []
+        self._lazy_check_scheduled = False
+        self.lazy_build_stats = {"placeholders": 0, "materialized": 0, "passes": 0}
+
+        self.canvas.configure(yscrollcommand=self._on_canvas_yview)
+        scope = getattr(self, "visibility_scope", None)
+        if scope is not None:
+            scope.add_listener(lambda visible: visible and self._schedule_lazy_check())
+
+    # yscrollcommand of the page canvas: feeds the scrollbar and looks for entries to build.
+    def _on_canvas_yview(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_lazy_check()
+
+    # Grids one entry now, or a placeholder for it when lazy building is on.
+    # Inputs:
+    #     parent_frame: The grid container.
+    #     key (str): The JSON key of the entry.
+    #     value (dict): The entry configuration.
+    #     current_path (str): The widget path.
+    #     grid_options (dict): row/column/columnspan/rowspan/sticky for the cell.
+    # Outputs:
+    #     bool: True if the cell is taken (so the layout advances).
+    def _place_widget_entry(self, parent_frame, key, value, current_path, grid_options):
+        widget_type = value.get("type") or value.get("widget_type")
+        if widget_type != "OcaBlock" and widget_type not in self.widget_factory:
+            return False
+
+        if not self.lazy_build_enabled:
+            target_frame = self._build_widget_entry(parent_frame, key, value, current_path)
+            if target_frame:
+                target_frame.grid(padx=5, pady=5, **grid_options)
+            return bool(target_frame)
+
+        placeholder = ttk.Frame(parent_frame, height=estimate_entry_height(value), width=1)
+        placeholder.grid(padx=5, pady=5, **grid_options)
+        self._lazy_pending.append((placeholder, parent_frame, key, value, current_path, grid_options))
+        self.lazy_build_stats["placeholders"] += 1
+        self._schedule_lazy_check()
+        return True
+
+    # Runs _materialize_visible once on the next idle pass (repeated calls coalesce).
+    def _schedule_lazy_check(self, delay_ms=None):
+        if self._lazy_check_scheduled or not self._lazy_pending:
+            return
+        self._lazy_check_scheduled = True
+        if delay_ms is None:
+            self.after_idle(self._materialize_visible)
+        else:
+            self.after(delay_ms, self._materialize_visible)
+
+    # Returns the (top, bottom) band of the scroll frame worth building, or None when hidden.
+    def _lazy_viewport(self) -> Optional[Tuple[float, float]]:
+        canvas = self.canvas
+        if not canvas.winfo_viewable():
+            return None
+        height = canvas.winfo_height()
+        if height <= 1:
+            return None
+        top = canvas.canvasy(0)
+        return top - self.lazy_build_margin_px, top + height + self.lazy_build_margin_px
+
+    # Returns the y offset of `widget` inside the scroll frame, or None if it is not in it.
+    def _offset_in_scroll_frame(self, widget) -> Optional[int]:
+        y = 0
+        while widget is not None and widget is not self.scroll_frame:
+            y += widget.winfo_y()
+            widget = widget.master
+        return None if widget is None else y
+
+    # Builds the queued entries near the viewport, nearest first, MATERIALIZE_BUDGET per pass.
+    def _materialize_visible(self):
+        self._lazy_check_scheduled = False
+        try:
+            viewport = self._lazy_viewport()
+            if viewport is None:
+                return
+            self.lazy_build_stats["passes"] += 1
+            self.scroll_frame.update_idletasks()  # placeholders need their grid geometry
+            top, bottom = viewport
+
+            due, pending = [], []
+            for record in self._lazy_pending:
+                placeholder = record[0]
+                if not placeholder.winfo_exists():
+                    continue  # The page was rebuilt under it.
+                y = self._offset_in_scroll_frame(placeholder)
+                if y is not None and y < bottom and y + placeholder.winfo_height() > top:
+                    due.append((abs(y - top), record))
+                else:
+                    pending.append(record)
+            due.sort(key=lambda item: item[0])
+
+            for _, record in due[MATERIALIZE_BUDGET:]:
+                pending.append(record)
+            self._lazy_pending = pending
+            for _, record in due[:MATERIALIZE_BUDGET]:
+                self._materialize_entry(*record)
+
+            if due:
+                # Built blocks add placeholders of their own and move the ones below them.
+                self._on_frame_configure()
+                self._schedule_lazy_check(delay_ms=1)
+        except tk.TclError:
+            pass  # The builder was destroyed between passes.
+
+    # Replaces one placeholder with the real widget in the same grid cell.
+    def _materialize_entry(self, placeholder, parent_frame, key, value, current_path, grid_options):
+        target_frame = self._build_widget_entry(parent_frame, key, value, current_path)
+        placeholder.destroy()
+        if target_frame:
+            target_frame.grid(padx=5, pady=5, **grid_options)
+        self.lazy_build_stats["materialized"] += 1
+        if app_constants.global_settings["debug_enabled"]:
+            debug_logger(
+                message=f"🧱 Built '{current_path}' as it scrolled into view.",
+                **_get_log_args(),
+            )
+
+    # Returns placeholder, built and still pending entry counts.
+    def get_lazy_build_stats(self) -> Dict[str, int]:
+        stats = dict(self.lazy_build_stats)
+        stats["pending"] = len(self._lazy_pending)
+        return stats
@@ -0,0 +1,105 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from workers.builder.builder_core.gui_animation_clock import AnimationClock
+    from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityScope
+
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+
+class _FakeRoot:
+    """Stands in for the Tk root: `after` callbacks run when the test advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.pending = {}
+        self._next_id = 0
+
+    def after(self, delay_ms, callback):
+        self._next_id += 1
+        self.pending[self._next_id] = (self.now + delay_ms / 1000.0, callback)
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def advance(self, ms):
+        end = self.now + ms / 1000.0
+        while self.pending:
+            after_id, (due, callback) = min(self.pending.items(), key=lambda item: item[1][0])
+            if due > end:
+                break
+            del self.pending[after_id]
+            self.now = due
+            callback()
+        self.now = end
+
+
+@unittest.skipUnless(TKINTER_AVAILABLE, "tkinter is not installed")
+class TestAnimationClock(unittest.TestCase):
+
+    def setUp(self):
+        self.root = _FakeRoot()
+        self.clock = AnimationClock(self.root, frame_interval_ms=16, time_func=lambda: self.root.now)
+
+    def test_one_timer_for_all_animators_until_they_rest(self):
+        remaining = {"a": 3, "b": 6}
+
+        def make(name):
+            def animator(dt):
+                remaining[name] -= 1
+                return remaining[name] > 0
+            return animator
+
+        for name in remaining:
+            self.clock.wake(make(name))
+        self.assertEqual(len(self.root.pending), 1)
+        self.root.advance(1000)
+        self.assertEqual(remaining, {"a": 0, "b": 0})
+        self.assertEqual(self.clock.get_stats()["ticks"], 9)
+        self.assertEqual(self.clock.get_stats()["active_animators"], 0)
+        self.assertEqual(self.root.pending, {})  # idle clock schedules nothing
+
+    def test_blinkers_with_the_same_interval_share_a_phase(self):
+        phases = {"a": [], "b": []}
+        self.clock.add_blinker(500, phases["a"].append)
+        self.root.advance(250)
+        self.clock.add_blinker(500, phases["b"].append)
+        self.root.advance(1000)
+        self.assertEqual(phases["a"], [True, False, True])
+        self.assertEqual(phases["b"], [True, False, True])
+        self.assertEqual(len(self.root.pending), 1)
+
+    def test_animators_in_a_hidden_scope_are_parked_until_shown(self):
+        ticks = []
+        scope = VisibilityScope()
+        self.clock.wake(lambda dt: ticks.append(dt) or True, scope)
+        self.root.advance(50)
+        scope._set_visible(False)
+        count = len(ticks)
+        self.root.advance(500)
+        self.assertEqual(len(ticks), count)
+        self.assertEqual(self.clock.get_stats()["active_animators"], 0)
+        scope._set_visible(True)
+        self.root.advance(50)
+        self.assertGreater(len(ticks), count)
+
+    def test_failing_animator_is_dropped(self):
+        def broken(dt):
+            raise RuntimeError("widget gone")
+
+        self.clock.wake(broken)
+        self.root.advance(100)
+        self.assertEqual(self.clock.get_stats()["active_animators"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from workers.builder.builder_core.gui_lazy_builder import (
+        GuiLazyBuilderMixin,
+        estimate_entry_height,
+    )
+
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+
+class _FakeWidget:
+    """A gridded widget with a fixed position that can be destroyed."""
+
+    def __init__(self, master=None, y=0, height=100):
+        self.master = master
+        self.y = y
+        self.height = height
+        self.exists = True
+
+    def winfo_y(self):
+        return self.y
+
+    def winfo_height(self):
+        return self.height
+
+    def winfo_exists(self):
+        return self.exists
+
+    def destroy(self):
+        self.exists = False
+
+    def update_idletasks(self):
+        pass
+
+
+class _FakeCanvas:
+    def __init__(self, top=0, height=300):
+        self.top = top
+        self.height = height
+
+    def winfo_viewable(self):
+        return True
+
+    def winfo_height(self):
+        return self.height
+
+    def canvasy(self, y):
+        return self.top + y
+
+
+class _FakeBuilder(GuiLazyBuilderMixin):
+    def __init__(self):
+        self.scroll_frame = _FakeWidget()
+        self.canvas = _FakeCanvas()
+        self.lazy_build_margin_px = 100
+        self._lazy_pending = []
+        self._lazy_check_scheduled = False
+        self.lazy_build_stats = {"placeholders": 0, "materialized": 0, "passes": 0}
+        self.built = []
+
+    def _build_widget_entry(self, parent_frame, key, value, current_path):
+        self.built.append(key)
+        return None
+
+    def after_idle(self, callback):
+        pass
+
+    def after(self, delay_ms, callback):
+        pass
+
+    def _on_frame_configure(self, event=None):
+        pass
+
+    def queue(self, key, y):
+        placeholder = _FakeWidget(self.scroll_frame, y, 100)
+        self._lazy_pending.append((placeholder, self.scroll_frame, key, {}, key, {}))
+
+
+@unittest.skipUnless(TKINTER_AVAILABLE, "tkinter is not installed")
+class TestGuiLazyBuilder(unittest.TestCase):
+
+    def test_only_entries_near_the_viewport_are_built(self):
+        builder = _FakeBuilder()
+        for index in range(11):
+            builder.queue(f"block_{index}", index * 200)
+
+        builder._materialize_visible()  # band -100..400
+        self.assertEqual(builder.built, ["block_0", "block_1"])
+        self.assertEqual(builder.get_lazy_build_stats()["pending"], 9)
+
+        builder.canvas.top = 1000  # band 900..1400
+        builder._materialize_visible()
+        self.assertEqual(builder.built[2:], ["block_5", "block_6"])
+
+    def test_block_height_estimate_follows_its_grid(self):
+        knob = {"type": "_Knob", "height": 50}
+        block = {"type": "OcaBlock", "layout_columns": 2, "fields": {"a": knob, "b": knob, "c": knob}}
+        self.assertEqual(estimate_entry_height(block), 20 + 60 + 60)
+        self.assertEqual(estimate_entry_height({"type": "_Label"}), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,8 +16,8 @@
 # Version 20250821.200641.1
 import tkinter as tk
 from tkinter import ttk
-from collections import deque
 import time
+import threading
 from typing import Dict, Any, List
 import inspect
 
@@ -29,11 +29,20 @@ from . import graph_builder
 from . import graph_styler
 from . import graph_interactor
 from . import graph_updater
+from .graph_decimation import LineDecimator
+from .graph_renderer import BlitRenderer, DEFAULT_FRAME_INTERVAL_MS
+from .graph_series_buffer import SeriesRingBuffer, parse_xy_csv, trace_x_axis
+from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityRegistry
+from workers.mqtt.mqtt_trace_payload import (
+    TracePayloadError,
+    decode_trace_payload,
+)
 
 app_constants = Config.get_instance()
 
 # Globals
-current_version = "20260101.000000.1"
+current_version = "20261016.230000.1"
+current_version_hash = 20261016 * 230000 * 1
 
 
 class FluxPlotter(tk.Frame):
@@ -41,6 +50,14 @@ class FluxPlotter(tk.Frame):
     A Tkinter-compatible Matplotlib graph widget that dynamically renders
     plots with multiple datasets based on a JSON configuration.
     Refactored to use helper modules for building, styling, interaction, and updating.
+
+    Each dataset lives in a preallocated NumPy ring buffer. Datasets arrive as CSV text through
+    their StringVar, or as binary trace payloads on the dataset's optional "trace_topic".
+    Redraws go through a BlitRenderer: at most one per frame, and only a blit of the data
+    lines unless the limits change. Unless a dataset sets "decimate": false, its line is fed
+    through a LineDecimator, so it never holds more than a min/max pair per pixel column.
+    While the plot is off screen (hidden tab, iconified window) traces and redraws are held
+    back, latest only, until it is shown.
     """
 
     # Initializes the FluxPlotter widget.
@@ -71,22 +88,38 @@ class FluxPlotter(tk.Frame):
         self.widget_id = widget_id
 
         self.lines: Dict[str, Any] = {}
-        self.x_data: Dict[str, deque] = {}
-        self.y_data: Dict[str, deque] = {}
+        self.line_feeds: Dict[str, Any] = {}  # The line itself or the LineDecimator feeding it
+        self.series: Dict[str, SeriesRingBuffer] = {}
         self.datasets_config: Dict[str, Any] = {}
         self.dataset_vars: Dict[str, tk.StringVar] = {}
+        self._pending_traces: Dict[str, tuple] = {}  # Filled by the MQTT thread, drained on the Tk loop
+        self._pending_traces_lock = threading.Lock()
 
+        self.visibility = VisibilityRegistry.scope_for(self)
         self.fig, self.ax, self.canvas = graph_builder.create_base_plot(self, config)
+        self.renderer = BlitRenderer(
+            self,
+            self.fig,
+            self.ax,
+            self.canvas,
+            frame_interval_ms=config.get("frame_interval_ms", DEFAULT_FRAME_INTERVAL_MS),
+            visibility=self.visibility,
+        )
 
         self._initialize_plot_elements()
         self._process_dataset_config()
         self._load_all_initial_data()
 
         self.bind("<Configure>", self._on_resize)
+        if self.subscriber_router and any(
+            ds_config.get("trace_topic") for ds_config in self.datasets_config.values()
+        ):
+            self.after(self.renderer.frame_interval_ms, self._poll_pending_traces)
 
     # Handles the resizing of the plot widget.
     # This method adjusts the size of the Matplotlib figure to match the new dimensions
-    # of the Tkinter widget and triggers a redraw of the canvas.
+    # of the Tkinter widget and requests a redraw; a burst of <Configure> events while the
+    # user drags the window costs one redraw per frame.
     # Inputs:
     #     event: The tkinter Configure event object.
     # Outputs:
@@ -99,7 +132,7 @@ class FluxPlotter(tk.Frame):
 
             if dpi > 0 and w_pixels > 1 and h_pixels > 1:
                 self.fig.set_size_inches(w_pixels / dpi, h_pixels / dpi)
-                graph_updater.autoscale_and_redraw(self.ax, self.canvas)
+                self.renderer.request_full_redraw()
 
     # Initializes core plot elements, including styling and interaction.
     # This method applies themes, sets up interactive features for the plot, and
@@ -118,7 +151,7 @@ class FluxPlotter(tk.Frame):
         graph_styler.apply_style(self.ax, self.fig, self.config, theme)
 
         # Setup interactions
-        graph_interactor.setup_interaction(self.fig, self.ax, self.config)
+        graph_interactor.setup_interaction(self.fig, self.ax, self.config, self.renderer)
 
         # Create line objects for each dataset
         for ds_config in self.config.get("datasets", []):
@@ -132,16 +165,18 @@ class FluxPlotter(tk.Frame):
                     linewidth=style.get("line_width", 1),
                     label=ds_config.get("label", ds_id),
                 )
-                self.lines[ds_id] = line
-                self.x_data[ds_id] = deque(maxlen=self.config.get("buffer_size", 100))
-                self.y_data[ds_id] = deque(maxlen=self.config.get("buffer_size", 100))
+                self.lines[ds_id] = self.renderer.add_artist(line)
+                self.line_feeds[ds_id] = (
+                    LineDecimator(line, self.ax) if ds_config.get("decimate", True) else line
+                )
+                self.series[ds_id] = SeriesRingBuffer(self.config.get("buffer_size", 100))
 
         if len(self.config.get("datasets", [])) > 1:
             self.ax.legend()
 
     # Callback for when an individual dataset's StringVar changes.
     # This method is triggered when new CSV data for a dataset is received. It parses
-    # the CSV, extracts x and y values, and loads this data into the plot.
+    # the CSV into x and y arrays in one vectorized pass and loads them into the plot.
     # Inputs:
     #     dataset_id (str): The ID of the dataset that changed.
     #     *args: Additional arguments from the StringVar trace.
@@ -154,24 +189,15 @@ class FluxPlotter(tk.Frame):
 
         csv_data = self.dataset_vars[dataset_id].get()
         debug_logger(
-            f"Processing CSV data for dataset '{dataset_id}':\n{csv_data}",
+            lambda: f"Processing CSV data for dataset '{dataset_id}' ({len(csv_data)} chars)",
             **_get_log_args(),
         )
         try:
-            x_values, y_values = [], []
-            lines = csv_data.strip().split("\n")
-            if lines and "x" in lines[0].lower() and "y" in lines[0].lower():
-                lines = lines[1:]
-            for line in lines:
-                if not line.strip():
-                    continue
-                parts = line.strip().split(",")
-                if len(parts) >= 2:
-                    x_values.append(float(parts[0]))
-                    y_values.append(float(parts[1]))
-
-            debug_logger(f"Extracted x_values: {x_values}", **_get_log_args())
-            debug_logger(f"Extracted y_values: {y_values}", **_get_log_args())
+            x_values, y_values = parse_xy_csv(csv_data)
+            debug_logger(
+                lambda: f"Extracted {len(x_values)} points for dataset '{dataset_id}'",
+                **_get_log_args(),
+            )
             self.load_initial_data(dataset_id, x_values, y_values)
         except Exception as e:
             debug_logger(
@@ -217,6 +243,65 @@ class FluxPlotter(tk.Frame):
                     )
                     self.state_mirror_engine.initialize_widget_state(dataset_path)
 
+                trace_topic = ds_config.get("trace_topic")
+                if trace_topic and self.subscriber_router:
+                    self.subscriber_router.subscribe_to_topic(
+                        trace_topic,
+                        lambda topic, payload, ds_id=ds_id: self._on_trace_message(
+                            ds_id, topic, payload
+                        ),
+                    )
+
+    # Receives a binary trace payload for a dataset from the MQTT thread.
+    # Only the newest trace per dataset is kept, under a lock; no Tk call is made here. The Tk
+    # loop drains them once per frame interval, so a burst of sweeps costs one redraw.
+    # Inputs:
+    #     dataset_id (str): The dataset the trace topic belongs to.
+    #     topic (str): The MQTT topic.
+    #     payload (bytes): The trace payload (see mqtt_trace_payload).
+    # Outputs:
+    #     None.
+    def _on_trace_message(self, dataset_id, topic, payload):
+        if not isinstance(payload, (bytes, bytearray)):
+            return
+        try:
+            metadata, values = decode_trace_payload(payload)
+        except TracePayloadError as e:
+            debug_logger(
+                f"❌ Invalid trace payload on '{topic}' for dataset '{dataset_id}': {e}",
+                **_get_log_args(),
+            )
+            return
+        with self._pending_traces_lock:
+            self._pending_traces[dataset_id] = (metadata, values)
+
+    # Tk-side poll of the traces received from the MQTT thread; reschedules itself every frame
+    # interval until the widget is destroyed.
+    def _poll_pending_traces(self):
+        try:
+            if not self.winfo_exists():
+                return
+            if self._pending_traces:
+                # Off screen the newest trace per dataset stays pending until the plot is shown again.
+                self.visibility.run(self._load_pending_traces, self._load_pending_traces)
+            self.after(self.renderer.frame_interval_ms, self._poll_pending_traces)
+        except tk.TclError:
+            pass  # The application is shutting down.
+
+    def _load_pending_traces(self):
+        with self._pending_traces_lock:
+            pending, self._pending_traces = self._pending_traces, {}
+        for dataset_id, (metadata, values) in pending.items():
+            ds_config = self.datasets_config.get(dataset_id, {})
+            x_values = trace_x_axis(
+                len(values),
+                metadata.get("start_hz", ds_config.get("x_start")),
+                metadata.get("stop_hz", ds_config.get("x_stop")),
+            )
+            self.load_trace(dataset_id, values, x_values, redraw=False)
+        if pending:
+            graph_updater.autoscale_and_redraw(self.ax, self.canvas, self.renderer)
+
     # Loads initial data for all configured datasets.
     # This method populates the plot with any initial CSV data specified in the
     # configuration for each dataset by setting their corresponding StringVars.
@@ -232,12 +317,13 @@ class FluxPlotter(tk.Frame):
                 self.dataset_vars[ds_id].set(csv_data)
 
     # Loads a complete set of initial data points for a specific dataset.
-    # This method takes lists of x and y values and loads them into the plot for
-    # the specified dataset, then triggers an autoscale and redraw.
+    # This method takes x and y values (lists or arrays) and loads them into the plot for
+    # the specified dataset, keeping the newest `buffer_size` points, then triggers an
+    # autoscale and redraw.
     # Inputs:
     #     dataset_id (str): The ID of the dataset to load data into.
-    #     x_values (List[float]): A list of x-axis values.
-    #     y_values (List[float]): A list of y-axis values.
+    #     x_values (List[float]): The x-axis values.
+    #     y_values (List[float]): The y-axis values.
     # Outputs:
     #     None.
     def load_initial_data(
@@ -253,13 +339,37 @@ class FluxPlotter(tk.Frame):
         if dataset_id not in self.lines:
             return
         graph_updater.load_initial_data(
-            self.lines[dataset_id],
-            self.x_data[dataset_id],
-            self.y_data[dataset_id],
+            self.line_feeds[dataset_id],
+            self.series[dataset_id],
+            x_values,
+            y_values,
+        )
+        graph_updater.autoscale_and_redraw(self.ax, self.canvas, self.renderer)
+
+    # Replaces a dataset with a whole trace (e.g. one sweep).
+    # Unlike load_initial_data, the dataset grows to the trace length instead of truncating it.
+    # Inputs:
+    #     dataset_id (str): The ID of the dataset to load data into.
+    #     y_values (array-like): The trace points.
+    #     x_values (array-like, optional): The x values; defaults to the point index.
+    #     redraw (bool, optional): Autoscale and redraw afterwards.
+    # Outputs:
+    #     None.
+    def load_trace(self, dataset_id: str, y_values, x_values=None, redraw: bool = True):
+        """Loads a whole trace into a dataset."""
+        if dataset_id not in self.lines:
+            return
+        if x_values is None:
+            x_values = trace_x_axis(len(y_values))
+        graph_updater.load_initial_data(
+            self.line_feeds[dataset_id],
+            self.series[dataset_id],
             x_values,
             y_values,
+            grow=True,
         )
-        graph_updater.autoscale_and_redraw(self.ax, self.canvas)
+        if redraw:
+            graph_updater.autoscale_and_redraw(self.ax, self.canvas, self.renderer)
 
     # Updates a specific dataset with a new data point.
     # This method adds a single new (x, y) data point to the specified dataset
@@ -275,13 +385,12 @@ class FluxPlotter(tk.Frame):
         if dataset_id not in self.lines:
             return
         graph_updater.update_graph_data(
-            self.lines[dataset_id],
-            self.x_data[dataset_id],
-            self.y_data[dataset_id],
+            self.line_feeds[dataset_id],
+            self.series[dataset_id],
             x_new,
             y_new,
         )
-        graph_updater.autoscale_and_redraw(self.ax, self.canvas)
+        graph_updater.autoscale_and_redraw(self.ax, self.canvas, self.renderer)
 
     # Clears data from one or all datasets on the plot.
     # This method can clear all data points from a specified dataset or from all
@@ -293,12 +402,8 @@ class FluxPlotter(tk.Frame):
     def clear_plot(self, dataset_id: str = None):
         """Clears data from a specific dataset or all datasets."""
         if dataset_id and dataset_id in self.lines:
-            graph_updater.clear_plot_data(
-                self.lines[dataset_id], self.x_data[dataset_id], self.y_data[dataset_id]
-            )
+            graph_updater.clear_plot_data(self.line_feeds[dataset_id], self.series[dataset_id])
         else:
             for ds_id in self.lines:
-                graph_updater.clear_plot_data(
-                    self.lines[ds_id], self.x_data[ds_id], self.y_data[ds_id]
-                )
-        graph_updater.autoscale_and_redraw(self.ax, self.canvas)
\ No newline at end of file
+                graph_updater.clear_plot_data(self.line_feeds[ds_id], self.series[ds_id])
+        graph_updater.autoscale_and_redraw(self.ax, self.canvas, self.renderer)
\ No newline at end of file
@@ -0,0 +1,172 @@
+# builder_data_graphing/graph_decimation.py
+#
+# Display decimation for large traces: each series is reduced to a min/max envelope per pixel
+# column of the axes, recomputed from the full-resolution data whenever the x limits change.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.234500.1
+from typing import Any, Tuple
+
+import numpy as np
+
+current_version = "20261016.234500.1"
+current_version_hash = 20261016 * 234500 * 1
+
+
+# Reduces a series to two points per pixel column.
+# Each column keeps its minimum and its maximum sample, in their original order and at their
+# original x positions, so a one-bin carrier still reaches its true peak on screen.
+# Inputs:
+#     x_values, y_values (array-like): The full-resolution series; x must be ascending when
+#                                      x_range is given.
+#     columns (int): The number of pixel columns available.
+#     x_range (tuple, optional): (x_min, x_max) of the visible window; one sample beyond each
+#                                edge is kept so the line runs off the axes instead of stopping short.
+# Outputs:
+#     tuple: (x, y) arrays. Series that already fit are returned as views, not copies.
+def minmax_decimate(x_values, y_values, columns: int, x_range=None) -> Tuple[np.ndarray, np.ndarray]:
+    x_values = np.asarray(x_values)
+    y_values = np.asarray(y_values)
+    start, stop = 0, min(len(x_values), len(y_values))
+    if x_range is not None:
+        start = max(int(np.searchsorted(x_values[:stop], x_range[0], side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(x_values[:stop], x_range[1], side="right")) + 1, stop)
+    x_window = x_values[start:stop]
+    y_window = y_values[start:stop]
+    count = len(x_window)
+    columns = int(columns)
+    if columns < 1 or count <= 2 * columns:
+        return x_window, y_window
+
+    per_column = count // columns
+    whole = per_column * columns
+    blocks = y_window[:whole].reshape(columns, per_column)
+    low = blocks.argmin(axis=1)
+    high = blocks.argmax(axis=1)
+    offsets = np.arange(0, whole, per_column)
+    pairs = [np.minimum(low, high) + offsets, np.maximum(low, high) + offsets]
+    if whole < count:
+        tail = y_window[whole:]
+        tail_pair = sorted((whole + int(tail.argmin()), whole + int(tail.argmax())))
+        pairs = [np.append(pairs[0], tail_pair[0]), np.append(pairs[1], tail_pair[1])]
+    # The first and last samples stay too, so autoscaling sees the true x extent.
+    index = np.empty(2 * len(pairs[0]) + 2, dtype=np.intp)
+    index[1:-1:2] = pairs[0]
+    index[2:-1:2] = pairs[1]
+    index[0], index[-1] = 0, count - 1
+    return x_window[index], y_window[index]
+
+
+class LineDecimator:
+    """
+    Stands in for a Line2D's set_data(): keeps the full-resolution series and gives the line
+    only the min/max envelope for the current axes width.
+
+    New data is decimated over its whole range so autoscaling still sees every extreme, unless
+    the user has zoomed (x autoscaling off), in which case the current x window is kept. Zoom
+    and pan (xlim_changed) re-decimate just the visible window from the full-resolution data.
+    Keep a reference to the decimator: Matplotlib holds the xlim_changed callback weakly.
+    """
+
+    # Initializes the decimator.
+    # Inputs:
+    #     line: The Matplotlib Line2D to feed.
+    #     ax: The axes the line belongs to.
+    #     oversample (float, optional): Envelope columns per screen pixel.
+    # Outputs:
+    #     None.
+    def __init__(self, line: Any, ax: Any, oversample: float = 1.0):
+        self.line = line
+        self.ax = ax
+        self.oversample = oversample
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._ascending = True
+        self._window = None
+        ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
+    # Replaces the full-resolution series (same call shape as Line2D.set_data).
+    def set_data(self, x_values, y_values) -> None:
+        self._x = np.asarray(x_values)
+        self._y = np.asarray(y_values)
+        self._ascending = len(self._x) < 2 or bool(np.all(self._x[1:] >= self._x[:-1]))
+        self._apply(self._zoom_window())
+
+    def _columns(self) -> int:
+        return int(self.ax.bbox.width * self.oversample)
+
+    def _apply(self, x_range) -> None:
+        self._window = x_range
+        x_shown, y_shown = minmax_decimate(self._x, self._y, self._columns(), x_range)
+        self.line.set_data(x_shown, y_shown)
+
+    # Returns the visible x window while zoomed into part of the series, else None (whole range).
+    def _zoom_window(self):
+        if self.ax.get_autoscalex_on() or not self._ascending or len(self._x) < 2:
+            return None
+        x_min, x_max = sorted(self.ax.get_xlim())
+        if x_min <= self._x[0] and x_max >= self._x[-1]:
+            return None
+        return (x_min, x_max)
+
+    def _on_xlim_changed(self, ax) -> None:
+        if len(self._x) <= 2 * self._columns() or not self._ascending:
+            return
+        x_min, x_max = sorted(ax.get_xlim())
+        if self._window is None and x_min <= self._x[0] and x_max >= self._x[-1]:
+            return  # Whole series visible; the full-range envelope is already current.
+        self._apply((x_min, x_max))
+
+
+# Times one full Agg draw of a line with and without decimation for growing point counts.
+def _benchmark():
+    import time
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6, 4), dpi=100)
+    ax = fig.add_subplot(111)
+    canvas = FigureCanvasAgg(fig)
+    (raw_line,) = ax.plot([], [], linewidth=1)
+    (decimated_line,) = ax.plot([], [], linewidth=1)
+    decimator = LineDecimator(decimated_line, ax)
+    rng = np.random.default_rng(1)
+    print(f"Axes width: {ax.bbox.width:.0f} px")
+    print(f"{'points':>9} {'raw ms':>9} {'decimated ms':>13} {'vertices':>9}")
+    for count in (1_000, 10_000, 40_000, 100_000, 400_000):
+        x_values = np.linspace(100e6, 6e9, count)
+        y_values = rng.normal(-95.0, 2.0, count)
+        y_values[count // 3] = -20.0  # A one-bin carrier that must survive decimation
+        timings = []
+        for line, other in ((raw_line, decimated_line), (decimated_line, raw_line)):
+            other.set_visible(False)
+            line.set_visible(True)
+            started = time.perf_counter()
+            for _ in range(5):
+                if line is raw_line:
+                    line.set_data(x_values, y_values)
+                else:
+                    decimator.set_data(x_values, y_values)
+                ax.relim()
+                ax.autoscale_view()
+                canvas.draw()
+            timings.append((time.perf_counter() - started) / 5 * 1000)
+        assert decimated_line.get_ydata().max() == -20.0
+        print(f"{count:>9} {timings[0]:>9.1f} {timings[1]:>13.1f} {len(decimated_line.get_xdata()):>9}")
+
+
+if __name__ == "__main__":
+    _benchmark()
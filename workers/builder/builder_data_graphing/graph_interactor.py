@@ -16,17 +16,23 @@
 from matplotlib.backend_bases import NavigationToolbar2
 from typing import Dict, Any
 
+current_version = "20261016.233000.1"
+current_version_hash = 20261016 * 233000 * 1
+
 
 class ZoomPan:
     # Initializes the ZoomPan functionality for a Matplotlib axis.
     # This sets up event listeners for mouse presses, releases, motion, and scrolling
-    # to enable interactive zooming and panning on the graph.
+    # to enable interactive zooming and panning on the graph. Redraws are requested, not
+    # performed, so a fast drag costs at most one redraw per frame.
     # Inputs:
     #     ax: The Matplotlib axes object to apply interaction to.
+    #     renderer (BlitRenderer, optional): The plot's renderer; without one, draw_idle is used.
     # Outputs:
     #     None.
-    def __init__(self, ax):
+    def __init__(self, ax, renderer=None):
         self.ax = ax
+        self.renderer = renderer
         self.fig = ax.get_figure()
         self.press = None
         self.cur_xlim = None
@@ -59,15 +65,14 @@ class ZoomPan:
         self.x0, self.y0, self.xpress, self.ypress = self.press
 
     # Handles the mouse button release event.
-    # This method clears the press state, indicating the end of a pan or zoom operation,
-    # and redraws the canvas.
+    # This method clears the press state, indicating the end of a pan or zoom operation.
+    # The limits were already redrawn while dragging, so nothing else is drawn.
     # Inputs:
     #     event: The Matplotlib mouse event object.
     # Outputs:
     #     None.
     def on_release(self, event):
         self.press = None
-        self.ax.figure.canvas.draw()
 
     # Handles the mouse motion event for panning.
     # If a mouse button is pressed, this method calculates the displacement
@@ -85,7 +90,7 @@ class ZoomPan:
         self.cur_ylim -= dy
         self.ax.set_xlim(self.cur_xlim)
         self.ax.set_ylim(self.cur_ylim)
-        self.ax.figure.canvas.draw()
+        self._request_redraw()
 
     # Handles the mouse scroll event for zooming.
     # This method adjusts the axis limits based on the scroll direction and a scale factor,
@@ -112,25 +117,36 @@ class ZoomPan:
 
         self.ax.set_xlim(new_xlim)
         self.ax.set_ylim(new_ylim)
-        self.ax.figure.canvas.draw()
+        self._request_redraw()
+
+    # The limits changed, so the background must be redrawn as well.
+    def _request_redraw(self):
+        if self.renderer is not None:
+            self.renderer.request_full_redraw()
+        else:
+            self.ax.figure.canvas.draw_idle()
 
 
 # Sets up interactive features for a Matplotlib graph.
 # This function enables zoom and pan functionality using the ZoomPan class,
 # and can optionally display hover annotations to show data values when the mouse
-# hovers over the plot area.
+# hovers over the plot area. With a renderer, the annotation is blitted rather than
+# redrawing the figure on every mouse move.
 # Inputs:
 #     fig (object): The Matplotlib figure object.
 #     ax (object): The Matplotlib axes object.
 #     interaction_config (Dict[str, Any]): A dictionary specifying which interactions to enable.
+#     renderer (BlitRenderer, optional): The plot's renderer.
 # Outputs:
 #     None.
-def setup_interaction(fig: object, ax: object, interaction_config: Dict[str, Any]):
+def setup_interaction(
+    fig: object, ax: object, interaction_config: Dict[str, Any], renderer: object = None
+):
     """
     Binds events for mouse movement and scrolling.
     """
     if interaction_config.get("enable_zoom") or interaction_config.get("enable_pan"):
-        ZoomPan(ax)
+        ZoomPan(ax, renderer)
 
     if interaction_config.get("show_hover_value"):
         annot = ax.annotate(
@@ -142,9 +158,11 @@ def setup_interaction(fig: object, ax: object, interaction_config: Dict[str, Any
             arrowprops=dict(arrowstyle="->"),
         )
         annot.set_visible(False)
+        if renderer is not None:
+            renderer.add_artist(annot)
 
         def on_mouse_hover(event):
-            update_annotation(event, ax, annot)
+            update_annotation(event, ax, annot, renderer)
 
         fig.canvas.mpl_connect("motion_notify_event", on_mouse_hover)
 
@@ -156,18 +174,20 @@ def setup_interaction(fig: object, ax: object, interaction_config: Dict[str, Any
 #     event: The Matplotlib mouse event object.
 #     ax: The Matplotlib axes object.
 #     annot: The Matplotlib annotation object.
+#     renderer (BlitRenderer, optional): The plot's renderer.
 # Outputs:
 #     None.
-def update_annotation(event, ax, annot):
+def update_annotation(event, ax, annot, renderer=None):
     """Updates the annotation box when mouse hovers over a point."""
+    redraw = renderer.request_update if renderer is not None else ax.figure.canvas.draw_idle
     if event.inaxes == ax:
         # For simplicity, we are not snapping to the line.
         # A more advanced implementation would find the nearest point on the line.
         annot.xy = (event.xdata, event.ydata)
         annot.set_text(f"x={event.xdata:.2f}, y={event.ydata:.2f}")
         annot.set_visible(True)
-        ax.figure.canvas.draw_idle()
+        redraw()
     else:
         if annot.get_visible():
             annot.set_visible(False)
-            ax.figure.canvas.draw_idle()
\ No newline at end of file
+            redraw()
\ No newline at end of file
@@ -0,0 +1,147 @@
+# builder_data_graphing/graph_renderer.py
+#
+# Coalesces redraw requests for a Matplotlib plot to at most one per frame, and blits the
+# animated artists over a cached background unless the axes limits actually changed.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.233000.1
+from typing import Any, Dict
+
+current_version = "20261016.233000.1"
+current_version_hash = 20261016 * 233000 * 1
+
+DEFAULT_FRAME_INTERVAL_MS = 16  # ~60 fps ceiling per plot
+
+
+class BlitRenderer:
+    """
+    Owns the redraw policy of one plot.
+
+    Animated artists (the data lines, hover annotations) are excluded from normal draws. Every
+    full draw, whoever triggers it, ends in a draw_event where the static background (axes,
+    grid, labels, ticks) is cached and the animated artists are blitted on top. Data updates
+    then only restore that background and redraw the animated artists.
+
+    request_update() and request_full_redraw() may be called any number of times; they are
+    served by a single `after` callback per frame. Full redraws go through canvas.draw_idle()
+    and only happen when the limits changed, the canvas was resized, or the background is gone.
+
+    With a visibility scope, no frame runs while the plot is off screen: the pending request
+    is parked in the scope and served by one frame when the plot is shown again.
+    """
+
+    # Initializes the renderer.
+    # Inputs:
+    #     widget: The Tk widget used to schedule frames (anything with `after`).
+    #     fig, ax, canvas: The Matplotlib figure, axes and canvas.
+    #     frame_interval_ms (int, optional): The minimum time between frames.
+    #     visibility (VisibilityScope, optional): Suspends frames while the plot is hidden.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        widget,
+        fig,
+        ax,
+        canvas,
+        frame_interval_ms: int = DEFAULT_FRAME_INTERVAL_MS,
+        visibility: Any = None,
+    ):
+        self.widget = widget
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.frame_interval_ms = max(1, int(frame_interval_ms))
+        self.visibility = visibility
+        self._artists = []
+        self._background = None
+        self._frame_pending = False
+        self._autoscale_pending = False
+        self._full_redraw_pending = False
+        self.stats: Dict[str, int] = {"requests": 0, "frames": 0, "blits": 0, "full_draws": 0, "suspended": 0}
+        self._draw_cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+    # Registers an artist that changes often; it is drawn by blitting only.
+    # Inputs:
+    #     artist: A Matplotlib artist belonging to `ax`.
+    # Outputs:
+    #     The artist.
+    def add_artist(self, artist: Any):
+        artist.set_animated(True)
+        self._artists.append(artist)
+        return artist
+
+    # Asks for the animated artists to be redrawn on the next frame.
+    # Inputs:
+    #     autoscale (bool, optional): Refit the limits to the data first; a full redraw follows
+    #                                 only if they change.
+    # Outputs:
+    #     None.
+    def request_update(self, autoscale: bool = False) -> None:
+        self.stats["requests"] += 1
+        self._autoscale_pending = self._autoscale_pending or autoscale
+        self._schedule()
+
+    # Asks for a full redraw on the next frame (limits set by zoom/pan, resize, style changes).
+    def request_full_redraw(self) -> None:
+        self.stats["requests"] += 1
+        self._full_redraw_pending = True
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if self._frame_pending or self._suspend():
+            return
+        self._frame_pending = True
+        self.widget.after(self.frame_interval_ms, self._on_frame)
+
+    # Parks the pending request in the visibility scope if the plot is off screen.
+    def _suspend(self) -> bool:
+        if self.visibility is None or self.visibility.visible:
+            return False
+        self.stats["suspended"] += 1
+        self.visibility.run(self, self._schedule)
+        return True
+
+    def _on_frame(self) -> None:
+        self._frame_pending = False
+        if self._suspend():
+            return
+        self.stats["frames"] += 1
+        if self._autoscale_pending:
+            self._autoscale_pending = False
+            limits = (self.ax.get_xlim(), self.ax.get_ylim())
+            self.ax.relim()
+            self.ax.autoscale_view()
+            if (self.ax.get_xlim(), self.ax.get_ylim()) != limits:
+                self._full_redraw_pending = True
+        if self._full_redraw_pending or self._background is None:
+            self._full_redraw_pending = False
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._blit_artists()
+        self.stats["blits"] += 1
+
+    # draw_event handler: every full draw refreshes the cached background.
+    def _on_draw(self, event) -> None:
+        self.stats["full_draws"] += 1
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._blit_artists()
+
+    def _blit_artists(self) -> None:
+        for artist in self._artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+
+    # Returns a copy of the request/frame/blit/full-draw/suspended counters.
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
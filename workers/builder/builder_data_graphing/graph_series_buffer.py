@@ -0,0 +1,174 @@
+# builder_data_graphing/graph_series_buffer.py
+#
+# Preallocated NumPy ring buffers for plot series, plus vectorized parsing of the CSV and binary
+# trace payloads that feed them.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.230000.1
+import warnings
+from typing import Tuple
+
+import numpy as np  # Matplotlib already depends on NumPy, so the plotting package can too.
+
+current_version = "20261016.230000.1"
+current_version_hash = 20261016 * 230000 * 1
+
+
+class SeriesRingBuffer:
+    """
+    A fixed-capacity (x, y) history stored twice back to back in preallocated arrays.
+    Every sample is written at `i` and `i + capacity`, so the newest `len` samples are always
+    one contiguous slice and view() hands Matplotlib a NumPy view instead of a fresh list.
+    """
+
+    # Initializes the buffer.
+    # Inputs:
+    #     capacity (int): The number of samples kept; older samples are overwritten.
+    #     dtype (str, optional): The NumPy dtype of both axes.
+    # Outputs:
+    #     None.
+    def __init__(self, capacity: int, dtype: str = "f8"):
+        self.dtype = np.dtype(dtype)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self._x = np.empty(2 * self.capacity, dtype=self.dtype)
+        self._y = np.empty(2 * self.capacity, dtype=self.dtype)
+        self._start = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    # Adds one sample, dropping the oldest when full.
+    def append(self, x: float, y: float) -> None:
+        capacity = self.capacity
+        head = (self._start + self._length) % capacity
+        self._x[head] = self._x[head + capacity] = x
+        self._y[head] = self._y[head + capacity] = y
+        if self._length < capacity:
+            self._length += 1
+        else:
+            self._start = (self._start + 1) % capacity
+
+    # Adds a block of samples with at most two slice copies per half.
+    # Inputs:
+    #     x_values, y_values (array-like): Equal-length sample arrays.
+    # Outputs:
+    #     None.
+    def extend(self, x_values, y_values) -> None:
+        x_values = np.asarray(x_values, dtype=self.dtype)
+        y_values = np.asarray(y_values, dtype=self.dtype)
+        count = min(len(x_values), len(y_values))
+        capacity = self.capacity
+        if count >= capacity:
+            self.replace(x_values[count - capacity : count], y_values[count - capacity : count])
+            return
+        head = (self._start + self._length) % capacity
+        first = min(count, capacity - head)
+        for store, values in ((self._x, x_values), (self._y, y_values)):
+            store[head : head + first] = values[:first]
+            store[head + capacity : head + capacity + first] = values[:first]
+            store[: count - first] = values[first:count]
+            store[capacity : capacity + count - first] = values[first:count]
+        total = self._length + count
+        if total > capacity:
+            self._start = (self._start + total - capacity) % capacity
+            self._length = capacity
+        else:
+            self._length = total
+
+    # Replaces the contents with a whole series (e.g. a new sweep).
+    # Inputs:
+    #     x_values, y_values (array-like): Equal-length sample arrays.
+    #     grow (bool, optional): Enlarge the buffer instead of keeping only the newest samples.
+    # Outputs:
+    #     None.
+    def replace(self, x_values, y_values, grow: bool = False) -> None:
+        x_values = np.asarray(x_values, dtype=self.dtype)
+        y_values = np.asarray(y_values, dtype=self.dtype)
+        count = min(len(x_values), len(y_values))
+        if grow and count > self.capacity:
+            self._allocate(count)
+        capacity = self.capacity
+        keep = min(count, capacity)
+        for store, values in ((self._x, x_values), (self._y, y_values)):
+            store[:keep] = values[count - keep : count]
+            store[capacity : capacity + keep] = values[count - keep : count]
+        self._start = 0
+        self._length = keep
+
+    def clear(self) -> None:
+        self._start = 0
+        self._length = 0
+
+    # Returns the samples oldest-first as (x, y) NumPy views; valid until the next write.
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        start, stop = self._start, self._start + self._length
+        return self._x[start:stop], self._y[start:stop]
+
+
+# Parses "x,y" CSV text (optionally with an x/y header line) into two arrays.
+# The common case is one np.fromstring() over the whole text; ragged or malformed text falls
+# back to the per-line parser, which skips lines it cannot use.
+# Inputs:
+#     csv_text (str): The dataset text.
+# Outputs:
+#     tuple: (x_values, y_values) as float64 arrays.
+def parse_xy_csv(csv_text: str) -> Tuple[np.ndarray, np.ndarray]:
+    text = csv_text.strip()
+    if text:
+        first_line, _, rest = text.partition("\n")
+        if "x" in first_line.lower() and "y" in first_line.lower():
+            text = rest.strip()
+            first_line = text.partition("\n")[0]
+    if not text:
+        return np.empty(0), np.empty(0)
+
+    columns = first_line.count(",") + 1
+    rows = text.count("\n") + 1
+    if columns >= 2:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                flat = np.fromstring(text.replace("\n", ","), sep=",")
+        except (ValueError, DeprecationWarning):
+            flat = None
+        if flat is not None and flat.size == rows * columns:
+            table = flat.reshape(rows, columns)
+            return table[:, 0], table[:, 1]
+
+    x_values, y_values = [], []
+    for line in text.split("\n"):
+        parts = line.strip().split(",")
+        if len(parts) >= 2:
+            try:
+                x, y = float(parts[0]), float(parts[1])
+            except ValueError:
+                continue
+            x_values.append(x)
+            y_values.append(y)
+    return np.asarray(x_values, dtype=float), np.asarray(y_values, dtype=float)
+
+
+# Builds the x axis for a trace that arrived as y values only.
+# Inputs:
+#     count (int): The number of points.
+#     start (float, optional): The first x value (e.g. start frequency).
+#     stop (float, optional): The last x value; without both, x is the point index.
+# Outputs:
+#     np.ndarray: The x values.
+def trace_x_axis(count: int, start=None, stop=None) -> np.ndarray:
+    if start is None or stop is None:
+        return np.arange(count, dtype=float)
+    return np.linspace(float(start), float(stop), count)
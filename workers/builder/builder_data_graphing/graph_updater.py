@@ -13,83 +13,83 @@
 # Feature Requests can be emailed to i @ like . audio
 #
 # Version 20250821.200641.1
-from collections import deque
-from typing import List, Any, Dict
+from typing import Any
+
+from .graph_series_buffer import SeriesRingBuffer
+
+current_version = "20261016.230000.1"
+current_version_hash = 20261016 * 230000 * 1
 
 
 # Efficiently updates the x and y data of a specific plot line.
-# This function appends new data points to the data deques and updates the Matplotlib line object,
-# making it suitable for real-time plotting.
+# This function appends the new point to the series ring buffer and hands the line a view of
+# the buffer, so no per-point list is rebuilt.
 # Inputs:
-#     line (Any): The Matplotlib line object to update.
-#     x_data (deque): A deque containing x-axis data points.
-#     y_data (deque): A deque containing y-axis data points.
+#     line (Any): The Matplotlib line object to update, or the LineDecimator feeding it.
+#     series (SeriesRingBuffer): The dataset's ring buffer.
 #     new_x (float): The new x-axis data point.
 #     new_y (float): The new y-axis data point.
 # Outputs:
 #     None.
-def update_graph_data(
-    line: Any, x_data: deque, y_data: deque, new_x: float, new_y: float
-):
+def update_graph_data(line: Any, series: SeriesRingBuffer, new_x: float, new_y: float):
     """
     Efficiently updates the x and y data of a specific line.
     """
-    x_data.append(new_x)
-    y_data.append(new_y)
-    line.set_data(list(x_data), list(y_data))
+    series.append(new_x, new_y)
+    line.set_data(*series.view())
 
 
-# Loads a complete set of initial data points for a specific dataset.
-# This function clears any existing data in the deques and extends them with the provided
-# lists of x and y values, then updates the Matplotlib line object.
+# Loads a complete set of data points for a specific dataset.
+# This function replaces the contents of the series ring buffer with the provided x and y
+# values, then updates the Matplotlib line object.
 # Inputs:
-#     line (Any): The Matplotlib line object to update.
-#     x_data (deque): A deque containing x-axis data points.
-#     y_data (deque): A deque containing y-axis data points.
-#     x_values (List[float]): A list of initial x-axis values.
-#     y_values (List[float]): A list of initial y-axis values.
+#     line (Any): The Matplotlib line object to update, or the LineDecimator feeding it.
+#     series (SeriesRingBuffer): The dataset's ring buffer.
+#     x_values (array-like): The x-axis values.
+#     y_values (array-like): The y-axis values.
+#     grow (bool, optional): Keep every point even if it exceeds the buffer size (whole traces).
 # Outputs:
 #     None.
 def load_initial_data(
     line: Any,
-    x_data: deque,
-    y_data: deque,
-    x_values: List[float],
-    y_values: List[float],
+    series: SeriesRingBuffer,
+    x_values,
+    y_values,
+    grow: bool = False,
 ):
     """Loads a complete set of initial data points for a specific dataset."""
-    x_data.clear()
-    y_data.clear()
-    x_data.extend(x_values)
-    y_data.extend(y_values)
-    line.set_data(list(x_data), list(y_data))
+    series.replace(x_values, y_values, grow=grow)
+    line.set_data(*series.view())
 
 
 # Clears all data from a specific plot line.
-# This function empties the data deques and resets the Matplotlib line object to display no data.
+# This function empties the series ring buffer and resets the Matplotlib line object to display no data.
 # Inputs:
-#     line (Any): The Matplotlib line object to clear.
-#     x_data (deque): A deque containing x-axis data points.
-#     y_data (deque): A deque containing y-axis data points.
+#     line (Any): The Matplotlib line object to clear, or the LineDecimator feeding it.
+#     series (SeriesRingBuffer): The dataset's ring buffer.
 # Outputs:
 #     None.
-def clear_plot_data(line: Any, x_data: deque, y_data: deque):
+def clear_plot_data(line: Any, series: SeriesRingBuffer):
     """Clears data from a specific dataset."""
-    x_data.clear()
-    y_data.clear()
+    series.clear()
     line.set_data([], [])
 
 
 # Autoscales the axes and redraws the canvas.
 # This function adjusts the axis limits to fit the current data and refreshes the
-# Matplotlib canvas to display the updated plot.
+# Matplotlib canvas to display the updated plot. With a renderer, both are deferred to the
+# next frame and the canvas is only fully redrawn if the limits changed.
 # Inputs:
 #     ax (object): The Matplotlib axes object.
 #     canvas (object): The Matplotlib FigureCanvasTkAgg object.
+#     renderer (BlitRenderer, optional): The plot's renderer.
 # Outputs:
 #     None.
-def autoscale_and_redraw(ax: object, canvas: object):
+def autoscale_and_redraw(ax: object, canvas: object, renderer: object = None):
     """Autoscales axes and redraws the canvas."""
+    if renderer is not None:
+        renderer.request_update(autoscale=True)
+        return
     ax.relim()
     ax.autoscale_view()
-    canvas.draw()
\ No newline at end of file
+    canvas.draw()
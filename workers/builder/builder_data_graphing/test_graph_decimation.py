@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    import numpy as np
+    from workers.builder.builder_data_graphing.graph_decimation import LineDecimator, minmax_decimate
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestMinMaxDecimate(unittest.TestCase):
+
+    def test_small_series_pass_through(self):
+        x, y = minmax_decimate(np.arange(10.0), np.zeros(10), columns=600)
+        self.assertEqual(len(x), 10)
+
+    def test_narrow_peak_survives_at_its_own_x(self):
+        x = np.arange(40_000.0)
+        y = np.full(40_000, -95.0)
+        y[12_345] = -20.0
+        y[30_001] = -130.0
+        x_shown, y_shown = minmax_decimate(x, y, columns=600)
+        self.assertLessEqual(len(x_shown), 2 * 601 + 2)
+        self.assertEqual(y_shown.max(), -20.0)
+        self.assertEqual(x_shown[y_shown.argmax()], 12_345.0)
+        self.assertEqual(y_shown.min(), -130.0)
+        self.assertTrue(np.all(np.diff(x_shown) >= 0))
+
+    def test_window_keeps_one_sample_beyond_each_edge(self):
+        x = np.arange(100.0)
+        x_shown, _ = minmax_decimate(x, x, columns=1000, x_range=(10.5, 20.5))
+        self.assertEqual((x_shown[0], x_shown[-1]), (10.0, 21.0))
+
+
+class _FakeLine:
+    def set_data(self, x_values, y_values):
+        self.x, self.y = x_values, y_values
+
+
+class _FakeAxes:
+    """The parts of a Matplotlib Axes that LineDecimator uses, 600 px wide."""
+
+    def __init__(self):
+        self.bbox = type("Bbox", (), {"width": 600})()
+        self.callbacks = type("Callbacks", (), {"connect": lambda *args: None})()
+        self.xlim = (0.0, 1.0)
+        self.autoscalex = True
+
+    def get_xlim(self):
+        return self.xlim
+
+    def get_autoscalex_on(self):
+        return self.autoscalex
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestLineDecimator(unittest.TestCase):
+
+    def test_new_data_while_zoomed_keeps_the_window(self):
+        ax, line = _FakeAxes(), _FakeLine()
+        decimator = LineDecimator(line, ax)
+        x = np.arange(40_000.0)
+        decimator.set_data(x, np.zeros(40_000))
+        self.assertEqual((line.x[0], line.x[-1]), (0.0, 39_999.0))
+
+        ax.xlim, ax.autoscalex = (1_000.0, 1_500.0), False  # What a toolbar zoom leaves behind
+        decimator._on_xlim_changed(ax)
+        decimator.set_data(x, np.ones(40_000))
+        self.assertEqual((line.x[0], line.x[-1]), (999.0, 1_501.0))
+        self.assertEqual(len(line.x), 503)
+        self.assertTrue(np.all(line.y == 1.0))
+
+        ax.autoscalex = True  # Home / autoscale shows the whole series again
+        decimator.set_data(x, np.ones(40_000))
+        self.assertEqual((line.x[0], line.x[-1]), (0.0, 39_999.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
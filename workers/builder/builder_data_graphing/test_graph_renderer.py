@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from workers.builder.builder_data_graphing.graph_renderer import BlitRenderer
+    from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityScope
+
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+
+
+class _FrameClock:
+    """Collects `after` callbacks so the test decides when a frame runs."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, delay_ms, callback):
+        self.pending.append(callback)
+
+    def run_frame(self):
+        pending, self.pending = self.pending, []
+        for callback in pending:
+            callback()
+
+
+@unittest.skipUnless(MATPLOTLIB_AVAILABLE, "Matplotlib is not installed")
+class TestBlitRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.fig = Figure(figsize=(4, 3), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.clock = _FrameClock()
+        self.visibility = VisibilityScope()
+        self.renderer = BlitRenderer(
+            self.clock, self.fig, self.ax, FigureCanvasAgg(self.fig), visibility=self.visibility
+        )
+        (self.line,) = self.ax.plot([0, 1, 2], [0, 1, 0])
+        self.renderer.add_artist(self.line)
+        self.renderer.request_update(autoscale=True)
+        self.clock.run_frame()
+
+    def test_requests_coalesce_into_one_frame(self):
+        for _ in range(10):
+            self.renderer.request_update(autoscale=True)
+        self.assertEqual(len(self.clock.pending), 1)
+
+    def test_data_inside_limits_is_blitted(self):
+        draws = self.renderer.get_stats()["full_draws"]
+        self.line.set_data([0, 1, 2], [1, 0, 0.5])
+        self.renderer.request_update(autoscale=True)
+        self.clock.run_frame()
+        stats = self.renderer.get_stats()
+        self.assertEqual(stats["full_draws"], draws)
+        self.assertEqual(stats["blits"], 1)
+
+    def test_limit_change_forces_full_draw(self):
+        draws = self.renderer.get_stats()["full_draws"]
+        self.line.set_data([0, 1, 2], [0, 50, 0])
+        self.renderer.request_update(autoscale=True)
+        self.clock.run_frame()
+        self.assertEqual(self.renderer.get_stats()["full_draws"], draws + 1)
+
+    def test_hidden_plot_draws_once_when_shown(self):
+        frames = self.renderer.get_stats()["frames"]
+        self.visibility._set_visible(False)
+        for _ in range(5):
+            self.renderer.request_update(autoscale=True)
+        self.assertEqual(self.clock.pending, [])
+        self.visibility._set_visible(True)
+        self.clock.run_frame()
+        self.assertEqual(self.renderer.get_stats()["frames"], frames + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
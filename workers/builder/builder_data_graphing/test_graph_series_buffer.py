@@ -0,0 +1,55 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    import numpy as np
+    from workers.builder.builder_data_graphing.graph_series_buffer import (
+        SeriesRingBuffer,
+        parse_xy_csv,
+    )
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestSeriesRingBuffer(unittest.TestCase):
+
+    def test_append_keeps_newest_samples_in_order(self):
+        series = SeriesRingBuffer(4)
+        for i in range(7):
+            series.append(i, i * 10)
+        x, y = series.view()
+        self.assertEqual(x.tolist(), [3, 4, 5, 6])
+        self.assertEqual(y.tolist(), [30, 40, 50, 60])
+
+    def test_extend_wraps_like_repeated_appends(self):
+        series, expected = SeriesRingBuffer(5), SeriesRingBuffer(5)
+        for block in ([1, 2, 3], [4, 5, 6, 7], [8], [9, 10, 11, 12, 13, 14]):
+            series.extend(block, block)
+            for value in block:
+                expected.append(value, value)
+            self.assertEqual(series.view()[0].tolist(), expected.view()[0].tolist())
+
+    def test_replace_can_grow_for_whole_traces(self):
+        series = SeriesRingBuffer(3)
+        series.replace(range(10), range(10))
+        self.assertEqual(series.view()[0].tolist(), [7, 8, 9])
+        series.replace(range(10), range(10), grow=True)
+        self.assertEqual(len(series), 10)
+
+    def test_parse_xy_csv_fast_and_fallback_paths(self):
+        x, y = parse_xy_csv("x,y\n1,2\n3,4\n")
+        self.assertEqual((x.tolist(), y.tolist()), ([1.0, 3.0], [2.0, 4.0]))
+        x, y = parse_xy_csv("1,2\n\n3,4,5\nbad\n6,7")
+        self.assertEqual((x.tolist(), y.tolist()), ([1.0, 3.0, 6.0], [2.0, 4.0, 7.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
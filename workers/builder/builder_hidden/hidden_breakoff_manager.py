@@ -48,7 +48,7 @@ class HiddenBreakoffManagerMixin:
         )
 
         # Check the state when the widget is mapped
-        self.bind("<Map>", self._check_breakoff_state)
+        self.bind("<Map>", self._check_breakoff_state, add="+")
 
     # Checks and updates the widget's break-off state.
     # This method determines if the widget is currently residing in a separate top-level
@@ -17,6 +17,7 @@ import time
 import orjson
 from workers.mqtt.mqtt_topic_utils import get_topic
 from workers.mqtt.mqtt_publisher_service import is_connected
+from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityRegistry
 
 
 class HiddenVisibilityManagerMixin:
@@ -25,14 +26,21 @@ class HiddenVisibilityManagerMixin:
     """
 
     # Initializes the "Visibility Snitch" functionality.
-    # This method sets up the MQTT topic for publishing visibility updates and binds
-    # to the Tkinter Map, Unmap, and Destroy events to monitor the widget's visibility state.
+    # This method registers the GUI as a visibility scope for render suspension, sets up the MQTT
+    # topic for publishing visibility updates and binds to the Tkinter Map, Unmap, and Destroy
+    # events to monitor the widget's visibility state.
     # Inputs:
     #     None.
     # Outputs:
     #     None.
     def _setup_visibility_snitch(self):
         """Called during __init__ to bind events."""
+        # Render suspension: widgets inside this GUI park their redraws while it is off screen.
+        visibility_registry = VisibilityRegistry.for_widget(self)
+        visibility_registry.register_scope(self)
+        self.bind("<Map>", visibility_registry.schedule_refresh, add="+")
+        self.bind("<Unmap>", visibility_registry.schedule_refresh, add="+")
+
         if not self.state_mirror_engine:
             return
 
@@ -44,9 +52,9 @@ class HiddenVisibilityManagerMixin:
         )
 
         # Bind to Tkinter Map (Show) and Unmap (Hide) events
-        self.bind("<Map>", self._on_gui_visible)
-        self.bind("<Unmap>", self._on_gui_hidden)
-        self.bind("<Destroy>", self._on_gui_destroy)
+        self.bind("<Map>", self._on_gui_visible, add="+")
+        self.bind("<Unmap>", self._on_gui_hidden, add="+")
+        self.bind("<Destroy>", self._on_gui_destroy, add="+")
 
     # Handles the event when the GUI widget becomes visible.
     # This method is triggered when the widget is mapped (becomes visible to the user).
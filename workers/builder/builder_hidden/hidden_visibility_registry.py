@@ -0,0 +1,173 @@
+# builder_hidden/hidden_visibility_registry.py
+#
+# Tracks which GUI containers are actually on screen (selected notebook tab, mapped and
+# not iconified window) so animations, canvas redraws and plot draws inside hidden ones
+# can be parked and replayed, latest value only, when they come back into view.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261017.013000.1
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, List
+
+from workers.logger.logger import debug_logger
+from workers.logger.log_utils import _get_log_args
+
+current_version = "20261017.013000.1"
+current_version_hash = 20261017 * 13000 * 1
+
+
+class VisibilityScope:
+    """
+    One container (a DynamicGuiBuilder) whose descendants render only while it is viewable.
+
+    run(key, func) calls func now when the scope is visible. While it is hidden the call is
+    parked under `key` instead, replacing anything parked under the same key, and every
+    parked call is replayed in one pass when the scope becomes visible again.
+    """
+
+    def __init__(self, widget: Any = None, visible: bool = True):
+        self.widget = widget
+        self.visible = visible
+        self._parked: Dict[Hashable, Callable[[], Any]] = {}
+        self._listeners: List[Callable[[bool], Any]] = []
+
+    # Runs `func` now if visible, else parks it under `key` (latest wins).
+    # Outputs:
+    #     bool: True if func ran now.
+    def run(self, key: Hashable, func: Callable[[], Any]) -> bool:
+        if self.visible:
+            func()
+            return True
+        self._parked[key] = func
+        return False
+
+    # Registers callback(visible) for every visibility change of this scope.
+    def add_listener(self, callback: Callable[[bool], Any]) -> None:
+        self._listeners.append(callback)
+
+    def parked_count(self) -> int:
+        return len(self._parked)
+
+    def _set_visible(self, visible: bool) -> None:
+        if visible == self.visible:
+            return
+        self.visible = visible
+        for callback in list(self._listeners):
+            self._call(callback, visible)
+        if visible:
+            parked, self._parked = self._parked, {}
+            for func in parked.values():
+                self._call(func)
+
+    @staticmethod
+    def _call(func, *args) -> None:
+        try:
+            func(*args)
+        except tk.TclError:
+            pass  # The widget went away while it was hidden.
+        except Exception as e:
+            debug_logger(
+                message=f"❌ Deferred update {func} failed on reveal: {e}",
+                **_get_log_args(),
+            )
+
+
+# Widgets outside any registered container are treated as always on screen.
+ALWAYS_VISIBLE = VisibilityScope()
+
+
+class VisibilityRegistry:
+    """
+    All visibility scopes of one Tk root.
+
+    Scopes are re-evaluated with winfo_viewable(), which is only true when the container and
+    every ancestor up to its window are mapped: an unselected notebook tab or an iconified
+    window counts as hidden. Re-evaluation runs once per idle pass after any notebook tab
+    change or window map/unmap, and when a scope's own container is mapped or unmapped.
+    """
+
+    def __init__(self, root: Any):
+        self.root = root
+        self.scopes: List[VisibilityScope] = []
+        self._refresh_pending = False
+        self.stats = {"refreshes": 0, "reveals": 0, "hides": 0}
+        root.bind_class("TNotebook", "<<NotebookTabChanged>>", self.schedule_refresh, add="+")
+        for window_class in ("Tk", "Toplevel"):
+            root.bind_class(window_class, "<Map>", self.schedule_refresh, add="+")
+            root.bind_class(window_class, "<Unmap>", self.schedule_refresh, add="+")
+
+    # Returns the registry of the Tk root that `widget` belongs to, creating it on first use.
+    @classmethod
+    def for_widget(cls, widget: Any) -> "VisibilityRegistry":
+        root = widget._root()
+        registry = getattr(root, "_visibility_registry", None)
+        if registry is None:
+            registry = cls(root)
+            root._visibility_registry = registry
+        return registry
+
+    # Returns the scope of the nearest registered container above `widget`.
+    # Inputs:
+    #     widget: Any Tk widget.
+    # Outputs:
+    #     VisibilityScope: The container's scope, or ALWAYS_VISIBLE outside any container.
+    @staticmethod
+    def scope_for(widget: Any) -> VisibilityScope:
+        while widget is not None:
+            scope = getattr(widget, "visibility_scope", None)
+            if isinstance(scope, VisibilityScope):
+                return scope
+            widget = getattr(widget, "master", None)
+        return ALWAYS_VISIBLE
+
+    # Makes `widget` a visibility container; its descendants find it with scope_for().
+    def register_scope(self, widget: Any) -> VisibilityScope:
+        scope = VisibilityScope(widget, visible=self._is_viewable(widget))
+        widget.visibility_scope = scope
+        self.scopes.append(scope)
+        widget.bind("<Destroy>", lambda event: self._on_scope_destroyed(event, scope), add="+")
+        self.schedule_refresh()
+        return scope
+
+    def _on_scope_destroyed(self, event, scope) -> None:
+        if event.widget is scope.widget and scope in self.scopes:
+            self.scopes.remove(scope)
+
+    # Re-evaluates every scope on the next idle pass (repeated calls coalesce).
+    def schedule_refresh(self, event=None) -> None:
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self.refresh)
+
+    def refresh(self) -> None:
+        self._refresh_pending = False
+        self.stats["refreshes"] += 1
+        for scope in list(self.scopes):
+            visible = self._is_viewable(scope.widget)
+            if visible != scope.visible:
+                self.stats["reveals" if visible else "hides"] += 1
+                scope._set_visible(visible)
+
+    @staticmethod
+    def _is_viewable(widget) -> bool:
+        try:
+            return bool(widget.winfo_viewable())
+        except tk.TclError:
+            return False
+
+    # Returns scope counts (total, visible), parked updates and refresh/reveal/hide counters.
+    def get_stats(self) -> Dict[str, int]:
+        stats = dict(self.stats)
+        stats["scopes"] = len(self.scopes)
+        stats["visible_scopes"] = sum(1 for scope in self.scopes if scope.visible)
+        stats["parked_updates"] = sum(scope.parked_count() for scope in self.scopes)
+        return stats
@@ -0,0 +1,83 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from workers.builder.builder_hidden.hidden_visibility_registry import (
+        ALWAYS_VISIBLE,
+        VisibilityRegistry,
+    )
+
+    TKINTER_AVAILABLE = True
+except ImportError:
+    TKINTER_AVAILABLE = False
+
+
+class _FakeWidget:
+    """Just enough of a Tk widget: a master chain, viewability and bindings."""
+
+    def __init__(self, master=None):
+        self.master = master
+        self.viewable = True
+        self.idle = []
+
+    def _root(self):
+        return self if self.master is None else self.master._root()
+
+    def winfo_viewable(self):
+        return self.viewable and (self.master is None or self.master.winfo_viewable())
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+    def bind_class(self, class_name, sequence, func, add=None):
+        pass
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def run_idle(self):
+        idle, self.idle = self.idle, []
+        for callback in idle:
+            callback()
+
+
+@unittest.skipUnless(TKINTER_AVAILABLE, "tkinter is not installed")
+class TestVisibilityRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.root = _FakeWidget()
+        self.tab = _FakeWidget(self.root)
+        self.registry = VisibilityRegistry.for_widget(self.tab)
+        self.scope = self.registry.register_scope(self.tab)
+        self.meter = _FakeWidget(_FakeWidget(self.tab))
+
+    def test_widgets_find_their_container_scope(self):
+        self.assertIs(VisibilityRegistry.scope_for(self.meter), self.scope)
+        self.assertIs(VisibilityRegistry.scope_for(_FakeWidget(self.root)), ALWAYS_VISIBLE)
+
+    def test_hidden_updates_are_parked_latest_wins_and_replayed_on_reveal(self):
+        drawn = []
+        self.tab.viewable = False
+        self.registry.schedule_refresh()
+        self.root.run_idle()
+        for value in (1, 2, 3):
+            self.scope.run("meter", lambda value=value: drawn.append(value))
+        self.scope.run("radar", lambda: drawn.append("radar"))
+        self.assertEqual(drawn, [])
+        self.assertEqual(self.registry.get_stats()["parked_updates"], 2)
+
+        self.tab.viewable = True
+        self.registry.schedule_refresh()
+        self.root.run_idle()
+        self.assertEqual(drawn, [3, "radar"])
+        self.scope.run("meter", lambda: drawn.append(4))
+        self.assertEqual(drawn, [3, "radar", 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,11 +6,15 @@ import time
 import json
 import random
 import orjson
+import numpy as np
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
 from workers.mqtt.mqtt_topic_utils import get_topic
 from workers.mqtt import mqtt_publisher_service
 from managers.configini.config_reader import Config
+from workers.builder.builder_core.gui_animation_clock import AnimationClock
+from workers.builder.builder_hidden.hidden_visibility_registry import VisibilityRegistry
+from workers.builder.builder_radar.radar_slice_buffer import RadarSliceBuffer
 
 app_constants = Config.get_instance()
 
@@ -82,12 +86,28 @@ class RadarCreatorMixin:
         canvas.pack(fill=tk.BOTH, expand=True)
 
         # 3. State Variables
+        # Slice values live in a NumPy ring (see RadarSliceBuffer); only changed slices are redrawn.
+        cols = colors.get("colors", {})
+        level_colors = (cols.get("safe", "#00ff00"), cols.get("warning", "#ffff00"), cols.get("critical", "#ff0000"))
+        slices = RadarSliceBuffer(
+            points_count, min_val, max_val, start_angle, clockwise,
+            thresholds=(colors.get("mid_point", 50), colors.get("upper_point", 80)),
+        )
+        slices.set_geometry(cx, cy, radius)
+        # Fraction of its height a slice loses per revolution (0 = no fade).
+        fade_per_revolution = min(max(float(visuals.get("fade_per_revolution", 0.0)), 0.0), 1.0)
+        fade_factor = (1.0 - fade_per_revolution) ** (1.0 / slices.points_count)
+
         radar_state = {
-            "data_buffer": [min_val] * points_count,
             "current_angle_idx": 0,
+            "cursor_idx": None,
             "current_input_value": min_val, # Holds the latest value received
-            "running": True
+            "running": True,
+            "sweep_elapsed_ms": 0.0,
         }
+        plot_items = {"slices": [], "styles": [], "area": None, "cursor": None}
+        animation_clock = AnimationClock.for_widget(canvas)
+        visibility = VisibilityRegistry.scope_for(canvas)
 
         # 4. Helper Functions
         def polar_to_cartesian(angle_deg, r):
@@ -97,14 +117,6 @@ class RadarCreatorMixin:
             y = cy - r * math.sin(theta_rad)
             return x, y
 
-        def get_color(val):
-            mid = colors.get("mid_point", 50)
-            upper = colors.get("upper_point", 80)
-            cols = colors.get("colors", {})
-            if val < mid: return cols.get("safe", "#00ff00")
-            elif val < upper: return cols.get("warning", "#ffff00")
-            else: return cols.get("critical", "#ff0000")
-
         # 5. Drawing Functions
         def draw_static_grid():
             canvas.delete("grid")
@@ -136,93 +148,72 @@ class RadarCreatorMixin:
                             lx, ly = polar_to_cartesian(a, radius + 15)
                             canvas.create_text(lx, ly, text=f"{a}°", fill="#888", font=grid_sys.get("labels", {}).get("font", "Arial 8"), tags="grid")
 
-        def update_plot_slice(idx, val):
-            """Updates just the slice for bar mode."""
-            step = 360.0 / points_count
-            offset = idx * step
-            
-            if clockwise:
-                angle = start_angle - offset
-            else:
-                angle = start_angle + offset
-            
-            tag = f"slice_{idx}"
-            canvas.delete(tag)
-            
-            norm = (val - min_val) / (max_val - min_val)
-            r = norm * radius
-            if r <= 0: return
+            # The retained data items stay on top of a regenerated grid
+            canvas.tag_lower("grid")
 
-            color = get_color(val)
-            px, py = polar_to_cartesian(angle, r)
-            
-            canvas.create_line(cx, cy, px, py, fill=color, width=2, tags=("data", tag))
+        def create_plot_items():
+            """Creates the data items once; updates and resizes only move and recolour them."""
+            if plot_style == "area":
+                fill_col = level_colors[0]
+                plot_items["area"] = canvas.create_polygon(cx, cy, cx, cy, cx, cy, fill=fill_col, outline=fill_col, width=1, tags="data", stipple="gray25")
+            elif plot_style in ["line", "bar"]:
+                # One line per slice: a spoke in bar mode, the segment from the previous slice in line mode
+                plot_items["slices"] = [
+                    canvas.create_line(cx, cy, cx, cy, width=2, state=tk.HIDDEN, tags="data")
+                    for _ in range(slices.points_count)
+                ]
+                plot_items["styles"] = [None] * slices.points_count
+            plot_items["cursor"] = canvas.create_line(cx, cy, cx, cy, fill="#FFFFFF", width=2, state=tk.HIDDEN, tags="scan_line")
+
+        def render_changes():
+            """Pushes the slices whose drawn length or colour changed to their canvas items."""
+            changed = slices.changed_slices()
+            if changed.size == 0:
+                return
 
-        def redraw_full_plot():
-            """Redraws the entire plot based on data buffer."""
-            canvas.delete("data")
-            
             if plot_style == "area":
-                points = [cx, cy] # Start at center
-                step = 360.0 / points_count
-                
-                # Order points based on rotation
-                for i in range(points_count):
-                    val = radar_state["data_buffer"][i]
-                    offset = i * step
-                    if clockwise:
-                        angle = start_angle - offset
-                    else:
-                        angle = start_angle + offset
-                    
-                    norm = (val - min_val) / (max_val - min_val)
-                    r = norm * radius
-                    px, py = polar_to_cartesian(angle, r)
-                    points.extend([px, py])
-                
+                points = [slices.cx, slices.cy] + slices.outline_points()
                 # Close the loop
-                points.extend(points[2:4]) 
-                
-                fill_col = colors.get("colors", {}).get("safe", "#00ff00")
-                canvas.create_polygon(points, fill=fill_col, outline=fill_col, width=1, tags="data", stipple="gray25")
-                
-            elif plot_style == "line":
-                # Connect dots
-                prev_x, prev_y = None, None
-                step = 360.0 / points_count
-                
-                for i in range(points_count + 1): # +1 to close loop
-                    idx = i % points_count
-                    val = radar_state["data_buffer"][idx]
-                    
-                    offset = idx * step
-                    if clockwise:
-                        angle = start_angle - offset
+                points.extend(points[2:4])
+                canvas.coords(plot_items["area"], points)
+                return
+            if plot_style not in ["line", "bar"]:
+                return
+
+            if plot_style == "line":
+                # A moved point bends the segment into it and the segment out of it
+                changed = np.union1d(changed, (changed + 1) % slices.points_count)
+                x0, y0 = slices.endpoints((changed - 1) % slices.points_count)
+                x0, y0 = x0.tolist(), y0.tolist()
+                shown = [True] * changed.size
+            else:
+                x0 = y0 = None
+                shown = (slices.heights[changed] > 0).tolist()
+            x1, y1 = slices.endpoints(changed)
+            x1, y1 = x1.tolist(), y1.tolist()
+            levels = slices.levels(changed).tolist()
+
+            items, styles = plot_items["slices"], plot_items["styles"]
+            for k, idx in enumerate(changed.tolist()):
+                style = level_colors[levels[k]] if shown[k] else None
+                if shown[k]:
+                    if x0 is None:
+                        canvas.coords(items[idx], slices.cx, slices.cy, x1[k], y1[k])
                     else:
-                        angle = start_angle + offset
-                        
-                    norm = (val - min_val) / (max_val - min_val)
-                    r = norm * radius
-                    px, py = polar_to_cartesian(angle, r)
-                    
-                    if prev_x is not None:
-                        color = get_color(val)
-                        canvas.create_line(prev_x, prev_y, px, py, fill=color, width=2, tags="data")
-                    
-                    prev_x, prev_y = px, py
-            
-            elif plot_style == "bar":
-                for i in range(points_count):
-                    val = radar_state["data_buffer"][i]
-                    update_plot_slice(i, val)
+                        canvas.coords(items[idx], x0[k], y0[k], x1[k], y1[k])
+                if style != styles[idx]:
+                    styles[idx] = style
+                    if style is None:
+                        canvas.itemconfigure(items[idx], state=tk.HIDDEN)
+                    else:
+                        canvas.itemconfigure(items[idx], fill=style, state=tk.NORMAL)
 
         def draw_cursor(idx):
-            canvas.delete("scan_line")
-            step = 360.0 / points_count
-            offset = idx * step
-            angle = (start_angle - offset) if clockwise else (start_angle + offset)
-            lx, ly = polar_to_cartesian(angle, radius)
-            canvas.create_line(cx, cy, lx, ly, fill="#FFFFFF", width=2, tags="scan_line")
+            if radar_state["cursor_idx"] is None:
+                canvas.itemconfigure(plot_items["cursor"], state=tk.NORMAL)
+            radar_state["cursor_idx"] = idx
+            lx, ly = slices.rim_point(idx)
+            canvas.coords(plot_items["cursor"], slices.cx, slices.cy, lx, ly)
 
         # 6. Resize Handler
         def on_resize(event):
@@ -237,9 +228,11 @@ class RadarCreatorMixin:
             radius = min(w, h) / 2 - 10
             if radius < 10: radius = 10
             
+            slices.set_geometry(cx, cy, radius)
             draw_static_grid()
-            redraw_full_plot()
-            # Note: cursor will be redrawn on next tick
+            render_changes()
+            if radar_state["cursor_idx"] is not None:
+                draw_cursor(radar_state["cursor_idx"])
 
         canvas.bind("<Configure>", on_resize)
 
@@ -249,28 +242,28 @@ class RadarCreatorMixin:
                 val = radar_state["current_input_value"]
             
             idx = radar_state["current_angle_idx"]
-            radar_state["data_buffer"][idx] = val
-            
-            if plot_style in ["area", "line"]:
-                redraw_full_plot()
-            else:
-                update_plot_slice(idx, val)
-            
+            if fade_factor < 1.0:
+                slices.fade(fade_factor)
+            slices.write(idx, val)
+            render_changes()
             draw_cursor(idx)
             
             # Increment
             radar_state["current_angle_idx"] = (idx + 1) % points_count
 
-        def sweep_loop():
-            if not radar_state["running"]: return
-            if mode == "sweep":
+        def sweep_loop(dt):
+            # Ticked by the shared animation clock; steps the sweep once per refresh_rate.
+            if not radar_state["running"] or mode != "sweep": return False
+            radar_state["sweep_elapsed_ms"] += dt
+            if radar_state["sweep_elapsed_ms"] >= refresh_rate:
+                radar_state["sweep_elapsed_ms"] %= max(refresh_rate, 1)
                 process_update()
-                canvas.after(refresh_rate, sweep_loop)
+            return True
 
         # 8. Interaction
         def clear_plot(event):
-            canvas.delete("data")
-            radar_state["data_buffer"] = [min_val] * points_count
+            slices.clear()
+            render_changes()
             debug_logger(message=f"Radar '{label}' cleared.", **_get_log_args())
 
         def on_mouse_interaction(event):
@@ -329,7 +322,8 @@ class RadarCreatorMixin:
                 radar_state["current_input_value"] = new_val
                 
                 if mode == "data_driven":
-                    process_update(new_val)
+                    # Off screen only the newest sample is kept and plotted when the radar is shown.
+                    visibility.run(process_update, lambda: process_update(new_val))
                     
             except: pass
             
@@ -345,11 +339,13 @@ class RadarCreatorMixin:
         # Initial draw handled by on_resize (which triggers on pack) 
         # But we call draw_static_grid once safely just in case
         draw_static_grid()
+        create_plot_items()
         
         if mode == "sweep":
-            sweep_loop()
+            process_update()
+            animation_clock.wake(sweep_loop, visibility)
         elif mode == "data_driven":
-            redraw_full_plot() if plot_style in ["area", "line"] else None
+            render_changes()
         
         if app_constants.global_settings["debug_enabled"]:
             debug_logger(message=f"📡 Radar Eye '{label}' is ready (Mode: {mode}).", **_get_log_args())
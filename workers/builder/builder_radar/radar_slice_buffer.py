@@ -0,0 +1,142 @@
+# builder_radar/radar_slice_buffer.py
+#
+# The slice values of a Radar Eye in a fixed-size NumPy ring, with the angle-to-canvas lookup
+# table for the current canvas size, a vectorized fade pass, and change tracking so the widget
+# only touches the canvas items of slices whose drawn geometry or colour actually changed.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261017.030000.1
+from typing import List, Tuple
+
+import numpy as np
+
+current_version = "20261017.030000.1"
+current_version_hash = 20261017 * 30000 * 1
+
+MIN_PIXEL_CHANGE = 0.5  # A slice whose drawn length moves less than this is left alone.
+
+
+class RadarSliceBuffer:
+    """
+    One value per slice of the revolution (slice i sits at start_angle -/+ i * 360 / count).
+
+    Values are kept as heights above min_value so a fade toward min_value is a single in-place
+    multiply. set_geometry() turns the per-slice unit vectors into canvas coordinates at full
+    radius once per canvas size; a slice end point is then center + norm * (rim - center).
+
+    changed_slices() compares the pixel length and colour level every slice would be drawn at
+    with what was drawn last, in one vectorized pass, and returns only the differing indices.
+    """
+
+    # Initializes the buffer.
+    # Inputs:
+    #     points_count (int): Slices per revolution.
+    #     min_value, max_value (float): The value range mapped to the radius.
+    #     start_angle (float, optional): Angle of slice 0 in degrees (90 = 12 o'clock).
+    #     clockwise (bool, optional): Direction of increasing slice index.
+    #     thresholds (tuple, optional): (mid_point, upper_point) colour level boundaries.
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        points_count: int,
+        min_value: float,
+        max_value: float,
+        start_angle: float = 90.0,
+        clockwise: bool = True,
+        thresholds: Tuple[float, float] = (50.0, 80.0),
+    ):
+        self.points_count = max(1, int(points_count))
+        self.min_value = float(min_value)
+        self.max_value = float(max_value)
+        span = self.max_value - self.min_value
+        self._value_span = span if span != 0 else 1.0
+        self._thresholds = np.asarray(thresholds, dtype=np.float64) - self.min_value
+
+        offsets = np.arange(self.points_count) * (360.0 / self.points_count)
+        angles = np.radians(start_angle - offsets if clockwise else start_angle + offsets)
+        self._cos = np.cos(angles)
+        self._sin = np.sin(angles)
+
+        self.heights = np.zeros(self.points_count)  # value - min_value
+        self._pixels = np.zeros(self.points_count)  # scratch: length each slice would be drawn at
+        self._drawn_pixels = np.full(self.points_count, np.nan)  # nan = never drawn
+        self._drawn_levels = np.full(self.points_count, -1, dtype=np.intp)
+        self.set_geometry(0.0, 0.0, 1.0)
+
+    # Rebuilds the coordinate lookup table for a new canvas size; every slice is redrawn next.
+    # Inputs:
+    #     cx, cy (float): The canvas centre.
+    #     radius (float): The radius that max_value maps to.
+    # Outputs:
+    #     None.
+    def set_geometry(self, cx: float, cy: float, radius: float) -> None:
+        self.cx, self.cy, self.radius = float(cx), float(cy), float(radius)
+        self.rim_dx = self.radius * self._cos  # rim point minus centre, per slice
+        self.rim_dy = -self.radius * self._sin  # screen y grows down
+        self._scale = self.radius / self._value_span
+        self.invalidate()
+
+    # Forces every slice to be reported by the next changed_slices().
+    def invalidate(self) -> None:
+        self._drawn_pixels.fill(np.nan)
+        self._drawn_levels.fill(-1)
+
+    def write(self, index: int, value: float) -> None:
+        self.heights[index] = value - self.min_value
+
+    def value(self, index: int) -> float:
+        return float(self.heights[index]) + self.min_value
+
+    # Fades every slice toward min_value: height *= factor, in one vectorized step.
+    def fade(self, factor: float) -> None:
+        self.heights *= factor
+
+    def clear(self) -> None:
+        self.heights.fill(0.0)
+
+    # Returns the colour level (0 safe, 1 warning, 2 critical) of the given slices.
+    def levels(self, indices) -> np.ndarray:
+        return np.searchsorted(self._thresholds, self.heights[indices], side="right")
+
+    # Returns the slices whose drawn length or colour level is stale and marks them drawn.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     np.ndarray: The indices to update on the canvas, in ascending order.
+    def changed_slices(self) -> np.ndarray:
+        pixels = np.multiply(self.heights, self._scale, out=self._pixels)
+        stale = np.abs(pixels - self._drawn_pixels) >= MIN_PIXEL_CHANGE
+        stale |= np.isnan(self._drawn_pixels)
+        levels = np.searchsorted(self._thresholds, self.heights, side="right")
+        stale |= levels != self._drawn_levels
+        indices = np.flatnonzero(stale)
+        self._drawn_pixels[indices] = pixels[indices]
+        self._drawn_levels[indices] = levels[indices]
+        return indices
+
+    # Returns the canvas end points of the given slices (arrays of x and y).
+    def endpoints(self, indices) -> Tuple[np.ndarray, np.ndarray]:
+        norm = self.heights[indices] / self._value_span
+        return self.cx + norm * self.rim_dx[indices], self.cy + norm * self.rim_dy[indices]
+
+    # Returns the rim point of one slice, e.g. for the sweep cursor.
+    def rim_point(self, index: int) -> Tuple[float, float]:
+        return self.cx + float(self.rim_dx[index]), self.cy + float(self.rim_dy[index])
+
+    # Returns the end points of every slice as one flat [x0, y0, x1, y1, ...] list.
+    def outline_points(self) -> List[float]:
+        xs, ys = self.endpoints(slice(None))
+        points = np.empty(2 * self.points_count)
+        points[0::2] = xs
+        points[1::2] = ys
+        return points.tolist()
@@ -0,0 +1,53 @@
+import unittest
+import math
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    import numpy as np
+    from workers.builder.builder_radar.radar_slice_buffer import RadarSliceBuffer
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestRadarSliceBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.slices = RadarSliceBuffer(360, 0, 100, start_angle=90, clockwise=True, thresholds=(50, 80))
+        self.slices.set_geometry(300, 300, 200)
+        self.slices.changed_slices()  # everything drawn once
+
+    def test_only_written_slices_are_reported(self):
+        self.slices.write(7, 60.0)
+        self.slices.write(300, 90.0)
+        np.testing.assert_array_equal(self.slices.changed_slices(), [7, 300])
+        self.assertEqual(self.slices.changed_slices().size, 0)
+        np.testing.assert_array_equal(self.slices.levels([7, 300, 8]), [1, 2, 0])
+
+    def test_end_points_follow_the_sweep_direction(self):
+        self.slices.write(90, 50.0)  # a quarter turn clockwise from 12 o'clock is 3 o'clock
+        xs, ys = self.slices.endpoints([90])
+        self.assertAlmostEqual(float(xs[0]), 400.0)
+        self.assertAlmostEqual(float(ys[0]), 300.0)
+        x, y = self.slices.rim_point(45)
+        self.assertAlmostEqual(x, 300 + 200 * math.cos(math.radians(45)))
+        self.assertAlmostEqual(y, 300 - 200 * math.sin(math.radians(45)))
+
+    def test_fade_reports_slices_whose_length_visibly_changed(self):
+        self.slices.write(1, 100.0)  # 200 px long
+        self.slices.write(2, 0.1)  # 0.2 px long
+        self.slices.changed_slices()
+        self.slices.fade(0.5)
+        np.testing.assert_array_equal(self.slices.changed_slices(), [1])
+        self.assertAlmostEqual(self.slices.value(1), 50.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,6 +32,7 @@ from .builder_core.gui_mqtt_manager import GuiMqttManagerMixin
 from .builder_core.gui_file_loader import GuiFileLoaderMixin
 from .builder_core.gui_rebuilder import GuiRebuilderMixin
 from .builder_core.gui_batch_builder import GuiBatchBuilderMixin
+from .builder_core.gui_lazy_builder import GuiLazyBuilderMixin
 
 # --- 2. ADAPTERS (ISOLATED WIDGETS) ---
 from .builder_data_graphing.plot_widget_adapter import PlotWidgetAdapterMixin
@@ -116,6 +117,7 @@ class DynamicGuiBuilder(
     GuiFileLoaderMixin,
     GuiRebuilderMixin,
     GuiBatchBuilderMixin,
+    GuiLazyBuilderMixin,
     # Adapters
     PlotWidgetAdapterMixin,
     MeterWidgetAdapterMixin,
@@ -245,7 +247,7 @@ class DynamicGuiBuilder(
 
         # Store the ID of the canvas window item for later use
         self.canvas_window_id = self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self._setup_lazy_build()  # yscrollcommand feeds the scrollbar and the lazy builder
 
         self.scroll_frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
@@ -314,4 +316,7 @@ class DynamicGuiBuilder(
 
         # The scrollregion update is handled by _on_frame_configure, which is bound to the
         # scroll_frame's <Configure> event. Forcing the canvas window's height to match the
-        # canvas height can interfere with vertical scrolling and is generally not needed here.
\ No newline at end of file
+        # canvas height can interfere with vertical scrolling and is generally not needed here.
+
+        # A taller viewport may uncover placeholders that still need building.
+        self._schedule_lazy_check()
@@ -16,13 +16,137 @@
 
 import inspect
 import os
+import sys
 
 # Removed: from managers.configini.config_reader import Config (This import caused the circular dependency)
 
+current_version = "20261016.140000.1"
+current_version_hash = 20261016 * 140000 * 1
+
+# --- Log levels ---
+LOG_LEVEL_DEBUG = 10
+LOG_LEVEL_INFO = 20
+LOG_LEVEL_WARNING = 30
+LOG_LEVEL_ERROR = 40
+LOG_LEVEL_OFF = 100
+LOG_LEVELS = {
+    "DEBUG": LOG_LEVEL_DEBUG,
+    "INFO": LOG_LEVEL_INFO,
+    "WARNING": LOG_LEVEL_WARNING,
+    "ERROR": LOG_LEVEL_ERROR,
+    "OFF": LOG_LEVEL_OFF,
+}
+# Levels a message can be logged at (the `level=` argument of debug_logger).
+MESSAGE_LEVELS = {
+    "DEBUG": LOG_LEVEL_DEBUG,
+    "INFO": LOG_LEVEL_INFO,
+    "WARNING": LOG_LEVEL_WARNING,
+    "ERROR": LOG_LEVEL_ERROR,
+    "CRITICAL": LOG_LEVEL_ERROR,
+}
+
+# Returned when logging is disabled; callers only ever unpack it with **.
+_NO_CONTEXT = {}
+
+# Caller context (file, function, version) keyed by code object. A function's file,
+# name and module version never change, so each is resolved once per process.
+_context_cache = {}
+
+# The Config class, imported lazily on first use to avoid the circular import.
+_config_class = None
+
+
+# Returns the Config class without importing it at module load time.
+# Inputs:
+#     None.
+# Outputs:
+#     type: The Config class, or None if it cannot be imported.
+def _get_config_class():
+    global _config_class
+    if _config_class is None:
+        try:
+            from managers.configini.config_reader import Config
+
+            _config_class = Config
+        except ImportError:
+            return None
+    return _config_class
+
+
+# Decides whether a message at the given level would be logged anywhere.
+# This is the fast path every log call checks first: it only reads a few attributes of
+# the Config singleton, so disabled logging costs no frame inspection and no formatting.
+# Until the Config singleton exists everything is enabled, because early messages are
+# buffered and filtered when the log directory is set.
+# Inputs:
+#     level (int, optional): The level of the message about to be logged.
+# Outputs:
+#     bool: True if the message should be produced.
+def is_log_enabled(level: int = LOG_LEVEL_DEBUG) -> bool:
+    """
+    Returns True if a message at `level` would reach the terminal or a log file.
+    Guard expensive log messages with it, or pass a callable message to debug_logger.
+    """
+    config_class = _get_config_class()
+    config = config_class._instance if config_class is not None else None
+    if config is None:
+        return True
+    if not config.ENABLE_DEBUG_MODE:
+        return False
+    threshold = LOG_LEVELS.get(str(getattr(config, "LOG_LEVEL", "DEBUG")).upper(), LOG_LEVEL_DEBUG)
+    return level >= threshold
+
+
+# Resolves the level of a single log message.
+# An explicit level name (the `level=` argument of debug_logger) wins; without one a message
+# containing "ERROR" or "❌" is an error and anything else is debug output.
+# Inputs:
+#     message (str): The log message.
+#     level_name (str, optional): The level the caller asked for.
+# Outputs:
+#     int: One of the LOG_LEVEL_* values.
+def message_level(message: str, level_name=None) -> int:
+    """
+    Returns the LOG_LEVEL_* value a message is logged at.
+    """
+    if level_name is not None:
+        level = MESSAGE_LEVELS.get(str(level_name).upper())
+        if level is not None:
+            return level
+    if "ERROR" in message or "❌" in message:
+        return LOG_LEVEL_ERROR
+    return LOG_LEVEL_DEBUG
+
+
+# Returns the cached logging context for a stack frame.
+# Inputs:
+#     frame (frame): The caller's frame.
+# Outputs:
+#     dict: A dictionary containing 'file', 'version' and 'function'. Shared; do not mutate.
+def get_frame_context(frame) -> dict:
+    """
+    Resolves file/function/version for `frame`, caching the result per code object.
+    """
+    code = frame.f_code
+    context = _context_cache.get(code)
+    if context is None:
+        context = {
+            "file": os.path.basename(code.co_filename) if code.co_filename else "?",
+            "version": (
+                frame.f_globals.get("current_version", "Unknown_Ver")
+                if frame.f_globals
+                else "Unknown_Ver"
+            ),
+            "function": code.co_name if code.co_name else "?",
+        }
+        _context_cache[code] = context
+    return context
+
 
 # Inspects the call stack to retrieve contextual information for logging.
-# This function dynamically captures the filename, function name, and
-# 'current_version' from the caller's frame, providing valuable metadata for log entries.
+# This function captures the filename, function name, and 'current_version' from the
+# caller's frame, providing valuable metadata for log entries. The result is cached per
+# code object, and when logging is disabled it returns immediately without touching the stack.
 # Inputs:
 #     None.
 # Outputs:
@@ -36,27 +160,11 @@ def _get_log_args():
     Configuration details that might be needed should be passed as arguments
     if absolutely necessary, or handled by the calling context.
     """
-    # Removed: app_constants = Config.get_instance() (This call caused the infinite loop)
+    if not is_log_enabled():
+        return _NO_CONTEXT
 
     try:
-        frame = inspect.currentframe().f_back
-        if frame:
-            # Safely get filename, defaulting to '?' if not available
-            filename = (
-                os.path.basename(frame.f_code.co_filename)
-                if frame.f_code.co_filename
-                else "?"
-            )
-            # Safely get function name, defaulting to '?' if not available
-            function_name = frame.f_code.co_name if frame.f_code.co_name else "?"
-            # Safely get version from globals, defaulting if not available
-            version = (
-                frame.f_globals.get("current_version", "Unknown_Ver")
-                if frame.f_globals
-                else "Unknown_Ver"
-            )
-
-            return {"file": filename, "version": version, "function": function_name}
+        return get_frame_context(sys._getframe(1))
     except Exception as e:
         # In case of any error during frame inspection, return a safe error context.
         # Ideally, errors during logging setup should be handled robustly,
@@ -67,8 +175,6 @@ def _get_log_args():
             "function": "unknown_func",
             "error": str(e),
         }
-    # Fallback return if no frame is found or other unexpected issue occurs
-    return {"file": "unknown", "version": "unknown", "function": "unknown"}
 
 
 # The 'debug_log' function present in the original log_utils.py also imported
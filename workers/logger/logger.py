@@ -15,6 +15,7 @@
 # Version 20250821.200641.1
 
 import os
+import sys
 import time
 import inspect
 from datetime import datetime
@@ -34,12 +35,35 @@ from workers.logger.logger_display import (
     display_debug_message_on_terminal,
     display_console_message_on_terminal,
 )
+from workers.logger.log_utils import (
+    is_log_enabled,
+    get_frame_context,
+    message_level,
+    _get_config_class,
+    MESSAGE_LEVELS,
+    LOG_LEVEL_DEBUG,
+    LOG_LEVEL_INFO,
+    LOG_LEVEL_WARNING,
+    LOG_LEVEL_ERROR,
+)
+
+current_version = "20261016.140000.1"
+current_version_hash = 20261016 * 140000 * 1
 
 # --- GLOBALS (Managed by this main logger module) ---
 _log_directory = None
 _config_instance_cache = None
 _log_file_timestamp = None
 
+# The marker printed after each message, by level.
+_LEVEL_MARKERS = {
+    LOG_LEVEL_DEBUG: "🦆",
+    LOG_LEVEL_INFO: "ℹ️",
+    LOG_LEVEL_WARNING: "⚠️",
+    LOG_LEVEL_ERROR: "❌",
+}
+_ERROR_MARKER = _LEVEL_MARKERS[LOG_LEVEL_ERROR]
+
 
 # Retrieves the application's global configuration instance.
 # This function uses a cached instance to avoid repeated lookups. If the configuration
@@ -60,6 +84,10 @@ def _get_config_instance():
         Config: The configuration instance.
     """
     global _config_instance_cache
+    config_class = _get_config_class()
+    if config_class is not None and config_class._instance is not None:
+        return config_class._instance  # Fast path once the real config exists.
+
     if _config_instance_cache is None:
         try:
             from managers.configini.config_reader import Config
@@ -98,13 +126,9 @@ def _get_config_instance():
             _config_instance_cache = DummyConfig()
 
     # Ensure that if the real config has been initialized later, we return that.
-    try:
-        from managers.configini.config_reader import Config
-
-        if Config._instance is not None:
-            return Config._instance
-    except ImportError:
-        pass  # Config not available, return cached dummy if any.
+    config_class = _get_config_class()
+    if config_class is not None and config_class._instance is not None:
+        return config_class._instance
 
     return _config_instance_cache
 
@@ -179,7 +203,7 @@ def set_log_directory(directory: str):
         config_instance = _get_config_instance()
 
         for timestamp, level, message, context_data in buffered_messages:
-            is_error = "ERROR" in message or "❌" in message
+            is_error = level == _ERROR_MARKER
 
             # 1. Display on terminal
             if config_instance.global_settings.get("debug_to_terminal", False):
@@ -202,59 +226,67 @@ def set_log_directory(directory: str):
 # This is the main logging function. It routes messages to the terminal and/or log files
 # based on the application's configuration. If called before the log directory is set,
 # it buffers messages for later processing.
+# The level gate is checked before anything else, so a disabled call does no formatting
+# and no frame inspection. `message` may be a zero-argument callable that builds the
+# string; it is only called once the message is known to be wanted. Caller context is
+# resolved from a per-code-object cache when it is not passed in.
 # Inputs:
-#     message (str): The log message to be written.
+#     message (str | Callable[[], str]): The log message, or a callable returning it.
+#     level (str, optional): "DEBUG", "INFO", "WARNING", "ERROR" or "CRITICAL". Without it
+#         a message containing "ERROR" or "❌" is an error and anything else is debug output.
 #     **kwargs: Additional context for the log message, such as file, function, and version.
 # Outputs:
 #     None.
-def debug_logger(message: str, **kwargs):
+def debug_logger(message, **kwargs):
     """
     Logs a debug message, buffering it if the log directory is not yet set.
 
     Args:
-        message (str): The log message.
+        message (str | Callable[[], str]): The log message, or a callable that returns it.
         **kwargs: Additional context for the log message.
         
     Returns:
         None
     """
-    config_instance = _get_config_instance()
+    # Fast path: nothing is logged below ERROR, so if even errors are disabled we are done.
+    if not is_log_enabled(LOG_LEVEL_ERROR):
+        return
 
-    # SILENCE: If PERFORMANCE_MODE is enabled, completely stop debug logging.
-    # if config_instance.PERFORMANCE_MODE:
-    #    return
+    # An explicit level is checked before a lazy message is built.
+    level_name = kwargs.pop("level", None)
+    explicit_level = MESSAGE_LEVELS.get(str(level_name).upper())
+    if explicit_level is not None and not is_log_enabled(explicit_level):
+        return
+
+    if callable(message):
+        try:
+            message = message()
+        except Exception as e:
+            message = f"❌ ERROR building lazy log message: {e}"
+    message = str(message)
+
+    # Determine log level: the `level=` argument, else the "ERROR"/"❌" heuristic.
+    log_level = message_level(message, level_name)
+    if not is_log_enabled(log_level):
+        return
+    is_error = log_level >= LOG_LEVEL_ERROR
+    level = _LEVEL_MARKERS[log_level]
+
+    config_instance = _get_config_instance()
 
     # Generate timestamp immediately for consistency across handlers.
     current_ts = f"{time.time():.6f}"
 
-    # Determine log level.
-    is_error = "ERROR" in message or "❌" in message
-    level = "❌" if is_error else "🦆"
-
-    # Gather caller context (file, function, version) for detailed logging.
-    # We inspect the frame *before* this function call.
-    frame = inspect.currentframe().f_back
-    caller_file = os.path.basename(frame.f_code.co_filename) if frame else "?"
-    caller_func = frame.f_code.co_name if frame else "?"
-    # Assuming 'current_version' might be a global in the main script context.
-    caller_version = (
-        frame.f_globals.get("current_version", "Unknown_Ver")
-        if frame
-        else "Unknown_Ver"
-    )
-
-    # Prepare context data, prioritizing explicit kwargs over derived caller info.
-    context_data_for_log = {
-        "file": kwargs.get("file", caller_file),
-        "function": kwargs.get("function", caller_func),
-        "version": kwargs.get("version", caller_version),
-    }
-    # Explicitly remove 'file', 'function', 'version' from kwargs before updating
-    # to prevent potential multiple value errors if they were passed via **_get_log_args().
-    filtered_kwargs = {
-        k: v for k, v in kwargs.items() if k not in ["file", "function", "version"]
-    }
-    context_data_for_log.update(filtered_kwargs)
+    # Prepare context data, prioritizing explicit kwargs over the cached caller context.
+    if "file" in kwargs and "function" in kwargs and "version" in kwargs:
+        context_data_for_log = dict(kwargs)
+    else:
+        try:
+            caller_context = get_frame_context(sys._getframe(1))
+        except Exception:
+            caller_context = {"file": "?", "function": "?", "version": "Unknown_Ver"}
+        context_data_for_log = dict(caller_context)
+        context_data_for_log.update(kwargs)
 
     # --- Routing Logic ---
     if _log_directory is None:
@@ -262,21 +294,22 @@ def debug_logger(message: str, **kwargs):
         add_to_buffer(current_ts, level, message, context_data_for_log)
     else:
         # PHASE 2: Immediate Processing. Log directory is set. Process logs now.
+        settings = config_instance.global_settings
 
         # 1. Display on terminal if enabled.
-        if config_instance.global_settings.get("debug_to_terminal", False):
+        if settings.get("debug_to_terminal", False):
             display_debug_message_on_terminal(
                 current_ts, level, message, context_data_for_log
             )
 
         # 2. Write to regular log file if enabled.
-        if config_instance.global_settings.get("debug_to_file", False):
+        if settings.get("debug_to_file", False):
             write_log_to_file(
                 current_ts, level, message, context_data_for_log, _log_file_timestamp
             )
 
         # 3. Write to error log file if it's an error and file logging is enabled.
-        if is_error and config_instance.global_settings.get("debug_to_file", False):
+        if is_error and settings.get("debug_to_file", False):
             write_log_to_error_file(current_ts, level, message, context_data_for_log)
 
 
@@ -0,0 +1,315 @@
+# logger/logger_async_writer.py
+#
+# A dedicated writer thread that batches formatted log lines to disk, with size/time-based rotation and a drop counter.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.150000.1
+
+import os
+import queue
+import threading
+import time
+
+current_version = "20261016.150000.1"
+current_version_hash = 20261016 * 150000 * 1
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_FLUSH_INTERVAL_S = 0.5
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_ROTATE_INTERVAL_S = 0  # 0 disables time-based rotation
+
+_STOP = object()
+
+
+class _OpenLog:
+    """
+    An open log file plus the bookkeeping rotation needs.
+    """
+
+    __slots__ = ("handle", "size", "opened_at")
+
+    def __init__(self, handle, size, opened_at):
+        self.handle = handle
+        self.size = size
+        self.opened_at = opened_at
+
+
+class AsyncLogWriter:
+    """
+    Moves log file I/O off the calling thread.
+
+    Callers hand over finished lines with `submit()`, which never blocks: if the bounded
+    queue is full the line is counted as dropped and a notice is written once the writer
+    catches up. The writer thread keeps files open, writes whole batches with
+    `writelines`, flushes at most every `flush_interval_s`, and rotates a file to
+    `<name>.1`, `<name>.2`, ... when it grows past `max_bytes` or is older than
+    `rotate_interval_s`.
+    """
+
+    # Initializes the writer. The thread is started lazily by the first submit().
+    # Inputs:
+    #     queue_size (int, optional): Maximum number of lines waiting to be written.
+    #     batch_size (int, optional): Maximum number of lines written per batch.
+    #     flush_interval_s (float, optional): Maximum time a written line may sit in the file buffer.
+    #     max_bytes (int, optional): Size at which a log file is rotated (0 disables).
+    #     backup_count (int, optional): Number of rotated files to keep per log.
+    #     rotate_interval_s (float, optional): Age at which a log file is rotated (0 disables).
+    # Outputs:
+    #     None.
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        rotate_interval_s: float = DEFAULT_ROTATE_INTERVAL_S,
+    ):
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.max_bytes = max(0, int(max_bytes))
+        self.backup_count = max(0, int(backup_count))
+        self.rotate_interval_s = max(0.0, float(rotate_interval_s))
+
+        self._queue = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self._files = {}  # path -> _OpenLog, only touched by the writer thread
+        self._last_flush = time.monotonic()
+        self._unflushed = False
+        self._dropped_unreported = 0
+
+        self.lines_written = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self.rotations = 0
+        self.write_errors = 0
+
+    # Queues one formatted line for a file. Never blocks the caller.
+    # Inputs:
+    #     file_path (str): The log file to append to.
+    #     line (str): The complete log line, without the trailing newline.
+    # Outputs:
+    #     bool: True if the line was queued, False if it was dropped because the queue is full.
+    def submit(self, file_path: str, line: str) -> bool:
+        """
+        Hands a line to the writer thread, or counts it as dropped if the queue is full.
+        After shutdown() the line is appended synchronously instead.
+        """
+        if self._closed:
+            return self._write_direct(file_path, line)
+        if self._thread is None:
+            self._ensure_started()
+        try:
+            self._queue.put_nowait((file_path, line))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            self._dropped_unreported += 1
+            return False
+
+    # Blocks until every line queued so far has been written and flushed.
+    # Inputs:
+    #     timeout (float, optional): Maximum seconds to wait.
+    # Outputs:
+    #     bool: True if the queue drained in time.
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Waits for the queue to drain and the files to be flushed.
+        """
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put((None, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    # Stops the writer thread after writing everything already queued, and closes the files.
+    # Inputs:
+    #     timeout (float, optional): Maximum seconds to wait for the thread.
+    # Outputs:
+    #     None.
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Drains the queue, closes all log files and stops the thread.
+        """
+        with self._start_lock:
+            self._closed = True
+            thread = self._thread
+            if thread is None:
+                return
+            try:
+                self._queue.put((_STOP, None), timeout=timeout)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+            self._thread = None
+
+    # Returns the writer counters.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     dict: Lines/bytes written, dropped lines, rotations, errors and current queue depth.
+    def get_stats(self) -> dict:
+        """
+        Returns a snapshot of the writer statistics.
+        """
+        return {
+            "lines_written": self.lines_written,
+            "bytes_written": self.bytes_written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def _ensure_started(self) -> None:
+        with self._start_lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="AsyncLogWriter", daemon=True
+                )
+                self._thread.start()
+
+    # The writer loop: block for one item, then drain up to a batch without blocking.
+    def _run(self) -> None:
+        running = True
+        while running:
+            timeout = self.flush_interval_s if self._unflushed else None
+            try:
+                first = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush_files()
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_file = {}
+            waiters = []
+            for file_path, line in batch:
+                if file_path is _STOP:
+                    running = False
+                elif file_path is None:
+                    waiters.append(line)
+                else:
+                    by_file.setdefault(file_path, []).append(line + "\n")
+
+            if self._dropped_unreported and by_file:
+                dropped, self._dropped_unreported = self._dropped_unreported, 0
+                notice = f"{time.time():.6f} ⚠️ Log queue overflow: {dropped} message(s) dropped. 🦆\n"
+                for lines in by_file.values():
+                    lines.insert(0, notice)
+
+            for file_path, lines in by_file.items():
+                self._write_lines(file_path, lines)
+
+            if waiters or not running or (
+                time.monotonic() - self._last_flush >= self.flush_interval_s
+            ):
+                self._flush_files()
+            for done in waiters:
+                done.set()
+
+        self._close_files()
+
+    def _write_lines(self, file_path: str, lines: list) -> None:
+        try:
+            log = self._open(file_path)
+            if self._needs_rotation(log):
+                self._rotate(file_path)
+                log = self._open(file_path)
+            log.handle.writelines(lines)
+            written = sum(len(line.encode("utf-8")) for line in lines)
+            log.size += written
+            self._unflushed = True
+            self.lines_written += len(lines)
+            self.bytes_written += written
+        except Exception as e:
+            self.write_errors += 1
+            print(f"❌ Critical Failure writing to log file {file_path}: {e}")
+
+    # Fallback used once the writer has been shut down (e.g. late messages during exit).
+    def _write_direct(self, file_path: str, line: str) -> bool:
+        try:
+            with open(file_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            return True
+        except Exception as e:
+            self.write_errors += 1
+            print(f"❌ Critical Failure writing to log file {file_path}: {e}")
+            return False
+
+    def _open(self, file_path: str) -> _OpenLog:
+        log = self._files.get(file_path)
+        if log is None:
+            handle = open(file_path, "a", encoding="utf-8")
+            size = handle.tell()
+            try:
+                opened_at = os.path.getmtime(file_path) if size else time.time()
+            except OSError:
+                opened_at = time.time()
+            log = _OpenLog(handle, size, opened_at)
+            self._files[file_path] = log
+        return log
+
+    def _needs_rotation(self, log: _OpenLog) -> bool:
+        if self.max_bytes and log.size >= self.max_bytes:
+            return True
+        if self.rotate_interval_s and log.size and (
+            time.time() - log.opened_at >= self.rotate_interval_s
+        ):
+            return True
+        return False
+
+    # Renames <name> -> <name>.1 -> <name>.2 ..., discarding the oldest beyond backup_count.
+    def _rotate(self, file_path: str) -> None:
+        log = self._files.pop(file_path)
+        log.handle.close()
+        if self.backup_count == 0:
+            os.remove(file_path)
+        else:
+            oldest = f"{file_path}.{self.backup_count}"
+            if os.path.exists(oldest):
+                os.remove(oldest)
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{file_path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{file_path}.{index + 1}")
+            os.replace(file_path, f"{file_path}.1")
+        self.rotations += 1
+
+    def _flush_files(self) -> None:
+        for file_path, log in list(self._files.items()):
+            try:
+                log.handle.flush()
+            except Exception:
+                self.write_errors += 1
+        self._last_flush = time.monotonic()
+        self._unflushed = False
+
+    def _close_files(self) -> None:
+        for log in self._files.values():
+            try:
+                log.handle.close()
+            except Exception:
+                pass
+        self._files.clear()
@@ -1,6 +1,8 @@
 # logger/logger_writer.py
 #
 # This module handles writing formatted log messages to files on disk, including a general log and a dedicated error log.
+# The actual file I/O happens on a dedicated writer thread (see logger_async_writer.py), so logging never blocks
+# the Tk main thread or the MQTT network thread.
 #
 # Author: Anthony Peter Kuzub
 # Blog: www.Like.audio (Contributor to this project)
@@ -15,12 +17,27 @@
 # Version 20250821.200641.1
 
 import os
+import atexit
+import threading
 from datetime import datetime
 import inspect  # Needed for context
 
+from workers.logger.logger_async_writer import (
+    AsyncLogWriter,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_BACKUP_COUNT,
+    DEFAULT_ROTATE_INTERVAL_S,
+)
+
+current_version = "20261016.150000.1"
+current_version_hash = 20261016 * 150000 * 1
+
 # Assume these helpers and state are accessible or will be passed.
 # For now, defining placeholders that will be imported/managed by logger.py
 _log_directory = None
+_async_writer = None
+_async_writer_lock = threading.Lock()
 
 
 # Placeholder function to retrieve the global configuration instance.
@@ -96,9 +113,53 @@ def set_log_directory_for_writer(directory: str):
             print(f"❌ Error creating log directory for writer: {e}")
 
 
+# Returns the shared asynchronous log writer, creating it on first use.
+# Queue size and rotation limits come from the [Debug] section of config.ini when the
+# configuration is available, otherwise the writer's defaults are used.
+# Inputs:
+#     None.
+# Outputs:
+#     AsyncLogWriter: The process-wide log writer.
+def get_async_log_writer() -> AsyncLogWriter:
+    """
+    Returns the process-wide AsyncLogWriter, creating it on first use.
+    """
+    global _async_writer
+    if _async_writer is None:
+        with _async_writer_lock:
+            if _async_writer is None:
+                config_instance = _get_config_instance()
+                _async_writer = AsyncLogWriter(
+                    queue_size=getattr(config_instance, "LOG_QUEUE_SIZE", DEFAULT_QUEUE_SIZE),
+                    max_bytes=getattr(config_instance, "LOG_MAX_BYTES", DEFAULT_MAX_BYTES),
+                    backup_count=getattr(config_instance, "LOG_BACKUP_COUNT", DEFAULT_BACKUP_COUNT),
+                    rotate_interval_s=getattr(
+                        config_instance, "LOG_ROTATE_INTERVAL_S", DEFAULT_ROTATE_INTERVAL_S
+                    ),
+                )
+    return _async_writer
+
+
+# Writes everything queued so far, closes the log files and stops the writer thread.
+# Registered with atexit so buffered lines are not lost when the application exits.
+# Inputs:
+#     None.
+# Outputs:
+#     None.
+def shutdown_log_writer():
+    """
+    Drains and stops the asynchronous log writer.
+    """
+    if _async_writer is not None:
+        _async_writer.shutdown()
+
+
+atexit.register(shutdown_log_writer)
+
+
 # Writes a general log message to a timestamped log file.
 # This function formats a log entry, including timestamp, level, message, and context data,
-# and appends it to a general log file. It filters out specific message types
+# and queues it for the writer thread to append to a general log file. It filters out specific message types
 # (e.g., Watchdog/Heartbeat messages) to keep the general log cleaner.
 # Inputs:
 #     timestamp (str): The timestamp of the log entry.
@@ -151,8 +212,7 @@ def write_log_to_file(
         if extras:
             log_entry += f" 🧩 {extras}"
 
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(log_entry + "\n")
+        get_async_log_writer().submit(file_path, log_entry)
 
     except Exception as e:
         # Fallback to console printing if file writing fails critically
@@ -161,7 +221,7 @@ def write_log_to_file(
 
 # Writes an error log message to a dedicated 'ERRORS.log' file.
 # This function formats an error log entry, including timestamp, level, message,
-# and context data, and appends it to a specific error log file,
+# and context data, and queues it for the writer thread to append to a specific error log file,
 # provided that file logging is enabled.
 # Inputs:
 #     timestamp (str): The timestamp of the log entry.
@@ -202,8 +262,7 @@ def write_log_to_error_file(
         if extras:
             log_entry += f" 🧩 {extras}"
 
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(log_entry + "\n")
+        get_async_log_writer().submit(file_path, log_entry)
 
     except Exception as e:
         # Fallback to console printing if error log writing fails critically
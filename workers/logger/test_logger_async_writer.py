@@ -0,0 +1,100 @@
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from workers.logger.logger_async_writer import AsyncLogWriter
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+class TestAsyncLogWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "debug.log")
+        self.writers = []
+
+    def tearDown(self):
+        for writer in self.writers:
+            writer.shutdown()
+        self.tmp.cleanup()
+
+    def _writer(self, **kwargs):
+        writer = AsyncLogWriter(**kwargs)
+        self.writers.append(writer)
+        return writer
+
+    def test_batched_lines_reach_the_file_after_flush_and_stop(self):
+        writer = self._writer(batch_size=16, flush_interval_s=60.0)
+        for i in range(100):
+            self.assertTrue(writer.submit(self.path, f"line {i}"))
+        self.assertTrue(writer.flush())
+        self.assertEqual(_read(self.path), [f"line {i}" for i in range(100)])
+
+        writer.submit(self.path, "last")
+        writer.shutdown()
+        self.assertEqual(_read(self.path)[-1], "last")
+        self.assertEqual(writer.get_stats()["lines_written"], 101)
+        writer.submit(self.path, "after stop")  # Written synchronously once the thread is gone
+        self.assertEqual(_read(self.path)[-1], "after stop")
+
+    def test_size_rotation(self):
+        writer = self._writer(max_bytes=10, backup_count=2)
+        for i in range(4):
+            writer.submit(self.path, f"entry {i} ........")  # Every line fills a file on its own
+            writer.flush()
+        self.assertEqual(writer.rotations, 3)
+        self.assertEqual(_read(self.path), ["entry 3 ........"])
+        self.assertEqual(_read(self.path + ".1"), ["entry 2 ........"])
+        self.assertEqual(_read(self.path + ".2"), ["entry 1 ........"])
+        self.assertFalse(os.path.exists(self.path + ".3"))
+
+    def test_time_rotation(self):
+        writer = self._writer(rotate_interval_s=0.05)
+        writer.submit(self.path, "old")
+        writer.flush()
+        time.sleep(0.1)
+        writer.submit(self.path, "new")
+        writer.flush()
+        self.assertEqual(writer.rotations, 1)
+        self.assertEqual(_read(self.path + ".1"), ["old"])
+        self.assertEqual(_read(self.path), ["new"])
+
+    def test_full_queue_counts_drops_and_reports_them(self):
+        writer = self._writer(queue_size=1)
+        entered, release = threading.Event(), threading.Event()
+        write_lines = writer._write_lines
+
+        def stalled_write(file_path, lines):
+            entered.set()
+            release.wait(5)
+            write_lines(file_path, lines)
+
+        writer._write_lines = stalled_write
+        writer.submit(self.path, "first")
+        self.assertTrue(entered.wait(5))  # The writer holds "first"; the queue is empty again
+        self.assertTrue(writer.submit(self.path, "second"))
+        self.assertFalse(writer.submit(self.path, "third"))
+        self.assertFalse(writer.submit(self.path, "fourth"))
+        self.assertEqual(writer.get_stats()["dropped"], 2)
+
+        release.set()
+        writer.flush()
+        lines = _read(self.path)
+        self.assertEqual(lines[0], "first")
+        self.assertIn("2 message(s) dropped", lines[1])
+        self.assertEqual(lines[2:], ["second"])
+
+
+if __name__ == '__main__':
+    unittest.main()
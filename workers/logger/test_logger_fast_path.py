@@ -0,0 +1,68 @@
+
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from managers.configini.config_reader import Config
+from workers.logger import log_utils
+from workers.logger.logger import debug_logger
+
+
+class TestLoggerFastPath(unittest.TestCase):
+
+    def setUp(self):
+        self.config = Config.get_instance()
+        self._saved = (self.config.ENABLE_DEBUG_MODE, self.config.LOG_LEVEL)
+
+    def tearDown(self):
+        self.config.ENABLE_DEBUG_MODE, self.config.LOG_LEVEL = self._saved
+
+    def test_disabled_logging_skips_context_and_lazy_messages(self):
+        self.config.ENABLE_DEBUG_MODE = False
+        calls = []
+        self.assertEqual(log_utils._get_log_args(), {})
+        debug_logger(message=lambda: calls.append("built") or "never")
+        self.assertEqual(calls, [])
+
+    def test_level_gate(self):
+        self.config.ENABLE_DEBUG_MODE = True
+        self.config.LOG_LEVEL = "ERROR"
+        self.assertFalse(log_utils.is_log_enabled(log_utils.LOG_LEVEL_DEBUG))
+        self.assertTrue(log_utils.is_log_enabled(log_utils.LOG_LEVEL_ERROR))
+        self.config.LOG_LEVEL = "OFF"
+        self.assertFalse(log_utils.is_log_enabled(log_utils.LOG_LEVEL_ERROR))
+
+    def test_explicit_level_wins_over_the_message_heuristic(self):
+        self.assertEqual(log_utils.message_level("⚠️ slow link", "WARNING"), log_utils.LOG_LEVEL_WARNING)
+        self.assertEqual(log_utils.message_level("plain text", "error"), log_utils.LOG_LEVEL_ERROR)
+        self.assertEqual(log_utils.message_level("❌ failed"), log_utils.LOG_LEVEL_ERROR)
+        self.assertEqual(log_utils.message_level("plain text", "TRACE"), log_utils.LOG_LEVEL_DEBUG)
+
+    def test_warning_threshold_keeps_warnings_and_drops_info(self):
+        self.config.ENABLE_DEBUG_MODE = True
+        self.config.LOG_LEVEL = "WARNING"
+        built = []
+        debug_logger(message=lambda: built.append("info") or "info", level="INFO")
+        self.assertEqual(built, [])
+        debug_logger(message=lambda: built.append("warning") or "warning", level="WARNING")
+        self.assertEqual(built, ["warning"])
+
+    def test_caller_context_is_cached_per_code_object(self):
+        self.config.ENABLE_DEBUG_MODE = True
+        self.config.LOG_LEVEL = "DEBUG"
+
+        def caller():
+            return log_utils._get_log_args()
+
+        first = caller()
+        self.assertEqual(first["function"], "caller")
+        self.assertEqual(first["file"], "test_logger_fast_path.py")
+        self.assertIs(caller(), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,7 @@ import orjson
 import inspect
 import uuid
 import time
-import queue
+import threading
 import tkinter as tk
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
@@ -30,8 +30,13 @@ app_constants = Config.get_instance()  # Get the singleton instance
 import workers.mqtt.mqtt_topic_utils as mqtt_topic_utils
 
 # Globals
-current_version = "20251225.004500.1"
-current_version_hash = 20251225 * 4500 * 1
+current_version = "20261016.130000.1"
+current_version_hash = 20261016 * 130000 * 1
+
+# --- GUI update pump tuning ---
+PUMP_FAST_INTERVAL_MS = 16  # ~60 fps while updates are flowing
+PUMP_IDLE_INTERVAL_MS = 100  # Back-off ceiling when the queue is quiet
+PUMP_TICK_BUDGET_S = 0.008  # Max time spent applying updates per tick
 
 
 class StateMirrorEngine:
@@ -68,12 +73,49 @@ class StateMirrorEngine:
         self.GUID = str(uuid.uuid4())
         self._silent_update = False
         self._suppress_broadcast = False
-        self.update_queue = queue.Queue()
-        self.root.after(100, self._process_queue)
+
+        # Pending GUI updates, keyed by widget_id. Last value wins, so a meter that
+        # receives 50 updates between ticks is only set (and redrawn) once.
+        self._pending_updates = {}
+        self._pending_lock = threading.Lock()
+        self._pump_interval_ms = PUMP_IDLE_INTERVAL_MS
+        self._update_stats = {
+            "enqueued": 0,
+            "applied": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "deferred": 0,
+            "peak_queue_depth": 0,
+            "last_tick_ms": 0.0,
+        }
+        self.root.after(self._pump_interval_ms, self._process_queue)
+
+    # Queues a GUI update to be applied on the main thread.
+    # Called from the MQTT network thread; only touches the coalescing map under its lock.
+    # A newer value for the same widget replaces the pending one.
+    # Inputs:
+    #     tk_var (tk.Variable): The tkinter variable to set.
+    #     value (Any): The new value.
+    #     widget_id (str): The widget the variable belongs to (the coalescing key).
+    # Outputs:
+    #     None.
+    def _enqueue_gui_update(self, tk_var, value, widget_id):
+        with self._pending_lock:
+            stats = self._update_stats
+            stats["enqueued"] += 1
+            if widget_id in self._pending_updates:
+                stats["coalesced"] += 1
+            self._pending_updates[widget_id] = (tk_var, value)
+            depth = len(self._pending_updates)
+            if depth > stats["peak_queue_depth"]:
+                stats["peak_queue_depth"] = depth
 
     # Processes the queue of pending GUI updates.
     # This method is run on the main GUI thread and safely applies state changes
     # from the MQTT broker to the corresponding tkinter variables, preventing race conditions.
+    # Each tick applies the latest value per widget within a fixed time budget, so a flood of
+    # updates can never stall the Tk main loop; whatever does not fit is carried to the next
+    # tick. The poll interval drops to ~16 ms while updates flow and backs off when quiet.
     # Inputs:
     #     None.
     # Outputs:
@@ -88,11 +130,20 @@ class StateMirrorEngine:
         Returns:
             None
         """
+        tick_start = time.perf_counter()
+        deadline = tick_start + PUMP_TICK_BUDGET_S
+        applied = 0
+        dropped = 0
+        carried_over = {}
         try:
-            while not self.update_queue.empty():
-                tk_var, value, widget_id = self.update_queue.get_nowait()
-
-                if app_constants.global_settings["debug_enabled"]:
+            with self._pending_lock:
+                batch = self._pending_updates
+                self._pending_updates = {}
+
+            debug_enabled = app_constants.global_settings["debug_enabled"]
+            items = iter(batch.items())
+            for widget_id, (tk_var, value) in items:
+                if debug_enabled:
                     debug_logger(
                         message=f"⚡ De-queuing update for GUI Widget '{widget_id}' to {value}",
                         **_get_log_args(),
@@ -101,10 +152,55 @@ class StateMirrorEngine:
                 self._silent_update = True
                 try:
                     tk_var.set(value)
+                    applied += 1
+                except tk.TclError:
+                    dropped += 1  # The widget was destroyed while its update was pending.
                 finally:
                     self._silent_update = False
+
+                if time.perf_counter() >= deadline:
+                    carried_over = dict(items)
+                    break
         finally:
-            self.root.after(100, self._process_queue)
+            with self._pending_lock:
+                # Anything enqueued during this tick is newer than what we carried over.
+                for widget_id, update in carried_over.items():
+                    self._pending_updates.setdefault(widget_id, update)
+                backlog = len(self._pending_updates)
+                stats = self._update_stats
+                stats["applied"] += applied
+                stats["dropped"] += dropped
+                stats["deferred"] += len(carried_over)
+                stats["last_tick_ms"] = (time.perf_counter() - tick_start) * 1000.0
+
+            if applied or backlog:
+                self._pump_interval_ms = PUMP_FAST_INTERVAL_MS
+            else:
+                self._pump_interval_ms = min(
+                    PUMP_IDLE_INTERVAL_MS, self._pump_interval_ms * 2
+                )
+            self.root.after(self._pump_interval_ms, self._process_queue)
+
+    # Returns counters describing the GUI update pump.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     dict: Enqueued/applied/coalesced/dropped/deferred counts, queue depth and timing.
+    def get_update_stats(self):
+        """
+        Returns a snapshot of the GUI update pump statistics.
+
+        Args:
+            None
+
+        Returns:
+            dict: The pump statistics, including the current queue depth and poll interval.
+        """
+        with self._pending_lock:
+            stats = dict(self._update_stats)
+            stats["queue_depth"] = len(self._pending_updates)
+        stats["poll_interval_ms"] = self._pump_interval_ms
+        return stats
 
     # Registers a GUI widget with the state engine.
     # This method creates a mapping between a widget, its tkinter variable, and its corresponding
@@ -279,7 +375,7 @@ class StateMirrorEngine:
 
                     if final_value is not None:
                         # Put the update task into the queue instead of calling .set() directly
-                        self.update_queue.put((tk_var, final_value, widget_id))
+                        self._enqueue_gui_update(tk_var, final_value, widget_id)
                 return True
             except Exception as e:
                 debug_logger(
@@ -510,8 +606,8 @@ class StateMirrorEngine:
                         try:
                             self._suppress_broadcast = True
                             # Put the update task into the queue instead of calling .set() directly
-                            self.update_queue.put(
-                                (tk_var, final_value, widget_info["id"])
+                            self._enqueue_gui_update(
+                                tk_var, final_value, widget_info["id"]
                             )
                         finally:
                             self._suppress_broadcast = False
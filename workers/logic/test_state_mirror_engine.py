@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+import tkinter as tk
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    from workers.logic import state_mirror_engine
+    from workers.logic.state_mirror_engine import StateMirrorEngine
+
+    ENGINE_AVAILABLE = True
+except ImportError:  # paho-mqtt is not installed
+    ENGINE_AVAILABLE = False
+
+
+class _FakeRoot:
+    """Records root.after() calls instead of running a Tk main loop."""
+
+    def __init__(self):
+        self.delays = []
+
+    def after(self, delay_ms, callback):
+        self.delays.append(delay_ms)
+
+
+class _FakeVar:
+    def __init__(self, on_set=None, error=None):
+        self.values = []
+        self.on_set = on_set
+        self.error = error
+
+    def set(self, value):
+        if self.error:
+            raise self.error
+        self.values.append(value)
+        if self.on_set:
+            self.on_set()
+
+
+@unittest.skipUnless(ENGINE_AVAILABLE, "paho-mqtt is not installed")
+class TestGuiUpdatePump(unittest.TestCase):
+
+    def setUp(self):
+        self.root = _FakeRoot()
+        self.engine = StateMirrorEngine("OPEN-AIR", None, self.root, None)
+
+    def test_last_value_wins_per_widget(self):
+        meter, label = _FakeVar(), _FakeVar()
+        for value in range(50):
+            self.engine._enqueue_gui_update(meter, value, "meter")
+        self.engine._enqueue_gui_update(label, "on", "label")
+        self.engine._process_queue()
+
+        self.assertEqual(meter.values, [49])
+        self.assertEqual(label.values, ["on"])
+        stats = self.engine.get_update_stats()
+        self.assertEqual((stats["enqueued"], stats["coalesced"], stats["applied"]), (51, 49, 2))
+
+    def test_carried_over_update_never_replaces_a_newer_one(self):
+        late = _FakeVar()
+        # While "first" is applied, the MQTT thread delivers a newer value for "late".
+        first = _FakeVar(on_set=lambda: self.engine._enqueue_gui_update(late, "new", "late"))
+        self.engine._enqueue_gui_update(first, 1, "first")
+        self.engine._enqueue_gui_update(late, "old", "late")
+
+        saved_budget = state_mirror_engine.PUMP_TICK_BUDGET_S
+        state_mirror_engine.PUMP_TICK_BUDGET_S = 0.0  # Only one update fits in a tick
+        try:
+            self.engine._process_queue()
+        finally:
+            state_mirror_engine.PUMP_TICK_BUDGET_S = saved_budget
+        self.assertEqual(late.values, [])
+        self.assertEqual(self.engine.get_update_stats()["deferred"], 1)
+
+        self.engine._process_queue()
+        self.assertEqual(late.values, ["new"])
+
+    def test_destroyed_widget_update_is_counted_as_dropped(self):
+        self.engine._enqueue_gui_update(_FakeVar(error=tk.TclError("invalid command name")), 1, "gone")
+        self.engine._enqueue_gui_update(_FakeVar(), 2, "alive")
+        self.engine._process_queue()
+        stats = self.engine.get_update_stats()
+        self.assertEqual((stats["applied"], stats["dropped"]), (1, 1))
+
+    def test_interval_backs_off_when_idle(self):
+        self.engine._enqueue_gui_update(_FakeVar(), 1, "meter")
+        for _ in range(5):
+            self.engine._process_queue()
+        fast = state_mirror_engine.PUMP_FAST_INTERVAL_MS
+        idle = state_mirror_engine.PUMP_IDLE_INTERVAL_MS
+        self.assertEqual(self.root.delays[1:], [fast, 2 * fast, 4 * fast, idle, idle])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+try:
+    import numpy as np
+    import orjson
+    from workers.markers.worker_marker_peak_detection import (
+        detect_peaks,
+        encode_peaks_payload,
+        peak_prominences,
+    )
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy.signal import find_peaks
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestPeakDetection(unittest.TestCase):
+
+    def setUp(self):
+        # Two carriers 30 kHz apart on a sloped floor, and a small ripple.
+        self.x = np.arange(0.0, 1000e3, 1e3)
+        self.y = np.linspace(-100.0, -90.0, len(self.x))
+        self.y[500] = -30.0
+        self.y[530] = -40.0
+        self.y[700] = -85.0
+        self.y[701] = -86.0
+
+    def test_threshold_and_top_n(self):
+        peaks = detect_peaks(self.x, self.y, threshold=-50.0)
+        self.assertEqual(peaks["index"].tolist(), [500, 530])
+        peaks = detect_peaks(self.x, self.y, top_n=1)
+        self.assertEqual(peaks["x"].tolist(), [500e3])
+
+    def test_min_separation_prefers_higher_peak(self):
+        peaks = detect_peaks(self.x, self.y, threshold=-50.0, min_separation=50e3)
+        self.assertEqual(peaks["index"].tolist(), [500])
+
+    def test_prominence(self):
+        # Each carrier is measured down to the higher of the lowest floor on either side; on
+        # the rising floor that is the bin just right of it.
+        prominences = peak_prominences(self.y, [500, 530, 700])
+        self.assertAlmostEqual(prominences[0], -30.0 - self.y[501])
+        self.assertAlmostEqual(prominences[1], -40.0 - self.y[531])
+        peaks = detect_peaks(self.x, self.y, prominence=20.0)
+        self.assertEqual(peaks["index"].tolist(), [500, 530])
+
+    def test_payload_is_one_array_document(self):
+        peaks = detect_peaks(self.x, self.y, threshold=-50.0)
+        payload = orjson.loads(encode_peaks_payload(peaks, source="MY123"))
+        self.assertEqual(payload["count"], 2)
+        self.assertEqual(payload["frequencies"], [500e3, 530e3])
+        self.assertEqual(payload["amplitudes"], [-30.0, -40.0])
+        self.assertEqual(payload["source"], "MY123")
+
+
+    def test_rising_steps_are_not_peaks(self):
+        peaks = detect_peaks(np.arange(11.0), [0, 1, 1, 2, 0, 0, 3, 3, 3, 5, 1])
+        self.assertEqual(peaks["index"].tolist(), [3, 9])
+
+    def test_plateau_is_reported_at_its_midpoint(self):
+        self.assertEqual(detect_peaks(np.arange(7.0), [0, 2, 2, 2, 2, 1, 0])["index"].tolist(), [2])
+        self.assertEqual(detect_peaks(np.arange(6.0), [0, 2, 2, 2, 1, 0])["index"].tolist(), [2])
+        self.assertEqual(detect_peaks(np.arange(4.0), [0, 2, 2, 2])["index"].tolist(), [])
+        self.assertEqual(detect_peaks(np.arange(4.0), [2, 2, 1, 0])["index"].tolist(), [])
+
+    @unittest.skipUnless(SCIPY_AVAILABLE, "SciPy is not installed")
+    def test_matches_scipy_on_quantized_traces(self):
+        rng = np.random.default_rng(3)
+        for _ in range(20):
+            y = np.round(rng.normal(-90.0, 0.02, 2000), 2)  # 0.01 dB steps: many ties
+            x = np.arange(len(y), dtype=float)
+            expected, properties = find_peaks(y, prominence=0.0)
+            peaks = detect_peaks(x, y, prominence=0.0)
+            self.assertEqual(peaks["index"].tolist(), expected.tolist())
+            np.testing.assert_allclose(peaks["prominence"], properties["prominences"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,279 @@
+# markers/worker_marker_peak_detection.py
+#
+# Vectorized peak detection for spectrum traces: local maxima filtered by threshold,
+# prominence and minimum separation, ranked to a top-N, and packed as one MQTT array payload.
+# Shared by the plots, the marker workers and Showtime.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261017.001500.1
+
+import orjson
+import numpy as np
+
+current_version = "20261017.001500.1"
+current_version_hash = 20261017 * 1500 * 1
+
+TOPIC_PEAKS_ROOT = "OPEN-AIR/measurements/peaks"
+
+
+class _RangeTable:
+    """
+    Sparse table over an array: level k holds the max (or min) of every window of 2**k
+    samples, so any inclusive range query is two lookups, done for all ranges at once.
+    """
+
+    def __init__(self, values: np.ndarray, reduce):
+        self.reduce = reduce
+        self.levels = [values]
+        width = 1
+        while 2 * width <= len(values):
+            previous = self.levels[-1]
+            self.levels.append(reduce(previous[:-width], previous[width:]))
+            width *= 2
+
+    # Reduces values[start..stop] (inclusive) for arrays of ranges.
+    def query(self, start: np.ndarray, stop: np.ndarray) -> np.ndarray:
+        level = np.log2(stop - start + 1).astype(np.intp)
+        result = np.empty(len(start), dtype=self.levels[0].dtype)
+        for k in np.unique(level):
+            mask = level == k
+            table = self.levels[k]
+            result[mask] = self.reduce(table[start[mask]], table[stop[mask] - (1 << k) + 1])
+        return result
+
+
+# Walks every peak towards the nearest strictly higher peak on one side by pointer jumping,
+# carrying the lowest valley passed on the way.
+# Inputs:
+#     heights (np.ndarray): Peak heights, in trace order.
+#     valleys (np.ndarray): valleys[i] is the lowest sample between peak i and its neighbour on
+#                           that side (or the trace edge).
+#     neighbour (np.ndarray): The adjacent peak on that side, -1 at the edge.
+# Outputs:
+#     np.ndarray: For each peak, the lowest sample before a higher peak or the edge.
+def _lowest_before_higher(heights, valleys, neighbour) -> np.ndarray:
+    lowest = valleys.copy()
+    pointer = neighbour.copy()
+    active = np.flatnonzero(pointer >= 0)
+    while len(active):
+        # A neighbour no higher than the peak is passed over along with everything it already
+        # passed over itself, so each round roughly doubles the distance covered.
+        target = pointer[active]
+        active = active[heights[target] <= heights[active]]
+        target = pointer[active]
+        lowest[active] = np.minimum(lowest[active], lowest[target])
+        pointer[active] = pointer[target]
+        active = active[pointer[active] >= 0]
+    return lowest
+
+
+# Computes topographic prominence: the peak height above the higher of the two lowest points
+# between the peak and the nearest higher sample on each side (or the trace edge).
+# Inputs:
+#     values (np.ndarray): The trace.
+#     index (np.ndarray): Ascending indices of local maxima. Any maximum higher than one of
+#                         them must be included (so filter by height only, not by other rules).
+# Outputs:
+#     np.ndarray: The prominence of each peak.
+def peak_prominences(values, index) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    index = np.asarray(index, dtype=np.intp)
+    count = len(index)
+    if count == 0:
+        return np.empty(0)
+    heights = values[index]
+    # Between two neighbouring maxima the trace never rises above both, so the nearest higher
+    # sample is found by walking peak to peak; only the valley between each pair is needed.
+    segment_minima = np.minimum.reduceat(values, index)  # [index[i], index[i + 1])
+    left_valleys = np.empty(count)
+    left_valleys[0] = values[: index[0] + 1].min()
+    left_valleys[1:] = segment_minima[:-1]
+    right_valleys = segment_minima
+    order = np.arange(count)
+    left_neighbour = order - 1
+    right_neighbour = np.where(order + 1 < count, order + 1, -1)
+    left_base = _lowest_before_higher(heights, left_valleys, left_neighbour)
+    right_base = _lowest_before_higher(heights, right_valleys, right_neighbour)
+    return heights - np.maximum(left_base, right_base)
+
+
+# Keeps peaks so that no two are within `distance`, preferring higher peaks.
+# The result is the same as taking peaks tallest-first (leftmost first among equals) and
+# skipping any within `distance` of one already taken; it is computed in a few vectorized
+# rounds instead of a loop over peaks.
+# Inputs:
+#     positions (np.ndarray): Ascending peak positions (e.g. frequencies).
+#     heights (np.ndarray): Peak heights.
+#     distance (float): The minimum separation, in the units of `positions`.
+# Outputs:
+#     np.ndarray: Boolean mask of the kept peaks.
+def _select_by_separation(positions, heights, distance) -> np.ndarray:
+    kept = np.zeros(len(positions), dtype=bool)
+    undecided = np.ones(len(positions), dtype=bool)
+    live = np.arange(len(positions))
+    while len(live):
+        live_positions = positions[live]
+        live_heights = heights[live]
+        window_start = np.searchsorted(live_positions, live_positions - distance, side="right")
+        window_stop = np.searchsorted(live_positions, live_positions + distance, side="left") - 1
+        # An undecided peak wins if nothing still in play around it is higher, and nothing
+        # of equal height is in play to its left.
+        maxima = _RangeTable(live_heights, np.maximum)
+        winners = undecided[live] & (maxima.query(window_start, window_stop) == live_heights)
+        candidates = np.flatnonzero(winners)
+        candidates = candidates[window_start[candidates] < candidates]
+        tied = maxima.query(window_start[candidates], candidates - 1) == live_heights[candidates]
+        winners[candidates[tied]] = False
+        kept[live[winners]] = True
+        # Anything within reach of a kept peak is out.
+        kept_before = np.concatenate(([0], np.cumsum(kept[live])))
+        near_kept = kept_before[window_stop + 1] - kept_before[window_start] > 0
+        undecided[live[near_kept]] = False
+        if not undecided.any():
+            break
+        live = np.flatnonzero(undecided | kept)
+    return kept
+
+
+# Finds the local maxima of a trace the way scipy.signal.find_peaks does: a run of equal
+# samples is a peak if the nearest different samples on both sides are lower, and is
+# reported at its midpoint. Runs touching either end of the trace are never peaks.
+# Inputs:
+#     values (np.ndarray): The trace.
+# Outputs:
+#     np.ndarray: Ascending indices of the maxima.
+def _local_maxima(values) -> np.ndarray:
+    if len(values) < 3:
+        return np.empty(0, dtype=np.intp)
+    changes = np.flatnonzero(values[1:] != values[:-1])
+    run_starts = np.concatenate(([0], changes + 1))
+    run_stops = np.concatenate((changes, [len(values) - 1]))
+    run_values = values[run_starts]
+    peak_runs = np.flatnonzero(
+        (run_values[1:-1] > run_values[:-2]) & (run_values[1:-1] > run_values[2:])
+    ) + 1
+    return (run_starts[peak_runs] + run_stops[peak_runs]) // 2
+
+
+# Finds the peaks of a trace.
+# Inputs:
+#     x_values (array-like): Ascending positions of the samples (e.g. frequency in Hz).
+#     y_values (array-like): The trace (e.g. amplitude in dBm).
+#     threshold (float, optional): Minimum peak height.
+#     prominence (float, optional): Minimum prominence (see peak_prominences).
+#     min_separation (float, optional): Minimum distance between peaks, in x units.
+#     top_n (int, optional): Keep only the N highest peaks.
+# Outputs:
+#     dict: "index", "x", "y" and "prominence" arrays, ordered by x. "prominence" is only
+#           computed when a prominence filter is given, else it is None.
+def detect_peaks(
+    x_values,
+    y_values,
+    threshold=None,
+    prominence=None,
+    min_separation=None,
+    top_n=None,
+) -> dict:
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+
+    index = _local_maxima(y_values)
+
+    if threshold is not None:
+        index = index[y_values[index] >= threshold]
+    prominences = None
+    if prominence is not None:
+        prominences = peak_prominences(y_values, index)
+        keep = prominences >= prominence
+        index, prominences = index[keep], prominences[keep]
+    if min_separation is not None and min_separation > 0 and len(index) > 1:
+        keep = _select_by_separation(x_values[index], y_values[index], min_separation)
+        index = index[keep]
+        if prominences is not None:
+            prominences = prominences[keep]
+    if top_n is not None and len(index) > top_n:
+        keep = np.sort(np.argsort(-y_values[index], kind="stable")[:top_n])
+        index = index[keep]
+        if prominences is not None:
+            prominences = prominences[keep]
+
+    return {
+        "index": index,
+        "x": x_values[index],
+        "y": y_values[index],
+        "prominence": prominences,
+    }
+
+
+# Packs detected peaks as one JSON MQTT payload.
+# Inputs:
+#     peaks (dict): The result of detect_peaks().
+#     **metadata: Extra fields, e.g. source, timestamp, frequency_units, amplitude_units.
+# Outputs:
+#     bytes: {"count": n, "frequencies": [...], "amplitudes": [...], ["prominences": [...]], ...}
+def encode_peaks_payload(peaks: dict, **metadata) -> bytes:
+    payload = dict(metadata)
+    payload["count"] = len(peaks["index"])
+    payload["frequencies"] = np.ascontiguousarray(peaks["x"], dtype=float)
+    payload["amplitudes"] = np.ascontiguousarray(peaks["y"], dtype=float)
+    if peaks.get("prominence") is not None:
+        payload["prominences"] = np.ascontiguousarray(peaks["prominence"], dtype=float)
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+# Publishes detected peaks to OPEN-AIR/measurements/peaks/<source>.
+# Inputs:
+#     source (str): The trace source, e.g. an instrument serial.
+#     peaks (dict): The result of detect_peaks().
+#     **metadata: Extra payload fields.
+# Outputs:
+#     None.
+def publish_peaks(source: str, peaks: dict, **metadata) -> None:
+    from workers.mqtt.mqtt_publisher_service import publish_payload
+
+    publish_payload(
+        f"{TOPIC_PEAKS_ROOT}/{source}",
+        encode_peaks_payload(peaks, source=source, **metadata),
+        retain=False,
+    )
+
+
+# Times detect_peaks() on a synthetic 100k-bin sweep.
+def _benchmark():
+    import time
+
+    rng = np.random.default_rng(7)
+    bins = 100_000
+    x_values = np.linspace(470e6, 698e6, bins)
+    y_values = rng.normal(-100.0, 1.5, bins)
+    carriers = rng.choice(bins, 60, replace=False)
+    y_values[carriers] += rng.uniform(20.0, 70.0, 60)
+
+    cases = {
+        "maxima only": {},
+        "threshold -90": {"threshold": -90.0},
+        "prominence 6": {"prominence": 6.0},
+        "separation 25 kHz, top 20": {"min_separation": 25e3, "top_n": 20},
+        "all filters": {"threshold": -90.0, "prominence": 6.0, "min_separation": 25e3, "top_n": 20},
+        "separation only (noise)": {"min_separation": 10e3},
+    }
+    for name, options in cases.items():
+        detect_peaks(x_values, y_values, **options)
+        started = time.perf_counter()
+        for _ in range(20):
+            peaks = detect_peaks(x_values, y_values, **options)
+        elapsed_ms = (time.perf_counter() - started) / 20 * 1000
+        print(f"{name:<28} {elapsed_ms:7.2f} ms  {len(peaks['index']):6d} peaks")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -14,25 +14,30 @@
 #
 # Version 20250821.200641.1
 
-import paho.mqtt.client as mqtt
 from workers.logger.logger import debug_logger
 from workers.logger.log_utils import _get_log_args
+from workers.mqtt.mqtt_topic_trie import MqttTopicTrie
+from workers.mqtt.mqtt_trace_payload import is_trace_payload
+
+current_version = "20261016.230000.1"
+current_version_hash = 20261016 * 230000 * 1
 
 
 class MqttSubscriberRouter:
     # Initializes the MqttSubscriberRouter.
-    # This sets up an internal dictionary to store topic filters and their
-    # corresponding callback functions.
+    # This sets up a topic-tree index that maps topic filters to their callback
+    # functions and resolves the subscribers of a topic in O(topic depth).
     # Inputs:
     #     None.
     # Outputs:
     #     None.
     def __init__(self):
-        self._subscribers = {}
+        self._subscribers = MqttTopicTrie()
 
     # Stores a callback function to be invoked when a message matching the topic filter is received.
     # This method registers a topic filter and its associated callback, but does not
     # immediately subscribe to the MQTT broker. Actual subscription occurs via `resubscribe_all_topics`.
+    # Several callbacks may subscribe to the same filter; each one is called.
     # Inputs:
     #     topic_filter (str): The MQTT topic filter to subscribe to.
     #     callback_func (function): The function to call when a message matching the filter is received.
@@ -43,16 +48,36 @@ class MqttSubscriberRouter:
         Stores a callback function for a given topic filter for later subscription.
         Actual subscription happens when the client connects/reconnects.
         """
-        self._subscribers[topic_filter] = callback_func
-        debug_logger(
-            message=f"📝 Topic '{topic_filter}' added to pending subscriptions.",
-            **_get_log_args(),
-        )
+        if self._subscribers.add(topic_filter, callback_func):
+            debug_logger(
+                message=f"📝 Topic '{topic_filter}' added to pending subscriptions.",
+                **_get_log_args(),
+            )
+
+    # Removes a callback (or every callback) registered for a topic filter.
+    # The broker subscription itself is left alone; with no callbacks left, messages on the
+    # filter are simply not dispatched.
+    # Inputs:
+    #     topic_filter (str): The MQTT topic filter to unsubscribe from.
+    #     callback_func (function, optional): The callback to remove; None removes all of them.
+    # Outputs:
+    #     int: The number of callbacks removed.
+    def unsubscribe_from_topic(self, topic_filter: str, callback_func=None) -> int:
+        """
+        Removes `callback_func` (or all callbacks) from `topic_filter`.
+        """
+        removed = self._subscribers.remove(topic_filter, callback_func)
+        if removed:
+            debug_logger(
+                message=f"🗑️ Removed {removed} callback(s) from topic '{topic_filter}'.",
+                **_get_log_args(),
+            )
+        return removed
 
     # Callback function for incoming MQTT messages.
     # This method is designed to be passed to the MQTT client. It decodes the payload
-    # and dispatches the message to all registered callback functions whose topic filters match
-    # the incoming message's topic.
+    # (binary trace payloads are passed through as bytes) and dispatches the message to all registered callback functions whose topic filters match
+    # the incoming message's topic, as resolved by the topic-tree index.
     # Inputs:
     #     client: The Paho MQTT client instance.
     #     userdata: User-defined data passed to the callback.
@@ -68,31 +93,30 @@ class MqttSubscriberRouter:
 
         # Log that a message was received at the router level
         debug_logger(
-            message=f"📨 MQTT Message Received: Topic='{msg.topic}', Payload='{msg.payload}'",
-            **_get_log_args(),
+            message=lambda: f"📨 MQTT Message Received: Topic='{msg.topic}', Payload='{msg.payload}'"
         )
 
         topic = msg.topic
-        try:
-            payload = msg.payload.decode()
-        except UnicodeDecodeError:
-            debug_logger(
-                message=f"❌ Could not decode payload for topic {topic}",
-                **_get_log_args(),
-            )
-            return
+        if is_trace_payload(msg.payload):
+            payload = msg.payload
+        else:
+            try:
+                payload = msg.payload.decode()
+            except UnicodeDecodeError:
+                debug_logger(
+                    message=f"❌ Could not decode payload for topic {topic}",
+                    **_get_log_args(),
+                )
+                return
 
-        for topic_filter, callback_func in list(
-            self._subscribers.items()
-        ):  # Iterate over a copy
-            if mqtt.topic_matches_sub(topic_filter, topic):
-                try:
-                    callback_func(topic, payload)
-                except Exception as e:
-                    debug_logger(
-                        message=f"❌ Error in callback for topic {topic}: {e}",
-                        **_get_log_args(),
-                    )
+        for callback_func in self._subscribers.match_callbacks(topic):
+            try:
+                callback_func(topic, payload)
+            except Exception as e:
+                debug_logger(
+                    message=f"❌ Error in callback for topic {topic}: {e}",
+                    **_get_log_args(),
+                )
 
     # Returns the internal `_on_message` method for use by the MQTT connection manager.
     # This provides the necessary callback for the Paho MQTT client to handle incoming messages.
@@ -118,7 +142,7 @@ class MqttSubscriberRouter:
         Instructs the MQTT client to subscribe to all topics registered with this router.
         This is typically called after a successful connection/reconnection.
         """
-        for topic_filter in list(self._subscribers.keys()):  # Iterate over a copy
+        for topic_filter in self._subscribers.filters():  # Returns a copy
             client.subscribe(topic_filter)
             debug_logger(
                 message=f"🔄 Resubscribed to {topic_filter}", **_get_log_args()
@@ -0,0 +1,249 @@
+# mqtt/mqtt_topic_trie.py
+#
+# A topic-tree index that resolves the callbacks subscribed to an MQTT topic in O(topic depth).
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.120000.1
+
+import threading
+from typing import Callable, Dict, List, Tuple
+
+current_version = "20261016.120000.1"
+current_version_hash = 20261016 * 120000 * 1
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+TOPIC_DELIMITER = "/"
+
+
+class _TrieNode:
+    """
+    One level of a wildcard topic filter. `callbacks` holds the subscribers whose filter
+    ends at this node; it is replaced (never mutated) so readers need no lock.
+    """
+
+    __slots__ = ("children", "callbacks", "topic_filter")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.callbacks: Tuple[Callable, ...] = ()
+        self.topic_filter = ""
+
+
+class MqttTopicTrie:
+    """
+    Maps MQTT topic filters to callbacks.
+
+    Filters without wildcards live in a flat dictionary (a single hash lookup per message);
+    filters containing `+` or `#` live in a trie that is walked one topic level at a time.
+    Several callbacks may share one filter. Lookups are lock-free; writers serialise on a lock
+    and publish new callback tuples so a concurrent match always sees a consistent list.
+    """
+
+    # Initializes an empty topic index.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     None.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._exact: Dict[str, Tuple[Callable, ...]] = {}
+        self._root = _TrieNode()
+        self._wildcard_filters: Dict[str, int] = {}  # filter -> number of callbacks
+
+    # Adds a callback for a topic filter.
+    # Registering the same callback twice for the same filter is a no-op.
+    # Inputs:
+    #     topic_filter (str): The MQTT topic filter, which may contain `+` and `#`.
+    #     callback_func (Callable): The function to register.
+    # Outputs:
+    #     bool: True if the callback was added, False if it was already registered.
+    def add(self, topic_filter: str, callback_func: Callable) -> bool:
+        """
+        Registers `callback_func` under `topic_filter`.
+        """
+        _validate_filter(topic_filter)
+        with self._lock:
+            if not _has_wildcard(topic_filter):
+                existing = self._exact.get(topic_filter, ())
+                if callback_func in existing:
+                    return False
+                self._exact[topic_filter] = existing + (callback_func,)
+                return True
+
+            node = self._root
+            for level in topic_filter.split(TOPIC_DELIMITER):
+                node = node.children.setdefault(level, _TrieNode())
+            if callback_func in node.callbacks:
+                return False
+            node.topic_filter = topic_filter
+            node.callbacks = node.callbacks + (callback_func,)
+            self._wildcard_filters[topic_filter] = len(node.callbacks)
+            return True
+
+    # Removes one callback, or every callback, registered for a topic filter.
+    # Empty trie branches are pruned so the index does not grow with churn.
+    # Inputs:
+    #     topic_filter (str): The MQTT topic filter.
+    #     callback_func (Callable, optional): The callback to remove; None removes all of them.
+    # Outputs:
+    #     int: The number of callbacks removed.
+    def remove(self, topic_filter: str, callback_func: Callable = None) -> int:
+        """
+        Unregisters `callback_func` (or all callbacks) from `topic_filter`.
+        """
+        with self._lock:
+            if not _has_wildcard(topic_filter):
+                existing = self._exact.get(topic_filter, ())
+                remaining = _without(existing, callback_func)
+                if remaining:
+                    self._exact[topic_filter] = remaining
+                else:
+                    self._exact.pop(topic_filter, None)
+                return len(existing) - len(remaining)
+
+            path = [self._root]
+            levels = topic_filter.split(TOPIC_DELIMITER)
+            for level in levels:
+                child = path[-1].children.get(level)
+                if child is None:
+                    return 0
+                path.append(child)
+
+            node = path[-1]
+            existing = node.callbacks
+            node.callbacks = _without(existing, callback_func)
+            if node.callbacks:
+                self._wildcard_filters[topic_filter] = len(node.callbacks)
+            else:
+                self._wildcard_filters.pop(topic_filter, None)
+                for depth in range(len(levels), 0, -1):
+                    current = path[depth]
+                    if current.callbacks or current.children:
+                        break
+                    del path[depth - 1].children[levels[depth - 1]]
+            return len(existing) - len(node.callbacks)
+
+    # Returns every (topic_filter, callback) pair whose filter matches a concrete topic.
+    # Inputs:
+    #     topic (str): The topic of an incoming message (no wildcards).
+    # Outputs:
+    #     List[Tuple[str, Callable]]: The matching subscriptions.
+    def match(self, topic: str) -> List[Tuple[str, Callable]]:
+        """
+        Resolves the subscribers for `topic`: one hash lookup plus a walk of the wildcard trie.
+        """
+        matches = [(topic, callback) for callback in self._exact.get(topic, ())]
+        if not self._wildcard_filters:
+            return matches
+
+        levels = topic.split(TOPIC_DELIMITER)
+        # Per the MQTT spec, topics beginning with '$' are not matched by a leading wildcard.
+        wildcards_allowed = not topic.startswith("$")
+        frontier = [self._root]
+        for level in levels:
+            next_frontier = []
+            for node in frontier:
+                children = node.children
+                if wildcards_allowed:
+                    multi = children.get(MULTI_LEVEL_WILDCARD)
+                    if multi is not None:
+                        matches.extend((multi.topic_filter, cb) for cb in multi.callbacks)
+                    single = children.get(SINGLE_LEVEL_WILDCARD)
+                    if single is not None:
+                        next_frontier.append(single)
+                child = children.get(level)
+                if child is not None:
+                    next_frontier.append(child)
+            if not next_frontier:
+                return matches
+            frontier = next_frontier
+            wildcards_allowed = True
+
+        for node in frontier:
+            matches.extend((node.topic_filter, cb) for cb in node.callbacks)
+            # "a/#" also matches the parent level "a".
+            multi = node.children.get(MULTI_LEVEL_WILDCARD)
+            if multi is not None:
+                matches.extend((multi.topic_filter, cb) for cb in multi.callbacks)
+        return matches
+
+    # Returns the callbacks whose filter matches a concrete topic.
+    # Inputs:
+    #     topic (str): The topic of an incoming message.
+    # Outputs:
+    #     List[Callable]: The matching callbacks, one entry per subscription.
+    def match_callbacks(self, topic: str) -> List[Callable]:
+        """
+        Like `match`, but returns only the callbacks.
+        """
+        return [callback for _, callback in self.match(topic)]
+
+    # Returns every registered topic filter.
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     List[str]: The filters, exact ones first.
+    def filters(self) -> List[str]:
+        """
+        Lists all topic filters that currently have at least one callback.
+        """
+        with self._lock:
+            return list(self._exact.keys()) + list(self._wildcard_filters.keys())
+
+    # Reports whether a filter has any callbacks registered.
+    # Inputs:
+    #     topic_filter (str): The MQTT topic filter.
+    # Outputs:
+    #     bool: True if the filter is registered.
+    def __contains__(self, topic_filter: str) -> bool:
+        return topic_filter in self._exact or topic_filter in self._wildcard_filters
+
+    # Returns the number of registered subscriptions (filter/callback pairs).
+    # Inputs:
+    #     None.
+    # Outputs:
+    #     int: The subscription count.
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(callbacks) for callbacks in self._exact.values()) + sum(
+                self._wildcard_filters.values()
+            )
+
+
+def _has_wildcard(topic_filter: str) -> bool:
+    return SINGLE_LEVEL_WILDCARD in topic_filter or MULTI_LEVEL_WILDCARD in topic_filter
+
+
+def _without(callbacks: Tuple[Callable, ...], callback_func: Callable) -> Tuple[Callable, ...]:
+    if callback_func is None:
+        return ()
+    return tuple(callback for callback in callbacks if callback != callback_func)
+
+
+# Rejects filters that MQTT brokers would refuse, so a typo fails at subscribe time
+# instead of silently never matching.
+def _validate_filter(topic_filter: str) -> None:
+    if not topic_filter:
+        raise ValueError("Topic filter must not be empty.")
+    levels = topic_filter.split(TOPIC_DELIMITER)
+    for index, level in enumerate(levels):
+        if MULTI_LEVEL_WILDCARD in level and (
+            level != MULTI_LEVEL_WILDCARD or index != len(levels) - 1
+        ):
+            raise ValueError(
+                f"'#' must occupy a whole, final level in topic filter '{topic_filter}'."
+            )
+        if SINGLE_LEVEL_WILDCARD in level and level != SINGLE_LEVEL_WILDCARD:
+            raise ValueError(
+                f"'+' must occupy a whole level in topic filter '{topic_filter}'."
+            )
@@ -0,0 +1,103 @@
+# workers/mqtt/mqtt_trace_payload.py
+#
+# The compact binary MQTT payload for instrument traces: a fixed header, a small JSON metadata
+# block and the points as little-endian float32.
+#
+# Author: Anthony Peter Kuzub
+# Blog: www.Like.audio (Contributor to this project)
+#
+# Professional services for customizing and tailoring this software to your specific
+# application can be negotiated. There is no charge to use, modify, or fork this software.
+#
+# Build Log: https://like.audio/category/software/spectrum-scanner/
+# Source Code: https://github.com/APKaudio/
+# Feature Requests can be emailed to i @ like . audio
+#
+# Version 20261016.220000.1
+
+import array
+import struct
+import sys
+
+import orjson
+
+# --- Graceful Dependency Importing ---
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+current_version = "20261016.220000.1"
+current_version_hash = 20261016 * 220000 * 1
+
+TRACE_PAYLOAD_MAGIC = b"OATR"
+TRACE_PAYLOAD_VERSION = 1
+
+# magic, version, reserved, metadata length, point count
+_HEADER = struct.Struct("<4sBBHI")
+
+
+class TracePayloadError(ValueError):
+    """Raised when a payload is not a valid trace payload."""
+
+
+# Packs a trace into one MQTT payload.
+# Inputs:
+#     values (sequence of float): The trace points (NumPy array, array.array or list).
+#     **metadata: JSON-serialisable details, e.g. serial, correlation_id, command, start_hz, stop_hz, units.
+# Outputs:
+#     bytes: header + metadata JSON + float32 little-endian body.
+def encode_trace_payload(values, **metadata) -> bytes:
+    """
+    A 10,001 point sweep becomes ~40 kB of float32 instead of ~150 kB of ASCII.
+    """
+    if NUMPY_AVAILABLE:
+        body = np.ascontiguousarray(values, dtype="<f4").tobytes()
+        count = len(body) // 4
+    else:
+        points = array.array("f", values)
+        if sys.byteorder != "little":
+            points.byteswap()
+        body = points.tobytes()
+        count = len(points)
+    meta = orjson.dumps(metadata) if metadata else b""
+    if len(meta) > 0xFFFF:
+        raise TracePayloadError("Trace metadata is larger than 64 kB.")
+    return _HEADER.pack(TRACE_PAYLOAD_MAGIC, TRACE_PAYLOAD_VERSION, 0, len(meta), count) + meta + body
+
+
+# Unpacks a payload produced by encode_trace_payload().
+# Inputs:
+#     payload (bytes): The MQTT payload.
+# Outputs:
+#     tuple: (metadata dict, values). Values are a float32 NumPy view of the payload when NumPy
+#            is available (no copy), else an array.array("f").
+def decode_trace_payload(payload) -> tuple:
+    payload = memoryview(payload)
+    if len(payload) < _HEADER.size:
+        raise TracePayloadError("Payload is shorter than the trace header.")
+    magic, version, _, meta_length, count = _HEADER.unpack_from(payload)
+    if magic != TRACE_PAYLOAD_MAGIC:
+        raise TracePayloadError("Payload is not a trace payload.")
+    if version != TRACE_PAYLOAD_VERSION:
+        raise TracePayloadError(f"Unsupported trace payload version {version}.")
+    body_start = _HEADER.size + meta_length
+    if len(payload) != body_start + count * 4:
+        raise TracePayloadError(f"Trace payload length does not match its {count} points.")
+    metadata = orjson.loads(payload[_HEADER.size : body_start]) if meta_length else {}
+    if NUMPY_AVAILABLE:
+        values = np.frombuffer(payload, dtype="<f4", count=count, offset=body_start)
+    else:
+        values = array.array("f")
+        values.frombytes(payload[body_start:])
+        if sys.byteorder != "little":
+            values.byteswap()
+    return metadata, values
+
+
+# Returns True if `payload` starts with the trace payload magic.
+def is_trace_payload(payload) -> bool:
+    return bytes(payload[:4]) == TRACE_PAYLOAD_MAGIC
@@ -0,0 +1,70 @@
+
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from workers.mqtt.mqtt_topic_trie import MqttTopicTrie
+from workers.mqtt.mqtt_subscriber_router import MqttSubscriberRouter
+
+
+def matched_filters(trie, topic):
+    return sorted(topic_filter for topic_filter, _ in trie.match(topic))
+
+
+class TestMqttTopicTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = MqttTopicTrie()
+        for topic_filter in ["a/b/c", "a/+/c", "a/#", "#", "+/b/+", "a/b", "x/+"]:
+            self.trie.add(topic_filter, print)
+
+    def test_wildcard_semantics(self):
+        self.assertEqual(matched_filters(self.trie, "a/b/c"), ["#", "+/b/+", "a/#", "a/+/c", "a/b/c"])
+        self.assertEqual(matched_filters(self.trie, "a/b"), ["#", "a/#", "a/b"])
+        self.assertEqual(matched_filters(self.trie, "a"), ["#", "a/#"])
+        self.assertEqual(matched_filters(self.trie, "x/y/z"), ["#"])
+        self.assertEqual(matched_filters(self.trie, "x/y"), ["#", "x/+"])
+
+    def test_system_topics_skip_leading_wildcards(self):
+        self.trie.add("$SYS/#", print)
+        self.assertEqual(matched_filters(self.trie, "$SYS/broker"), ["$SYS/#"])
+
+    def test_multiple_callbacks_per_filter_and_unsubscribe(self):
+        trie = MqttTopicTrie()
+        first, second = [], []
+        self.assertTrue(trie.add("a/+", first.append))
+        self.assertTrue(trie.add("a/+", second.append))
+        self.assertFalse(trie.add("a/+", second.append))
+        self.assertEqual(len(trie.match_callbacks("a/1")), 2)
+
+        self.assertEqual(trie.remove("a/+", first.append), 1)
+        self.assertEqual(trie.match_callbacks("a/1"), [second.append])
+        self.assertEqual(trie.remove("a/+"), 1)
+        self.assertEqual(trie.match("a/1"), [])
+        self.assertEqual(trie.filters(), [])
+        self.assertEqual(len(trie), 0)
+
+    def test_invalid_filters_are_rejected(self):
+        for bad in ["", "a/#/b", "a/b#", "a/+b"]:
+            with self.assertRaises(ValueError):
+                self.trie.add(bad, print)
+
+    def test_router_dispatches_to_every_subscriber(self):
+        class Message:
+            topic = "OPEN-AIR/knob/1"
+            payload = b'{"val": 3}'
+
+        router = MqttSubscriberRouter()
+        received = []
+        router.subscribe_to_topic("OPEN-AIR/knob/1", lambda t, p: received.append(("exact", p)))
+        router.subscribe_to_topic("OPEN-AIR/#", lambda t, p: received.append(("wild", p)))
+        router._on_message(None, None, Message())
+        self.assertEqual(sorted(received), [("exact", '{"val": 3}'), ("wild", '{"val": 3}')])
+
+
+if __name__ == '__main__':
+    unittest.main()
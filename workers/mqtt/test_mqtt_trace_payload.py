@@ -0,0 +1,44 @@
+import unittest
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from workers.mqtt.mqtt_trace_payload import (
+    TracePayloadError,
+    decode_trace_payload,
+    encode_trace_payload,
+    is_trace_payload,
+)
+from managers.Visa_Fleet_Manager.manager_visa_known_types import get_trace_transfer
+
+
+class TestTracePayload(unittest.TestCase):
+
+    def test_round_trip_keeps_points_and_metadata(self):
+        points = [-90.5, -42.25, 0.0, 3.5]
+        payload = encode_trace_payload(points, serial="MY123", correlation_id="c-1")
+        self.assertTrue(is_trace_payload(payload))
+        metadata, values = decode_trace_payload(payload)
+        self.assertEqual(metadata, {"serial": "MY123", "correlation_id": "c-1"})
+        self.assertEqual(list(values), points)
+
+    def test_payload_is_float32(self):
+        payload = encode_trace_payload([0.0] * 1001)
+        self.assertEqual(len(payload), 12 + 1001 * 4)
+
+    def test_rejects_foreign_and_truncated_payloads(self):
+        with self.assertRaises(TracePayloadError):
+            decode_trace_payload(b'{"status": "ok", "response": "1"}')
+        with self.assertRaises(TracePayloadError):
+            decode_trace_payload(encode_trace_payload([1.0, 2.0])[:-1])
+
+    def test_trace_transfer_by_model(self):
+        self.assertEqual(get_trace_transfer("E4411A")["format"], "REAL,32")
+        self.assertIsNone(get_trace_transfer("UNKNOWN")["format"])
+
+
+if __name__ == '__main__':
+    unittest.main()
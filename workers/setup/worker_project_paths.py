@@ -50,6 +50,7 @@ except Exception as e:
 MARKERS_JSON_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "MARKERS.json"
 MARKERS_CSV_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "MARKERS.csv"
 DEVICE_STATE_SNAPSHOT_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "device_state_snapshot.json"
+DEVICE_STATE_JOURNAL_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "device_state_journal.jsonl"
 YAKETY_YAK_REPO_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "YAKETYYAK.json"
 PRESET_REPO_PATH = GLOBAL_PROJECT_ROOT / "DATA" / "PRESET.csv"
 